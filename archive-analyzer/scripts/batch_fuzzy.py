@@ -0,0 +1,108 @@
+"""배치 퍼지 매칭 (rapidfuzz process.cdist)
+
+클립마다 process.extract/extractOne을 호출하는 대신, 정규화된 쿼리와 선택지 문자열
+목록을 한 번에 넘겨 점수 행렬을 계산하고 행마다 상위 k개를 고릅니다.
+
+- 점수 행렬은 행(쿼리) 단위 청크로 나눠 계산하므로 최대 메모리는
+  chunk 행 수 x 선택지 수 x dtype 크기로 제한됩니다 (max_cells).
+- cdist는 workers=-1로 모든 코어를 사용합니다.
+- 동점은 선택지 인덱스가 작은 쪽이 앞에 옵니다
+  (선형 탐색에서 "첫 최고 점수"를 고르던 결과와 같음).
+
+점수는 process.extract와 같은 스코어러/전처리(processor=None)로 계산하므로,
+같은 선택지 목록에 대해서는 클립별 호출과 같은 점수를 얻습니다.
+"""
+
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    from rapidfuzz import process
+    BATCH_AVAILABLE = True
+except ImportError:
+    BATCH_AVAILABLE = False
+
+# 청크당 점수 행렬 최대 셀 수 (float64 기준 약 128MB)
+DEFAULT_MAX_CELLS = 16_000_000
+
+
+def chunk_rows(num_choices: int, max_cells: int = DEFAULT_MAX_CELLS) -> int:
+    """선택지 수에 맞춘 청크당 쿼리 행 수"""
+    return max(1, max_cells // max(1, num_choices))
+
+
+def score_chunks(
+    queries: Sequence[str],
+    choices: Sequence[str],
+    scorer: Callable,
+    score_cutoff: Optional[float] = None,
+    max_cells: int = DEFAULT_MAX_CELLS,
+    workers: int = -1,
+) -> Iterator[Tuple[int, "np.ndarray"]]:
+    """(시작 행, 점수 행렬 청크)를 순서대로 생성
+
+    score_cutoff 미만 점수는 cdist가 0으로 채웁니다.
+    """
+    rows = chunk_rows(len(choices), max_cells)
+    for start in range(0, len(queries), rows):
+        matrix = process.cdist(
+            queries[start : start + rows],
+            choices,
+            scorer=scorer,
+            processor=None,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+            workers=workers,
+        )
+        yield start, matrix
+
+
+def top_k_row(row: "np.ndarray", k: int, score_cutoff: float = 0.0) -> List[Tuple[int, float]]:
+    """한 행에서 점수 상위 k개 (인덱스, 점수) - 동점은 인덱스 오름차순"""
+    if k <= 0 or row.size == 0:
+        return []
+    if k == 1:
+        idx = int(row.argmax())
+        score = float(row[idx])
+        return [(idx, score)] if score > 0 and score >= score_cutoff else []
+
+    k = min(k, row.size)
+    # k번째 점수 이상인 후보만 정렬 (경계 동점까지 포함해 인덱스 순서 보장)
+    kth = row[np.argpartition(row, -k)[-k]]
+    floor = max(kth, score_cutoff)
+    idx = np.flatnonzero(row >= floor)
+    idx = idx[row[idx] > 0]
+    order = np.lexsort((idx, -row[idx]))[:k]
+    return [(int(idx[i]), float(row[idx[i]])) for i in order]
+
+
+def batch_top_k(
+    queries: Sequence[str],
+    choices: Sequence[str],
+    scorer: Callable,
+    k: int = 1,
+    score_cutoff: float = 0.0,
+    max_cells: int = DEFAULT_MAX_CELLS,
+    workers: int = -1,
+) -> List[List[Tuple[int, float]]]:
+    """쿼리별 상위 k개 선택지 (인덱스, 점수) 목록
+
+    Args:
+        queries: 정규화된 쿼리 문자열
+        choices: 정규화된 선택지 문자열
+        scorer: rapidfuzz 스코어러 (fuzz.token_set_ratio 등)
+        k: 행당 후보 수
+        score_cutoff: 최소 점수 (이상, 0-100)
+        max_cells: 청크당 점수 행렬 최대 셀 수
+        workers: cdist 병렬 스레드 수 (-1 = 전체 코어)
+    """
+    results: List[List[Tuple[int, float]]] = [[] for _ in queries]
+    if not queries or not choices:
+        return results
+
+    for start, matrix in score_chunks(
+        queries, choices, scorer, score_cutoff or None, max_cells, workers
+    ):
+        for offset, row in enumerate(matrix):
+            results[start + offset] = top_k_row(row, k, score_cutoff)
+    return results
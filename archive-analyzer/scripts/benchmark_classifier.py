@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""카탈로그 분류기 벤치마크
+
+archive.db의 실제 경로 코퍼스로 기존 classify_path_multilevel 방식
+(호출마다 모든 YAML 패턴 re.search)과 컴파일된 CatalogClassifier를 비교합니다.
+두 결과가 모든 경로에서 같은지도 검증합니다.
+
+Usage:
+    python scripts/benchmark_classifier.py
+    python scripts/benchmark_classifier.py --db data/output/archive.db --all-types
+    python scripts/benchmark_classifier.py --paths-file paths.txt --repeat 3
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# 프로젝트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive_analyzer.sync import (
+    CatalogClassifier,
+    SubcatalogMatch,
+    get_multilevel_patterns,
+)
+from archive_analyzer.utils.path import normalize_path
+
+
+def classify_reference(path: str) -> SubcatalogMatch:
+    """기존 구현: 매 호출마다 패턴 목록 생성 + 전체 re.search"""
+    normalized = normalize_path(path)
+
+    best_match = None
+    best_match_length = 0
+    best_result = None
+
+    for pattern, catalog, subcatalog_template, depth in get_multilevel_patterns():
+        match = re.search(pattern, normalized, re.IGNORECASE)
+        if match:
+            match_length = len(match.group(0))
+            if match_length > best_match_length:
+                best_match_length = match_length
+                best_match = match
+                best_result = (catalog, subcatalog_template, depth)
+
+    if best_match and best_result:
+        catalog, subcatalog_template, depth = best_result
+        year = None
+        if best_match.groups() and best_match.group(1).isdigit():
+            year = best_match.group(1)
+        return SubcatalogMatch(
+            catalog_id=catalog, subcatalog_id=subcatalog_template, depth=depth, year=year
+        )
+
+    return SubcatalogMatch(catalog_id="OTHER", subcatalog_id=None, depth=0)
+
+
+def load_paths(args) -> List[str]:
+    if args.paths_file:
+        with open(args.paths_file, encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()]
+
+    conn = sqlite3.connect(args.db)
+    try:
+        if args.all_types:
+            rows = conn.execute("SELECT path FROM files").fetchall()
+        else:
+            rows = conn.execute("SELECT path FROM files WHERE file_type = 'video'").fetchall()
+    finally:
+        conn.close()
+    return [row[0] for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카탈로그 분류기 벤치마크")
+    parser.add_argument("--db", default="data/output/archive.db", help="archive.db 경로")
+    parser.add_argument("--paths-file", help="경로 목록 파일 (한 줄에 하나, --db 대신 사용)")
+    parser.add_argument("--all-types", action="store_true", help="비디오 외 파일도 포함")
+    parser.add_argument("--repeat", type=int, default=1, help="코퍼스 반복 횟수")
+    args = parser.parse_args()
+
+    paths = load_paths(args) * args.repeat
+    if not paths:
+        print("경로가 없습니다.")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"카탈로그 분류기 벤치마크: {len(paths):,} paths")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    expected = [classify_reference(p) for p in paths]
+    reference_time = time.perf_counter() - start
+
+    classifier = CatalogClassifier.from_yaml()
+    start = time.perf_counter()
+    actual = [classifier.classify(p) for p in paths]
+    compiled_time = time.perf_counter() - start
+
+    mismatches = [
+        (path, exp, act) for path, exp, act in zip(paths, expected, actual) if exp != act
+    ]
+
+    print(f"{'Method':20} {'Seconds':>10} {'paths/s':>14}")
+    print("-" * 46)
+    print(f"{'reference':20} {reference_time:10.3f} {len(paths) / reference_time:14,.0f}")
+    print(f"{'CatalogClassifier':20} {compiled_time:10.3f} {len(paths) / compiled_time:14,.0f}")
+    print(f"\n속도 향상: {reference_time / compiled_time:.1f}x")
+
+    if mismatches:
+        print(f"\n결과 불일치: {len(mismatches)}건")
+        for path, exp, act in mismatches[:10]:
+            print(f"  {path}\n    expected={exp}\n    actual  ={act}")
+        sys.exit(1)
+
+    print("결과 일치: 모든 경로 동일")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""files 테이블 적재 벤치마크
+
+합성 FileRecord로 스캔 저장 경로(insert_files_batch)의 rows/sec를 측정합니다.
+각 모드마다 빈 DB에 최초 적재 + 같은 행 재적재(재스캔)를 수행합니다.
+
+모드:
+- legacy-replace : SQLite 기본 PRAGMA + INSERT OR REPLACE (기존 방식)
+- balanced       : WAL 프로필 + UPSERT
+- balanced+bulk  : WAL 프로필 + UPSERT + bulk_load() (보조 인덱스 지연)
+
+Usage:
+    python scripts/benchmark_database.py                  # 1,000,000행
+    python scripts/benchmark_database.py --rows 100000
+    python scripts/benchmark_database.py --batch 500 --modes balanced balanced+bulk
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List
+
+# 프로젝트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive_analyzer.database import Database, FileRecord
+
+LEGACY_REPLACE_SQL = """
+    INSERT OR REPLACE INTO files
+    (path, filename, extension, size_bytes, modified_at, file_type, parent_folder, scan_status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+MODES = ["legacy-replace", "balanced", "balanced+bulk"]
+EXTENSIONS = [".mp4", ".mxf", ".mov", ".mkv", ".srt", ".jpg"]
+FILE_TYPES = {".mp4": "video", ".mxf": "video", ".mov": "video", ".mkv": "video",
+              ".srt": "subtitle", ".jpg": "image"}
+
+
+def synthetic_batches(rows: int, batch_size: int) -> Iterator[List[FileRecord]]:
+    """NAS 경로 형태의 합성 레코드 배치 생성 (폴더당 50개 파일)"""
+    base = "\\\\10.10.100.122\\docker\\GGPNAs\\ARCHIVE"
+    epoch = datetime(2024, 1, 1)
+    batch: List[FileRecord] = []
+
+    for i in range(rows):
+        ext = EXTENSIONS[i % len(EXTENSIONS)]
+        folder = f"{base}\\CAT{i % 17:02d}\\{2003 + i % 22}\\EVENT{i // 50:06d}"
+        name = f"clip_{i:08d}{ext}"
+        batch.append(
+            FileRecord(
+                path=f"{folder}\\{name}",
+                filename=name,
+                extension=ext,
+                size_bytes=1_000_000 + (i * 7919) % 5_000_000_000,
+                modified_at=epoch + timedelta(seconds=i),
+                file_type=FILE_TYPES[ext],
+                parent_folder=folder,
+                scan_status="scanned",
+            )
+        )
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def _insert_legacy(db: Database, records: List[FileRecord]) -> None:
+    conn = db._get_connection()
+    conn.executemany(
+        LEGACY_REPLACE_SQL,
+        [
+            (
+                r.path,
+                r.filename,
+                r.extension,
+                r.size_bytes,
+                r.modified_at.isoformat() if r.modified_at else None,
+                r.file_type,
+                r.parent_folder,
+                r.scan_status,
+            )
+            for r in records
+        ],
+    )
+    conn.commit()
+
+
+def run_pass(db: Database, mode: str, rows: int, batch_size: int) -> float:
+    """1회 적재 후 rows/sec 반환"""
+    bulk = db.bulk_load() if mode == "balanced+bulk" else nullcontext()
+
+    start = time.perf_counter()
+    with bulk:
+        for batch in synthetic_batches(rows, batch_size):
+            if mode == "legacy-replace":
+                _insert_legacy(db, batch)
+            else:
+                db.insert_files_batch(batch)
+    elapsed = time.perf_counter() - start
+
+    return rows / elapsed if elapsed > 0 else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="files 테이블 적재 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="합성 파일 수 (기본: 1,000,000)")
+    parser.add_argument("--batch", type=int, default=1000, help="배치 크기 (기본: 1000)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="측정할 모드")
+    parser.add_argument("--dir", type=str, help="DB 파일 생성 디렉토리 (기본: 임시 디렉토리)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"files 적재 벤치마크: {args.rows:,} rows, batch {args.batch:,}")
+    print("=" * 70)
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=args.dir, ignore_cleanup_errors=True) as tmp:
+        for mode in args.modes:
+            profile = "legacy" if mode == "legacy-replace" else "balanced"
+            db = Database(str(Path(tmp) / f"{mode}.db"), profile=profile)
+            try:
+                initial = run_pass(db, mode, args.rows, args.batch)
+                rescan = run_pass(db, mode, args.rows, args.batch)
+                count = db.get_file_count()
+            finally:
+                db.close()
+
+            results.append((mode, initial, rescan, count))
+            print(f"  {mode:16} initial {initial:12,.0f} rows/s | rescan {rescan:12,.0f} rows/s")
+
+    print()
+    print(f"{'Mode':16} {'Initial rows/s':>16} {'Rescan rows/s':>16} {'Rows':>12}")
+    print("-" * 64)
+    for mode, initial, rescan, count in results:
+        print(f"{mode:16} {initial:16,.0f} {rescan:16,.0f} {count:12,}")
+
+
+if __name__ == "__main__":
+    main()
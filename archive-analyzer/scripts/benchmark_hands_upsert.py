@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+"""아카이브 시트 → hands 적재 벤치마크 (행 단위 vs 일괄 upsert)
+
+합성 워크시트 값으로 ArchiveHandsSync.sync_values()의 DB 반영 시간을 비교합니다.
+Google Sheets 연결 없이 임시 pokervod.db에 최초 적재 + 같은 시트 재동기화를 수행하고,
+두 방식의 hands / hand_players / hand_tags 결과가 같은지 확인합니다.
+
+모드:
+- per-row : 핸드마다 SELECT + INSERT/UPDATE + 정규화 테이블 개별 쿼리 (bulk_write=False)
+- bulk    : 임시 테이블 적재 + upsert 1회 + INSERT ... SELECT (bulk_write=True)
+
+Usage:
+    python scripts/benchmark_hands_upsert.py
+    python scripts/benchmark_hands_upsert.py --sheets 50 --hands 400
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+# 프로젝트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive_analyzer.archive_hands_sync import ArchiveHandsSync, ArchiveSyncConfig
+
+MODES = {"per-row": False, "bulk": True}
+
+SCHEMA = """
+    CREATE TABLE files (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nas_path TEXT,
+        filename TEXT
+    );
+    CREATE TABLE hands (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_id INTEGER NOT NULL REFERENCES files(id),
+        hand_number INTEGER,
+        start_sec REAL,
+        end_sec REAL,
+        highlight_score INTEGER,
+        cards_shown TEXT,
+        players TEXT,
+        tags TEXT,
+        title_source TEXT
+    );
+    CREATE TABLE hand_players (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        hand_id INTEGER NOT NULL,
+        player_name VARCHAR(100) NOT NULL,
+        position INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (hand_id) REFERENCES hands(id) ON DELETE CASCADE
+    );
+    CREATE TABLE hand_tags (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        hand_id INTEGER NOT NULL,
+        tag VARCHAR(50) NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (hand_id) REFERENCES hands(id) ON DELETE CASCADE,
+        UNIQUE(hand_id, tag)
+    );
+    CREATE INDEX idx_hands_file_hand ON hands(file_id, hand_number);
+    CREATE INDEX idx_hand_players_hand ON hand_players(hand_id);
+    CREATE INDEX idx_hand_tags_hand ON hand_tags(hand_id);
+"""
+
+HEADERS = [
+    "File No.",
+    "File Name",
+    "Nas Folder Link",
+    "In",
+    "Out",
+    "Hand Grade",
+    "Hands",
+    "Tag (Player)",
+    "Tag (Player)",
+    "Tag (Player)",
+    "Tag (Poker Play)",
+    "Tag (Poker Play)",
+    "Tag (Emotion)",
+]
+PLAYERS = ["Phil Ivey", "Daniel Negreanu", "Tom Dwan", "Phil Hellmuth", "Doyle Brunson"]
+POKER_TAGS = ["Preflop All-in", "Hero Call", "Cooler", "Bad Beat", "Bluff", "Hero Fold"]
+EMOTIONS = ["Brutal", "Lucky", "Absurd", ""]
+
+
+class _DbOnlySync(ArchiveHandsSync):
+    """Google Sheets 연결 없이 DB 반영만 하는 동기화 (벤치마크용)"""
+
+    def __init__(self, db_path: str, bulk_write: bool):
+        self.config = ArchiveSyncConfig(db_path=db_path, bulk_write=bulk_write)
+        self._connect_db()
+        self._load_file_mapping()
+
+
+def timecode(seconds: int) -> str:
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def make_sheets(count: int, hands: int, revision: int) -> List[List[List[str]]]:
+    """워크시트 값 목록 (1~2행 메모, 3행 헤더, 4행부터 핸드)
+
+    revision이 바뀌면 일부 핸드의 시간/등급/플레이어/태그가 바뀝니다 (재동기화).
+    """
+    sheets = []
+    for sheet in range(count):
+        rng = random.Random(sheet * 1000 + revision)
+        filename = f"WSOP_2024_Main_Event_Day{sheet}.mp4"
+        folder = f"\\\\10.10.100.122\\docker\\GGPNAs\\ARCHIVE\\WSOP\\2024\\{filename}"
+        rows = [["Archive Team Hands", ""], ["", ""], HEADERS]
+        for hand in range(1, hands + 1):
+            start = hand * 120 + rng.randint(0, 30)
+            players = rng.sample(PLAYERS, rng.randint(0, 3))
+            tags = rng.sample(POKER_TAGS, 2)
+            rows.append(
+                [
+                    str(hand),
+                    filename,
+                    folder,
+                    timecode(start),
+                    timecode(start + rng.randint(30, 90)),
+                    "★" * rng.randint(0, 3),
+                    "AhKd vs QsQc" if rng.random() < 0.5 else "",
+                    *(players + [""] * (3 - len(players))),
+                    *(tags if rng.random() < 0.8 else ["", ""]),
+                    rng.choice(EMOTIONS),
+                ]
+            )
+        sheets.append(rows)
+    return sheets
+
+
+def create_db(path: str, sheets: int) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO files (nas_path, filename) VALUES (?, ?)",
+        [
+            (
+                f"//10.10.100.122/docker/GGPNAs/ARCHIVE/WSOP/2024/"
+                f"WSOP_2024_Main_Event_Day{sheet}.mp4",
+                f"WSOP_2024_Main_Event_Day{sheet}.mp4",
+            )
+            for sheet in range(sheets)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def snapshot(path: str) -> List[List[tuple]]:
+    """비교용 테이블 내용 (링크 테이블은 자동 증가 id/생성 시각 제외)"""
+    conn = sqlite3.connect(path)
+    try:
+        return [
+            conn.execute("SELECT * FROM hands ORDER BY id").fetchall(),
+            conn.execute(
+                "SELECT hand_id, player_name, position FROM hand_players ORDER BY 1, 3, 2"
+            ).fetchall(),
+            conn.execute("SELECT hand_id, tag FROM hand_tags ORDER BY 1, 2").fetchall(),
+        ]
+    finally:
+        conn.close()
+
+
+def run(mode: str, args, workdir: str) -> List[List[tuple]]:
+    path = os.path.join(workdir, f"pokervod_{mode}.db")
+    create_db(path, args.sheets)
+    sync = _DbOnlySync(path, MODES[mode])
+    total = args.sheets * args.hands
+
+    print(f"\n=== {mode} (워크시트 {args.sheets}개 × 핸드 {args.hands}개) ===")
+    try:
+        for label, revision in (("최초 적재", 0), ("재동기화", 1)):
+            sheets = make_sheets(args.sheets, args.hands, revision)
+
+            # 시트 행 파싱만 (두 모드 공통 비용)
+            start = time.perf_counter()
+            for values in sheets:
+                for row in values[3:]:
+                    sync.parse_sheet_row(values[2], row)
+            parsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for values in sheets:
+                sync.sync_values(values)
+            elapsed = time.perf_counter() - start
+            written = max(elapsed - parsed, 1e-9)
+            print(
+                f"  {label:<6} 전체 {elapsed:7.3f}초  DB 반영 {written:7.3f}초 "
+                f"({total / written:,.0f} hands/sec)"
+            )
+    finally:
+        sync.close()
+    return snapshot(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="hands 적재 벤치마크 (행 단위 vs 일괄)")
+    parser.add_argument("--sheets", type=int, default=20, help="워크시트 수")
+    parser.add_argument("--hands", type=int, default=300, help="워크시트당 핸드 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hands_upsert_") as workdir:
+        results = {mode: run(mode, args, workdir) for mode in MODES}
+
+    same = results["per-row"] == results["bulk"]
+    counts = ", ".join(
+        f"{name} {len(rows):,}"
+        for name, rows in zip(("hands", "hand_players", "hand_tags"), results["bulk"])
+    )
+    print(f"\n결과 비교: {'동일' if same else '불일치'} ({counts})")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
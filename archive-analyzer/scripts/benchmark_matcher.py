@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""클립 매칭 후보 인덱스 벤치마크
+
+CandidateIndex(블로킹)와 FullScanIndex(기존 선형 탐색과 동일)로 같은 입력을 매칭해
+전략별 소요 시간을 비교하고, 두 결과가 같은지 검증합니다.
+
+- clip 모드: clip_matcher.ClipMatcher + 클립 트래커 CSV
+- iconik 모드: match_by_path 전략 + media_files/clip_metadata (--iconik-db)
+- --batch: indexed 쪽을 배치 퍼지 매칭(process.cdist)으로 실행
+
+Usage:
+    python scripts/benchmark_matcher.py
+    python scripts/benchmark_matcher.py --db archive.db --csv "data/input/... Clip Tracker.csv:2024"
+    python scripts/benchmark_matcher.py --legacy          # match_clip 순차 전략
+    python scripts/benchmark_matcher.py --iconik-db data/output/archive.db
+    python scripts/benchmark_matcher.py --batch           # 배치 cdist vs 클립별 전체 탐색
+    python scripts/benchmark_matcher.py --approx-pool     # 작은 후보 풀 IDF 근사 (결과 차이 확인)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# 같은 폴더의 매칭 스크립트 import
+sys.path.insert(0, str(Path(__file__).parent))
+
+from candidate_index import CandidateIndex, FullScanIndex
+
+DEFAULT_CSVS = [
+    "data/input/WSOP HAND SELECTION -  2024 WSOP Clip Tracker.csv:2024",
+    "data/input/WSOP HAND SELECTION - 2025 WSOP Clip Tracker.csv:2025",
+    "data/input/WSOP HAND SELECTION - 2025 WSOP Cyprus SC Clip Tracker.csv:2025",
+    "data/input/WSOP HAND SELECTION - 2025 WSOP Europe Clip Tracker.csv:2025",
+]
+
+
+def print_timings(title: str, indexed: Dict[str, float], full: Dict[str, float]) -> None:
+    print(f"\n{title}")
+    print(f"{'Strategy':22} {'full scan':>12} {'indexed':>12} {'speedup':>9}")
+    print("-" * 58)
+    for name in sorted(set(indexed) | set(full), key=lambda n: -full.get(n, 0)):
+        f, i = full.get(name, 0.0), indexed.get(name, 0.0)
+        speedup = f"{f / i:8.1f}x" if i > 0 else "       -"
+        print(f"{name:22} {f:11.3f}s {i:11.3f}s {speedup}")
+    f_total, i_total = sum(full.values()), sum(indexed.values())
+    print("-" * 58)
+    print(f"{'total':22} {f_total:11.3f}s {i_total:11.3f}s")
+
+
+def report_mismatches(mismatches: List[Tuple]) -> None:
+    if mismatches:
+        print(f"\n결과 불일치: {len(mismatches)}건")
+        for key, expected, actual in mismatches[:10]:
+            print(f"  {key}\n    full scan={expected}\n    indexed  ={actual}")
+        sys.exit(1)
+    print("\n결과 일치: 모든 클립 동일")
+
+
+def run_clip_mode(args) -> None:
+    from clip_matcher import ClipMatcher
+
+    csvs = []
+    for spec in args.csv or DEFAULT_CSVS:
+        path, _, year = spec.rpartition(":")
+        if Path(path).exists():
+            csvs.append((path, year))
+    if not csvs:
+        print("CSV 파일이 없습니다.")
+        sys.exit(1)
+
+    outcomes = {}
+    for label, factory in (("full", FullScanIndex), ("indexed", CandidateIndex)):
+        start = time.perf_counter()
+        matcher = ClipMatcher(
+            args.db, index_factory=factory, approximate_pool=args.approx_pool
+        )
+        build_time = time.perf_counter() - start
+
+        clips = []
+        for path, year in csvs:
+            clips.extend(matcher.load_csv(path, year))
+
+        if args.batch and label == "indexed":
+            matcher.match_all_batch(clips)
+        else:
+            for clip in clips:
+                if args.legacy:
+                    matcher.match_clip(clip)
+                else:
+                    matcher.match_with_candidates(clip)
+
+        print(f"[{label}] index build {build_time:.2f}s, {len(clips)} clips")
+        outcomes[label] = (
+            {
+                clip.clip_id: (
+                    clip.matched_file_id,
+                    clip.match_method,
+                    round(clip.match_confidence, 6),
+                    [c.file_id for c in clip.candidates],
+                )
+                for clip in clips
+            },
+            dict(matcher.strategy_times),
+        )
+
+    (expected, full_times), (actual, indexed_times) = outcomes["full"], outcomes["indexed"]
+    print_timings("ClipMatcher 전략별 소요 시간", indexed_times, full_times)
+    report_mismatches(
+        [
+            (key, expected[key], actual.get(key))
+            for key in expected
+            if expected[key] != actual.get(key)
+        ]
+    )
+
+
+def run_iconik_mode(args) -> None:
+    import match_by_path as mbp
+
+    mbp.logger.setLevel("WARNING")
+    media_files = mbp.load_media_files(args.iconik_db)
+    clips = mbp.load_unmatched_clips(args.iconik_db)
+    print(f"media files: {len(media_files):,}, unmatched clips: {len(clips):,}")
+
+    outcomes = {}
+    for label, factory in (("full", FullScanIndex), ("indexed", CandidateIndex)):
+        index = mbp.build_media_index(
+            media_files, index_factory=factory, approximate_pool=args.approx_pool
+        )
+        batch = args.batch and label == "indexed"
+        results, timings = mbp.match_clips(clips, media_files, index, batch=batch)
+        outcomes[label] = ({r.iconik_id: r for r in results}, timings)
+
+    (expected, full_times), (actual, indexed_times) = outcomes["full"], outcomes["indexed"]
+    print_timings("match_by_path 전략별 소요 시간", indexed_times, full_times)
+    keys = set(expected) | set(actual)
+    report_mismatches(
+        [
+            (key, expected.get(key), actual.get(key))
+            for key in sorted(keys)
+            if expected.get(key) != actual.get(key)
+        ]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="클립 매칭 후보 인덱스 벤치마크")
+    parser.add_argument("--db", default="archive.db", help="archive.db 경로 (clip 모드)")
+    parser.add_argument("--csv", action="append", help="클립 트래커 CSV (경로:연도, 반복 가능)")
+    parser.add_argument("--legacy", action="store_true", help="match_clip 순차 전략으로 비교")
+    parser.add_argument("--batch", action="store_true", help="indexed 쪽을 배치 cdist로 실행")
+    parser.add_argument(
+        "--approx-pool", action="store_true", help="작은 후보 풀을 IDF 상위 파일로 확장 (근사)"
+    )
+    parser.add_argument("--iconik-db", help="media_files/clip_metadata DB (iconik 모드)")
+    args = parser.parse_args()
+
+    if args.iconik_db:
+        run_iconik_mode(args)
+    else:
+        run_clip_mode(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""검색 엔진 지연 벤치마크 (SQLite FTS5 vs MeiliSearch)
+
+자주 쓰는 검색어를 각 엔진에 N회씩 요청하고 검색어별 지연(p50/p95/max)을 출력합니다.
+MeiliSearch는 패키지가 설치되어 있고 서버가 응답할 때만 측정합니다.
+
+Usage:
+    python scripts/benchmark_search.py
+    python scripts/benchmark_search.py --db-path data/output/archive.db --repeat 200
+    python scripts/benchmark_search.py --no-meili
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive_analyzer.fts_search import FTSSearchEngine, fts5_available
+from archive_analyzer.search import MEILISEARCH_AVAILABLE, SearchConfig, SearchService
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+# (이름, 메서드, 인자) - API에서 자주 쓰는 검색 패턴
+COMMON_QUERIES: List[Tuple[str, str, Dict]] = [
+    ("files: wsop", "search_files", {"query": "wsop"}),
+    ("files: wsop 2024 (prefix)", "search_files", {"query": "wso 202"}),
+    ("files: main event +video", "search_files", {"query": "main event", "file_type": "video"}),
+    ("files: .mp4 +facets", "search_files", {"query": "mp4", "facets": ["extension", "file_type"]}),
+    ("media: h264", "search_media", {"query": "h264"}),
+    ("media: wsop +1080p", "search_media", {"query": "wsop", "resolution": "1080p"}),
+    ("clips: ivey", "search_clips", {"query": "ivey"}),
+    ("clips: bluff +facets", "search_clips", {"query": "bluff", "facets": ["hand_grade", "year"]}),
+]
+
+
+def summarize(name: str, values: List[float], errors: int = 0) -> str:
+    if not values:
+        return f"  {name:<40} 응답 없음 (오류 {errors})"
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"  {name:<40} n={len(values):>5}  "
+        f"p50={statistics.median(ordered) * 1000:8.2f}ms  "
+        f"p95={p95 * 1000:8.2f}ms  max={ordered[-1] * 1000:8.2f}ms  오류={errors}"
+    )
+
+
+def measure(call: Callable[[], object], repeat: int, warmup: int) -> Tuple[List[float], int]:
+    """call을 warmup회 실행한 뒤 repeat회 지연 측정"""
+    latencies: List[float] = []
+    errors = 0
+    for i in range(warmup + repeat):
+        start = time.perf_counter()
+        try:
+            call()
+        except Exception:
+            errors += 1
+            continue
+        if i >= warmup:
+            latencies.append(time.perf_counter() - start)
+    return latencies, errors
+
+
+def run_engine(label: str, engine, repeat: int, warmup: int) -> None:
+    print(f"\n=== {label} ===")
+    for name, method, kwargs in COMMON_QUERIES:
+        search = getattr(engine, method)
+        latencies, errors = measure(lambda: search(**kwargs), repeat, warmup)
+        print(summarize(name, latencies, errors))
+
+
+def connect_meilisearch(host: str, api_key: str):
+    """응답하는 MeiliSearch가 있으면 SearchService, 없으면 None"""
+    if not MEILISEARCH_AVAILABLE:
+        print("\nMeiliSearch: meilisearch 패키지 미설치 - 건너뜀")
+        return None
+    try:
+        service = SearchService(SearchConfig(host=host, api_key=api_key))
+    except Exception as e:
+        print(f"\nMeiliSearch: 연결 실패 ({e}) - 건너뜀")
+        return None
+    if not service.health_check():
+        print(f"\nMeiliSearch: {host} 응답 없음 - 건너뜀")
+        return None
+    return service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 엔진 지연 벤치마크")
+    parser.add_argument(
+        "--db-path",
+        type=str,
+        default="data/output/archive.db",
+        help="archive.db 경로 (기본: data/output/archive.db)",
+    )
+    parser.add_argument("--host", type=str, default="http://localhost:7700", help="MeiliSearch 호스트")
+    parser.add_argument(
+        "--api-key", type=str, default="archive-analyzer-dev-key", help="MeiliSearch API 키"
+    )
+    parser.add_argument("--repeat", type=int, default=100, help="검색어별 반복 횟수 (기본: 100)")
+    parser.add_argument("--warmup", type=int, default=5, help="측정 전 워밍업 횟수 (기본: 5)")
+    parser.add_argument("--no-meili", action="store_true", help="MeiliSearch 측정 생략")
+    args = parser.parse_args()
+
+    if not Path(args.db_path).exists():
+        print(f"오류: DB 파일을 찾을 수 없습니다: {args.db_path}")
+        sys.exit(1)
+
+    if not fts5_available():
+        print("오류: 이 Python의 SQLite는 FTS5를 지원하지 않습니다.")
+        sys.exit(1)
+
+    print(f"DB: {args.db_path}  반복: {args.repeat}  워밍업: {args.warmup}")
+
+    start = time.perf_counter()
+    engine = FTSSearchEngine(args.db_path)
+    print(f"FTS5 준비: {time.perf_counter() - start:.2f}초 (최초 실행 시 인덱스 생성 포함)")
+    for name, count in engine.get_stats().items():
+        print(f"  {name}: {count.get('numberOfDocuments', 0):,}건")
+
+    try:
+        run_engine("SQLite FTS5", engine, args.repeat, args.warmup)
+    finally:
+        engine.close()
+
+    if not args.no_meili:
+        service = connect_meilisearch(args.host, args.api_key)
+        if service:
+            run_engine(f"MeiliSearch ({args.host})", service, args.repeat, args.warmup)
+
+
+if __name__ == "__main__":
+    main()
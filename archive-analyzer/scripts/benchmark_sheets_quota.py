@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""Google Sheets 요청 스케줄러 처리량 벤치마크 (가짜 Sheets 서버)
+
+실제 API 대신 한도(window당 읽기/쓰기 요청 수)를 그대로 흉내 내는 로컬 가짜 Sheets
+(tests/fake_sheets.py, 테스트 픽스처와 공용)로
+여러 클라이언트(데몬)가 동시에 요청할 때의 처리량과 429 횟수를 비교합니다.
+
+- fixed: 기존 방식 (클라이언트마다 요청 전 고정 딜레이 1.2초, 읽기/쓰기 구분 없음)
+- scheduler: 클라이언트마다 별도 토큰 버킷 (프로세스 간 공유 없음)
+- shared: 토큰 버킷 상태를 SQLite 파일로 공유 (SHEETS_RATE_LIMIT_PATH와 동일)
+
+시간은 --window로 축소합니다 (기본 6초 = 실제 60초의 1/10, 한도 횟수는 동일).
+
+Usage:
+    python scripts/benchmark_sheets_quota.py
+    python scripts/benchmark_sheets_quota.py --clients 3 --windows 5
+    python scripts/benchmark_sheets_quota.py --mode shared --window 60
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+# 프로젝트 루트(tests 패키지)와 src를 path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from gspread.exceptions import APIError
+
+from archive_analyzer.sheets_rate_limit import READ, WRITE, SheetsRequestScheduler
+from tests.fake_sheets import FakeSheetsServer, FakeSpreadsheet
+
+MODES = ("fixed", "scheduler", "shared")
+
+
+# =============================================
+# Clients
+# =============================================
+
+
+def fixed_delay_call(delay: float) -> Callable:
+    """기존 SheetsClient 방식: 요청마다 고정 딜레이 후 호출 (429면 실패로 집계)"""
+
+    def call(kind: str, func: Callable, *args):
+        time.sleep(delay)
+        return func(*args)
+
+    return call
+
+
+def run_client(call: Callable, spreadsheet: FakeSpreadsheet, stop: threading.Event, errors: List):
+    """읽기 3 : 쓰기 1 비율로 요청 반복"""
+    worksheet = spreadsheet.sheets["Sheet1"]
+    i = 0
+    while not stop.is_set():
+        try:
+            if i % 4 == 3:
+                call(WRITE, worksheet.update_cell, 4, 2, "0:00:01")
+            else:
+                call(READ, worksheet.get_all_values)
+        except (APIError, RuntimeError):
+            errors.append(1)
+        i += 1
+
+
+def run(mode: str, args) -> None:
+    server = FakeSheetsServer(args.read_limit, args.write_limit, args.window, args.latency)
+    spreadsheet = server.spreadsheet
+    spreadsheet.add_sheet("Sheet1", [["File No.", "In", "Out"], ["1", "0:00:01", "0:00:10"]])
+    shared_path = None
+    if mode == "shared":
+        fd, shared_path = tempfile.mkstemp(suffix=".db", prefix="sheets_rate_")
+        os.close(fd)
+
+    calls = []
+    for _ in range(args.clients):
+        if mode == "fixed":
+            calls.append(fixed_delay_call(1.2 * args.window / 60))
+        else:
+            # 클라이언트(프로세스)마다 별도 스케줄러 인스턴스
+            scheduler = SheetsRequestScheduler(
+                read_limit=args.read_limit,
+                write_limit=args.write_limit,
+                window=args.window,
+                shared_path=shared_path,
+                max_backoff=args.window,
+            )
+            calls.append(scheduler.call)
+
+    stop = threading.Event()
+    errors: List = []
+    threads = [
+        threading.Thread(target=run_client, args=(call, spreadsheet, stop, errors))
+        for call in calls
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(args.window * args.windows)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    windows = elapsed / args.window
+    print(f"\n=== {mode} (클라이언트 {args.clients}, {elapsed:.1f}초 = {windows:.1f} window) ===")
+    for kind, limit in ((READ, args.read_limit), (WRITE, args.write_limit)):
+        rate = server.accepted[kind] / windows
+        print(
+            f"  {kind:<5} 성공 {server.accepted[kind]:>5}  "
+            f"window당 {rate:6.1f}/{limit} ({rate / limit:6.1%})  "
+            f"429 {server.rejected[kind]:>4}"
+        )
+    print(f"  실패한 호출 (재시도 소진/429): {len(errors)}")
+
+    if shared_path:
+        os.remove(shared_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sheets 요청 스케줄러 처리량 벤치마크")
+    parser.add_argument("--mode", choices=MODES + ("all",), default="all", help="비교할 방식")
+    parser.add_argument("--clients", type=int, default=2, help="동시 클라이언트(데몬) 수")
+    parser.add_argument("--read-limit", type=int, default=60, help="window당 읽기 한도")
+    parser.add_argument("--write-limit", type=int, default=60, help="window당 쓰기 한도")
+    parser.add_argument("--window", type=float, default=6.0, help="한도 구간 (초, 실제는 60)")
+    parser.add_argument("--windows", type=int, default=3, help="측정할 window 수")
+    parser.add_argument("--latency", type=float, default=0.005, help="가짜 API 응답 지연 (초)")
+    args = parser.parse_args()
+
+    for mode in MODES if args.mode == "all" else (args.mode,):
+        run(mode, args)
+
+
+if __name__ == "__main__":
+    main()
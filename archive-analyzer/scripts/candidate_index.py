@@ -0,0 +1,190 @@
+"""클립 매칭용 후보 인덱스 (blocking)
+
+clip_matcher.py, match_by_path.py의 매칭 전략이 클립마다 전체 파일을
+선형 탐색하지 않도록 후보 집합을 좁혀 주는 공용 인덱스입니다.
+
+- 경로 컴포넌트 인덱스: 경로 부분 문자열 포함 관계(양방향)의 후보
+- 복합 키: (이벤트, 연도, Day) 등 임의 튜플 키 → 파일 목록
+- 토큰 포스팅 + IDF: 공유 토큰의 IDF 합으로 퍼지 스코어링 후보 선별
+- trigram 포스팅: 파일명 부분 문자열 검사(선수명, 이벤트 패턴 등) 후보
+- 조건부 부분집합 캐시: 클립과 무관한 필터(Main Event 파일 등)를 한 번만 계산
+
+경로/trigram 후보는 "조건을 만족할 수 있는 파일"의 상위집합이고 모든 결과는
+등록 순서로 정렬되므로, 호출자가 원래 조건을 다시 적용하면 선형 탐색과
+같은 결과(첫 매칭 우선 등)를 얻습니다. 토큰/IDF 후보(ranked)만 근사입니다.
+
+FullScanIndex는 블로킹 없이 항상 전체 목록을 돌려주는 기준 구현입니다
+(scripts/benchmark_matcher.py에서 결과 비교용).
+"""
+
+import math
+from collections import defaultdict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set
+
+PATH_SEP = "\\"
+GRAM_SIZE = 3
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i : i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class CandidateIndex:
+    """파일 후보 인덱스 (doc_id는 등록 순서를 가짐)"""
+
+    def __init__(self):
+        self.docs: Dict[Hashable, Any] = {}
+        self._order: Dict[Hashable, int] = {}
+
+        # 경로 컴포넌트 → 그 컴포넌트를 포함하는 문서
+        self._components: Dict[str, List[Hashable]] = defaultdict(list)
+        # 경로의 마지막 내부 컴포넌트 → 문서 (문서 경로가 검색 경로에 포함되는 경우용)
+        self._path_keys: Dict[str, List[Hashable]] = defaultdict(list)
+        self._keyless: List[Hashable] = []
+
+        self._keys: Dict[tuple, List[Hashable]] = defaultdict(list)
+        self._tokens: Dict[str, List[Hashable]] = defaultdict(list)
+        self._grams: Dict[str, Set[Hashable]] = defaultdict(set)
+
+        self._subsets: Dict[Hashable, List[Hashable]] = {}
+        self._subset_ids: Dict[Hashable, FrozenSet[Hashable]] = {}
+        self._subset_docs: Dict[Hashable, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(
+        self,
+        doc_id: Hashable,
+        doc: Any = None,
+        path: str = "",
+        tokens: Iterable[str] = (),
+        keys: Iterable[tuple] = (),
+        texts: Iterable[str] = (),
+    ) -> None:
+        """문서 등록
+
+        Args:
+            doc_id: 문서 ID
+            doc: 원본 객체 (docs[doc_id]로 조회)
+            path: 정규화된 경로 (구분자 '\\', 호출자가 대소문자 정규화)
+            tokens: 검색 토큰 (IDF 계산 대상)
+            keys: 복합 키 튜플 목록
+            texts: 부분 문자열 검사 대상 문자열 (trigram 포스팅)
+        """
+        self._order[doc_id] = len(self._order)
+        self.docs[doc_id] = doc
+
+        if path:
+            parts = path.split(PATH_SEP)
+            for component in {p for p in parts if p}:
+                self._components[component].append(doc_id)
+            interior = [p for p in parts[1:-1] if p]
+            if interior:
+                self._path_keys[interior[-1]].append(doc_id)
+            else:
+                self._keyless.append(doc_id)
+
+        for key in set(keys):
+            self._keys[key].append(doc_id)
+        for token in set(tokens):
+            self._tokens[token].append(doc_id)
+        for text in texts:
+            for gram in _grams(text):
+                self._grams[gram].add(doc_id)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def all_ids(self) -> List[Hashable]:
+        return list(self._order)
+
+    def ordered(self, ids: Iterable[Hashable], within: Optional[FrozenSet] = None) -> List[Hashable]:
+        """등록 순서로 정렬 (within이 있으면 그 집합으로 제한)"""
+        if within is not None:
+            ids = (doc_id for doc_id in ids if doc_id in within)
+        return sorted(ids, key=self._order.__getitem__)
+
+    def lookup(self, key: tuple) -> List[Hashable]:
+        """복합 키 조회 (등록 순서)"""
+        return self._keys.get(key, [])
+
+    def subset(self, name: Hashable, predicate: Callable[[Any], bool]) -> List[Hashable]:
+        """predicate(doc)를 만족하는 문서 ID 목록 (이름별로 한 번만 계산)"""
+        if name not in self._subsets:
+            self._subsets[name] = [
+                doc_id for doc_id, doc in self.docs.items() if predicate(doc)
+            ]
+            self._subset_ids[name] = frozenset(self._subsets[name])
+            self._subset_docs[name] = [self.docs[doc_id] for doc_id in self._subsets[name]]
+        return self._subsets[name]
+
+    def subset_ids(self, name: Hashable, predicate: Callable[[Any], bool]) -> FrozenSet[Hashable]:
+        self.subset(name, predicate)
+        return self._subset_ids[name]
+
+    def subset_docs(self, name: Hashable, predicate: Callable[[Any], bool]) -> List[Any]:
+        self.subset(name, predicate)
+        return self._subset_docs[name]
+
+    def path_candidates(self, search_path: str) -> List[Hashable]:
+        """경로가 search_path를 포함하거나 search_path에 포함될 수 있는 문서
+
+        search_path가 문서 경로에 포함되면 search_path의 내부 컴포넌트(양쪽이
+        구분자로 닫힌 컴포넌트)는 모두 문서 경로의 컴포넌트이고, 반대로 문서 경로가
+        search_path에 포함되면 문서의 내부 컴포넌트가 search_path의 컴포넌트입니다.
+        """
+        parts = search_path.split(PATH_SEP)
+        candidates: Set[Hashable] = set(self._keyless)
+
+        interior = [p for p in parts[1:-1] if p]
+        if interior:
+            rarest = min(interior, key=lambda p: len(self._components.get(p, ())))
+            candidates.update(self._components.get(rarest, ()))
+        else:
+            candidates.update(self._order)
+
+        for component in {p for p in parts if p}:
+            candidates.update(self._path_keys.get(component, ()))
+
+        return self.ordered(candidates)
+
+    def substring_candidates(self, needle: str) -> Set[Hashable]:
+        """texts 중 하나에 needle을 포함할 수 있는 문서 (순서 없음)"""
+        if len(needle) < GRAM_SIZE:
+            return set(self._order)
+        postings = sorted((self._grams.get(g, set()) for g in _grams(needle)), key=len)
+        if not postings[0]:
+            return set()
+        return set(postings[0]).intersection(*postings[1:])
+
+    def idf(self, token: str) -> float:
+        df = len(self._tokens.get(token, ()))
+        return math.log((len(self._order) + 1) / (df + 1)) + 1.0
+
+    def ranked(self, tokens: Iterable[str], limit: int) -> List[Hashable]:
+        """쿼리 토큰을 공유하는 문서를 IDF 합 순으로 최대 limit개 (동점은 등록 순서)"""
+        scores: Dict[Hashable, float] = defaultdict(float)
+        for token in set(tokens):
+            postings = self._tokens.get(token)
+            if not postings:
+                continue
+            weight = self.idf(token)
+            for doc_id in postings:
+                scores[doc_id] += weight
+        ranked = sorted(scores, key=lambda d: (-scores[d], self._order[d]))
+        return ranked[:limit]
+
+
+class FullScanIndex(CandidateIndex):
+    """블로킹 없는 기준 구현 (후보 조회가 항상 전체 문서 반환)"""
+
+    def path_candidates(self, search_path: str) -> List[Hashable]:
+        return self.all_ids()
+
+    def substring_candidates(self, needle: str) -> Set[Hashable]:
+        return set(self._order)
+
+    def ranked(self, tokens: Iterable[str], limit: int) -> List[Hashable]:
+        return self.all_ids()
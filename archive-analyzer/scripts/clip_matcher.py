@@ -14,6 +14,13 @@
 - MEDIUM (0.6-0.85): 높은 신뢰도 복수 후보
 - LOW (0.4-0.6): 검토 필요
 - REVIEW (<0.4): 수동 검토 필수
+
+후보 선별은 candidate_index.CandidateIndex(경로 컴포넌트, 복합 키, 토큰 IDF,
+trigram)를 사용하며, 전략별 소요 시간은 strategy_times에 누적됩니다.
+파일별 정규화/추출 결과는 matcher_cache.FeatureCache(archive.matcher.db)에 저장되어
+바뀐 행만 다시 계산합니다.
+배치 모드(match_all_batch, --batch)는 batch_fuzzy의 process.cdist 점수 행렬로
+같은 후보 풀의 클립을 한 번에 스코어링합니다.
 """
 
 import sys
@@ -21,6 +28,7 @@ import os
 import re
 import csv
 import sqlite3
+import time
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Tuple
@@ -28,6 +36,11 @@ from difflib import SequenceMatcher
 from collections import defaultdict
 from enum import Enum
 
+from batch_fuzzy import BATCH_AVAILABLE, DEFAULT_MAX_CELLS, batch_top_k
+from candidate_index import CandidateIndex
+from matcher_cache import FeatureCache, FeatureRow, Features, cache_path_for
+from parallel_pool import chunk_indices, worker_pool
+
 # RapidFuzz import
 try:
     from rapidfuzz import fuzz, process
@@ -185,11 +198,29 @@ class FileInfo:
     day: str = ""
 
 
+# approximate_pool: 전체 파일 대상 퍼지 검색 대신 IDF 순위로 선별할 후보 수
+FUZZY_POOL_LIMIT = 500
+
+# 파일 특성 캐시 버전 (_file_features 추출 로직 변경 시 올림)
+FEATURE_VERSION = "1"
+
+
 class ClipMatcher:
     """클립-파일 매칭 엔진"""
 
-    def __init__(self, db_path: str = "archive.db"):
+    def __init__(self, db_path: str = "archive.db", index_factory=CandidateIndex,
+                 feature_cache: Optional[str] = "", approximate_pool: bool = False):
+        """
+        Args:
+            db_path: archive.db 경로
+            index_factory: 후보 인덱스 클래스
+            feature_cache: 파일 특성 캐시 경로 ("" = archive.matcher.db, None = 사용 안 함)
+            approximate_pool: 후보 풀이 작을 때 전체 파일 대신 IDF 상위
+                FUZZY_POOL_LIMIT개로 퍼지 검색 (빠르지만 결과가 달라질 수 있음)
+        """
         self.db_path = db_path
+        self.feature_cache = cache_path_for(db_path) if feature_cache == "" else feature_cache
+        self.approximate_pool = approximate_pool
         self.files: Dict[int, FileInfo] = {}
         self.clips: List[ClipInfo] = []
 
@@ -197,6 +228,11 @@ class ClipMatcher:
         self.by_event_number: Dict[str, List[int]] = defaultdict(list)
         self.by_year: Dict[str, List[int]] = defaultdict(list)
         self.by_token: Dict[str, List[int]] = defaultdict(list)
+        self.index: CandidateIndex = index_factory()
+        self._choice_texts: Dict[int, str] = {}
+
+        # 전략별 누적 소요 시간 (초)
+        self.strategy_times: Dict[str, float] = defaultdict(float)
 
         self._load_files()
 
@@ -252,8 +288,33 @@ class ClipMatcher:
             return 'final'
         return ""
 
-    def _load_files(self):
-        """DB에서 파일 정보 로드 및 인덱싱"""
+    def _file_features(self, filename: str, path: str) -> Features:
+        """파일 특성 추출 (정규화 이름, 토큰, 연도, 이벤트 번호, Day)
+
+        추출 로직을 바꾸면 FEATURE_VERSION을 올려 캐시를 다시 계산하게 합니다.
+        """
+        full_text = f"{filename} {path}"
+        return (
+            self._normalize_text(full_text),
+            self._extract_tokens(full_text),
+            self._extract_year(full_text),
+            self._extract_event_number(full_text),
+            self._extract_day(full_text),
+        )
+
+    def _load_feature_rows(self) -> List[FeatureRow]:
+        """영상 파일 특성 로드 (캐시가 있으면 바뀐 행만 다시 계산)"""
+        if self.feature_cache:
+            try:
+                with FeatureCache(self.db_path, self.feature_cache, FEATURE_VERSION) as cache:
+                    refreshed, removed = cache.refresh(self._file_features)
+                    rows = cache.load()
+                print(f"Feature cache: {refreshed} refreshed, {removed} removed "
+                      f"({self.feature_cache})")
+                return rows
+            except sqlite3.Error as e:
+                print(f"Warning: feature cache unavailable ({e}), extracting in memory")
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -263,16 +324,17 @@ class ClipMatcher:
             WHERE file_type = 'video'
         ''')
 
-        for row in cursor.fetchall():
-            file_id, filename, path, parent_folder = row
+        rows = [
+            (file_id, filename, path, parent_folder, *self._file_features(filename, path))
+            for file_id, filename, path, parent_folder in cursor.fetchall()
+        ]
+        conn.close()
+        return rows
 
-            # 정규화 및 토큰 추출
-            full_text = f"{filename} {path}"
-            normalized = self._normalize_text(full_text)
-            tokens = self._extract_tokens(full_text)
-            year = self._extract_year(full_text)
-            event_num = self._extract_event_number(full_text)
-            day = self._extract_day(full_text)
+    def _load_files(self):
+        """DB에서 파일 정보 로드 및 인덱싱"""
+        for row in self._load_feature_rows():
+            file_id, filename, path, parent_folder, normalized, tokens, year, event_num, day = row
 
             file_info = FileInfo(
                 id=file_id,
@@ -296,7 +358,20 @@ class ClipMatcher:
             for token in tokens:
                 self.by_token[token].append(file_id)
 
-        conn.close()
+            self.index.add(
+                file_id,
+                file_info,
+                path=path.replace('/', '\\').lower(),
+                tokens=tokens,
+                keys=[
+                    ('event', event_num),
+                    ('event', event_num, year),
+                    ('event', event_num, year, day),
+                    ('event_day', event_num, day),
+                ] if event_num else [],
+                texts=[filename.lower()],
+            )
+
         print(f"Loaded {len(self.files)} video files")
         print(f"Indexed {len(self.by_event_number)} event numbers")
 
@@ -308,8 +383,8 @@ class ClipMatcher:
         # 경로 정규화
         search_path = clip.nas_folder_link.replace('/', '\\').lower()
 
-        for file_id, file_info in self.files.items():
-            file_path = file_info.path.replace('/', '\\').lower()
+        for file_id in self.index.path_candidates(search_path):
+            file_path = self.files[file_id].path.replace('/', '\\').lower()
             if search_path in file_path or file_path in search_path:
                 return (file_id, 1.0)
 
@@ -338,16 +413,18 @@ class ClipMatcher:
             player_names = [p.strip().lower() for p in re.split(r'\s+vs\s+', clip.players, flags=re.IGNORECASE)]
 
         # 2024 파일 패턴으로 검색
-        candidates = []
-        for file_id, file_info in self.files.items():
-            fname_lower = file_info.filename.lower()
+        ev_patterns = [f'ev-{event_num}', f'ev{event_num}', f'-{event_num}-']
+        pool = set().union(*(self.index.substring_candidates(p) for p in ev_patterns))
+        files_2024 = self.index.subset_ids(
+            '2024',
+            lambda f: 'wsop-2024' in f.filename.lower() or '2024' in f.path.lower(),
+        )
 
-            # wsop-2024 패턴 확인
-            if 'wsop-2024' not in fname_lower and '2024' not in file_info.path.lower():
-                continue
+        candidates = []
+        for file_id in self.index.ordered(pool, within=files_2024):
+            fname_lower = self.files[file_id].filename.lower()
 
             # 이벤트 번호 패턴 매칭 (ev-58, ev58 등)
-            ev_patterns = [f'ev-{event_num}', f'ev{event_num}', f'-{event_num}-']
             if not any(p in fname_lower for p in ev_patterns):
                 continue
 
@@ -397,8 +474,12 @@ class ClipMatcher:
         # 연도 필터
         year = clip.source_year or self._extract_year(clip.event_name)
 
+        # 선수명을 포함할 수 있는 파일만 검사
+        pool = set().union(*(self.index.substring_candidates(p) for p in player_names))
+
         candidates = []
-        for file_id, file_info in self.files.items():
+        for file_id in self.index.ordered(pool):
+            file_info = self.files[file_id]
             fname_lower = file_info.filename.lower()
 
             # 연도 필터링
@@ -441,10 +522,7 @@ class ClipMatcher:
             part = part_match.group(1)
 
         # Main Event 파일 후보 검색
-        candidates = []
-        for file_id, file_info in self.files.items():
-            if self._is_main_event(file_info.filename) or self._is_main_event(file_info.path):
-                candidates.append(file_id)
+        candidates = self._main_event_files()
 
         if not candidates:
             return None
@@ -512,20 +590,26 @@ class ClipMatcher:
         if not event_num:
             return None
 
-        candidates = self.by_event_number.get(event_num, [])
+        # (이벤트, 연도, Day) 복합 키로 후보 조회
+        candidates = self.index.lookup(('event', event_num))
 
         if not candidates:
             return None
 
         # 연도 필터링
+        year_applied = False
         if year:
-            year_filtered = [fid for fid in candidates if self.files[fid].year == year]
+            year_filtered = self.index.lookup(('event', event_num, year))
             if year_filtered:
                 candidates = year_filtered
+                year_applied = True
 
         # Day 필터링
         if day:
-            day_filtered = [fid for fid in candidates if self.files[fid].day == day]
+            if year_applied:
+                day_filtered = self.index.lookup(('event', event_num, year, day))
+            else:
+                day_filtered = self.index.lookup(('event_day', event_num, day))
             if day_filtered:
                 candidates = day_filtered
 
@@ -598,6 +682,29 @@ class ClipMatcher:
 
         return None
 
+    def _main_event_files(self) -> List[int]:
+        """Main Event 파일 목록 (클립과 무관하므로 한 번만 계산)"""
+        return self.index.subset(
+            'main_event',
+            lambda f: self._is_main_event(f.filename) or self._is_main_event(f.path),
+        )
+
+    def _run_strategy(self, name: str, strategy, clip: ClipInfo) -> Optional[Tuple[int, float]]:
+        """전략 실행 + 소요 시간 누적"""
+        start = time.perf_counter()
+        try:
+            return strategy(clip)
+        finally:
+            self.strategy_times[name] += time.perf_counter() - start
+
+    def print_strategy_times(self):
+        """전략별 소요 시간 리포트"""
+        total = sum(self.strategy_times.values())
+        print("\n[Strategy Timing]")
+        for name, seconds in sorted(self.strategy_times.items(), key=lambda x: -x[1]):
+            share = seconds / total * 100 if total else 0
+            print(f"  {name:20} {seconds:9.3f}s ({share:5.1f}%)")
+
     def _get_confidence_level(self, score: float, num_candidates: int) -> ConfidenceLevel:
         """점수와 후보 수로 신뢰도 등급 결정"""
         if score >= 0.85 and num_candidates == 1:
@@ -609,57 +716,43 @@ class ClipMatcher:
         else:
             return ConfidenceLevel.REVIEW
 
-    def match_with_candidates(self, clip: ClipInfo, max_candidates: int = 5,
-                               score_cutoff: float = 40.0) -> ClipInfo:
-        """RapidFuzz 기반 다중 후보 매칭
-
-        Args:
-            clip: 매칭할 클립 정보
-            max_candidates: 최대 후보 수 (기본 5개)
-            score_cutoff: 최소 점수 (0-100, 기본 40)
-
-        Returns:
-            후보 목록이 포함된 ClipInfo
-        """
-        if not RAPIDFUZZ_AVAILABLE:
-            # Fallback to original matching
-            return self.match_clip(clip)
-
+    def _set_single_match(self, clip: ClipInfo, result: Tuple[int, float], method: str,
+                          level: ConfidenceLevel, score: float, scorer_name: str):
+        """단일 후보 매칭 결과 기록"""
+        file_info = self.files[result[0]]
+        clip.matched_file_id = result[0]
+        clip.match_confidence = result[1]
+        clip.match_method = method
+        clip.confidence_level = level
+        clip.candidates = [MatchCandidate(
+            file_id=result[0],
+            filename=file_info.filename,
+            path=file_info.path,
+            score=score,
+            scorer_name=scorer_name
+        )]
+
+    def _prematch(self, clip: ClipInfo) -> bool:
+        """경로 / 2024 패턴 매칭 (퍼지 검색 전 단계). 매칭되면 True"""
         # 1. 정확한 경로 매칭 시도 (최우선)
-        result = self._match_by_path(clip)
+        result = self._run_strategy('path', self._match_by_path, clip)
         if result:
-            file_info = self.files[result[0]]
-            clip.matched_file_id = result[0]
-            clip.match_confidence = result[1]
-            clip.match_method = "path"
-            clip.confidence_level = ConfidenceLevel.HIGH
-            clip.candidates = [MatchCandidate(
-                file_id=result[0],
-                filename=file_info.filename,
-                path=file_info.path,
-                score=100.0,
-                scorer_name="exact_path"
-            )]
-            return clip
+            self._set_single_match(clip, result, "path", ConfidenceLevel.HIGH, 100.0, "exact_path")
+            return True
 
         # 1.5. 2024 PokerGo 클립 패턴 매칭
-        result = self._match_2024_pattern(clip)
+        result = self._run_strategy('2024_pattern', self._match_2024_pattern, clip)
         if result:
-            file_info = self.files[result[0]]
-            clip.matched_file_id = result[0]
-            clip.match_confidence = result[1]
-            clip.match_method = "2024_pattern"
-            clip.confidence_level = ConfidenceLevel.HIGH if result[1] >= 0.85 else ConfidenceLevel.MEDIUM
-            clip.candidates = [MatchCandidate(
-                file_id=result[0],
-                filename=file_info.filename,
-                path=file_info.path,
-                score=result[1] * 100,
-                scorer_name="2024_pattern"
-            )]
-            return clip
+            level = ConfidenceLevel.HIGH if result[1] >= 0.85 else ConfidenceLevel.MEDIUM
+            self._set_single_match(
+                clip, result, "2024_pattern", level, result[1] * 100, "2024_pattern"
+            )
+            return True
 
-        # 2. 검색 쿼리 구성
+        return False
+
+    def _search_query(self, clip: ClipInfo) -> str:
+        """퍼지 검색 쿼리 구성 (이벤트명 + 이벤트 번호 + 선수)"""
         search_parts = []
         if clip.event_name:
             search_parts.append(clip.event_name)
@@ -667,13 +760,10 @@ class ClipMatcher:
             search_parts.append(f"Event {clip.event_number}")
         if clip.players:
             search_parts.append(clip.players)
+        return " ".join(search_parts)
 
-        search_query = " ".join(search_parts)
-        if not search_query.strip():
-            clip.confidence_level = ConfidenceLevel.UNMATCHED
-            return clip
-
-        # 3. 연도/이벤트 기반 사전 필터링으로 검색 범위 축소
+    def _candidate_pool(self, clip: ClipInfo, search_query: str) -> set:
+        """연도/이벤트 기반 사전 필터링으로 퍼지 검색 범위 축소"""
         year = clip.source_year or self._extract_year(clip.event_name)
         event_num = self._extract_event_number(clip.event_number + " " + clip.event_name)
 
@@ -686,9 +776,7 @@ class ClipMatcher:
 
         # Main Event의 경우 특별 처리
         if self._is_main_event(clip.event_name):
-            for fid, finfo in self.files.items():
-                if self._is_main_event(finfo.filename) or self._is_main_event(finfo.path):
-                    candidate_pool.add(fid)
+            candidate_pool.update(self._main_event_files())
 
         # 연도로 필터링 (후보 풀이 비어있으면 연도 기준으로 시작)
         if not candidate_pool and year:
@@ -701,58 +789,38 @@ class ClipMatcher:
                 candidate_pool.update(self.by_token.get(token, [])[:100])
 
         # 후보 풀이 너무 작으면 전체 검색
+        # (approximate_pool: IDF 순위 상위 파일로 먼저 확장, 그래도 부족하면 전체 검색)
+        if self.approximate_pool and len(candidate_pool) < 10:
+            candidate_pool.update(
+                self.index.ranked(self._extract_tokens(search_query), FUZZY_POOL_LIMIT)
+            )
         if len(candidate_pool) < 10:
             candidate_pool = set(self.files.keys())
 
-        # 4. RapidFuzz로 다중 후보 검색
-        choices = {}
-        for fid in candidate_pool:
-            if fid in self.files:
-                finfo = self.files[fid]
-                # 파일명 + 상위 폴더를 검색 대상으로
-                choices[fid] = f"{finfo.filename} {finfo.parent_folder}"
-
-        if not choices:
-            clip.confidence_level = ConfidenceLevel.UNMATCHED
-            return clip
+        return candidate_pool
 
-        # 여러 스코어러로 매칭
-        all_matches = []
+    def _choice_text(self, file_id: int) -> str:
+        """퍼지 검색 대상 문자열 (파일명 + 상위 폴더, 파일별로 한 번만 생성)"""
+        text = self._choice_texts.get(file_id)
+        if text is None:
+            finfo = self.files[file_id]
+            text = self._choice_texts[file_id] = f"{finfo.filename} {finfo.parent_folder}"
+        return text
 
-        # Token Set Ratio: 단어 순서 무관, 부분 집합 매칭에 강함
-        matches = process.extract(
-            search_query,
-            choices,
-            scorer=fuzz.token_set_ratio,
-            limit=max_candidates * 2,
-            score_cutoff=score_cutoff
-        )
-        for choice, score, key in matches:
-            all_matches.append((key, score, "token_set_ratio"))
-
-        # Token Sort Ratio: 단어 순서 정규화 후 비교
-        matches = process.extract(
-            search_query,
-            choices,
-            scorer=fuzz.token_sort_ratio,
-            limit=max_candidates,
-            score_cutoff=score_cutoff
-        )
-        for choice, score, key in matches:
-            all_matches.append((key, score, "token_sort_ratio"))
-
-        # Partial Ratio: 부분 문자열 매칭
-        matches = process.extract(
-            search_query,
-            choices,
-            scorer=fuzz.partial_ratio,
-            limit=max_candidates,
-            score_cutoff=score_cutoff
-        )
-        for choice, score, key in matches:
-            all_matches.append((key, score, "partial_ratio"))
+    def _fuzzy_scorers(self, max_candidates: int) -> List[Tuple[str, object, int]]:
+        """다중 후보 매칭 스코어러: (이름, 스코어러, 후보 수)"""
+        return [
+            # Token Set Ratio: 단어 순서 무관, 부분 집합 매칭에 강함
+            ("token_set_ratio", fuzz.token_set_ratio, max_candidates * 2),
+            # Token Sort Ratio: 단어 순서 정규화 후 비교
+            ("token_sort_ratio", fuzz.token_sort_ratio, max_candidates),
+            # Partial Ratio: 부분 문자열 매칭
+            ("partial_ratio", fuzz.partial_ratio, max_candidates),
+        ]
 
-        # 5. 후보 통합 및 정렬
+    def _rank_candidates(self, clip: ClipInfo, all_matches: List[Tuple[int, float, str]],
+                         max_candidates: int):
+        """스코어러별 매칭 (file_id, score, scorer)을 후보로 통합해 clip.candidates에 기록"""
         candidate_scores: Dict[int, List[Tuple[float, str]]] = defaultdict(list)
         for fid, score, scorer in all_matches:
             candidate_scores[fid].append((score, scorer))
@@ -778,7 +846,8 @@ class ClipMatcher:
         final_candidates.sort(key=lambda x: -x.score)
         clip.candidates = final_candidates[:max_candidates]
 
-        # 6. 신뢰도 등급 결정 및 최종 매칭
+    def _resolve_candidates(self, clip: ClipInfo, score_cutoff: float):
+        """후보로 신뢰도 등급 결정 및 최종 매칭 (후보가 없으면 선수명 매칭)"""
         if clip.candidates:
             top_score = clip.candidates[0].score / 100.0  # 0-1 범위로 변환
             clip.match_confidence = top_score
@@ -795,34 +864,153 @@ class ClipMatcher:
                 top_score,
                 len([c for c in clip.candidates if c.score >= score_cutoff])
             )
+            return
+
+        # Fallback: 선수명 기반 매칭 시도
+        result = self._run_strategy('players', self._match_by_players, clip)
+        if result:
+            self._set_single_match(
+                clip, result, "players", ConfidenceLevel.LOW, result[1] * 100, "players"
+            )
+            clip.needs_review = True  # 선수명 매칭은 항상 검토 필요
         else:
-            # 7. Fallback: 선수명 기반 매칭 시도
-            result = self._match_by_players(clip)
-            if result:
-                file_info = self.files[result[0]]
-                clip.matched_file_id = result[0]
-                clip.match_confidence = result[1]
-                clip.match_method = "players"
-                clip.confidence_level = ConfidenceLevel.LOW
-                clip.candidates = [MatchCandidate(
-                    file_id=result[0],
-                    filename=file_info.filename,
-                    path=file_info.path,
-                    score=result[1] * 100,
-                    scorer_name="players"
-                )]
-                clip.needs_review = True  # 선수명 매칭은 항상 검토 필요
-            else:
-                clip.confidence_level = ConfidenceLevel.UNMATCHED
-                clip.match_method = "unmatched"
+            clip.confidence_level = ConfidenceLevel.UNMATCHED
+            clip.match_method = "unmatched"
+
+    def match_with_candidates(self, clip: ClipInfo, max_candidates: int = 5,
+                               score_cutoff: float = 40.0) -> ClipInfo:
+        """RapidFuzz 기반 다중 후보 매칭
+
+        Args:
+            clip: 매칭할 클립 정보
+            max_candidates: 최대 후보 수 (기본 5개)
+            score_cutoff: 최소 점수 (0-100, 기본 40)
+
+        Returns:
+            후보 목록이 포함된 ClipInfo
+        """
+        if not RAPIDFUZZ_AVAILABLE:
+            # Fallback to original matching
+            return self.match_clip(clip)
+
+        if self._prematch(clip):
+            return clip
+
+        # 2. 검색 쿼리 구성
+        fuzzy_start = time.perf_counter()
+        search_query = self._search_query(clip)
+        if not search_query.strip():
+            clip.confidence_level = ConfidenceLevel.UNMATCHED
+            return clip
+
+        # 3. 연도/이벤트 기반 후보 풀
+        candidate_pool = self._candidate_pool(clip, search_query)
+
+        # 4. RapidFuzz로 다중 후보 검색 (ID 순 - 동점 순서를 배치 모드와 맞춤)
+        choices = {
+            fid: self._choice_text(fid) for fid in sorted(candidate_pool) if fid in self.files
+        }
+        if not choices:
+            clip.confidence_level = ConfidenceLevel.UNMATCHED
+            return clip
+
+        # 여러 스코어러로 매칭
+        all_matches = []
+        for scorer_name, scorer, limit in self._fuzzy_scorers(max_candidates):
+            matches = process.extract(
+                search_query,
+                choices,
+                scorer=scorer,
+                limit=limit,
+                score_cutoff=score_cutoff
+            )
+            for choice, score, key in matches:
+                all_matches.append((key, score, scorer_name))
 
+        # 5. 후보 통합 및 정렬
+        self._rank_candidates(clip, all_matches, max_candidates)
+        self.strategy_times['rapidfuzz'] += time.perf_counter() - fuzzy_start
+
+        # 6. 신뢰도 등급 결정 및 최종 매칭
+        self._resolve_candidates(clip, score_cutoff)
         return clip
 
+    def match_all_batch(self, clips: List[ClipInfo], max_candidates: int = 5,
+                        score_cutoff: float = 40.0,
+                        max_cells: int = DEFAULT_MAX_CELLS) -> Dict[str, int]:
+        """배치 다중 후보 매칭 (match_with_candidates와 같은 후보 풀/스코어러)
+
+        경로/2024 패턴 매칭 후 남은 클립을 후보 풀이 같은 것끼리 묶고, 그룹마다
+        process.cdist(workers=-1)로 쿼리 x 후보 점수 행렬을 행 청크 단위로 계산해
+        스코어러별 상위 k개를 고릅니다. 선택지 문자열은 파일별로 한 번만 만듭니다.
+
+        Args:
+            clips: 매칭할 클립 목록
+            max_candidates: 최대 후보 수
+            score_cutoff: 최소 점수 (0-100)
+            max_cells: 청크당 점수 행렬 최대 셀 수 (최대 메모리 제한)
+
+        Returns:
+            매칭 방법별 통계
+        """
+        if not (RAPIDFUZZ_AVAILABLE and BATCH_AVAILABLE):
+            for clip in clips:
+                self.match_with_candidates(clip, max_candidates, score_cutoff)
+            return self._method_stats(clips)
+
+        # 1. 퍼지 검색 대상 클립을 후보 풀별로 그룹화
+        groups: Dict[Tuple[int, ...], List[Tuple[ClipInfo, str]]] = defaultdict(list)
+        for clip in clips:
+            if self._prematch(clip):
+                continue
+
+            prepare_start = time.perf_counter()
+            search_query = self._search_query(clip)
+            pool = ()
+            if search_query.strip():
+                pool = tuple(sorted(
+                    fid for fid in self._candidate_pool(clip, search_query) if fid in self.files
+                ))
+            self.strategy_times['batch_prepare'] += time.perf_counter() - prepare_start
+
+            if not pool:
+                clip.confidence_level = ConfidenceLevel.UNMATCHED
+                continue
+            groups[pool].append((clip, search_query))
+
+        # 2. 그룹별 점수 행렬 (행 청크) → 스코어러별 상위 k개
+        for pool, members in groups.items():
+            choices = [self._choice_text(fid) for fid in pool]
+            queries = [query for _, query in members]
+            all_matches: List[List[Tuple[int, float, str]]] = [[] for _ in members]
+
+            for scorer_name, scorer, limit in self._fuzzy_scorers(max_candidates):
+                cdist_start = time.perf_counter()
+                top = batch_top_k(
+                    queries, choices, scorer,
+                    k=limit, score_cutoff=score_cutoff, max_cells=max_cells,
+                )
+                self.strategy_times[f'cdist_{scorer_name}'] += time.perf_counter() - cdist_start
+                for matches, row in zip(all_matches, top):
+                    matches.extend((pool[j], score, scorer_name) for j, score in row)
+
+            for (clip, _), matches in zip(members, all_matches):
+                self._rank_candidates(clip, matches, max_candidates)
+                self._resolve_candidates(clip, score_cutoff)
+
+        return self._method_stats(clips)
+
+    def _method_stats(self, clips: List[ClipInfo]) -> Dict[str, int]:
+        stats: Dict[str, int] = defaultdict(int)
+        for clip in clips:
+            stats[clip.match_method] += 1
+        return dict(stats)
+
     def match_clip(self, clip: ClipInfo) -> ClipInfo:
         """단일 클립 매칭 (여러 전략 순차 적용)"""
 
         # 1. 경로 기반 매칭 (가장 정확)
-        result = self._match_by_path(clip)
+        result = self._run_strategy('path', self._match_by_path, clip)
         if result:
             clip.matched_file_id = result[0]
             clip.match_confidence = result[1]
@@ -830,7 +1018,7 @@ class ClipMatcher:
             return clip
 
         # 2. Main Event 전용 매칭
-        result = self._match_main_event(clip)
+        result = self._run_strategy('main_event', self._match_main_event, clip)
         if result:
             clip.matched_file_id = result[0]
             clip.match_confidence = result[1]
@@ -838,7 +1026,7 @@ class ClipMatcher:
             return clip
 
         # 3. 이벤트 번호 기반 매칭
-        result = self._match_by_event(clip)
+        result = self._run_strategy('event', self._match_by_event, clip)
         if result:
             clip.matched_file_id = result[0]
             clip.match_confidence = result[1]
@@ -846,7 +1034,7 @@ class ClipMatcher:
             return clip
 
         # 4. Fuzzy 매칭
-        result = self._match_by_fuzzy(clip)
+        result = self._run_strategy('fuzzy', self._match_by_fuzzy, clip)
         if result:
             clip.matched_file_id = result[0]
             clip.match_confidence = result[1]
@@ -956,30 +1144,73 @@ class ClipMatcher:
 
         return clips
 
-    def match_all(self, clips: List[ClipInfo], use_rapidfuzz: bool = True) -> Dict[str, int]:
+    def _match_one(self, clip: ClipInfo, use_rapidfuzz: bool, max_candidates: int,
+                   score_cutoff: float) -> ClipInfo:
+        if use_rapidfuzz and RAPIDFUZZ_AVAILABLE:
+            return self.match_with_candidates(clip, max_candidates, score_cutoff)
+        return self.match_clip(clip)
+
+    def match_all(self, clips: List[ClipInfo], use_rapidfuzz: bool = True,
+                  max_candidates: int = 5, score_cutoff: float = 40.0,
+                  workers: int = 1) -> Dict[str, int]:
         """모든 클립 매칭 및 통계 반환
 
         Args:
             clips: 매칭할 클립 목록
             use_rapidfuzz: True면 다중 후보 매칭, False면 기존 단일 매칭
+            max_candidates: 최대 후보 수 (다중 후보 매칭)
+            score_cutoff: 최소 점수 (다중 후보 매칭)
+            workers: 프로세스 수 (2 이상이면 프로세스 풀, 결과 순서는 동일)
 
         Returns:
             매칭 방법별 통계
         """
-        stats = defaultdict(int)
+        if workers > 1 and len(clips) > 1:
+            self._match_parallel(clips, workers, use_rapidfuzz, max_candidates, score_cutoff)
+            return self._method_stats(clips)
 
         for i, clip in enumerate(clips):
-            if use_rapidfuzz and RAPIDFUZZ_AVAILABLE:
-                self.match_with_candidates(clip)
-            else:
-                self.match_clip(clip)
-            stats[clip.match_method] = stats.get(clip.match_method, 0) + 1
+            self._match_one(clip, use_rapidfuzz, max_candidates, score_cutoff)
 
             # 진행률 출력 (100개마다)
             if (i + 1) % 100 == 0:
                 print(f"  Processed {i + 1}/{len(clips)} clips...")
 
-        return dict(stats)
+        return self._method_stats(clips)
+
+    def _warm_caches(self):
+        """포크 전에 클립과 무관한 지연 캐시를 채워 워커가 공유하게 함"""
+        self._main_event_files()
+        for file_id in self.files:
+            self._choice_text(file_id)
+
+    def _match_parallel(self, clips: List[ClipInfo], workers: int, use_rapidfuzz: bool,
+                        max_candidates: int, score_cutoff: float):
+        """프로세스 풀 매칭 (클립 청크 단위, 결과는 원래 ClipInfo 객체에 반영)"""
+        global _worker_matcher, _worker_clips
+
+        self._warm_caches()
+        _worker_matcher, _worker_clips = self, clips
+        initargs = (
+            self.db_path, type(self.index), self.feature_cache, self.approximate_pool, clips
+        )
+        tasks = [
+            (chunk, use_rapidfuzz, max_candidates, score_cutoff)
+            for chunk in chunk_indices(range(len(clips)), workers)
+        ]
+
+        done = 0
+        try:
+            with worker_pool(workers, _init_worker, initargs) as pool:
+                for results, times in pool.imap(_match_chunk, tasks):
+                    for i, matched in results:
+                        clips[i].__dict__.update(matched.__dict__)
+                    for name, seconds in times.items():
+                        self.strategy_times[name] += seconds
+                    done += len(results)
+                    print(f"  Processed {done}/{len(clips)} clips ({workers} workers)...")
+        finally:
+            _worker_matcher, _worker_clips = None, []
 
     def match_all_with_review(self, clips: List[ClipInfo]) -> Dict[str, List[ClipInfo]]:
         """모든 클립을 매칭하고 신뢰도 등급별로 분류
@@ -1409,6 +1640,31 @@ class ClipMatcher:
                     print(f"    {marker} [{cand.file_id}] {cand.filename[:40]}... (score: {cand.score:.1f})")
 
 
+# 프로세스 풀 워커 상태 (fork: 부모 매처를 copy-on-write로 공유, spawn: _init_worker로 생성)
+_worker_matcher: Optional[ClipMatcher] = None
+_worker_clips: List[ClipInfo] = []
+
+
+def _init_worker(db_path: str, index_factory, feature_cache: Optional[str],
+                 approximate_pool: bool, clips: List[ClipInfo]):
+    """spawn 워커 초기화 (파일 특성 캐시로 인덱스 재구성)"""
+    global _worker_matcher, _worker_clips
+    _worker_matcher = ClipMatcher(db_path, index_factory, feature_cache, approximate_pool)
+    _worker_clips = clips
+
+
+def _match_chunk(task) -> Tuple[List[Tuple[int, ClipInfo]], Dict[str, float]]:
+    """워커: 클립 청크 매칭 → ((인덱스, 매칭된 ClipInfo) 목록, 이 청크의 전략별 소요 시간)"""
+    indices, use_rapidfuzz, max_candidates, score_cutoff = task
+    matcher = _worker_matcher
+    matcher.strategy_times.clear()
+    results = [
+        (i, matcher._match_one(_worker_clips[i], use_rapidfuzz, max_candidates, score_cutoff))
+        for i in indices
+    ]
+    return results, dict(matcher.strategy_times)
+
+
 def main():
     """메인 함수"""
     import argparse
@@ -1423,6 +1679,13 @@ def main():
     parser.add_argument('--legacy', action='store_true', help="Use legacy matching (without RapidFuzz)")
     parser.add_argument('--max-candidates', type=int, default=5, help="Max candidates per clip (default: 5)")
     parser.add_argument('--score-cutoff', type=float, default=40.0, help="Min score cutoff 0-100 (default: 40)")
+    parser.add_argument('--batch', action='store_true', help="Batch matching with process.cdist (all cores)")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes for matching (default: 1)")
+    parser.add_argument('--no-feature-cache', action='store_true',
+                        help="Extract file features in memory (skip archive.matcher.db)")
+    parser.add_argument('--approx-pool', action='store_true',
+                        help=f"Fuzzy search top {FUZZY_POOL_LIMIT} IDF-ranked files instead of "
+                             "all files when the candidate pool is small (faster, approximate)")
     args = parser.parse_args()
 
     print("=" * 70)
@@ -1430,7 +1693,8 @@ def main():
     print(f"RapidFuzz: {'Available' if RAPIDFUZZ_AVAILABLE else 'Not Available'}")
     print("=" * 70)
 
-    matcher = ClipMatcher("archive.db")
+    matcher = ClipMatcher("archive.db", feature_cache=None if args.no_feature_cache else "",
+                          approximate_pool=args.approx_pool)
 
     # 검색 모드
     if args.search:
@@ -1463,14 +1727,20 @@ def main():
     # 매칭 실행
     if args.legacy or not RAPIDFUZZ_AVAILABLE:
         print("\nMatching clips (legacy mode)...")
-        stats = matcher.match_all(all_clips, use_rapidfuzz=False)
+        stats = matcher.match_all(all_clips, use_rapidfuzz=False, workers=args.workers)
         matcher.print_results(all_clips)
     else:
-        print(f"\nMatching clips (RapidFuzz, max_candidates={args.max_candidates}, cutoff={args.score_cutoff})...")
-        for clip in all_clips:
-            matcher.match_with_candidates(clip, max_candidates=args.max_candidates, score_cutoff=args.score_cutoff)
+        mode = "batch cdist" if args.batch else "RapidFuzz"
+        print(f"\nMatching clips ({mode}, max_candidates={args.max_candidates}, cutoff={args.score_cutoff})...")
+        if args.batch:
+            matcher.match_all_batch(all_clips, max_candidates=args.max_candidates, score_cutoff=args.score_cutoff)
+        else:
+            matcher.match_all(all_clips, max_candidates=args.max_candidates,
+                              score_cutoff=args.score_cutoff, workers=args.workers)
         matcher.print_results_extended(all_clips)
 
+    matcher.print_strategy_times()
+
     # 리포트 내보내기
     if args.export:
         matcher.export_matched_report(all_clips, "matched_clips.csv")
@@ -138,6 +138,8 @@ def extract_batch_parallel(
     successful = 0
     failed = 0
     skipped = 0
+    bytes_transferred = 0
+    full_downloads = 0
 
     start_time = datetime.now()
 
@@ -165,6 +167,8 @@ def extract_batch_parallel(
             'skipped': skipped,
             'elapsed_seconds': 0,
             'files_per_second': 0,
+            'bytes_transferred': 0,
+            'full_downloads': 0,
         }
 
     # 병렬 처리
@@ -179,6 +183,10 @@ def extract_batch_parallel(
         for future in as_completed(futures):
             file_record, info, error = future.result()
             processed += 1
+            if info:
+                bytes_transferred += info.bytes_transferred
+                if info.probe_method == "full":
+                    full_downloads += 1
 
             if error:
                 failed += 1
@@ -192,6 +200,7 @@ def extract_batch_parallel(
                 if verbose:
                     print(f"\n[{processed}/{total}] SUCCESS: {file_record.filename}")
                     print(f"    {info.video_codec} {info.resolution} | {info.duration_formatted}")
+                    print(f"    {info.probe_method}: {info.bytes_transferred:,} bytes read")
             else:
                 failed += 1
                 if info:
@@ -236,6 +245,8 @@ def extract_batch_parallel(
         'skipped': skipped,
         'elapsed_seconds': elapsed,
         'files_per_second': processed / elapsed if elapsed > 0 else 0,
+        'bytes_transferred': bytes_transferred,
+        'full_downloads': full_downloads,
     }
 
 
@@ -321,6 +332,8 @@ def main():
         print(f"Skipped (existing): {result['skipped']}")
         print(f"Elapsed time: {result['elapsed_seconds']:.1f} seconds")
         print(f"Speed: {result['files_per_second']:.2f} files/second")
+        print(f"Transferred: {result['bytes_transferred'] / (1024**2):.1f} MB "
+              f"(full downloads: {result['full_downloads']})")
         print()
 
         # DB 통계 확인
@@ -14,6 +14,9 @@ from typing import Optional, List, Dict, Any
 # 프로젝트 src 경로 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from batch_fuzzy import BATCH_AVAILABLE, batch_top_k  # noqa: E402
 
 from archive_analyzer.database import Database
 
@@ -167,7 +170,7 @@ def fuzzy_match_file(clip_title: str, file_paths: List[str], threshold: int = 60
     filenames = [Path(p).stem for p in file_paths]
 
     # 클립 제목 정규화
-    clip_normalized = clip_title.lower().replace('-', ' ').replace('_', ' ')
+    clip_normalized = _normalize_title(clip_title)
 
     # 매칭
     result = process.extractOne(
@@ -184,6 +187,33 @@ def fuzzy_match_file(clip_title: str, file_paths: List[str], threshold: int = 60
     return None
 
 
+def _normalize_title(clip_title: str) -> str:
+    return clip_title.lower().replace('-', ' ').replace('_', ' ')
+
+
+def fuzzy_match_files(
+    clip_titles: List[str], file_paths: List[str], threshold: int = 60
+) -> List[Optional[tuple]]:
+    """퍼지 매칭 배치 버전 (fuzzy_match_file과 같은 결과)
+
+    제목과 파일명을 한 번만 정규화하고 process.cdist 점수 행렬(행 청크, 전체 코어)에서
+    행마다 최고 점수 파일을 고릅니다.
+
+    Returns:
+        clip_titles 순서의 (file_path, confidence) or None 목록
+    """
+    if not FUZZY_AVAILABLE or not file_paths:
+        return [None] * len(clip_titles)
+    if not BATCH_AVAILABLE:
+        return [fuzzy_match_file(t, file_paths, threshold) for t in clip_titles]
+
+    filenames = [Path(p).stem for p in file_paths]
+    queries = [_normalize_title(t) for t in clip_titles]
+
+    top = batch_top_k(queries, filenames, fuzz.token_set_ratio, k=1, score_cutoff=threshold)
+    return [(file_paths[row[0][0]], row[0][1] / 100.0) if row else None for row in top]
+
+
 def import_iconik_csv(
     csv_path: str,
     db_path: str = "archive.db",
@@ -222,25 +252,28 @@ def import_iconik_csv(
             file_map[record.path] = record.id
         logger.info(f"Loaded {len(file_paths)} files for matching")
 
+    # 파일 매칭 (전체 클립 배치)
+    match_results: List[Optional[tuple]] = [None] * len(clips)
+    if match_files and file_paths:
+        logger.info("Matching clips to files (batch)...")
+        match_results = fuzzy_match_files(
+            [clip.get('title', '') for clip in clips],
+            file_paths,
+            threshold=match_threshold
+        )
+
     # 클립 임포트
     imported = 0
     matched = 0
 
     for i, clip in enumerate(clips):
-        # 파일 매칭
-        if match_files and file_paths:
-            match_result = fuzzy_match_file(
-                clip.get('title', ''),
-                file_paths,
-                threshold=match_threshold
-            )
-
-            if match_result:
-                matched_path, confidence = match_result
-                clip['matched_file_path'] = matched_path
-                clip['file_id'] = file_map.get(matched_path)
-                clip['match_confidence'] = confidence
-                matched += 1
+        match_result = match_results[i]
+        if match_result:
+            matched_path, confidence = match_result
+            clip['matched_file_path'] = matched_path
+            clip['file_id'] = file_map.get(matched_path)
+            clip['match_confidence'] = confidence
+            matched += 1
 
         # DB에 삽입
         try:
@@ -3,11 +3,15 @@
 
 archive.db 데이터를 MeiliSearch로 인덱싱합니다.
 
+변경 로그(search_changes) 기준으로 지난 실행 이후 바뀐 문서만 전송하며,
+전체 재인덱싱과 증분 인덱싱의 처리량을 따로 출력합니다.
+
 사용법:
-    python scripts/index_to_meilisearch.py [--db-path PATH] [--clear]
+    python scripts/index_to_meilisearch.py [--db-path PATH] [--clear] [--full]
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -15,6 +19,25 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from archive_analyzer.search import SearchService, SearchConfig, MEILISEARCH_AVAILABLE
+from archive_analyzer.search_cache import invalidate_shared
+
+
+def print_throughput(reports) -> None:
+    """전체/증분 인덱싱 처리량을 구분해 출력"""
+    for mode, label in (("full", "전체 재인덱싱"), ("incremental", "증분 인덱싱")):
+        selected = [r for r in reports if r.mode == mode]
+        if not selected:
+            continue
+        print(f"\n=== 처리량: {label} ===")
+        for r in selected:
+            print(
+                f"  {r.index}: upsert {r.upserted:,}건, delete {r.deleted:,}건, "
+                f"{r.seconds:.1f}초 ({r.docs_per_sec:,.0f} docs/s)"
+            )
+        total = sum(r.total for r in selected)
+        seconds = sum(r.seconds for r in selected)
+        rate = total / seconds if seconds > 0 else 0.0
+        print(f"  합계: {total:,}건, {seconds:.1f}초 ({rate:,.0f} docs/s)")
 
 
 def main():
@@ -42,6 +65,17 @@ def main():
         action="store_true",
         help="기존 인덱스 초기화 후 재인덱싱",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="변경 로그와 무관하게 전체 재인덱싱",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=str,
+        default=os.getenv("SEARCH_CACHE_PATH"),
+        help="인덱싱 후 무효화할 API 공유 검색 캐시 (기본: SEARCH_CACHE_PATH)",
+    )
     parser.add_argument(
         "--stats",
         action="store_true",
@@ -96,20 +130,25 @@ def main():
     # 기존 인덱스 초기화
     if args.clear:
         print("\n기존 인덱스 초기화 중...")
-        service.clear_all()
+        service.clear_all(str(db_path))
         print("초기화 완료")
 
     # 인덱싱 실행
     print(f"\n인덱싱 시작: {db_path}")
     try:
-        results = service.index_from_db(str(db_path))
+        results = service.index_from_db(str(db_path), full=args.full)
         print("\n=== 인덱싱 결과 ===")
         for table, count in results.items():
             print(f"  {table}: {count}건")
+        print_throughput(service.last_reports)
         print("\n인덱싱 완료!")
     except Exception as e:
         print(f"오류: 인덱싱 실패: {e}")
         sys.exit(1)
+    finally:
+        if args.cache_path and Path(args.cache_path).exists():
+            invalidate_shared(args.cache_path)
+            print(f"검색 캐시 무효화: {args.cache_path}")
 
     # 최종 통계
     print("\n=== 최종 통계 ===")
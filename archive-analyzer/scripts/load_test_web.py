@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""웹 대시보드 부하 테스트
+
+실행 중인 모니터링 서버(web/app.py)에 동시 클라이언트 N개로 API를 반복 호출하고
+엔드포인트별 지연(p50/p95/max)과 처리량을 출력합니다.
+부하 중에도 /health 응답이 빠른지 함께 측정해 이벤트 루프 블로킹 여부를 확인합니다.
+
+Usage:
+    uvicorn archive_analyzer.web.app:app --port 8080   # 별도 터미널
+    python scripts/load_test_web.py
+    python scripts/load_test_web.py --clients 50 --requests 20
+    python scripts/load_test_web.py --url http://localhost:8080 --endpoints /api/dashboard
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+import httpx
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+DEFAULT_ENDPOINTS = [
+    "/api/dashboard",
+    "/api/stats",
+    "/api/matching?page=1&per_page=20",
+    "/api/matching/tree",
+    "/api/history?limit=50",
+]
+
+
+async def client_worker(
+    client: httpx.AsyncClient,
+    endpoints: List[str],
+    requests: int,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int],
+    error_kinds: Counter,
+) -> None:
+    """한 클라이언트가 엔드포인트를 순환하며 요청"""
+    for i in range(requests):
+        endpoint = endpoints[i % len(endpoints)]
+        start = time.perf_counter()
+        try:
+            response = await client.get(endpoint)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            errors[endpoint] += 1
+            error_kinds[type(e).__name__] += 1
+            continue
+        latencies[endpoint].append(time.perf_counter() - start)
+
+
+async def health_probe(client: httpx.AsyncClient, stop: asyncio.Event, out: List[float]) -> None:
+    """부하 중 /health 지연 측정 (DB를 건드리지 않는 엔드포인트)"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            await client.get("/health")
+            out.append(time.perf_counter() - start)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.1)
+
+
+def summarize(name: str, values: List[float], errors: int = 0) -> str:
+    if not values:
+        return f"  {name:<40} 응답 없음 (오류 {errors})"
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"  {name:<40} n={len(values):>5}  "
+        f"p50={statistics.median(ordered) * 1000:8.1f}ms  "
+        f"p95={p95 * 1000:8.1f}ms  max={ordered[-1] * 1000:8.1f}ms  오류={errors}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    health: List[float] = []
+    error_kinds: Counter = Counter()
+
+    limits = httpx.Limits(max_connections=args.clients + 1)
+    async with httpx.AsyncClient(
+        base_url=args.url, timeout=args.timeout, limits=limits
+    ) as client:
+        stop = asyncio.Event()
+        probe = asyncio.create_task(health_probe(client, stop, health))
+
+        # 클라이언트마다 시작 엔드포인트를 달리해 요청을 섞음
+        orders = []
+        for i in range(args.clients):
+            k = i % len(args.endpoints)
+            orders.append(args.endpoints[k:] + args.endpoints[:k])
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                client_worker(client, order, args.requests, latencies, errors, error_kinds)
+                for order in orders
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await probe
+
+    total = sum(len(v) for v in latencies.values())
+    print(f"\n동시 클라이언트 {args.clients}개 x {args.requests}회 ({elapsed:.2f}초)")
+    print(f"  처리량: {total / elapsed:,.1f} req/s, 오류: {sum(errors.values())}")
+    if error_kinds:
+        print(f"  오류 종류: {dict(error_kinds)}")
+    print()
+    for endpoint in args.endpoints:
+        print(summarize(endpoint, latencies[endpoint], errors[endpoint]))
+    print()
+    print(summarize("/health (부하 중)", health))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="웹 대시보드 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:8080", help="서버 주소")
+    parser.add_argument("--clients", "-c", type=int, default=50, help="동시 클라이언트 수")
+    parser.add_argument("--requests", "-n", type=int, default=20, help="클라이언트당 요청 수")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--endpoints", nargs="+", default=DEFAULT_ENDPOINTS, help="대상 엔드포인트")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,27 @@
 
 media_metadata.csv의 Path 구조를 분석하여
 iconik 클립과 아카이브 파일을 매칭합니다.
+
+전략들은 candidate_index.CandidateIndex로 후보를 좁힌 뒤 원래 조건을 적용합니다.
+퍼지 스코어링은 기본적으로 필터 범위 전체를 대상으로 하며 (기존 결과와 동일),
+--approx-pool을 주면 IDF 순위 상위 후보에만 수행합니다 (근사, 결과가 달라질 수 있음).
 """
 
 import csv
 import re
 import sqlite3
 import logging
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from collections import defaultdict
+from contextlib import nullcontext
 from dataclasses import dataclass
 
+from batch_fuzzy import BATCH_AVAILABLE, DEFAULT_MAX_CELLS, batch_top_k
+from candidate_index import CandidateIndex
+from parallel_pool import chunk_indices, worker_pool
+
 try:
     from rapidfuzz import fuzz
     FUZZY_AVAILABLE = True
@@ -66,6 +76,12 @@ PROJECT_TO_PATH = {
     'Mediterranean Poker Party MPP': 'MPP',
 }
 
+# approximate_pool: 퍼지 스코어링 대상으로 선별할 IDF 순위 상위 후보 수
+FUZZY_CANDIDATE_LIMIT = 200
+
+# 파일명 유사도 매칭 최소 점수 (token_set_ratio)
+SIMILARITY_THRESHOLD = 75
+
 # 연도 → Archive Path 매핑
 YEAR_TO_ARCHIVE = {
     (1973, 2002): 'WSOP Archive (1973-2002)',
@@ -330,28 +346,66 @@ def load_unmatched_clips(db_path: str) -> List[Dict]:
     return clips
 
 
-def build_media_index(media_files: List[MediaFile]) -> Dict[str, List[MediaFile]]:
-    """미디어 파일 인덱스 생성"""
-    index = defaultdict(list)
+def build_media_index(
+    media_files: List[MediaFile], index_factory=CandidateIndex, approximate_pool: bool = False
+) -> CandidateIndex:
+    """미디어 파일 후보 인덱스 생성
+
+    복합 키: ('cat', category), ('sub', sub_category), ('loc', location), ('year', year_folder)
+    토큰: normalized_name 토큰 (퍼지 후보 선별), 부분 문자열: 파일명(소문자), normalized_name
+
+    approximate_pool=True면 퍼지 스코어링을 필터 범위 전체 대신 IDF 상위
+    FUZZY_CANDIDATE_LIMIT개 후보로 제한합니다 (근사).
+    """
+    index = index_factory()
+    index.approximate_pool = approximate_pool
 
     for mf in media_files:
-        # 카테고리별 인덱스
-        if mf.category:
-            index[f'cat:{mf.category}'].append(mf)
+        keys = [
+            (kind, value)
+            for kind, value in (
+                ('cat', mf.category),
+                ('sub', mf.sub_category),
+                ('loc', mf.location),
+                ('year', mf.year_folder),
+            )
+            if value
+        ]
+        index.add(
+            mf.id,
+            mf,
+            tokens=mf.normalized_name.split(),
+            keys=keys,
+            texts=[mf.filename.lower(), mf.normalized_name],
+        )
 
-        # 서브카테고리별 인덱스
-        if mf.sub_category:
-            index[f'sub:{mf.sub_category}'].append(mf)
+    return index
 
-        # Location별 인덱스
-        if mf.location:
-            index[f'loc:{mf.location}'].append(mf)
 
-        # Archive Path별 인덱스
-        if mf.year_folder:
-            index[f'year:{mf.year_folder}'].append(mf)
+def _files_under(index: CandidateIndex, target: str) -> Tuple[List[MediaFile], FrozenSet[int]]:
+    """path에 target을 포함하는 파일과 그 ID 집합 (target별로 한 번만 계산)"""
+    def predicate(mf):
+        return target in mf.path
 
-    return index
+    name = ('path', target)
+    return index.subset_docs(name, predicate), index.subset_ids(name, predicate)
+
+
+def _fuzzy_pool(
+    index: CandidateIndex,
+    query: str,
+    candidates: List[MediaFile],
+    scope: Optional[FrozenSet[int]],
+) -> List[MediaFile]:
+    """퍼지 스코어링할 후보
+
+    기본은 필터 범위 전체(candidates). approximate_pool이면 query와 토큰을 공유하는
+    IDF 상위 파일만 (scope가 있으면 그 안에서).
+    """
+    if not index.approximate_pool:
+        return candidates
+    ids = index.ranked(query.split(), FUZZY_CANDIDATE_LIMIT)
+    return [index.docs[i] for i in index.ordered(ids, within=scope)]
 
 
 # ============================================================
@@ -360,7 +414,7 @@ def build_media_index(media_files: List[MediaFile]) -> Dict[str, List[MediaFile]
 
 def match_by_project_path(
     clip: Dict,
-    media_index: Dict[str, List[MediaFile]],
+    media_index: CandidateIndex,
     all_media: List[MediaFile]
 ) -> Optional[MatchResult]:
     """Strategy 1: ProjectName → Path 직접 매칭"""
@@ -375,21 +429,24 @@ def match_by_project_path(
         return None
 
     # 해당 경로의 파일들 찾기
-    candidates = []
-    for mf in all_media:
-        if target_path in mf.path or target_path in mf.location or target_path in mf.sub_category:
-            candidates.append(mf)
+    def in_project(mf):
+        return target_path in mf.path or target_path in mf.location or target_path in mf.sub_category
+
+    name = ('project', target_path)
+    candidates = media_index.subset_docs(name, in_project)
 
     if not candidates:
         return None
 
     # 파일명 유사도로 최적 매칭
-    return find_best_match(clip, candidates, 'project_path')
+    return find_best_match(
+        clip, candidates, 'project_path', media_index, media_index.subset_ids(name, in_project)
+    )
 
 
 def match_by_year_archive(
     clip: Dict,
-    media_index: Dict[str, List[MediaFile]],
+    media_index: CandidateIndex,
     all_media: List[MediaFile]
 ) -> Optional[MatchResult]:
     """Strategy 2: 연도 기반 Archive Path 매칭"""
@@ -407,17 +464,23 @@ def match_by_year_archive(
         return None
 
     # 해당 Archive의 파일들
-    candidates = [mf for mf in all_media if archive_path in mf.path or archive_path in mf.sub_category]
+    def in_archive(mf):
+        return archive_path in mf.path or archive_path in mf.sub_category
+
+    name = ('archive', archive_path)
+    candidates = media_index.subset_docs(name, in_archive)
 
     if not candidates:
         return None
 
-    return find_best_match(clip, candidates, 'year_archive')
+    return find_best_match(
+        clip, candidates, 'year_archive', media_index, media_index.subset_ids(name, in_archive)
+    )
 
 
 def match_subclip_parent(
     clip: Dict,
-    media_index: Dict[str, List[MediaFile]],
+    media_index: CandidateIndex,
     all_media: List[MediaFile]
 ) -> Optional[MatchResult]:
     """Strategy 3: Subclip → 부모 파일 매칭"""
@@ -434,23 +497,25 @@ def match_subclip_parent(
     if len(parent_normalized) < 5:
         return None
 
-    # 프로젝트 기반 후보 필터링
-    candidates = all_media
+    # 프로젝트 기반 후보 필터링 (scope None = 전체)
+    candidates, scope = all_media, None
     project = clip['project_name']
     if project and project in PROJECT_TO_PATH:
         target = PROJECT_TO_PATH[project]
-        candidates = [mf for mf in all_media if target in mf.path]
+        candidates, scope = _files_under(media_index, target)
 
     if not candidates:
-        candidates = all_media
+        candidates, scope = all_media, None
 
     # 부모 파일명과 유사한 파일 찾기
     best_match = None
     best_score = 0
 
-    for mf in candidates:
-        if not FUZZY_AVAILABLE:
-            # 단순 포함 검사
+    if not FUZZY_AVAILABLE:
+        # 단순 포함 검사 (부모 파일명을 포함할 수 있는 파일만)
+        pool = media_index.substring_candidates(parent_normalized)
+        for file_id in media_index.ordered(pool, within=scope):
+            mf = media_index.docs[file_id]
             if parent_normalized in mf.normalized_name:
                 return MatchResult(
                     iconik_id=clip['iconik_id'],
@@ -459,7 +524,8 @@ def match_subclip_parent(
                     match_method='subclip_parent',
                     confidence=0.80,
                 )
-        else:
+    else:
+        for mf in _fuzzy_pool(media_index, parent_normalized, candidates, scope):
             score = fuzz.token_set_ratio(parent_normalized, mf.normalized_name)
             if score > best_score:
                 best_score = score
@@ -477,9 +543,34 @@ def match_subclip_parent(
     return None
 
 
+def _similarity_target(clip: Dict) -> Optional[str]:
+    """파일명 유사도 매칭의 프로젝트 기반 경로 필터 (None = 전체)"""
+    project = clip['project_name']
+    if not project:
+        return None
+
+    # PRE-2016 연도 프로젝트
+    year = extract_year(project)
+    if year and year <= 2016:
+        return get_archive_path_for_year(year)
+
+    # 직접 매핑
+    return PROJECT_TO_PATH.get(project)
+
+
+def _similarity_result(clip: Dict, mf: MediaFile, score: float) -> MatchResult:
+    return MatchResult(
+        iconik_id=clip['iconik_id'],
+        media_file_id=mf.id,
+        media_filename=mf.filename,
+        match_method='filename_similarity',
+        confidence=min(0.95, score / 100),
+    )
+
+
 def match_by_filename_similarity(
     clip: Dict,
-    media_index: Dict[str, List[MediaFile]],
+    media_index: CandidateIndex,
     all_media: List[MediaFile]
 ) -> Optional[MatchResult]:
     """Strategy 4: 파일명 유사도 매칭"""
@@ -491,49 +582,83 @@ def match_by_filename_similarity(
     if len(title_normalized) < 5:
         return None
 
-    # 프로젝트 기반 후보 필터링
-    candidates = all_media
-    project = clip['project_name']
-    if project:
-        # PRE-2016 연도 프로젝트
-        year = extract_year(project)
-        if year and year <= 2016:
-            archive_path = get_archive_path_for_year(year)
-            if archive_path:
-                candidates = [mf for mf in all_media if archive_path in mf.path]
-
-        # 직접 매핑
-        elif project in PROJECT_TO_PATH:
-            target = PROJECT_TO_PATH[project]
-            candidates = [mf for mf in all_media if target in mf.path]
+    # 프로젝트 기반 후보 필터링 (scope None = 전체)
+    candidates, scope = all_media, None
+    target = _similarity_target(clip)
+    if target:
+        candidates, scope = _files_under(media_index, target)
 
     if not candidates:
-        candidates = all_media
+        candidates, scope = all_media, None
 
     best_match = None
     best_score = 0
 
-    for mf in candidates:
+    for mf in _fuzzy_pool(media_index, title_normalized, candidates, scope):
         score = fuzz.token_set_ratio(title_normalized, mf.normalized_name)
         if score > best_score:
             best_score = score
             best_match = mf
 
-    if best_match and best_score >= 75:
-        return MatchResult(
-            iconik_id=clip['iconik_id'],
-            media_file_id=best_match.id,
-            media_filename=best_match.filename,
-            match_method='filename_similarity',
-            confidence=min(0.95, best_score / 100),
-        )
+    if best_match and best_score >= SIMILARITY_THRESHOLD:
+        return _similarity_result(clip, best_match, best_score)
 
     return None
 
 
+def match_by_filename_similarity_batch(
+    clips: List[Dict],
+    media_index: CandidateIndex,
+    all_media: List[MediaFile],
+    max_cells: int = DEFAULT_MAX_CELLS,
+) -> Dict[str, MatchResult]:
+    """Strategy 4 배치 버전: 경로 필터가 같은 클립끼리 process.cdist로 한 번에 스코어링
+
+    필터 범위 전체를 스코어링하므로 approximate_pool 없이 돌린
+    match_by_filename_similarity와 같은 결과입니다 (동점은 등록 순서상 첫 파일).
+
+    Returns:
+        iconik_id → MatchResult
+    """
+    if not FUZZY_AVAILABLE:
+        return {}
+    if not BATCH_AVAILABLE:
+        results = (match_by_filename_similarity(c, media_index, all_media) for c in clips)
+        return {r.iconik_id: r for r in results if r}
+
+    # 경로 필터별 그룹 (None = 전체)
+    groups: Dict[Optional[str], List[Tuple[Dict, str]]] = defaultdict(list)
+    for clip in clips:
+        title_normalized = normalize_filename(clip['title'])
+        if len(title_normalized) < 5:
+            continue
+        target = _similarity_target(clip)
+        if target and not _files_under(media_index, target)[0]:
+            target = None
+        groups[target].append((clip, title_normalized))
+
+    matches = {}
+    for target, members in groups.items():
+        docs = _files_under(media_index, target)[0] if target else all_media
+        top = batch_top_k(
+            [title for _, title in members],
+            [mf.normalized_name for mf in docs],
+            fuzz.token_set_ratio,
+            k=1,
+            score_cutoff=SIMILARITY_THRESHOLD,
+            max_cells=max_cells,
+        )
+        for (clip, _), row in zip(members, top):
+            if row:
+                idx, score = row[0]
+                matches[clip['iconik_id']] = _similarity_result(clip, docs[idx], score)
+
+    return matches
+
+
 def match_by_players(
     clip: Dict,
-    media_index: Dict[str, List[MediaFile]],
+    media_index: CandidateIndex,
     all_media: List[MediaFile]
 ) -> Optional[MatchResult]:
     """Strategy 5: 선수 이름 + 연도 매칭"""
@@ -549,19 +674,24 @@ def match_by_players(
     # 연도 추출
     year = clip.get('year') or extract_year(clip['project_name'] + ' ' + clip['title'])
 
-    # 후보 필터링
-    candidates = all_media
+    # 후보 필터링 (scope None = 전체)
+    scope = None
     if year and year <= 2016:
         archive_path = get_archive_path_for_year(year)
         if archive_path:
-            candidates = [mf for mf in all_media if archive_path in mf.path]
+            _, scope = _files_under(media_index, archive_path)
+
+    # 성(surname)만 매칭 (공백 이후)
+    surnames = [player.split()[-1] if ' ' in player else player for player in players]
+    pool = set().union(
+        *(media_index.substring_candidates(s) for s in surnames if len(s) >= 3)
+    )
 
     # 선수 이름이 파일명에 포함된 파일 찾기
-    for mf in candidates:
+    for file_id in media_index.ordered(pool, within=scope):
+        mf = media_index.docs[file_id]
         filename_lower = mf.filename.lower()
-        for player in players:
-            # 성(surname)만 매칭 (공백 이후)
-            surname = player.split()[-1] if ' ' in player else player
+        for surname in surnames:
             if len(surname) >= 3 and surname in filename_lower:
                 return MatchResult(
                     iconik_id=clip['iconik_id'],
@@ -577,9 +707,11 @@ def match_by_players(
 def find_best_match(
     clip: Dict,
     candidates: List[MediaFile],
-    method: str
+    method: str,
+    media_index: CandidateIndex,
+    scope: FrozenSet[int],
 ) -> Optional[MatchResult]:
-    """후보 중 최적 매칭 찾기"""
+    """후보 중 최적 매칭 찾기 (approximate_pool이면 scope 내 IDF 상위 후보만 스코어링)"""
     if not candidates:
         return None
 
@@ -598,7 +730,7 @@ def find_best_match(
     best_match = None
     best_score = 0
 
-    for mf in candidates:
+    for mf in _fuzzy_pool(media_index, title_normalized, candidates, scope):
         score = fuzz.token_set_ratio(title_normalized, mf.normalized_name)
         if score > best_score:
             best_score = score
@@ -616,11 +748,143 @@ def find_best_match(
     return None
 
 
-def run_matching(db_path: str) -> Dict[str, int]:
+STRATEGIES = [
+    ('project_path', match_by_project_path),
+    ('subclip_parent', match_subclip_parent),
+    ('year_archive', match_by_year_archive),
+    ('filename_similarity', match_by_filename_similarity),
+    ('player_name', match_by_players),
+]
+
+# 배치 버전이 있는 전략 (clips 전체 → iconik_id별 결과)
+BATCH_STRATEGIES = {
+    'filename_similarity': match_by_filename_similarity_batch,
+}
+
+
+# 프로세스 풀 워커 상태 (fork: 부모 인덱스를 copy-on-write로 공유, spawn: _init_worker로 생성)
+_worker_state: Dict = {}
+
+
+def _init_worker(
+    clips: List[Dict], media_files: List[MediaFile], index_factory, approximate_pool: bool
+) -> None:
+    """spawn 워커 초기화 (미디어 인덱스 재구성)"""
+    _worker_state.update(
+        clips=clips,
+        media_files=media_files,
+        media_index=build_media_index(
+            media_files, index_factory=index_factory, approximate_pool=approximate_pool
+        ),
+    )
+
+
+def _strategy_chunk(task: Tuple[str, List[int]]) -> Dict[int, MatchResult]:
+    """워커: 클립 청크에 전략 하나 적용 → 클립 인덱스별 매칭 결과"""
+    strategy_name, indices = task
+    strategy_func = dict(STRATEGIES)[strategy_name]
+    clips = _worker_state['clips']
+    matches = {}
+    for i in indices:
+        result = strategy_func(
+            clips[i], _worker_state['media_index'], _worker_state['media_files']
+        )
+        if result:
+            matches[i] = result
+    return matches
+
+
+def match_clips(
+    clips: List[Dict],
+    media_files: List[MediaFile],
+    media_index: CandidateIndex,
+    batch: bool = False,
+    workers: int = 1,
+) -> Tuple[List[MatchResult], Dict[str, float]]:
+    """전략을 순서대로 적용 (앞 전략에서 매칭된 클립은 건너뜀)
+
+    batch=True면 BATCH_STRATEGIES에 있는 전략은 남은 클립 전체를 한 번에 매칭합니다.
+    workers가 2 이상이면 전략마다 남은 클립을 청크로 나눠 프로세스 풀에서 매칭하고,
+    결과는 순차 실행과 같은 순서로 병합합니다.
+
+    Returns:
+        (매칭 결과, 전략별 소요 시간(초))
+    """
+    results = []
+    matched_ids = set()
+    timings: Dict[str, float] = {}
+
+    _worker_state.update(clips=clips, media_files=media_files, media_index=media_index)
+    pool_context = (
+        worker_pool(
+            workers,
+            _init_worker,
+            (clips, media_files, type(media_index), media_index.approximate_pool),
+        )
+        if workers > 1
+        else nullcontext()
+    )
+
+    try:
+        with pool_context as pool:
+            for strategy_name, strategy_func in STRATEGIES:
+                logger.info(f"Running strategy: {strategy_name}")
+                strategy_matches = 0
+                start = time.perf_counter()
+
+                batch_results = None
+                pool_results = None
+                if batch and strategy_name in BATCH_STRATEGIES:
+                    remaining = [c for c in clips if c['iconik_id'] not in matched_ids]
+                    batch_results = BATCH_STRATEGIES[strategy_name](
+                        remaining, media_index, media_files
+                    )
+                elif pool is not None:
+                    remaining_idx = [
+                        i for i, c in enumerate(clips) if c['iconik_id'] not in matched_ids
+                    ]
+                    tasks = [
+                        (strategy_name, chunk) for chunk in chunk_indices(remaining_idx, workers)
+                    ]
+                    pool_results = {}
+                    for chunk_results in pool.imap(_strategy_chunk, tasks):
+                        pool_results.update(chunk_results)
+
+                for i, clip in enumerate(clips):
+                    if clip['iconik_id'] in matched_ids:
+                        continue
+
+                    if batch_results is not None:
+                        result = batch_results.get(clip['iconik_id'])
+                    elif pool_results is not None:
+                        result = pool_results.get(i)
+                    else:
+                        result = strategy_func(clip, media_index, media_files)
+                    if result:
+                        results.append(result)
+                        matched_ids.add(clip['iconik_id'])
+                        strategy_matches += 1
+
+                timings[strategy_name] = time.perf_counter() - start
+                logger.info(
+                    f"  {strategy_name}: {strategy_matches} matches ({timings[strategy_name]:.2f}s)"
+                )
+    finally:
+        _worker_state.clear()
+
+    return results, timings
+
+
+def run_matching(
+    db_path: str, batch: bool = False, workers: int = 1, approximate_pool: bool = False
+) -> Dict[str, int]:
     """전체 매칭 실행
 
     Args:
         db_path: 데이터베이스 경로
+        batch: 배치 퍼지 매칭(process.cdist) 사용 여부
+        workers: 매칭 프로세스 수
+        approximate_pool: 퍼지 스코어링을 IDF 상위 후보로 제한 (근사)
 
     Returns:
         매칭 통계
@@ -635,35 +899,12 @@ def run_matching(db_path: str) -> Dict[str, int]:
     logger.info(f"  Unmatched clips: {len(unmatched_clips)}")
 
     # 인덱스 생성
-    media_index = build_media_index(media_files)
+    media_index = build_media_index(media_files, approximate_pool=approximate_pool)
 
     # 매칭 실행
-    results = []
-    matched_ids = set()
-
-    strategies = [
-        ('project_path', match_by_project_path),
-        ('subclip_parent', match_subclip_parent),
-        ('year_archive', match_by_year_archive),
-        ('filename_similarity', match_by_filename_similarity),
-        ('player_name', match_by_players),
-    ]
-
-    for strategy_name, strategy_func in strategies:
-        logger.info(f"Running strategy: {strategy_name}")
-        strategy_matches = 0
-
-        for clip in unmatched_clips:
-            if clip['iconik_id'] in matched_ids:
-                continue
-
-            result = strategy_func(clip, media_index, media_files)
-            if result:
-                results.append(result)
-                matched_ids.add(clip['iconik_id'])
-                strategy_matches += 1
-
-        logger.info(f"  {strategy_name}: {strategy_matches} matches")
+    results, timings = match_clips(
+        unmatched_clips, media_files, media_index, batch=batch, workers=workers
+    )
 
     # 결과 저장
     logger.info("Saving results...")
@@ -682,6 +923,7 @@ def run_matching(db_path: str) -> Dict[str, int]:
         method_counts[r.match_method] += 1
 
     stats['by_method'] = dict(method_counts)
+    stats['timings'] = timings
 
     return stats
 
@@ -823,6 +1065,10 @@ def main():
     parser.add_argument('--db', '-d', required=True, help='데이터베이스 경로')
     parser.add_argument('--output', '-o', help='출력 CSV 경로')
     parser.add_argument('--load-only', action='store_true', help='media_metadata만 로드')
+    parser.add_argument('--batch', action='store_true', help='배치 퍼지 매칭 (process.cdist, 전체 코어)')
+    parser.add_argument('--workers', type=int, default=1, help='매칭 프로세스 수 (기본: 1)')
+    parser.add_argument('--approx-pool', action='store_true',
+                        help='퍼지 스코어링을 IDF 상위 후보로 제한 (근사, 결과가 달라질 수 있음)')
 
     args = parser.parse_args()
 
@@ -841,7 +1087,9 @@ def main():
 
     # 2. 매칭 실행
     print("\n[2] 매칭 실행 중...")
-    stats = run_matching(args.db)
+    stats = run_matching(
+        args.db, batch=args.batch, workers=args.workers, approximate_pool=args.approx_pool
+    )
 
     print("\n[3] 매칭 결과")
     print("-" * 70)
@@ -853,6 +1101,10 @@ def main():
     for method, count in stats.get('by_method', {}).items():
         print(f"    {method}: {count}개")
 
+    print("\n  [전략별 소요 시간]")
+    for strategy, seconds in stats.get('timings', {}).items():
+        print(f"    {strategy}: {seconds:.2f}초")
+
     # 3. CSV 내보내기
     if args.output:
         print(f"\n[4] CSV 내보내기: {args.output}")
@@ -0,0 +1,163 @@
+"""클립 매칭용 파일 특성 캐시 (archive.db 옆 사이드카 SQLite)
+
+ClipMatcher가 실행마다 모든 영상 파일에 대해 다시 계산하던 정규화 이름, 토큰,
+연도, 이벤트 번호, Day를 archive.matcher.db에 저장합니다.
+
+- 파일 ID별로 (modified_at, path, filename, parent_folder)를 함께 저장해 바뀐 행만
+  다시 계산합니다 (parent_folder는 매칭 텍스트에 쓰이며 경로와 별개로 갱신될 수 있음).
+- files에서 사라졌거나 영상이 아니게 된 행은 캐시에서 삭제합니다.
+- 추출 로직이 바뀌면 version을 올려 전체를 다시 계산합니다.
+
+변경 감지는 archive.db를 ATTACH한 뒤 한 번의 조인으로 처리하므로,
+변경이 없는 아카이브에서는 캐시 행을 읽기만 합니다.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+# (normalized_name, tokens, year, event_number, day)
+Features = Tuple[str, List[str], str, str, str]
+# (file_id, filename, path, parent_folder, normalized_name, tokens, year, event_number, day)
+FeatureRow = Tuple[int, str, str, Optional[str], str, List[str], str, str, str]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS file_features (
+    file_id INTEGER PRIMARY KEY,
+    modified_at TEXT,
+    path TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    parent_folder TEXT,
+    normalized_name TEXT NOT NULL,
+    tokens TEXT NOT NULL,
+    year TEXT NOT NULL,
+    event_number TEXT NOT NULL,
+    day TEXT NOT NULL
+);
+"""
+
+# 캐시가 없거나 (modified_at, path, filename, parent_folder)가 달라진 영상 파일
+CHANGED_SQL = """
+    SELECT f.id, f.filename, f.path, f.parent_folder, f.modified_at
+    FROM src.files f
+    LEFT JOIN file_features c ON c.file_id = f.id
+    WHERE f.file_type = 'video'
+      AND (c.file_id IS NULL
+           OR c.modified_at IS NOT f.modified_at
+           OR c.path IS NOT f.path
+           OR c.filename IS NOT f.filename
+           OR c.parent_folder IS NOT f.parent_folder)
+"""
+
+STALE_SQL = """
+    DELETE FROM file_features
+    WHERE file_id NOT IN (SELECT id FROM src.files WHERE file_type = 'video')
+"""
+
+UPSERT_SQL = """
+    INSERT INTO file_features
+        (file_id, modified_at, path, filename, parent_folder,
+         normalized_name, tokens, year, event_number, day)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_id) DO UPDATE SET
+        modified_at = excluded.modified_at,
+        path = excluded.path,
+        filename = excluded.filename,
+        parent_folder = excluded.parent_folder,
+        normalized_name = excluded.normalized_name,
+        tokens = excluded.tokens,
+        year = excluded.year,
+        event_number = excluded.event_number,
+        day = excluded.day
+"""
+
+LOAD_SQL = """
+    SELECT file_id, filename, path, parent_folder,
+           normalized_name, tokens, year, event_number, day
+    FROM file_features
+    ORDER BY file_id
+"""
+
+
+def cache_path_for(db_path: str) -> str:
+    """archive.db → archive.matcher.db"""
+    return str(Path(db_path).with_suffix(".matcher.db"))
+
+
+class FeatureCache:
+    """파일 특성 캐시
+
+    Usage:
+        with FeatureCache("archive.db", version="1") as cache:
+            refreshed, removed = cache.refresh(extract)
+            rows = cache.load()
+    """
+
+    def __init__(self, db_path: str, cache_path: Optional[str] = None, version: str = "1"):
+        self.db_path = db_path
+        self.cache_path = cache_path or cache_path_for(db_path)
+        self.version = str(version)
+        self.conn = sqlite3.connect(self.cache_path)
+        self.conn.executescript(SCHEMA)
+        self._check_version()
+
+    def __enter__(self) -> "FeatureCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _check_version(self) -> None:
+        """추출 로직 버전이 다르면 캐시 비우기"""
+        row = self.conn.execute(
+            "SELECT value FROM cache_meta WHERE key = 'version'"
+        ).fetchone()
+        if row and row[0] == self.version:
+            return
+        with self.conn:
+            self.conn.execute("DELETE FROM file_features")
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache_meta (key, value) VALUES ('version', ?)",
+                (self.version,),
+            )
+
+    def refresh(self, extract: Callable[[str, str], Features]) -> Tuple[int, int]:
+        """바뀐 행만 다시 계산
+
+        Args:
+            extract: (filename, path) → (normalized_name, tokens, year, event_number, day)
+
+        Returns:
+            (다시 계산한 행 수, 삭제한 행 수)
+        """
+        self.conn.execute("ATTACH DATABASE ? AS src", (self.db_path,))
+        try:
+            changed = self.conn.execute(CHANGED_SQL).fetchall()
+            with self.conn:
+                removed = self.conn.execute(STALE_SQL).rowcount
+                rows = []
+                for file_id, filename, path, parent_folder, modified_at in changed:
+                    normalized, tokens, year, event_num, day = extract(filename, path)
+                    rows.append((
+                        file_id, modified_at, path, filename, parent_folder,
+                        normalized, " ".join(tokens), year, event_num, day,
+                    ))
+                self.conn.executemany(UPSERT_SQL, rows)
+        finally:
+            self.conn.execute("DETACH DATABASE src")
+        return len(changed), removed
+
+    def load(self) -> List[FeatureRow]:
+        """캐시된 특성 (파일 ID 순)"""
+        return [
+            (file_id, filename, path, parent_folder, normalized, tokens.split(), year, ev, day)
+            for file_id, filename, path, parent_folder, normalized, tokens, year, ev, day
+            in self.conn.execute(LOAD_SQL)
+        ]
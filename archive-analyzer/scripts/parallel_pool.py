@@ -0,0 +1,58 @@
+"""클립 매칭 프로세스 풀 헬퍼
+
+clip_matcher.py, match_by_path.py의 --workers 모드에서 사용합니다.
+
+- fork를 쓸 수 있으면(Linux) 부모가 만든 읽기 전용 파일 인덱스를 모듈 전역에 둔 뒤
+  포크해 copy-on-write로 공유합니다. gc.freeze()로 포크 전 객체를 GC 추적에서 빼
+  자식 프로세스의 GC가 공유 페이지를 건드리지 않게 합니다.
+- fork가 없으면(Windows) spawn + initializer로 워커마다 인덱스를 다시 만듭니다.
+- 작업은 연속된 인덱스 청크로 나누고 imap으로 순서대로 받으므로 병합 결과는
+  순차 실행과 같은 순서입니다.
+"""
+
+import gc
+import multiprocessing as mp
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Sequence
+
+# 워커당 청크 수 (클립별 비용 편차 흡수)
+CHUNKS_PER_WORKER = 4
+
+
+def can_fork() -> bool:
+    return "fork" in mp.get_all_start_methods()
+
+
+def chunk_indices(indices: Sequence[int], workers: int) -> List[List[int]]:
+    """인덱스 목록을 워커 수 x CHUNKS_PER_WORKER개의 연속 청크로 분할"""
+    if not indices:
+        return []
+    size = max(1, -(-len(indices) // (workers * CHUNKS_PER_WORKER)))
+    return [list(indices[i : i + size]) for i in range(0, len(indices), size)]
+
+
+@contextmanager
+def worker_pool(
+    workers: int,
+    initializer: Optional[Callable] = None,
+    initargs: tuple = (),
+) -> Iterator["mp.pool.Pool"]:
+    """fork(copy-on-write) 또는 spawn(initializer) 프로세스 풀
+
+    fork 모드에서는 호출자가 풀을 열기 전에 공유할 상태를 모듈 전역에 두어야 하며,
+    initializer는 spawn 모드에서만 실행됩니다.
+    """
+    if can_fork():
+        gc.freeze()
+        try:
+            pool = mp.get_context("fork").Pool(workers)
+        finally:
+            gc.unfreeze()
+    else:
+        pool = mp.get_context("spawn").Pool(workers, initializer=initializer, initargs=initargs)
+
+    try:
+        yield pool
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""카탈로그 트리 집계(file_catalogs, catalog_nodes) 갱신 스크립트
+
+웹 대시보드 트리 뷰가 읽는 카탈로그 분류/노드 집계를 갱신합니다.
+평소에는 pokervod 동기화(run_full_sync) 후 자동으로 갱신되며,
+동기화 없이 스캔만 했거나 catalog_patterns.yaml을 바꾼 뒤 수동으로 실행합니다.
+(바뀐 경로만 다시 분류하며, 패턴이 바뀌면 전체를 다시 분류합니다.)
+
+Usage:
+    python scripts/rebuild_catalog_tree.py
+    python scripts/rebuild_catalog_tree.py --db data/output/archive.db --pokervod data/pokervod.db
+    python scripts/rebuild_catalog_tree.py --show
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+# 프로젝트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive_analyzer.catalog_tree import (
+    has_catalog_tables,
+    read_catalog_tree,
+    refresh_catalog_tree,
+)
+
+
+def print_tree(nodes, indent: int = 0) -> None:
+    for node in nodes:
+        size_gb = node.total_size / (1024**3)
+        print(
+            f"  {'  ' * indent}{node.name}: {node.total_files:,}개 "
+            f"(직속 {node.direct_files:,}, 동기화 {node.synced_files:,}, {size_gb:,.1f} GB)"
+        )
+        print_tree(node.children, indent + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카탈로그 트리 집계 갱신")
+    parser.add_argument(
+        "--db", "-d", default="data/output/archive.db", help="archive.db 경로"
+    )
+    parser.add_argument(
+        "--pokervod", "-p", default="data/pokervod.db", help="pokervod.db 경로 (동기화 수 집계)"
+    )
+    parser.add_argument("--show", action="store_true", help="갱신 없이 현재 트리만 출력")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"오류: DB 파일을 찾을 수 없습니다: {args.db}")
+        sys.exit(1)
+
+    if not args.show:
+        pokervod = args.pokervod if Path(args.pokervod).exists() else None
+        if pokervod is None:
+            print(f"경고: pokervod.db 없음 ({args.pokervod}) - 동기화 수는 0으로 집계")
+        start = time.perf_counter()
+        result = refresh_catalog_tree(args.db, pokervod)
+        print(
+            f"갱신 완료: 분류 {result['classified']:,}건, 삭제 {result['removed']:,}건, "
+            f"노드 {result['nodes']:,}개 ({time.perf_counter() - start:.2f}초)"
+        )
+
+    conn = sqlite3.connect(args.db)
+    try:
+        if not has_catalog_tables(conn):
+            print("카탈로그 트리 집계가 없습니다 (--show 없이 실행하세요)")
+            return
+        print_tree(read_catalog_tree(conn))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
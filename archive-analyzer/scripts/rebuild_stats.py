@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""사전 집계 통계(stats_summary) 재생성 스크립트
+
+대시보드/리포트가 읽는 stats_summary를 files, media_info 전체에서 다시 집계합니다.
+트리거를 우회한 외부 수정(다른 도구의 INSERT OR REPLACE 등) 이후 복구용입니다.
+
+Usage:
+    python scripts/rebuild_stats.py
+    python scripts/rebuild_stats.py --db data/output/archive.db
+    python scripts/rebuild_stats.py --show
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+# 프로젝트 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive_analyzer.database import Database
+from archive_analyzer.stats_summary import read_entry, stats_updated_at
+
+
+def main():
+    parser = argparse.ArgumentParser(description="stats_summary 재생성")
+    parser.add_argument(
+        "--db", "-d", default="data/output/archive.db", help="archive.db 경로"
+    )
+    parser.add_argument("--show", action="store_true", help="재생성 없이 현재 상태만 출력")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"오류: DB 파일을 찾을 수 없습니다: {args.db}")
+        sys.exit(1)
+
+    db = Database(args.db)
+    try:
+        conn = db._get_connection()
+
+        if not args.show:
+            start = time.perf_counter()
+            rows = db.rebuild_stats()
+            print(f"재집계 완료: {rows:,}행 ({time.perf_counter() - start:.2f}초)")
+
+        total = read_entry(conn, "total")
+        print(f"  파일: {total.file_count:,}개 (비디오 {total.video_count:,}개)")
+        print(f"  미디어 정보(성공): {read_entry(conn, 'media_total').file_count:,}개")
+        print(f"  마지막 재집계: {read_entry(conn, '_meta', 'rebuilt_at').updated_at}")
+        print(f"  마지막 갱신: {stats_updated_at(conn)}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
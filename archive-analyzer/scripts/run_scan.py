@@ -26,6 +26,9 @@ USERNAME = "GGP"
 PASSWORD = os.getenv("SMB_PASSWORD", "!@QW12qw")
 ARCHIVE_PATH = "GGPNAs/ARCHIVE"
 DB_PATH = "archive.db"
+SCAN_WORKERS = int(os.getenv("SCAN_WORKERS", "1"))  # 2 이상이면 다중 세션 병렬 탐색
+# 인덱스/트리거 없이 적재 후 재구성 (오프라인 최초 적재 전용, 스캔 중 조회가 느려짐)
+SCAN_BULK = "--bulk" in sys.argv[1:] or os.getenv("SCAN_BULK") == "1"
 
 
 def progress_callback(progress: ScanProgress):
@@ -52,6 +55,8 @@ def main():
     print(f"Share: {SHARE}")
     print(f"Archive: {ARCHIVE_PATH}")
     print(f"Database: {DB_PATH}")
+    print(f"Workers: {SCAN_WORKERS}")
+    print(f"Bulk load: {SCAN_BULK}")
     print()
 
     # SMB 연결
@@ -77,6 +82,8 @@ def main():
             database=database,
             archive_path=ARCHIVE_PATH,
             batch_size=50,
+            parallel_workers=SCAN_WORKERS,
+            bulk_load=SCAN_BULK,
         )
         scanner.set_progress_callback(progress_callback)
 
@@ -101,6 +108,15 @@ def main():
             size_gb = data['size'] / (1024**3)
             print(f"  {file_type:12}: {data['count']:6,} files ({size_gb:8.2f} GB)")
 
+        if result.worker_stats:
+            print()
+            print("By Worker:")
+            for ws in result.worker_stats:
+                print(
+                    f"  #{ws['worker_id']:<3}: {ws['files']:8,} files, "
+                    f"{ws['directories']:6,} dirs, {ws['files_per_second']:8.1f} f/s"
+                )
+
         if result.errors:
             print()
             print(f"Errors: {len(result.errors)}")
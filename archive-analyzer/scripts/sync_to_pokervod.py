@@ -104,6 +104,12 @@ def main():
         print(f"\n=== 파일 동기화 결과 ===")
         print(f"  삽입: {result.inserted}개")
         print(f"  업데이트: {result.updated}개")
+        print(f"  변경 없음: {result.skipped}개")
+        for action, paths in result.diff.items():
+            if paths:
+                print(f"  [{action}] 샘플:")
+                for path in paths:
+                    print(f"    - {path}")
         if result.errors:
             print(f"  오류: {len(result.errors)}개")
             for error in result.errors[:10]:
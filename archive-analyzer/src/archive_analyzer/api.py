@@ -1,6 +1,10 @@
 """FastAPI 기반 검색 API
 
 MeiliSearch를 통한 파일/미디어/클립 검색 REST API를 제공합니다.
+MeiliSearch가 없거나 응답하지 않으면 검색 엔드포인트는 SQLite FTS5 엔진
+(fts_search.FTSSearchEngine, SEARCH_DB_PATH)으로 대체합니다.
+같은 검색 결과는 SearchCache(LRU + TTL)에 엔진별로 보관하며 /index, /clear 후,
+그리고 SEARCH_DB_PATH의 검색 변경 로그 워터마크가 움직이면 무효화됩니다.
 
 실행:
     uvicorn archive_analyzer.api:app --reload --port 8000
@@ -8,6 +12,7 @@ MeiliSearch를 통한 파일/미디어/클립 검색 REST API를 제공합니다
 
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 from html import escape
 from pathlib import Path
@@ -26,12 +31,14 @@ try:
 except ImportError:
     SLOWAPI_AVAILABLE = False
 
+from .fts_search import FTSSearchEngine, fts5_available
 from .search import (
     MEILISEARCH_AVAILABLE,
     SearchResult,
     SearchService,
     get_search_service,
 )
+from .search_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, SearchCache
 
 # 환경 변수 기반 설정
 ALLOWED_ORIGINS = os.getenv(
@@ -43,26 +50,49 @@ API_KEY = os.getenv("ARCHIVE_API_KEY", "")
 # 허용된 DB 경로 (Path Traversal 방지)
 ALLOWED_DB_DIR = Path(os.getenv("ALLOWED_DB_DIR", "data/output"))  # 상대경로 기본값
 
+# FTS5 폴백 검색용 DB (MeiliSearch 미사용/장애 시)
+SEARCH_DB_PATH = Path(os.getenv("SEARCH_DB_PATH", str(ALLOWED_DB_DIR / "archive.db")))
+
 MAX_OFFSET = 10000  # offset 상한
 
+# MeiliSearch 헬스체크 결과 캐시 시간 (초)
+HEALTH_CACHE_SECONDS = 5.0
+
+# 검색 결과 캐시 (SEARCH_CACHE_SIZE=0이면 비활성화, SEARCH_CACHE_PATH는 워커 간 공유 파일)
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", str(DEFAULT_MAX_ENTRIES)))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", str(DEFAULT_TTL_SECONDS)))
+SEARCH_CACHE_PATH = os.getenv("SEARCH_CACHE_PATH") or None
+
 logger = logging.getLogger(__name__)
 
 # 전역 서비스 인스턴스
 _service: Optional[SearchService] = None
+_fts_engine: Optional[FTSSearchEngine] = None
+_cache = SearchCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL, SEARCH_CACHE_PATH)
+_meili_health = {"ok": False, "checked_at": 0.0}
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행"""
-    global _service
+    global _service, _fts_engine
     if MEILISEARCH_AVAILABLE:
         try:
             _service = get_search_service()
             logger.info("MeiliSearch 서비스 초기화 완료")
         except Exception as e:
             logger.warning(f"MeiliSearch 초기화 실패: {e}")
+    if SEARCH_DB_PATH.exists() and fts5_available():
+        try:
+            _fts_engine = FTSSearchEngine(str(SEARCH_DB_PATH))
+            logger.info(f"FTS5 폴백 검색 초기화 완료: {SEARCH_DB_PATH}")
+        except Exception as e:
+            logger.warning(f"FTS5 폴백 검색 초기화 실패: {e}")
     yield
     # 종료 시 정리
+    if _fts_engine:
+        _fts_engine.close()
+    _cache.close()
 
 
 app = FastAPI(
@@ -165,12 +195,14 @@ class HealthResponse(BaseModel):
 
     status: str
     meilisearch: bool
+    fallback: bool = False
 
 
 class StatsResponse(BaseModel):
     """통계 응답"""
 
     indexes: dict
+    cache: dict = {}
 
 
 class IndexResponse(BaseModel):
@@ -192,6 +224,60 @@ def get_service() -> SearchService:
     return _service
 
 
+def meilisearch_healthy() -> bool:
+    """MeiliSearch 상태 (HEALTH_CACHE_SECONDS 동안 캐시)"""
+    if _service is None:
+        return False
+    now = time.monotonic()
+    if now - _meili_health["checked_at"] >= HEALTH_CACHE_SECONDS:
+        _meili_health["ok"] = _service.health_check()
+        _meili_health["checked_at"] = now
+    return _meili_health["ok"]
+
+
+def current_engine() -> str:
+    """이번 검색에 사용할 엔진 (meilisearch / fts5)"""
+    if _fts_engine is None or meilisearch_healthy():
+        return "meilisearch"
+    return "fts5"
+
+
+def run_search(method: str, **kwargs) -> SearchResult:
+    """캐시된 검색 결과, 없으면 검색 엔진 호출
+
+    스캔 등으로 archive.db가 바뀌어 변경 로그 워터마크가 움직였으면 먼저 캐시를 비웁니다.
+    """
+    if _fts_engine is not None:
+        seq = _fts_engine.change_seq()
+        if seq is not None:
+            _cache.sync_source(seq)
+    engine = current_engine()
+    return _cache.get_or_search(
+        method, lambda: search_engine(method, engine, **kwargs), engine=engine, **kwargs
+    )
+
+
+def search_engine(method: str, engine: str, **kwargs) -> SearchResult:
+    """MeiliSearch 검색, 사용할 수 없으면 FTS5 폴백
+
+    MeiliSearch 요청이 실패하면 상태를 비정상으로 기록하고 같은 요청을
+    FTS5 엔진으로 다시 수행합니다. 폴백 엔진이 없으면 기존처럼 MeiliSearch만 사용합니다.
+    """
+    if engine == "fts5":
+        return getattr(_fts_engine, method)(**kwargs)
+    if _fts_engine is None:
+        return getattr(get_service(), method)(**kwargs)
+
+    try:
+        return getattr(_service, method)(**kwargs)
+    except Exception:
+        logger.warning("MeiliSearch 검색 실패 - FTS5 폴백 사용", exc_info=True)
+        _meili_health.update(ok=False, checked_at=time.monotonic())
+        # 진행 중인 캐시 저장 취소 (FTS5 결과가 meilisearch 키로 저장되지 않도록)
+        _cache.invalidate()
+    return getattr(_fts_engine, method)(**kwargs)
+
+
 def result_to_response(result: SearchResult) -> SearchResponse:
     """SearchResult를 API 응답으로 변환 (XSS 방지 포함)"""
     sanitized_hits = [sanitize_result(hit) for hit in result.hits]
@@ -219,33 +305,39 @@ async def health_check(request: Request):
     meilisearch_ok = False
     if _service:
         meilisearch_ok = _service.health_check()
+    fallback_ok = _fts_engine is not None and _fts_engine.health_check()
 
     return HealthResponse(
         status="ok" if meilisearch_ok else "degraded",
         meilisearch=meilisearch_ok,
+        fallback=fallback_ok,
     )
 
 
 @app.get("/stats", response_model=StatsResponse)
 @rate_limit("120/minute")
 async def get_stats(request: Request):
-    """인덱스 통계 조회"""
+    """인덱스 통계 + 검색 캐시 통계 (적중률, 절약한 지연) 조회"""
     service = get_service()
     stats = service.get_stats()
-    return StatsResponse(indexes=stats)
+    return StatsResponse(indexes=stats, cache=_cache.get_stats())
 
 
 @app.post("/index", response_model=IndexResponse, dependencies=[Depends(verify_api_key)])
 @rate_limit("10/minute")
-async def index_from_db(request: Request, db_path: str = Query(..., description="archive.db 경로")):
-    """DB에서 데이터 인덱싱 (API Key 필요)"""
+async def index_from_db(
+    request: Request,
+    db_path: str = Query(..., description="archive.db 경로"),
+    full: bool = Query(False, description="전체 재인덱싱 (기본: 변경분만)"),
+):
+    """DB에서 변경된 데이터 인덱싱 (API Key 필요)"""
     service = get_service()
 
     # 경로 검증 (#27)
     validated_path = validate_db_path(db_path)
 
     try:
-        results = service.index_from_db(str(validated_path))
+        results = service.index_from_db(str(validated_path), full=full)
         return IndexResponse(
             success=True,
             indexed=results,
@@ -254,6 +346,9 @@ async def index_from_db(request: Request, db_path: str = Query(..., description=
     except Exception:
         logger.exception("Indexing failed")  # 상세 로그는 서버에만
         raise HTTPException(status_code=500, detail="인덱싱 중 오류가 발생했습니다")
+    finally:
+        # 실패해도 일부 문서는 반영됐을 수 있으므로 항상 무효화
+        _cache.invalidate()
 
 
 @app.get("/search/files", response_model=SearchResponse)
@@ -270,8 +365,8 @@ async def search_files(
 
     파일명, 경로, 폴더명으로 검색합니다.
     """
-    service = get_service()
-    result = service.search_files(
+    result = run_search(
+        "search_files",
         query=q,
         file_type=file_type,
         extension=extension,
@@ -295,8 +390,8 @@ async def search_media(
 
     파일 경로, 코덱, 컨테이너 포맷으로 검색합니다.
     """
-    service = get_service()
-    result = service.search_media(
+    result = run_search(
+        "search_media",
         query=q,
         video_codec=video_codec,
         resolution=resolution,
@@ -322,8 +417,8 @@ async def search_clips(
 
     플레이어, 토너먼트, 이벤트 등으로 검색합니다.
     """
-    service = get_service()
-    result = service.search_clips(
+    result = run_search(
+        "search_clips",
         query=q,
         project_name=project_name,
         hand_grade=hand_grade,
@@ -337,10 +432,23 @@ async def search_clips(
 
 @app.delete("/clear", dependencies=[Depends(verify_api_key)])
 @rate_limit("5/minute")
-async def clear_all(request: Request):
-    """모든 인덱스 초기화 (API Key 필요, 개발/테스트용)"""
+async def clear_all(
+    request: Request,
+    db_path: Optional[str] = Query(
+        None, description="인덱싱 상태를 초기화할 archive.db 경로 (기본: SEARCH_DB_PATH)"
+    ),
+):
+    """모든 인덱스 초기화 (API Key 필요, 개발/테스트용)
+
+    인덱싱 상태(워터마크)도 초기화하므로 다음 /index는 전체 재인덱싱합니다.
+    """
     service = get_service()
-    service.clear_all()
+    if db_path:
+        state_db: Optional[Path] = validate_db_path(db_path)
+    else:
+        state_db = SEARCH_DB_PATH if SEARCH_DB_PATH.exists() else None
+    service.clear_all(str(state_db) if state_db else None)
+    _cache.invalidate()
     logger.warning("All indexes cleared by API request")
     return {"success": True, "message": "모든 인덱스가 초기화되었습니다."}
 
@@ -7,18 +7,23 @@ Usage:
     python -m archive_analyzer.archive_hands_sync --dry-run
     python -m archive_analyzer.archive_hands_sync --daemon            # 1시간 간격
     python -m archive_analyzer.archive_hands_sync --daemon --interval 1800  # 30분 간격
+    python -m archive_analyzer.archive_hands_sync --sync --bulk   # 전체 시트 일괄 읽기/쓰기
 """
 
 import json
 import os
 import sqlite3
 import time
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import gspread
 from google.oauth2.service_account import Credentials
+from gspread.utils import absolute_range_name, rowcol_to_a1
+
+from archive_analyzer.sheets_rate_limit import SheetsRequestScheduler, get_scheduler
 
 # =============================================
 # Configuration
@@ -33,6 +38,8 @@ class ArchiveSyncConfig:
     archive_spreadsheet_id: str = "1_RN_W_ZQclSZA0Iez6XniCXVtjkkd5HNZwiT6l-z6d4"
     db_path: str = None
     sync_interval_seconds: int = 3600  # 기본 1시간
+    bulk: bool = False  # 전체 워크시트 일괄 읽기/쓰기 (values_batch_get/update)
+    bulk_write: bool = True  # hands 일괄 upsert (False면 행 단위 _upsert_hand)
 
     def __post_init__(self):
         if self.credentials_path is None:
@@ -44,6 +51,8 @@ class ArchiveSyncConfig:
             self.db_path = os.environ.get(
                 "DB_PATH", "data/pokervod.db"  # 상대경로 기본값
             )
+        if os.environ.get("ARCHIVE_SYNC_BULK", "").lower() in ("1", "true", "yes"):
+            self.bulk = True
 
 
 # =============================================
@@ -142,6 +151,169 @@ def normalize_nas_path(path: str) -> str:
     return normalized.lower()
 
 
+class _PathNode:
+    """경로 트라이 노드"""
+
+    __slots__ = ("children", "first", "terminal")
+
+    def __init__(self, first: int):
+        self.children: Dict[str, "_PathNode"] = {}
+        self.first = first  # 하위 경로 중 가장 앞선 순번
+        self.terminal: Optional[int] = None  # 이 노드에서 끝나는 경로의 순번
+
+
+class FileIdResolver:
+    """NAS 경로/파일명 → file_id 색인 (동기화 사이클마다 한 번 생성)
+
+    기존 find_file_id와 같은 우선순위(정확 매칭 → 경로 포함 관계 → 파일명 부분 문자열,
+    각각 files 테이블 순서상 첫 번째)를 선형 탐색 없이 찾습니다.
+
+    - 경로: '/' 세그먼트 트라이. 노드마다 하위 경로 중 가장 앞선 순번을 저장합니다.
+      시트 경로 ⊂ DB 경로(폴더 링크)는 시작 세그먼트 색인에서 내려가 노드 하나로,
+      DB 경로 ⊂ 시트 경로는 시트 경로의 각 시작 위치에서 내려가며 찾습니다.
+      포함 관계는 세그먼트 경계 기준입니다 (마지막 세그먼트만 접두사 허용).
+    - 파일명: 소문자 파일명을 개행으로 이은 문자열 하나에서 str.find 후 이진 탐색으로
+      행을 찾습니다 (trigram 색인은 5만 건 생성에 0.6초로 조회 총비용보다 커서 사용 안 함).
+    - 트라이/파일명 문자열은 처음 필요할 때 만들고, 조회 결과는 메모이즈합니다
+      (같은 Nas Folder Link를 가진 행이 반복됨).
+    """
+
+    def __init__(self, paths: Dict[str, Any], filenames: List[Tuple[Any, str]]):
+        """
+        Args:
+            paths: 정규화 경로 → file_id (files 테이블 순서)
+            filenames: (file_id, 파일명) 목록 (files 테이블 순서)
+        """
+        self.paths = paths
+        self._ids = list(paths.values())
+        self._root: Optional[_PathNode] = None
+        # 세그먼트 이름 → 그 세그먼트로 끝나는 노드들 (중간 위치부터 매칭용)
+        self._segment_nodes: Dict[str, List[_PathNode]] = {}
+
+        self._filenames = filenames
+        self._name_text: Optional[str] = None
+        self._name_starts: List[int] = []
+        self._path_cache: Dict[str, Optional[Any]] = {}
+        self._name_cache: Dict[str, Optional[Any]] = {}
+
+    @classmethod
+    def from_db(cls, conn: sqlite3.Connection) -> "FileIdResolver":
+        paths = {}
+        for file_id, nas_path in conn.execute(
+            "SELECT id, nas_path FROM files WHERE nas_path IS NOT NULL"
+        ):
+            if nas_path:
+                paths[normalize_nas_path(nas_path)] = file_id
+        filenames = conn.execute(
+            "SELECT id, filename FROM files WHERE filename IS NOT NULL"
+        ).fetchall()
+        return cls(paths, filenames)
+
+    def _build_trie(self):
+        self._root = _PathNode(0)
+        for order, path in enumerate(self.paths):
+            self._insert(path_segments(path), order)
+
+    def _insert(self, segments: List[str], order: int):
+        node = self._root
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _PathNode(order)
+                self._segment_nodes.setdefault(segment, []).append(child)
+            node = child
+        if node.terminal is None:
+            node.terminal = order
+
+    def _descend(self, node: _PathNode, segments: List[str]) -> Optional[int]:
+        """node에서 segments를 따라 내려간 하위 경로 중 가장 앞선 순번 (마지막은 접두사 허용)"""
+        for i, segment in enumerate(segments):
+            child = node.children.get(segment)
+            if child is None:
+                if i < len(segments) - 1:
+                    return None
+                orders = [c.first for key, c in node.children.items() if key.startswith(segment)]
+                return min(orders) if orders else None
+            node = child
+        return node.first
+
+    def _match_path(self, normalized: str) -> Optional[int]:
+        segments = path_segments(normalized)
+        if not segments:
+            return None
+        if self._root is None:
+            self._build_trie()
+        candidates = []
+
+        # 시트 경로 ⊂ DB 경로: 첫 세그먼트가 나오는 모든 위치에서 내려가기
+        for start in self._segment_nodes.get(segments[0], ()):
+            order = self._descend(start, segments[1:])
+            if order is not None:
+                candidates.append(order)
+
+        # DB 경로 ⊂ 시트 경로: 시트 경로의 각 위치에서 시작해 끝나는 DB 경로 찾기
+        for offset in range(len(segments)):
+            node = self._root
+            for segment in segments[offset:]:
+                node = node.children.get(segment)
+                if node is None:
+                    break
+                if node.terminal is not None:
+                    candidates.append(node.terminal)
+
+        return min(candidates) if candidates else None
+
+    def _match_filename(self, name: str) -> Optional[Any]:
+        """name을 포함하는 첫 번째 파일명의 file_id (LOWER(filename) LIKE '%name%')"""
+        if self._name_text is None:
+            lowered = [(filename or "").lower() for _, filename in self._filenames]
+            position = 0
+            for filename in lowered:
+                self._name_starts.append(position)
+                position += len(filename) + 1
+            self._name_text = "\n".join(lowered)
+        if "\n" in name:
+            return None
+        position = self._name_text.find(name)
+        if position < 0:
+            return None
+        return self._filenames[bisect_right(self._name_starts, position) - 1][0]
+
+    def resolve(self, nas_path: str, filename: str) -> Optional[Any]:
+        """NAS 경로 또는 파일명으로 file_id 찾기"""
+        if nas_path:
+            normalized = normalize_nas_path(nas_path)
+            # 정확히 매칭
+            if normalized in self.paths:
+                return self.paths[normalized]
+            # 부분 매칭 (폴더 경로)
+            if normalized not in self._path_cache:
+                order = self._match_path(normalized)
+                self._path_cache[normalized] = None if order is None else self._ids[order]
+            if self._path_cache[normalized] is not None:
+                return self._path_cache[normalized]
+
+        # 파일명으로 검색
+        if filename:
+            name = filename.lower()
+            if name not in self._name_cache:
+                self._name_cache[name] = self._match_filename(name)
+            return self._name_cache[name]
+
+        return None
+
+
+def path_segments(normalized: str) -> List[str]:
+    """정규화 경로 → 세그먼트 목록 (빈 세그먼트 제외)"""
+    return [segment for segment in normalized.split("/") if segment]
+
+
+def fill_rows(rows: List[List[str]]) -> List[List[str]]:
+    """행 길이를 가장 긴 행에 맞춤 (values_batch_get 결과를 get_all_values 형태로)"""
+    width = max((len(row) for row in rows), default=0)
+    return [row + [""] * (width - len(row)) for row in rows]
+
+
 # =============================================
 # Archive Hands Sync Service
 # =============================================
@@ -155,8 +327,12 @@ class ArchiveHandsSync:
         "https://www.googleapis.com/auth/drive",
     ]
 
-    def __init__(self, config: ArchiveSyncConfig = None):
+    def __init__(
+        self, config: ArchiveSyncConfig = None, scheduler: SheetsRequestScheduler = None
+    ):
         self.config = config or ArchiveSyncConfig()
+        # Sheets API 요청은 공용 토큰 버킷 스케줄러를 거침 (SheetsSyncService와 한도 공유)
+        self.scheduler = scheduler or get_scheduler()
         self._connect_sheets()
         self._connect_db()
         self._load_file_mapping()
@@ -168,7 +344,9 @@ class ArchiveHandsSync:
             scopes=self.SCOPES,
         )
         self.client = gspread.authorize(creds)
-        self.spreadsheet = self.client.open_by_key(self.config.archive_spreadsheet_id)
+        self.spreadsheet = self.scheduler.read(
+            self.client.open_by_key, self.config.archive_spreadsheet_id
+        )
 
     def _connect_db(self):
         """SQLite 연결"""
@@ -176,38 +354,14 @@ class ArchiveHandsSync:
         self.conn.row_factory = sqlite3.Row
 
     def _load_file_mapping(self):
-        """파일 경로 → file_id 매핑 로드"""
-        cursor = self.conn.execute("SELECT id, nas_path FROM files WHERE nas_path IS NOT NULL")
-        self.file_mapping = {}
-        for row in cursor:
-            if row["nas_path"]:
-                normalized = normalize_nas_path(row["nas_path"])
-                self.file_mapping[normalized] = row["id"]
+        """파일 경로/파일명 → file_id 색인 로드 (사이클마다 갱신)"""
+        self.resolver = FileIdResolver.from_db(self.conn)
+        self.file_mapping = self.resolver.paths
         print(f"Loaded {len(self.file_mapping)} file mappings")
 
     def find_file_id(self, nas_path: str, filename: str) -> Optional[str]:
         """NAS 경로 또는 파일명으로 file_id 찾기"""
-        if nas_path:
-            normalized = normalize_nas_path(nas_path)
-            # 정확히 매칭
-            if normalized in self.file_mapping:
-                return self.file_mapping[normalized]
-            # 부분 매칭 (폴더 경로)
-            for path, file_id in self.file_mapping.items():
-                if normalized in path or path in normalized:
-                    return file_id
-
-        # 파일명으로 검색
-        if filename:
-            filename_normalized = filename.lower()
-            cursor = self.conn.execute(
-                "SELECT id FROM files WHERE LOWER(filename) LIKE ?", (f"%{filename_normalized}%",)
-            )
-            row = cursor.fetchone()
-            if row:
-                return row["id"]
-
-        return None
+        return self.resolver.resolve(nas_path, filename)
 
     def parse_sheet_row(self, headers: List[str], row: List[str]) -> Optional[Dict[str, Any]]:
         """시트 행을 hands 레코드로 변환"""
@@ -276,22 +430,43 @@ class ArchiveHandsSync:
             "_source_path": nas_path,
         }
 
+    def read_worksheets(self, titles: List[str] = None) -> Dict[str, List[List[str]]]:
+        """여러 워크시트 값을 한 번에 읽기 (목록 1회 + values_batch_get 1회/100시트)
+
+        Args:
+            titles: 읽을 워크시트 이름 (None이면 전체)
+
+        Returns:
+            {워크시트 이름: 값} - get_all_values()처럼 행 길이를 맞춤, 없는 시트는 제외
+        """
+        existing = [ws.title for ws in self.scheduler.read(self.spreadsheet.worksheets)]
+        if titles is not None:
+            wanted = set(titles)
+            existing = [title for title in existing if title in wanted]
+        ranges = [absolute_range_name(title) for title in existing]
+        values = self.scheduler.batch_get(self.spreadsheet, ranges) if ranges else []
+        return {title: fill_rows(rows) for title, rows in zip(existing, values)}
+
     def sync_worksheet(self, worksheet_name: str, dry_run: bool = False) -> Dict[str, int]:
         """단일 워크시트 동기화"""
-        stats = {"inserted": 0, "updated": 0, "skipped": 0, "no_file": 0}
-
         try:
-            ws = self.spreadsheet.worksheet(worksheet_name)
+            ws = self.scheduler.read(self.spreadsheet.worksheet, worksheet_name)
         except gspread.WorksheetNotFound:
             print(f"  Worksheet not found: {worksheet_name}")
-            return stats
+            return {"inserted": 0, "updated": 0, "skipped": 0, "no_file": 0}
+
+        return self.sync_values(self.scheduler.read(ws.get_all_values), dry_run)
+
+    def sync_values(self, all_values: List[List[str]], dry_run: bool = False) -> Dict[str, int]:
+        """읽어 둔 워크시트 값 → hands 테이블 동기화"""
+        stats = {"inserted": 0, "updated": 0, "skipped": 0, "no_file": 0}
 
-        all_values = ws.get_all_values()
         if len(all_values) < 4:
             return stats
 
         headers = all_values[2]  # 3행이 헤더
         data_rows = all_values[3:]  # 4행부터 데이터
+        staged = []  # bulk_write: 워크시트 단위로 모아서 한 번에 반영
 
         for row in data_rows:
             record = self.parse_sheet_row(headers, row)
@@ -311,16 +486,128 @@ class ArchiveHandsSync:
                     f"tags={record['tags']}"
                 )
                 stats["inserted"] += 1
+            elif self.config.bulk_write:
+                staged.append(record)
+                stats["inserted"] += 1
             else:
                 # DB에 upsert
                 self._upsert_hand(record)
                 stats["inserted"] += 1
 
         if not dry_run:
-            self.conn.commit()
+            try:
+                if staged:
+                    self._bulk_upsert_hands(staged)
+                self.conn.commit()
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
 
         return stats
 
+    def _bulk_upsert_hands(self, records: List[Dict[str, Any]]):
+        """hands + 정규화 테이블 일괄 upsert (임시 테이블 경유, 커밋은 호출자)
+
+        _upsert_hand를 행마다 부르는 것과 같은 결과를 집합 연산으로 만듭니다.
+        - 같은 (file_id, hand_number)가 여러 번 나오면 마지막 행 기준
+        - 기존 핸드는 가장 작은 id 행을 갱신, 없으면 새로 추가 (INSERT ... ON CONFLICT 1회)
+        - 플레이어/태그가 있는 핸드만 hand_players/hand_tags를 지우고
+          JSON 컬럼을 json_each로 펼쳐 INSERT ... SELECT로 다시 채움
+
+        executescript()는 먼저 COMMIT하므로 문장마다 execute()로 실행합니다.
+        """
+        conn = self.conn
+        for sql in (
+            "CREATE INDEX IF NOT EXISTS idx_hands_file_hand ON hands(file_id, hand_number)",
+            """CREATE TEMP TABLE IF NOT EXISTS staged_hands (
+                seq INTEGER PRIMARY KEY,
+                hand_id INTEGER,
+                file_id, hand_number, start_sec, end_sec, highlight_score,
+                cards_shown, players, tags, title_source
+            )""",
+            "DELETE FROM temp.staged_hands",
+        ):
+            conn.execute(sql)
+
+        hands_rows = [
+            (
+                seq,
+                record["file_id"],
+                record["hand_number"],
+                record["start_sec"],
+                record["end_sec"],
+                record["highlight_score"],
+                record["cards_shown"],
+                record["players"],
+                record["tags"],
+                record["title_source"],
+            )
+            for seq, record in enumerate(records)
+        ]
+        conn.executemany(
+            """
+            INSERT INTO temp.staged_hands (
+                seq, file_id, hand_number, start_sec, end_sec,
+                highlight_score, cards_shown, players, tags, title_source
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            hands_rows,
+        )
+
+        for sql in (
+            # 시트 안 중복 핸드는 마지막 행만
+            """DELETE FROM temp.staged_hands WHERE seq NOT IN (
+                SELECT MAX(seq) FROM temp.staged_hands GROUP BY file_id, hand_number
+            )""",
+            # 기존 핸드 id
+            """UPDATE temp.staged_hands SET hand_id = (
+                SELECT MIN(h.id) FROM hands h
+                WHERE h.file_id = staged_hands.file_id
+                  AND h.hand_number = staged_hands.hand_number
+            )""",
+            # hands upsert (hand_id가 NULL이면 새 id, 있으면 UPDATE)
+            """INSERT INTO hands (
+                id, file_id, hand_number, start_sec, end_sec,
+                highlight_score, cards_shown, players, tags, title_source
+            )
+            SELECT hand_id, file_id, hand_number, start_sec, end_sec,
+                   highlight_score, cards_shown, players, tags, title_source
+            FROM temp.staged_hands WHERE true ORDER BY seq
+            ON CONFLICT(id) DO UPDATE SET
+                start_sec = excluded.start_sec,
+                end_sec = excluded.end_sec,
+                highlight_score = excluded.highlight_score,
+                cards_shown = excluded.cards_shown,
+                players = excluded.players,
+                tags = excluded.tags,
+                title_source = excluded.title_source""",
+            # 새로 추가된 핸드 id
+            """UPDATE temp.staged_hands SET hand_id = (
+                SELECT MIN(h.id) FROM hands h
+                WHERE h.file_id = staged_hands.file_id
+                  AND h.hand_number = staged_hands.hand_number
+            )
+            WHERE hand_id IS NULL""",
+            # 정규화 테이블 (hand_players, hand_tags) 재구성
+            """DELETE FROM hand_players WHERE hand_id IN (
+                SELECT hand_id FROM temp.staged_hands WHERE players IS NOT NULL
+            )""",
+            """INSERT INTO hand_players (hand_id, player_name, position)
+            SELECT s.hand_id, trim(p.value), p.key + 1
+            FROM temp.staged_hands s, json_each(s.players) p
+            WHERE p.type = 'text' AND p.value != ''
+            ORDER BY s.seq, p.key""",
+            """DELETE FROM hand_tags WHERE hand_id IN (
+                SELECT hand_id FROM temp.staged_hands WHERE tags IS NOT NULL
+            )""",
+            """INSERT OR IGNORE INTO hand_tags (hand_id, tag)
+            SELECT s.hand_id, trim(t.value)
+            FROM temp.staged_hands s, json_each(s.tags) t
+            WHERE t.type = 'text' AND t.value != ''
+            ORDER BY s.seq, t.key""",
+        ):
+            conn.execute(sql)
+
     def _upsert_hand(self, record: Dict[str, Any]):
         """hands 테이블에 upsert + 정규화 테이블 업데이트"""
         # file_id + hand_number로 중복 체크
@@ -422,15 +709,31 @@ class ArchiveHandsSync:
             except (json.JSONDecodeError, TypeError):
                 pass
 
-    def sync_all(self, dry_run: bool = False):
-        """모든 워크시트 동기화"""
-        print(f"Syncing archive sheets (dry_run={dry_run})...")
+    def sync_all(self, dry_run: bool = False, bulk: bool = None):
+        """모든 워크시트 동기화
+
+        Args:
+            dry_run: 미리보기 (DB 쓰기 없음)
+            bulk: 모든 워크시트를 values_batch_get으로 한 번에 읽기 (None이면 config.bulk)
+        """
+        bulk = self.config.bulk if bulk is None else bulk
+        print(f"Syncing archive sheets (dry_run={dry_run}, bulk={bulk})...")
+        cycle = self._start_cycle()
 
         total_stats = {"inserted": 0, "updated": 0, "skipped": 0, "no_file": 0}
 
-        for ws in self.spreadsheet.worksheets():
-            print(f"\n  [{ws.title}]")
-            stats = self.sync_worksheet(ws.title, dry_run)
+        if bulk:
+            worksheets = self.read_worksheets().items()
+        else:
+            all_worksheets = self.scheduler.read(self.spreadsheet.worksheets)
+            worksheets = [(ws.title, None) for ws in all_worksheets]
+
+        for title, all_values in worksheets:
+            print(f"\n  [{title}]")
+            if all_values is None:
+                stats = self.sync_worksheet(title, dry_run)
+            else:
+                stats = self.sync_values(all_values, dry_run)
             for key in total_stats:
                 total_stats[key] += stats.get(key, 0)
             print(f"    -> inserted: {stats['inserted']}, no_file: {stats['no_file']}")
@@ -438,9 +741,22 @@ class ArchiveHandsSync:
         print("\n=== Total ===")
         print(f"  Inserted: {total_stats['inserted']}")
         print(f"  No file match: {total_stats['no_file']}")
+        self._end_cycle(cycle)
 
         return total_stats
 
+    def _start_cycle(self) -> Tuple[float, int, int]:
+        return time.perf_counter(), self.scheduler.stats["read"], self.scheduler.stats["write"]
+
+    def _end_cycle(self, cycle: Tuple[float, int, int]):
+        """사이클별 API 호출 수와 소요 시간 출력"""
+        start, reads, writes = cycle
+        print(
+            f"  API calls: read {self.scheduler.stats['read'] - reads}, "
+            f"write {self.scheduler.stats['write'] - writes} "
+            f"({time.perf_counter() - start:.1f}s)"
+        )
+
     def close(self):
         """연결 종료"""
         self.conn.close()
@@ -465,6 +781,11 @@ class ArchiveHandsSync:
 
                 print(f"[{now}] Next sync in {interval//60} minutes...")
                 time.sleep(interval)
+                # 다음 사이클용 파일 색인 갱신 (새로 동기화된 files 반영)
+                try:
+                    self._load_file_mapping()
+                except sqlite3.Error as e:
+                    print(f"File mapping reload error (using previous): {e}")
         except KeyboardInterrupt:
             print("\nDaemon stopped.")
 
@@ -531,8 +852,14 @@ class ArchiveHandsSync:
     def get_worksheet_file_mapping(self, worksheet_name: str) -> Optional[Tuple[str, str]]:
         """워크시트에서 NAS 경로와 파일명 추출"""
         try:
-            ws = self.spreadsheet.worksheet(worksheet_name)
-            all_values = ws.get_all_values()
+            ws = self.scheduler.read(self.spreadsheet.worksheet, worksheet_name)
+            return self._file_info_from_values(self.scheduler.read(ws.get_all_values))
+        except Exception:
+            return None
+
+    def _file_info_from_values(self, all_values: List[List[str]]) -> Optional[Tuple[str, str]]:
+        """워크시트 값(첫 데이터 행)에서 NAS 경로와 파일명 추출"""
+        try:
             if len(all_values) < 4:
                 return None
 
@@ -561,19 +888,28 @@ class ArchiveHandsSync:
         워크시트의 NAS 경로로 file_id를 찾고,
         해당 file_id의 모든 hands를 시트에 업데이트
         """
-        stats = {"synced": 0, "added": 0, "skipped": 0, "no_match": 0}
-
         try:
-            ws = self.spreadsheet.worksheet(worksheet_name)
+            ws = self.scheduler.read(self.spreadsheet.worksheet, worksheet_name)
         except gspread.WorksheetNotFound:
             print(f"  Worksheet not found: {worksheet_name}")
-            return stats
+            return {"synced": 0, "added": 0, "skipped": 0, "no_match": 0}
+
+        stats, updates = self.reverse_updates(self.scheduler.read(ws.get_all_values))
+        self._push_updates({worksheet_name: updates}, dry_run)
+        return stats
+
+    def reverse_updates(
+        self, all_values: List[List[str]]
+    ) -> Tuple[Dict[str, int], List[Tuple[int, int, str]]]:
+        """읽어 둔 워크시트 값과 DB hands 비교 → (통계, [(행, 열, 값)] 변경 셀 목록)"""
+        stats = {"synced": 0, "added": 0, "skipped": 0, "no_match": 0}
+        updates = []  # (row, col, value) 리스트
 
         # 시트에서 파일 정보 추출
-        file_info = self.get_worksheet_file_mapping(worksheet_name)
+        file_info = self._file_info_from_values(all_values)
         if not file_info:
             print("  No file info in worksheet")
-            return stats
+            return stats, updates
 
         nas_path, filename = file_info
         file_id = self.find_file_id(nas_path, filename)
@@ -581,7 +917,7 @@ class ArchiveHandsSync:
         if not file_id:
             print(f"  No file_id match for: {filename[:50]}...")
             stats["no_match"] = 1
-            return stats
+            return stats, updates
 
         # DB에서 해당 파일의 hands 조회
         cursor = self.conn.execute(
@@ -599,12 +935,10 @@ class ArchiveHandsSync:
 
         if not db_hands:
             print(f"  No hands in DB for file_id={file_id}")
-            return stats
+            return stats, updates
 
-        # 시트 데이터 읽기
-        all_values = ws.get_all_values()
         if len(all_values) < 3:
-            return stats
+            return stats, updates
 
         headers = all_values[2]
 
@@ -621,8 +955,6 @@ class ArchiveHandsSync:
         emotion_indices = find_col_indices("Tag (Emotion)")
 
         # 각 데이터 행 업데이트
-        updates = []  # (row, col, value) 리스트
-
         for row_idx, row in enumerate(all_values[3:], start=4):  # 4행부터 (1-indexed)
             if len(row) == 0:
                 continue
@@ -708,34 +1040,69 @@ class ArchiveHandsSync:
 
             stats["synced"] += 1
 
-        # 배치 업데이트
-        if updates and not dry_run:
-            for row, col, value in updates:
-                ws.update_cell(row, col, value)
-            stats["added"] = len(updates)
-        elif updates:
-            print(f"    [DRY-RUN] Would update {len(updates)} cells")
-            stats["added"] = len(updates)
+        stats["added"] = len(updates)
+        return stats, updates
+
+    def _push_updates(
+        self, updates_by_title: Dict[str, List[Tuple[int, int, str]]], dry_run: bool = False
+    ):
+        """변경 셀을 values_batch_update 한 번으로 쓰기 (워크시트 여러 개 가능)"""
+        data = [
+            {
+                "range": absolute_range_name(title, rowcol_to_a1(row, col)),
+                "values": [[value]],
+            }
+            for title, updates in updates_by_title.items()
+            for row, col, value in updates
+        ]
+        if not data:
+            return
+        if dry_run:
+            print(f"    [DRY-RUN] Would update {len(data)} cells")
+            return
+        # update_cell과 같은 입력 방식 (타임코드 등 사용자 입력처럼 해석)
+        self.scheduler.write(
+            self.spreadsheet.values_batch_update,
+            {"valueInputOption": "USER_ENTERED", "data": data},
+        )
 
-        return stats
+    def reverse_sync_all(self, dry_run: bool = False, bulk: bool = None):
+        """모든 워크시트 역동기화 (DB → Sheet)
 
-    def reverse_sync_all(self, dry_run: bool = False):
-        """모든 워크시트 역동기화 (DB → Sheet)"""
-        print(f"Reverse syncing to archive sheets (dry_run={dry_run})...")
+        bulk 모드는 전체 워크시트를 한 번에 읽고, 모든 변경 셀을
+        values_batch_update 한 번으로 씁니다. (None이면 config.bulk)
+        """
+        bulk = self.config.bulk if bulk is None else bulk
+        print(f"Reverse syncing to archive sheets (dry_run={dry_run}, bulk={bulk})...")
+        cycle = self._start_cycle()
 
         total_stats = {"synced": 0, "added": 0, "skipped": 0, "no_match": 0}
+        pending: Dict[str, List[Tuple[int, int, str]]] = {}
 
-        for ws in self.spreadsheet.worksheets():
-            print(f"\n  [{ws.title}]")
-            stats = self.reverse_sync_worksheet(ws.title, dry_run)
+        if bulk:
+            worksheets = self.read_worksheets().items()
+        else:
+            all_worksheets = self.scheduler.read(self.spreadsheet.worksheets)
+            worksheets = [(ws.title, None) for ws in all_worksheets]
+
+        for title, all_values in worksheets:
+            print(f"\n  [{title}]")
+            if all_values is None:
+                stats = self.reverse_sync_worksheet(title, dry_run)
+            else:
+                stats, pending[title] = self.reverse_updates(all_values)
             for key in total_stats:
                 total_stats[key] += stats.get(key, 0)
             print(f"    -> synced: {stats['synced']}, cells updated: {stats['added']}")
 
+        if pending:
+            self._push_updates(pending, dry_run)
+
         print("\n=== Total ===")
         print(f"  Hands synced: {total_stats['synced']}")
         print(f"  Cells updated: {total_stats['added']}")
         print(f"  No file match: {total_stats['no_match']}")
+        self._end_cycle(cycle)
 
         return total_stats
 
@@ -756,6 +1123,11 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Preview without writing")
     parser.add_argument("--sheet", type=str, help="Sync specific worksheet only")
     parser.add_argument("--daemon", action="store_true", help="Run as background daemon")
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Read all worksheets in one batch request and write all cell updates in one",
+    )
     parser.add_argument(
         "--interval", type=int, default=3600, help="Sync interval in seconds (default: 3600 = 1hr)"
     )
@@ -763,6 +1135,8 @@ def main():
     args = parser.parse_args()
 
     config = ArchiveSyncConfig(sync_interval_seconds=args.interval)
+    if args.bulk:
+        config.bulk = True
     sync = ArchiveHandsSync(config)
 
     try:
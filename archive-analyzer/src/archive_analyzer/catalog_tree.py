@@ -0,0 +1,338 @@
+"""카탈로그 트리 사전 집계 (file_catalogs, catalog_nodes)
+
+웹 대시보드의 카탈로그 트리가 요청마다 LIKE 전체 스캔을 하지 않도록
+classify_path_multilevel() 분류 결과를 archive.db에 저장하고 노드별 집계를 유지합니다.
+
+- file_catalogs: 비디오 파일별 (catalog_id, subcatalog_id, depth, year)
+  경로나 패턴(catalog_patterns.yaml)이 바뀐 행만 다시 분류합니다.
+- catalog_nodes: 카탈로그/서브카탈로그 노드별 직속 파일 수, 하위 포함 파일 수,
+  크기, pokervod.db 동기화 파일 수 (filename 기준)
+- 노드의 파일 목록은 (catalog_id, subcatalog_id, file_id) 인덱스로 cursor 페이지 조회
+
+분류는 Python 정규식이라 트리거로 유지할 수 없으므로 SyncService.run_full_sync()가
+동기화 후 refresh_catalog_tree()로 갱신합니다 (scripts/rebuild_catalog_tree.py로 수동 갱신).
+"""
+
+import hashlib
+import logging
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .sync import (
+    SubcatalogMatch,
+    classify_path_multilevel,
+    get_multilevel_patterns,
+    parent_subcatalog_id,
+    subcatalog_display_name,
+)
+
+logger = logging.getLogger(__name__)
+
+_NOW = "strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')"
+
+# subcatalog_id '' = 카탈로그 루트 (서브카탈로그 없이 카탈로그에 직속)
+ROOT = ""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_catalogs (
+    file_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    catalog_id TEXT NOT NULL,
+    subcatalog_id TEXT NOT NULL DEFAULT '',
+    depth INTEGER NOT NULL DEFAULT 0,
+    year TEXT,
+    pattern_version TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_file_catalogs_node
+    ON file_catalogs(catalog_id, subcatalog_id, file_id);
+CREATE TABLE IF NOT EXISTS catalog_nodes (
+    catalog_id TEXT NOT NULL,
+    subcatalog_id TEXT NOT NULL DEFAULT '',
+    parent_id TEXT,
+    depth INTEGER NOT NULL DEFAULT 0,
+    name TEXT NOT NULL,
+    direct_files INTEGER NOT NULL DEFAULT 0,
+    total_files INTEGER NOT NULL DEFAULT 0,
+    total_size INTEGER NOT NULL DEFAULT 0,
+    synced_files INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT,
+    PRIMARY KEY (catalog_id, subcatalog_id)
+);
+"""
+
+# 분류가 없거나 경로/패턴 버전이 달라진 비디오 파일
+_CHANGED_SQL = """
+    SELECT f.id, f.path
+    FROM files f
+    LEFT JOIN file_catalogs c ON c.file_id = f.id
+    WHERE f.file_type = 'video'
+      AND (c.file_id IS NULL OR c.path IS NOT f.path OR c.pattern_version IS NOT ?)
+"""
+
+_STALE_SQL = """
+    DELETE FROM file_catalogs
+    WHERE file_id NOT IN (SELECT id FROM files WHERE file_type = 'video')
+"""
+
+_UPSERT_SQL = """
+    INSERT INTO file_catalogs
+        (file_id, path, catalog_id, subcatalog_id, depth, year, pattern_version)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_id) DO UPDATE SET
+        path = excluded.path,
+        catalog_id = excluded.catalog_id,
+        subcatalog_id = excluded.subcatalog_id,
+        depth = excluded.depth,
+        year = excluded.year,
+        pattern_version = excluded.pattern_version
+"""
+
+# pokervod.db(pv)에 같은 filename이 있으면 동기화된 파일 (웹 매칭 화면과 동일 기준)
+_SYNCED_SQL = "EXISTS (SELECT 1 FROM pv.files p WHERE p.filename = f.filename)"
+
+
+@dataclass
+class CatalogNode:
+    """카탈로그 트리 노드"""
+
+    catalog_id: str
+    subcatalog_id: str
+    parent_id: Optional[str]
+    depth: int
+    name: str
+    direct_files: int = 0
+    total_files: int = 0
+    total_size: int = 0
+    synced_files: int = 0
+    updated_at: Optional[str] = None
+    children: List["CatalogNode"] = field(default_factory=list)
+
+
+def pattern_version() -> str:
+    """현재 multilevel_patterns의 버전 (패턴이 바뀌면 전체 재분류)"""
+    return hashlib.sha1(repr(get_multilevel_patterns()).encode("utf-8")).hexdigest()[:12]
+
+
+def has_catalog_tables(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'catalog_nodes'"
+    ).fetchone()
+    return row is not None
+
+
+def ensure_catalog_schema(conn: sqlite3.Connection) -> None:
+    conn.executescript(_SCHEMA)
+
+
+def refresh_file_catalogs(conn: sqlite3.Connection) -> Tuple[int, int]:
+    """바뀐 비디오 파일만 다시 분류 (호출자가 커밋)
+
+    Returns:
+        (분류한 행 수, 삭제한 행 수)
+    """
+    version = pattern_version()
+    changed = conn.execute(_CHANGED_SQL, (version,)).fetchall()
+    removed = conn.execute(_STALE_SQL).rowcount
+
+    rows = []
+    for file_id, path in changed:
+        match = classify_path_multilevel(path)
+        rows.append(
+            (
+                file_id,
+                path,
+                match.catalog_id,
+                match.full_subcatalog_id or ROOT,
+                match.depth,
+                match.year,
+                version,
+            )
+        )
+    conn.executemany(_UPSERT_SQL, rows)
+    return len(rows), removed
+
+
+def _node_parent(catalog_id: str, subcatalog_id: str, depth: int, year: Optional[str]) -> str:
+    """상위 노드의 subcatalog_id (없으면 카탈로그 루트)"""
+    parent = parent_subcatalog_id(SubcatalogMatch(catalog_id, subcatalog_id, depth, year))
+    return parent if parent and parent != subcatalog_id else ROOT
+
+
+def rebuild_catalog_nodes(conn: sqlite3.Connection, pokervod_attached: bool = False) -> int:
+    """file_catalogs에서 노드 집계 재생성 (호출자가 커밋)
+
+    Args:
+        pokervod_attached: pokervod.db가 pv로 ATTACH되어 있으면 동기화 파일 수 집계
+
+    Returns:
+        노드 수
+    """
+    synced = f"SUM({_SYNCED_SQL})" if pokervod_attached else "0"
+    direct = conn.execute(
+        f"""
+        SELECT c.catalog_id, c.subcatalog_id, MAX(c.depth), MAX(c.year),
+               COUNT(*), SUM(COALESCE(f.size_bytes, 0)), {synced}
+        FROM file_catalogs c
+        JOIN files f ON f.id = c.file_id
+        GROUP BY c.catalog_id, c.subcatalog_id
+        """
+    ).fetchall()
+
+    nodes: Dict[Tuple[str, str], CatalogNode] = {}
+
+    def node_for(catalog_id: str, subcatalog_id: str, depth: int, year: Optional[str]):
+        key = (catalog_id, subcatalog_id)
+        node = nodes.get(key)
+        # 연도는 {year} 템플릿으로 만든 ID일 때만 의미가 있음 (범위 ID는 파일마다 다름)
+        if year and not subcatalog_id.endswith(f"-{year}"):
+            year = None
+        if node is None:
+            if subcatalog_id == ROOT:
+                node = CatalogNode(catalog_id, ROOT, None, 0, catalog_id)
+            else:
+                match = SubcatalogMatch(catalog_id, subcatalog_id, depth, year)
+                node = CatalogNode(
+                    catalog_id,
+                    subcatalog_id,
+                    _node_parent(catalog_id, subcatalog_id, depth, year),
+                    depth,
+                    subcatalog_display_name(subcatalog_id, match),
+                )
+            nodes[key] = node
+        return node
+
+    for catalog_id, subcatalog_id, depth, year, count, size, synced_count in direct:
+        node = node_for(catalog_id, subcatalog_id, depth, year)
+        node.direct_files = count
+
+        # 자기 자신과 모든 상위 노드에 누적
+        current = node
+        seen = {current.subcatalog_id}
+        while True:
+            current.total_files += count
+            current.total_size += size or 0
+            current.synced_files += synced_count or 0
+            if current.parent_id is None or current.parent_id in seen:
+                break
+            seen.add(current.parent_id)
+            current = node_for(catalog_id, current.parent_id, max(0, current.depth - 1), None)
+
+    conn.execute("DELETE FROM catalog_nodes")
+    conn.executemany(
+        f"""
+        INSERT INTO catalog_nodes
+            (catalog_id, subcatalog_id, parent_id, depth, name,
+             direct_files, total_files, total_size, synced_files, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, {_NOW})
+        """,
+        [
+            (
+                n.catalog_id, n.subcatalog_id, n.parent_id, n.depth, n.name,
+                n.direct_files, n.total_files, n.total_size, n.synced_files,
+            )
+            for n in nodes.values()
+        ],
+    )
+    return len(nodes)
+
+
+def refresh_catalog_tree(archive_db: str, pokervod_db: Optional[str] = None) -> Dict[str, int]:
+    """분류 증분 갱신 + 노드 집계 재생성
+
+    Args:
+        archive_db: archive.db 경로
+        pokervod_db: pokervod.db 경로 (있으면 동기화 파일 수 집계)
+
+    Returns:
+        {"classified", "removed", "nodes"}
+    """
+    conn = sqlite3.connect(archive_db)
+    try:
+        ensure_catalog_schema(conn)
+        attached = False
+        if pokervod_db:
+            conn.execute("ATTACH DATABASE ? AS pv", (pokervod_db,))
+            attached = True
+        with conn:
+            classified, removed = refresh_file_catalogs(conn)
+            node_count = rebuild_catalog_nodes(conn, pokervod_attached=attached)
+        if attached:
+            conn.execute("DETACH DATABASE pv")
+    finally:
+        conn.close()
+
+    logger.info(
+        f"카탈로그 트리 갱신: 분류 {classified}건, 삭제 {removed}건, 노드 {node_count}개"
+    )
+    return {"classified": classified, "removed": removed, "nodes": node_count}
+
+
+def read_catalog_tree(conn: sqlite3.Connection) -> List[CatalogNode]:
+    """노드 전체를 트리로 조회 (카탈로그 루트 목록, 파일 수 내림차순)"""
+    nodes = {
+        (row[0], row[1]): CatalogNode(*row)
+        for row in conn.execute(
+            """
+            SELECT catalog_id, subcatalog_id, parent_id, depth, name,
+                   direct_files, total_files, total_size, synced_files, updated_at
+            FROM catalog_nodes
+            ORDER BY total_files DESC, catalog_id, subcatalog_id
+            """
+        )
+    }
+    roots = []
+    for (catalog_id, _), node in nodes.items():
+        if node.parent_id is None:
+            roots.append(node)
+            continue
+        parent = nodes.get((catalog_id, node.parent_id))
+        if parent is None:
+            parent = nodes.get((catalog_id, ROOT))
+        if parent is not None:
+            parent.children.append(node)
+    return roots
+
+
+def read_node_files(
+    conn: sqlite3.Connection,
+    catalog_id: str,
+    subcatalog_id: str = ROOT,
+    cursor: Optional[int] = None,
+    limit: int = 50,
+    pokervod_attached: bool = False,
+) -> Tuple[List[Dict], Optional[int]]:
+    """노드 직속 파일 목록 (file_id 순 keyset 페이지)
+
+    Returns:
+        (파일 목록, 다음 cursor - 마지막 페이지면 None)
+    """
+    synced = _SYNCED_SQL if pokervod_attached else "0"
+    rows = conn.execute(
+        f"""
+        SELECT f.id, f.path, f.filename, f.size_bytes, {synced}
+        FROM file_catalogs c
+        JOIN files f ON f.id = c.file_id
+        WHERE c.catalog_id = ? AND c.subcatalog_id = ? AND c.file_id > ?
+        ORDER BY c.file_id
+        LIMIT ?
+        """,
+        (catalog_id, subcatalog_id, cursor or 0, limit + 1),
+    ).fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1][0]
+
+    files = [
+        {
+            "source_id": file_id,
+            "name": filename,
+            "path": path,
+            "status": "synced" if is_synced else "not_synced",
+            "size_bytes": size_bytes,
+        }
+        for file_id, path, filename, size_bytes, is_synced in rows
+    ]
+    return files, next_cursor
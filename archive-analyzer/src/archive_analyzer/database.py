@@ -1,9 +1,14 @@
 """SQLite 데이터베이스 모듈
 
 스캔 결과 저장 및 조회를 위한 데이터베이스 관리
+- 성능 프로필 (WAL, synchronous, cache/mmap 크기 등 PRAGMA 묶음)
+- 대량 적재 모드 (보조 인덱스 유지 지연)
+- 사전 집계 통계 (stats_summary, 트리거로 증분 갱신)
 """
 
+import json
 import logging
+import os
 import sqlite3
 import threading
 import time
@@ -12,8 +17,85 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Dict, Iterator, List, Optional, Tuple
 
+from .fts_search import refill_fts
+from .search_changes import STATE_TABLE as SEARCH_STATE_TABLE
+from .search_changes import _existing_tables, reset_sync_state
+from .stats_summary import (
+    StatsEntry,
+    create_stats_triggers,
+    ensure_stats_schema,
+    read_dimension,
+    rebuild_stats,
+)
+
 logger = logging.getLogger(__name__)
 
+# 연결마다 적용하는 PRAGMA 프로필 (SQLITE_PROFILE 환경변수로 선택)
+SQLITE_PROFILES: Dict[str, Dict[str, object]] = {
+    # 스캔 쓰기 중에도 웹 대시보드가 읽을 수 있도록 WAL (기본)
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,  # 약 64MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # 대량 적재용 (OS 장애 시 마지막 트랜잭션 유실 가능)
+    "bulk": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256000,  # 약 256MB
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # SQLite 기본값 유지 (WAL을 쓸 수 없는 네트워크 드라이브 등)
+    "legacy": {},
+}
+
+DEFAULT_SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "balanced")
+
+# 프로필에 없는 PRAGMA 복원용 SQLite 기본값
+_PRAGMA_DEFAULTS: Dict[str, object] = {
+    "synchronous": "FULL",
+    "cache_size": -2000,
+    "mmap_size": 0,
+    "temp_store": "DEFAULT",
+}
+
+# files 보조 인덱스 (대량 적재 시 삭제 후 재생성)
+FILES_SECONDARY_INDEXES: Dict[str, str] = {
+    "idx_files_type": "CREATE INDEX IF NOT EXISTS idx_files_type ON files(file_type)",
+    "idx_files_status": "CREATE INDEX IF NOT EXISTS idx_files_status ON files(scan_status)",
+    "idx_files_parent": "CREATE INDEX IF NOT EXISTS idx_files_parent ON files(parent_folder)",
+    # 웹 매칭 화면: 같은 filename의 중복 파일 조회
+    "idx_files_filename": "CREATE INDEX IF NOT EXISTS idx_files_filename ON files(filename)",
+}
+
+# files UPSERT - INSERT OR REPLACE와 달리 행을 지우지 않으므로 id가 유지되고
+# 값이 같으면 아무것도 쓰지 않음 (인덱스 변경 없음)
+_FILES_UPSERT_SQL = """
+    INSERT INTO files
+    (path, filename, extension, size_bytes, modified_at, file_type, parent_folder, scan_status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        filename = excluded.filename,
+        extension = excluded.extension,
+        size_bytes = excluded.size_bytes,
+        modified_at = excluded.modified_at,
+        file_type = excluded.file_type,
+        parent_folder = excluded.parent_folder,
+        scan_status = excluded.scan_status
+    WHERE files.filename IS NOT excluded.filename
+        OR files.extension IS NOT excluded.extension
+        OR files.size_bytes IS NOT excluded.size_bytes
+        OR files.modified_at IS NOT excluded.modified_at
+        OR files.file_type IS NOT excluded.file_type
+        OR files.parent_folder IS NOT excluded.parent_folder
+        OR files.scan_status IS NOT excluded.scan_status
+"""
+
 
 @dataclass
 class MediaInfoRecord:
@@ -142,13 +224,25 @@ class Database:
 
     SCHEMA_VERSION = 1
 
-    def __init__(self, db_path: str = "archive.db", stats_cache_ttl: int = 60):
+    def __init__(
+        self,
+        db_path: str = "archive.db",
+        stats_cache_ttl: int = 60,
+        profile: Optional[str] = None,
+    ):
         """
         Args:
             db_path: 데이터베이스 파일 경로
             stats_cache_ttl: 통계 캐시 TTL (초, 기본값 60초) (#42)
+            profile: PRAGMA 프로필 이름 (SQLITE_PROFILES, 기본: SQLITE_PROFILE 환경변수)
         """
+        profile = profile or DEFAULT_SQLITE_PROFILE
+        if profile not in SQLITE_PROFILES:
+            raise ValueError(
+                f"Unknown SQLite profile: {profile} (available: {', '.join(SQLITE_PROFILES)})"
+            )
         self.db_path = db_path
+        self.profile = profile
         self._local = threading.local()  # #17 - 스레드 로컬 저장소
         self._stats_cache: Optional[Tuple[float, dict]] = None  # (timestamp, data) #42
         self._stats_cache_ttl = stats_cache_ttl  # #42
@@ -170,8 +264,76 @@ class Database:
         if self._connection is None:
             self._local.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self._local.conn.row_factory = sqlite3.Row
+            # INSERT OR REPLACE가 지우는 행에도 DELETE 트리거가 동작하도록 (stats_summary,
+            # search_changes, FTS 트리거 모두 필요). 외부 도구 연결에는 이 설정이 없으므로
+            # 그 경우 rebuild_stats() / reset_sync_state() / rebuild_fts()로 복구
+            self._local.conn.execute("PRAGMA recursive_triggers = ON")
+            self._apply_pragmas(self._local.conn, SQLITE_PROFILES[self.profile])
         return self._connection
 
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection, pragmas: Dict[str, object]) -> None:
+        """PRAGMA 적용 (journal_mode 변경 실패는 경고만)"""
+        for name, value in pragmas.items():
+            try:
+                conn.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.DatabaseError as e:
+                logger.warning(f"PRAGMA {name}={value} failed: {e}")
+
+    @contextmanager
+    def bulk_load(self):
+        """대량 적재 모드 컨텍스트 매니저 (명시적으로 켤 때만 사용)
+
+        - files 보조 인덱스를 삭제했다가 종료 시 한 번에 재생성
+          (행마다 인덱스 B-tree를 갱신하는 비용 제거)
+        - bulk 프로필 PRAGMA 적용 (synchronous=OFF, 큰 캐시) 후 원래 프로필로 복원
+        - files의 행 단위 트리거(stats_summary, search_changes, FTS)를 모두 끄고
+          종료 시 다시 만든 뒤 한 번에 재구성: 통계 재집계, FTS 'rebuild',
+          files 검색 인덱싱 상태 초기화 (다음 index_from_db는 files 전체 재인덱싱)
+
+        적재 중에는 다른 연결(대시보드/API)도 인덱스 없는 조회와 갱신 전 통계를 보므로
+        자동으로 켜지 않습니다 (오프라인 최초 적재용). 같은 스레드의 쓰기에만 적용되며,
+        변경 로그가 남지 않으므로 삽입/갱신에만 사용하세요 (삭제는 검색 인덱스에 반영 안 됨).
+
+        Usage:
+            with db.bulk_load():
+                db.insert_files_batch(records)
+        """
+        conn = self._get_connection()
+        # journal_mode는 DB 파일에 영구 저장되므로 현재 프로필 값을 유지
+        self._apply_pragmas(
+            conn, {k: v for k, v in SQLITE_PROFILES["bulk"].items() if k != "journal_mode"}
+        )
+        for name in FILES_SECONDARY_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        triggers = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'files'"
+        ).fetchall()
+        for name, _ in triggers:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        conn.commit()
+        logger.info(
+            f"Bulk load mode: secondary indexes and {len(triggers)} triggers on files dropped"
+        )
+
+        try:
+            yield self
+        finally:
+            conn = self._get_connection()
+            for sql in FILES_SECONDARY_INDEXES.values():
+                conn.execute(sql)
+            for name, sql in triggers:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+                conn.execute(sql)
+            rebuild_stats(conn)
+            refill_fts(conn, ("files",))
+            if SEARCH_STATE_TABLE in _existing_tables(conn):
+                reset_sync_state(conn, ("files",))
+            conn.commit()
+            self._apply_pragmas(conn, _PRAGMA_DEFAULTS | SQLITE_PROFILES[self.profile])
+            self.invalidate_stats_cache()
+            logger.info("Bulk load mode finished: indexes, triggers and derived tables rebuilt")
+
     @contextmanager
     def transaction(self):
         """트랜잭션 컨텍스트 매니저 (#34 - 연결 복구 로직 추가)"""
@@ -216,9 +378,8 @@ class Database:
 
         # 인덱스 생성
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_path ON files(path)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_type ON files(file_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_status ON files(scan_status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_parent ON files(parent_folder)")
+        for sql in FILES_SECONDARY_INDEXES.values():
+            cursor.execute(sql)
 
         # 스캔 체크포인트 테이블
         cursor.execute(
@@ -372,6 +533,57 @@ class Database:
             "CREATE INDEX IF NOT EXISTS idx_media_files_normalized ON media_files(normalized_name)"
         )
 
+        # FFprobe 결과 캐시 (콘텐츠 지문 = 크기 + 앞/뒤 일부 해시)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS probe_cache (
+                fingerprint TEXT PRIMARY KEY,
+                file_size INTEGER NOT NULL,
+                media_json TEXT NOT NULL,
+                hit_count INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        # 디렉토리 상태 테이블 (증분 스캔 - 디렉토리 mtime 기반 변경 감지)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS directories (
+                path TEXT PRIMARY KEY,
+                parent_path TEXT,
+                mtime REAL,
+                child_count INTEGER DEFAULT 0,
+                file_count INTEGER DEFAULT 0,
+                scanned_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_directories_parent ON directories(parent_path)"
+        )
+
+        # 파일 변경 이력 테이블 (웹 대시보드 get_file_history에서 조회)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS file_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_id INTEGER,
+                event_type TEXT NOT NULL,
+                old_path TEXT,
+                new_path TEXT,
+                detected_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_file_history_detected ON file_history(detected_at)"
+        )
+
+        # 사전 집계 통계 (기존 DB에 처음 생성하는 경우 전체 재집계)
+        if ensure_stats_schema(conn):
+            rebuild_stats(conn)
+
         conn.commit()
         logger.info(f"Database schema ensured at {self.db_path}")
 
@@ -396,11 +608,7 @@ class Database:
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-            INSERT OR REPLACE INTO files
-            (path, filename, extension, size_bytes, modified_at, file_type, parent_folder, scan_status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+            _FILES_UPSERT_SQL,
             (
                 record.path,
                 record.filename,
@@ -415,7 +623,10 @@ class Database:
 
         conn.commit()
         self.invalidate_stats_cache()  # #42 - 캐시 무효화
-        return cursor.lastrowid
+
+        # UPSERT가 UPDATE로 처리되면 lastrowid가 갱신되지 않으므로 경로로 조회
+        row = conn.execute("SELECT id FROM files WHERE path = ?", (record.path,)).fetchone()
+        return row[0] if row else cursor.lastrowid
 
     def insert_files_batch(self, records: List[FileRecord]) -> int:
         """파일 레코드 일괄 삽입
@@ -446,14 +657,7 @@ class Database:
             for r in records
         ]
 
-        cursor.executemany(
-            """
-            INSERT OR REPLACE INTO files
-            (path, filename, extension, size_bytes, modified_at, file_type, parent_folder, scan_status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            data,
-        )
+        cursor.executemany(_FILES_UPSERT_SQL, data)
 
         conn.commit()
         self.invalidate_stats_cache()  # #42 - 캐시 무효화
@@ -493,6 +697,49 @@ class Database:
         for row in cursor:
             yield FileRecord.from_row(tuple(row), columns)
 
+    def iter_files_for_media(
+        self, file_type: str = "video", skip_existing: bool = True, page_size: int = 500
+    ) -> Iterator[FileRecord]:
+        """미디어 추출 대상 파일 지연 조회 (id 키셋 페이지 단위)
+
+        페이지마다 커서를 닫으므로, 다른 스레드의 쓰기 트랜잭션을
+        장시간 막지 않습니다.
+
+        Args:
+            file_type: 파일 유형
+            skip_existing: 추출 성공한 media_info가 있는 파일 제외
+            page_size: 페이지 크기
+        """
+        conn = self._get_connection()
+        condition = (
+            """AND NOT EXISTS (
+                SELECT 1 FROM media_info m
+                WHERE m.file_id = f.id AND m.extraction_status = 'success'
+            )"""
+            if skip_existing
+            else ""
+        )
+        last_id = 0
+
+        while True:
+            cursor = conn.execute(
+                f"""
+                SELECT f.* FROM files f
+                WHERE f.file_type = ? AND f.id > ? {condition}
+                ORDER BY f.id
+                LIMIT ?
+            """,
+                (file_type, last_id, page_size),
+            )
+            columns = [col[0] for col in cursor.description]
+            rows = cursor.fetchall()
+            if not rows:
+                return
+
+            for row in rows:
+                yield FileRecord.from_row(tuple(row), columns)
+            last_id = rows[-1]["id"]
+
     def update_file_status(self, path: str, status: str) -> bool:
         """파일 상태 업데이트"""
         conn = self._get_connection()
@@ -519,6 +766,119 @@ class Database:
         cursor.execute("SELECT 1 FROM files WHERE path = ? LIMIT 1", (path,))
         return cursor.fetchone() is not None
 
+    def get_files_in_folder(self, parent_folder: str) -> List[sqlite3.Row]:
+        """폴더 직속 파일 조회 (id, path, size_bytes, modified_at)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT id, path, size_bytes, modified_at FROM files WHERE parent_folder = ?",
+            (parent_folder,),
+        )
+        return cursor.fetchall()
+
+    # === 디렉토리 상태 (증분 스캔) ===
+
+    def get_directory_states(self) -> Dict[str, dict]:
+        """저장된 디렉토리 상태 전체 조회
+
+        Returns:
+            {path: {parent_path, mtime, child_count, file_count}}
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT path, parent_path, mtime, child_count, file_count FROM directories"
+        )
+        return {
+            row["path"]: {
+                "parent_path": row["parent_path"],
+                "mtime": row["mtime"],
+                "child_count": row["child_count"],
+                "file_count": row["file_count"],
+            }
+            for row in cursor.fetchall()
+        }
+
+    def save_directory_states(self, states: List[dict]) -> int:
+        """디렉토리 상태 일괄 저장
+
+        Args:
+            states: {path, parent_path, mtime, child_count, file_count} 목록
+
+        Returns:
+            저장된 레코드 수
+        """
+        if not states:
+            return 0
+
+        conn = self._get_connection()
+        now = datetime.now().isoformat()
+        conn.executemany(
+            """
+            INSERT INTO directories (path, parent_path, mtime, child_count, file_count, scanned_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                parent_path = excluded.parent_path,
+                mtime = excluded.mtime,
+                child_count = excluded.child_count,
+                file_count = excluded.file_count,
+                scanned_at = excluded.scanned_at
+        """,
+            [
+                (
+                    st["path"],
+                    st.get("parent_path"),
+                    st["mtime"],
+                    st.get("child_count", 0),
+                    st.get("file_count", 0),
+                    now,
+                )
+                for st in states
+            ],
+        )
+        conn.commit()
+        return len(states)
+
+    def delete_directory_states(self, paths: List[str]) -> int:
+        """디렉토리 상태 삭제 (NAS에서 사라진 폴더)"""
+        if not paths:
+            return 0
+
+        conn = self._get_connection()
+        conn.executemany("DELETE FROM directories WHERE path = ?", [(p,) for p in paths])
+        conn.commit()
+        return len(paths)
+
+    def add_file_history(self, events: List[dict]) -> int:
+        """파일 변경 이력 기록
+
+        Args:
+            events: {file_id, event_type, old_path, new_path} 목록
+                    event_type: added / modified / renamed / deleted
+
+        Returns:
+            기록된 이벤트 수
+        """
+        if not events:
+            return 0
+
+        conn = self._get_connection()
+        now = datetime.now().isoformat()
+        conn.executemany(
+            """
+            INSERT INTO file_history (file_id, event_type, old_path, new_path, detected_at)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            [
+                (e.get("file_id"), e["event_type"], e.get("old_path"), e.get("new_path"), now)
+                for e in events
+            ],
+        )
+        conn.commit()
+        return len(events)
+
     # === 통계 ===
 
     def get_file_count(self, file_type: Optional[str] = None) -> int:
@@ -569,31 +929,14 @@ class Database:
                 cached_stats["cached"] = True
                 return cached_stats
 
-        # 캐시 미스 또는 만료 - DB 조회
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                file_type,
-                COUNT(*) as count,
-                COALESCE(SUM(size_bytes), 0) as total_size
-            FROM files
-            GROUP BY file_type
-        """
-        )
-
+        # 캐시 미스 또는 만료 - 사전 집계 테이블 조회
         stats: Dict[str, any] = {"total_files": 0, "total_size": 0, "by_type": {}}
 
-        for row in cursor.fetchall():
-            file_type = row["file_type"] or "unknown"
-            count = row["count"]
-            size = row["total_size"]
-
-            stats["by_type"][file_type] = {"count": count, "size": size}
-            stats["total_files"] += count
-            stats["total_size"] += size
+        for key, entry in self.get_summary_stats("type").items():
+            file_type = key or "unknown"
+            stats["by_type"][file_type] = {"count": entry.file_count, "size": entry.total_size}
+            stats["total_files"] += entry.file_count
+            stats["total_size"] += entry.total_size
 
         # 캐시 갱신
         with self._stats_lock:
@@ -602,6 +945,32 @@ class Database:
         stats["cached"] = False
         return stats
 
+    def get_summary_stats(self, dimension: str) -> Dict[str, StatsEntry]:
+        """사전 집계 통계 조회 (stats_summary)
+
+        Args:
+            dimension: total, type, type_ext, extension, folder, status, catalog,
+                non_hls, duplicates, extraction, media_total, resolution, codec,
+                container, duration, bitrate, compat
+
+        Returns:
+            {key: StatsEntry} (NULL 값의 키는 '')
+        """
+        return read_dimension(self._get_connection(), dimension)
+
+    def rebuild_stats(self) -> int:
+        """사전 집계 통계 전체 재생성 (복구용)
+
+        Returns:
+            생성된 집계 행 수
+        """
+        conn = self._get_connection()
+        count = rebuild_stats(conn)
+        create_stats_triggers(conn)
+        conn.commit()
+        self.invalidate_stats_cache()
+        return count
+
     def invalidate_stats_cache(self) -> None:
         """통계 캐시 무효화 (#42)
 
@@ -706,12 +1075,61 @@ class Database:
         cursor.execute("DELETE FROM scan_checkpoints")
         cursor.execute("DELETE FROM scan_stats")
         cursor.execute("DELETE FROM media_info")
+        cursor.execute("DELETE FROM directories")
+        cursor.execute("DELETE FROM file_history")
+        rebuild_stats(conn)
 
         conn.commit()
         logger.warning("All data cleared from database")
 
     # === 미디어 정보 (Issue #8) ===
 
+    _MEDIA_INFO_INSERT_SQL = """
+        INSERT OR REPLACE INTO media_info (
+            file_id, file_path, video_codec, video_codec_long,
+            width, height, framerate, video_bitrate,
+            audio_codec, audio_codec_long, audio_channels,
+            audio_sample_rate, audio_bitrate, duration_seconds,
+            bitrate, container_format, format_long_name, file_size,
+            has_video, has_audio, video_stream_count, audio_stream_count,
+            subtitle_stream_count, title, creation_time,
+            extraction_status, extraction_error
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _media_info_params(info) -> tuple:
+        """MediaInfo/MediaInfoRecord를 INSERT 파라미터로 변환"""
+        return (
+            info.file_id,
+            info.file_path,
+            info.video_codec,
+            getattr(info, "video_codec_long", None),
+            info.width,
+            info.height,
+            info.framerate,
+            getattr(info, "video_bitrate", None),
+            info.audio_codec,
+            getattr(info, "audio_codec_long", None),
+            info.audio_channels,
+            info.audio_sample_rate,
+            getattr(info, "audio_bitrate", None),
+            info.duration_seconds,
+            info.bitrate,
+            info.container_format,
+            getattr(info, "format_long_name", None),
+            getattr(info, "file_size", None),
+            1 if info.has_video else 0,
+            1 if info.has_audio else 0,
+            info.video_stream_count,
+            info.audio_stream_count,
+            info.subtitle_stream_count,
+            getattr(info, "title", None),
+            getattr(info, "creation_time", None),
+            info.extraction_status,
+            getattr(info, "extraction_error", None),
+        )
+
     def insert_media_info(self, info) -> int:
         """미디어 정보 삽입
 
@@ -724,53 +1142,29 @@ class Database:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO media_info (
-                file_id, file_path, video_codec, video_codec_long,
-                width, height, framerate, video_bitrate,
-                audio_codec, audio_codec_long, audio_channels,
-                audio_sample_rate, audio_bitrate, duration_seconds,
-                bitrate, container_format, format_long_name, file_size,
-                has_video, has_audio, video_stream_count, audio_stream_count,
-                subtitle_stream_count, title, creation_time,
-                extraction_status, extraction_error
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                info.file_id,
-                info.file_path,
-                info.video_codec,
-                getattr(info, "video_codec_long", None),
-                info.width,
-                info.height,
-                info.framerate,
-                getattr(info, "video_bitrate", None),
-                info.audio_codec,
-                getattr(info, "audio_codec_long", None),
-                info.audio_channels,
-                info.audio_sample_rate,
-                getattr(info, "audio_bitrate", None),
-                info.duration_seconds,
-                info.bitrate,
-                info.container_format,
-                getattr(info, "format_long_name", None),
-                getattr(info, "file_size", None),
-                1 if info.has_video else 0,
-                1 if info.has_audio else 0,
-                info.video_stream_count,
-                info.audio_stream_count,
-                info.subtitle_stream_count,
-                getattr(info, "title", None),
-                getattr(info, "creation_time", None),
-                info.extraction_status,
-                getattr(info, "extraction_error", None),
-            ),
-        )
+        cursor.execute(self._MEDIA_INFO_INSERT_SQL, self._media_info_params(info))
 
         conn.commit()
         return cursor.lastrowid
 
+    def insert_media_info_batch(self, infos: List) -> int:
+        """미디어 정보 일괄 삽입 (단일 트랜잭션)
+
+        Args:
+            infos: MediaInfo 또는 MediaInfoRecord 목록
+
+        Returns:
+            삽입된 레코드 수
+        """
+        if not infos:
+            return 0
+
+        with self.transaction() as conn:
+            conn.executemany(
+                self._MEDIA_INFO_INSERT_SQL, [self._media_info_params(i) for i in infos]
+            )
+        return len(infos)
+
     def get_media_info_by_file_id(self, file_id: int) -> Optional[MediaInfoRecord]:
         """파일 ID로 미디어 정보 조회"""
         conn = self._get_connection()
@@ -851,6 +1245,23 @@ class Database:
 
         return {row[0] for row in cursor.fetchall()}
 
+    def get_extracted_media_count(self, file_type: str = "video") -> int:
+        """추출 성공한 media_info가 있는 파일 수 (파일 유형별)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT COUNT(*) FROM files f
+            WHERE f.file_type = ? AND EXISTS (
+                SELECT 1 FROM media_info m
+                WHERE m.file_id = f.id AND m.extraction_status = 'success'
+            )
+        """,
+            (file_type,),
+        )
+        return cursor.fetchone()[0]
+
     def get_media_info_count(self, status: Optional[str] = None) -> int:
         """미디어 정보 수 조회"""
         conn = self._get_connection()
@@ -937,6 +1348,61 @@ class Database:
 
         return stats
 
+    # === FFprobe 결과 캐시 ===
+
+    def get_probe_cache_sizes(self) -> set:
+        """캐시된 파일 크기 집합 (조회 전 1차 필터용)"""
+        conn = self._get_connection()
+        cursor = conn.execute("SELECT DISTINCT file_size FROM probe_cache")
+        return {row[0] for row in cursor.fetchall()}
+
+    def get_probe_cache(self, fingerprint: str) -> Optional[dict]:
+        """지문으로 캐시된 미디어 정보 조회
+
+        Returns:
+            미디어 정보 필드 딕셔너리 또는 None
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT media_json FROM probe_cache WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def save_probe_cache(self, entries: List[Tuple[str, int, dict]]) -> int:
+        """캐시 항목 저장
+
+        Args:
+            entries: (fingerprint, file_size, 미디어 정보 필드 딕셔너리) 목록
+
+        Returns:
+            저장된 항목 수
+        """
+        if not entries:
+            return 0
+
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO probe_cache (fingerprint, file_size, media_json)
+                VALUES (?, ?, ?)
+            """,
+                [(fp, size, json.dumps(fields)) for fp, size, fields in entries],
+            )
+        return len(entries)
+
+    def add_probe_cache_hits(self, fingerprints: List[str]) -> None:
+        """캐시 적중 횟수 기록"""
+        if not fingerprints:
+            return
+
+        with self.transaction() as conn:
+            conn.executemany(
+                "UPDATE probe_cache SET hit_count = hit_count + 1 WHERE fingerprint = ?",
+                [(fp,) for fp in fingerprints],
+            )
+
     # === 클립 메타데이터 (iconik CSV) ===
 
     def insert_clip_metadata(self, clip: dict) -> int:
@@ -0,0 +1,412 @@
+"""SQLite FTS5 기반 내장 검색 엔진 (MeiliSearch 대체)
+
+MeiliSearch 서버가 없거나 내려가 있을 때 api.py가 사용하는 폴백 엔진입니다.
+SearchService와 같은 search_files / search_media / search_clips 시그니처와
+SearchResult 형태를 제공합니다.
+
+- files_fts, media_info_fts, clip_metadata_fts: 외부 콘텐츠(external content) FTS5 테이블
+  (원본 행을 복제하지 않고 rowid = 원본 id로 참조)
+- INSERT/UPDATE/DELETE 트리거로 원본 테이블과 같은 트랜잭션에서 갱신되므로
+  별도의 인덱싱 작업이 필요 없습니다. 처음 생성할 때만 'rebuild'로 채웁니다.
+- 검색어의 각 단어는 접두어 검색("wso"*)이며 모든 단어를 포함해야 합니다 (AND).
+  정렬은 bm25 (searchableAttributes 순서대로 컬럼 가중치)
+- 필터와 패싯은 MeiliSearch의 filterableAttributes와 같은 필드를 지원합니다.
+
+외부 도구로 DB를 수정했다면 rebuild_fts()로 다시 채우세요.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .search import SearchResult
+from .search_changes import current_seq
+
+logger = logging.getLogger(__name__)
+
+# 해상도 라벨 (search.py 인덱싱 쿼리와 동일)
+RESOLUTION_LABEL_SQL = """CASE
+    WHEN m.height >= 2160 THEN '4K'
+    WHEN m.height >= 1440 THEN '1440p'
+    WHEN m.height >= 1080 THEN '1080p'
+    WHEN m.height >= 720 THEN '720p'
+    WHEN m.height >= 480 THEN '480p'
+    ELSE 'Other'
+END"""
+
+# 패싯 값 최대 개수 (MeiliSearch maxValuesPerFacet 기본값)
+MAX_FACET_VALUES = 100
+
+
+@dataclass(frozen=True)
+class _FtsSpec:
+    """원본 테이블 ↔ FTS 테이블 정의"""
+
+    table: str
+    alias: str
+    columns: Tuple[str, ...]
+    weights: Tuple[float, ...]
+    select: str
+    # 필터/패싯 필드 → SQL 표현식
+    fields: Dict[str, str]
+
+    @property
+    def fts(self) -> str:
+        return f"{self.table}_fts"
+
+
+_SPECS = {
+    "files": _FtsSpec(
+        table="files",
+        alias="f",
+        columns=("filename", "path", "parent_folder", "file_type", "extension"),
+        weights=(10.0, 4.0, 3.0, 1.0, 1.0),
+        select=(
+            "f.id, f.path, f.filename, f.extension, f.size_bytes, f.modified_at, "
+            "f.file_type, f.parent_folder, f.scan_status"
+        ),
+        fields={
+            "file_type": "f.file_type",
+            "extension": "f.extension",
+            "parent_folder": "f.parent_folder",
+            "scan_status": "f.scan_status",
+        },
+    ),
+    "media_info": _FtsSpec(
+        table="media_info",
+        alias="m",
+        columns=("file_path", "video_codec", "audio_codec", "container_format", "title"),
+        weights=(10.0, 4.0, 3.0, 2.0, 1.0),
+        select=f"m.*, {RESOLUTION_LABEL_SQL} AS resolution_label",
+        fields={
+            "video_codec": "m.video_codec",
+            "audio_codec": "m.audio_codec",
+            "has_video": "m.has_video",
+            "has_audio": "m.has_audio",
+            "extraction_status": "m.extraction_status",
+            "resolution_label": RESOLUTION_LABEL_SQL,
+        },
+    ),
+    "clip_metadata": _FtsSpec(
+        table="clip_metadata",
+        alias="c",
+        columns=(
+            "title",
+            "description",
+            "players_tags",
+            "project_name",
+            "episode_event",
+            "tournament",
+            "hand_tag",
+        ),
+        weights=(10.0, 2.0, 6.0, 4.0, 4.0, 3.0, 3.0),
+        select="c.*",
+        fields={
+            "project_name": "c.project_name",
+            "year": "c.year",
+            "location": "c.location",
+            "hand_grade": "c.hand_grade",
+            "is_badbeat": "c.is_badbeat",
+            "is_bluff": "c.is_bluff",
+            "is_suckout": "c.is_suckout",
+            "is_cooler": "c.is_cooler",
+            "game_type": "c.game_type",
+        },
+    ),
+}
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def fts5_available() -> bool:
+    """현재 sqlite3 빌드의 FTS5 지원 여부"""
+    try:
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(a)")
+        conn.close()
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def to_match_expression(query: str) -> str:
+    """검색어 → FTS5 MATCH 식 (단어별 접두어 검색, AND). 단어가 없으면 빈 문자열"""
+    return " ".join(f'"{word}"*' for word in _WORD.findall(query))
+
+
+def _trigger_sql(spec: _FtsSpec) -> List[str]:
+    cols = ", ".join(spec.columns)
+    new_values = ", ".join(f"new.{c}" for c in spec.columns)
+    old_values = ", ".join(f"old.{c}" for c in spec.columns)
+    insert = f"INSERT INTO {spec.fts}(rowid, {cols}) VALUES (new.id, {new_values});"
+    delete = (
+        f"INSERT INTO {spec.fts}({spec.fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    return [
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{spec.fts}_insert AFTER INSERT ON {spec.table}
+        BEGIN {insert} END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{spec.fts}_delete AFTER DELETE ON {spec.table}
+        BEGIN {delete} END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{spec.fts}_update AFTER UPDATE OF {cols}
+        ON {spec.table}
+        BEGIN {delete} {insert} END""",
+    ]
+
+
+def ensure_fts_schema(conn: sqlite3.Connection) -> List[str]:
+    """FTS 테이블/트리거 생성 (없을 때만). 새로 만든 FTS 테이블은 원본으로 채움
+
+    Returns:
+        새로 생성해 rebuild한 FTS 테이블 이름 목록
+    """
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    created = []
+    for spec in _SPECS.values():
+        if spec.table not in existing:
+            continue
+        if spec.fts not in existing:
+            conn.execute(
+                f"""CREATE VIRTUAL TABLE {spec.fts} USING fts5(
+                    {", ".join(spec.columns)},
+                    content='{spec.table}', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                )"""
+            )
+            conn.execute(f"INSERT INTO {spec.fts}({spec.fts}) VALUES ('rebuild')")
+            created.append(spec.fts)
+        for sql in _trigger_sql(spec):
+            conn.execute(sql)
+    conn.commit()
+    if created:
+        logger.info(f"FTS5 인덱스 생성: {', '.join(created)}")
+    return created
+
+
+def rebuild_fts(conn: sqlite3.Connection) -> None:
+    """FTS 인덱스를 원본 테이블에서 다시 채움 (복구용)"""
+    created = ensure_fts_schema(conn)
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    for spec in _SPECS.values():
+        if spec.fts in existing and spec.fts not in created:
+            conn.execute(f"INSERT INTO {spec.fts}({spec.fts}) VALUES ('rebuild')")
+    conn.commit()
+
+
+def refill_fts(conn: sqlite3.Connection, tables: Tuple[str, ...]) -> List[str]:
+    """이미 있는 FTS 인덱스만 원본 테이블에서 다시 채움 (트리거를 끈 대량 적재 후)
+
+    Returns:
+        다시 채운 FTS 테이블 이름 목록
+    """
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    refilled = []
+    for table in tables:
+        spec = _SPECS.get(table)
+        if spec and spec.fts in existing:
+            conn.execute(f"INSERT INTO {spec.fts}({spec.fts}) VALUES ('rebuild')")
+            refilled.append(spec.fts)
+    return refilled
+
+
+class FTSSearchEngine:
+    """SQLite FTS5 검색 엔진 (SearchService와 같은 검색 인터페이스)"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: archive.db 경로 (처음 사용 시 FTS 테이블/트리거 생성)
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        ensure_fts_schema(self._get_connection())
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """스레드별 연결"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA recursive_triggers = ON")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _where(
+        self, spec: _FtsSpec, match: str, filters: Dict[str, Any]
+    ) -> Tuple[str, str, List[Any]]:
+        """(FROM 절, WHERE 절, 파라미터)"""
+        params: List[Any] = []
+        if match:
+            # CROSS JOIN: 필터 컬럼 인덱스가 아니라 FTS 검색 결과부터 조인하도록 순서 고정
+            source = (
+                f"{spec.fts} CROSS JOIN {spec.table} {spec.alias} "
+                f"ON {spec.alias}.id = {spec.fts}.rowid"
+            )
+            clauses = [f"{spec.fts} MATCH ?"]
+            params.append(match)
+        else:
+            source = f"{spec.table} {spec.alias}"
+            clauses = []
+        for name, value in filters.items():
+            if value is None:
+                continue
+            clauses.append(f"{spec.fields[name]} = ?")
+            params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return source, where, params
+
+    def _search(
+        self,
+        table: str,
+        query: str,
+        filters: Dict[str, Any],
+        limit: int,
+        offset: int,
+        facets: Optional[List[str]],
+    ) -> SearchResult:
+        start = time.perf_counter()
+        spec = _SPECS[table]
+        conn = self._get_connection()
+        match = to_match_expression(query)
+        source, where, params = self._where(spec, match, filters)
+
+        if match:
+            weights = ", ".join(str(w) for w in spec.weights)
+            order = f"bm25({spec.fts}, {weights}), {spec.alias}.id"
+        else:
+            order = f"{spec.alias}.id"
+
+        rows = conn.execute(
+            f"SELECT {spec.select} FROM {source} {where} ORDER BY {order} LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+        total = conn.execute(f"SELECT COUNT(*) FROM {source} {where}", params).fetchone()[0]
+
+        facet_counts = {}
+        for name in facets or []:
+            if name not in spec.fields:
+                continue
+            expr = spec.fields[name]
+            facet_counts[name] = {
+                str(value): count
+                for value, count in conn.execute(
+                    f"""SELECT {expr} AS value, COUNT(*) FROM {source} {where}
+                    GROUP BY value HAVING value IS NOT NULL
+                    ORDER BY COUNT(*) DESC LIMIT {MAX_FACET_VALUES}""",
+                    params,
+                )
+            }
+
+        return SearchResult(
+            hits=[dict(row) for row in rows],
+            total_hits=total,
+            processing_time_ms=int((time.perf_counter() - start) * 1000),
+            query=query,
+            facets=facet_counts,
+        )
+
+    def search_files(
+        self,
+        query: str,
+        file_type: Optional[str] = None,
+        extension: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        facets: Optional[List[str]] = None,
+    ) -> SearchResult:
+        """파일 검색 (SearchService.search_files와 동일)"""
+        return self._search(
+            "files",
+            query,
+            {"file_type": file_type, "extension": extension},
+            limit,
+            offset,
+            facets,
+        )
+
+    def search_media(
+        self,
+        query: str,
+        video_codec: Optional[str] = None,
+        resolution: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        facets: Optional[List[str]] = None,
+    ) -> SearchResult:
+        """미디어 정보 검색 (SearchService.search_media와 동일)"""
+        return self._search(
+            "media_info",
+            query,
+            {"video_codec": video_codec, "resolution_label": resolution},
+            limit,
+            offset,
+            facets,
+        )
+
+    def search_clips(
+        self,
+        query: str,
+        project_name: Optional[str] = None,
+        hand_grade: Optional[str] = None,
+        year: Optional[int] = None,
+        is_bluff: Optional[bool] = None,
+        limit: int = 20,
+        offset: int = 0,
+        facets: Optional[List[str]] = None,
+    ) -> SearchResult:
+        """클립 메타데이터 검색 (SearchService.search_clips와 동일)"""
+        return self._search(
+            "clip_metadata",
+            query,
+            {
+                "project_name": project_name,
+                "hand_grade": hand_grade,
+                "year": year or None,
+                "is_bluff": None if is_bluff is None else (1 if is_bluff else 0),
+            },
+            limit,
+            offset,
+            facets,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """FTS 인덱스별 문서 수"""
+        conn = self._get_connection()
+        stats = {}
+        for spec in _SPECS.values():
+            try:
+                count = conn.execute(f"SELECT COUNT(*) FROM {spec.fts}").fetchone()[0]
+                stats[spec.fts] = {"numberOfDocuments": count, "isIndexing": False}
+            except sqlite3.Error as e:
+                stats[spec.fts] = {"error": str(e)}
+        return stats
+
+    def change_seq(self) -> Optional[int]:
+        """검색 변경 로그 워터마크 (DB 변경 감지용, 변경 로그가 없으면 None)"""
+        try:
+            return current_seq(self._get_connection())
+        except sqlite3.OperationalError:
+            return None
+
+    def health_check(self) -> bool:
+        try:
+            self._get_connection().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
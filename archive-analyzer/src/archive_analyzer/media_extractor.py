@@ -2,28 +2,60 @@
 
 비디오/오디오 파일에서 기술 메타데이터를 추출합니다.
 - FFprobe를 사용한 메타데이터 추출
-- SMB 파일 스트리밍 지원
+- SMB 파일 스트리밍 지원 (head/tail/moov 범위 읽기 + sparse 파일)
 - 배치 처리 지원
+- 콘텐츠 지문 기반 FFprobe 결과 캐시 (복사/이동된 파일 재분석 생략)
 
 Issue #8: 미디어 메타데이터 추출기 구현 (FR-002)
 """
 
+import hashlib
 import json
 import logging
 import os
+import queue
+import shutil
+import struct
 import subprocess
 import tempfile
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from contextlib import nullcontext
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
 from .smb_connector import SMBConnector
 
 logger = logging.getLogger(__name__)
 
+# FFprobe 분석 결과 필드 (캐시 저장/복사 대상)
+PROBE_RESULT_FIELDS = [
+    "video_codec",
+    "video_codec_long",
+    "width",
+    "height",
+    "framerate",
+    "video_bitrate",
+    "audio_codec",
+    "audio_codec_long",
+    "audio_channels",
+    "audio_sample_rate",
+    "audio_bitrate",
+    "duration_seconds",
+    "bitrate",
+    "container_format",
+    "format_long_name",
+    "has_video",
+    "has_audio",
+    "video_stream_count",
+    "audio_stream_count",
+    "subtitle_stream_count",
+    "title",
+    "creation_time",
+]
+
 
 @dataclass
 class MediaInfo:
@@ -70,6 +102,13 @@ class MediaInfo:
     extraction_error: Optional[str] = None
     extracted_at: Optional[datetime] = None
 
+    # 전송량 (SMB에서 읽은 바이트 수, 재시도 포함) / 사용한 읽기 방식
+    bytes_transferred: int = 0
+    probe_method: Optional[str] = None
+
+    # 콘텐츠 지문 (크기 + 앞/뒤 일부 해시, 캐시 키)
+    fingerprint: Optional[str] = None
+
     @property
     def resolution(self) -> Optional[str]:
         """해상도 문자열 (예: 1920x1080)"""
@@ -262,33 +301,261 @@ class FFprobeExtractor:
                 info.subtitle_stream_count += 1
 
 
+# ISO BMFF(MP4/MOV) 계열 확장자
+MP4_EXTENSIONS = {".mp4", ".mov", ".m4v", ".m4a", ".3gp", ".3g2", ".f4v"}
+
+
+def _is_box_type(box_type: bytes) -> bool:
+    """4바이트 박스 타입이 출력 가능한 ASCII인지 확인"""
+    return len(box_type) == 4 and all(0x20 <= b <= 0x7E or b == 0xA9 for b in box_type)
+
+
+def locate_mp4_boxes(
+    read_at: Callable[[int, int], bytes], file_size: int, head: bytes = b""
+) -> Tuple[Optional[Tuple[int, int]], List[Tuple[int, bytes]]]:
+    """MP4/MOV 최상위 박스를 헤더만 읽으며 순회하여 moov 위치 탐색
+
+    mdat 본문은 읽지 않고 박스 크기만큼 건너뜁니다.
+
+    Args:
+        read_at: (offset, size) -> bytes 범위 읽기 함수
+        file_size: 전체 파일 크기
+        head: 이미 읽어 둔 파일 앞부분 (이 범위의 헤더는 다시 읽지 않음)
+
+    Returns:
+        ((moov offset, moov size) 또는 None, [(offset, 박스 헤더 bytes)])
+        박스 구조가 아니면 (None, [])
+    """
+    headers: List[Tuple[int, bytes]] = []
+    offset = 0
+
+    while offset + 8 <= file_size:
+        if offset + 16 <= len(head):
+            header = head[offset : offset + 16]
+        else:
+            header = read_at(offset, min(16, file_size - offset))
+        if len(header) < 8:
+            break
+
+        size, box_type = struct.unpack(">I4s", header[:8])
+        header_len = 8
+        if size == 1:
+            if len(header) < 16:
+                break
+            size = struct.unpack(">Q", header[8:16])[0]
+            header_len = 16
+        elif size == 0:
+            size = file_size - offset
+
+        if not _is_box_type(box_type) or size < header_len:
+            return None, []
+
+        headers.append((offset, header[:header_len]))
+        if box_type == b"moov":
+            return (offset, size), headers
+        offset += size
+
+    return None, headers
+
+
+class _RangeReader:
+    """SMB 파일 범위 읽기 (이미 읽은 구간은 다시 전송하지 않음)
+
+    콘텐츠 지문(앞/뒤 64KB)과 FFprobe용 범위(head/tail)가 겹치는 바이트를
+    한 번의 파일 열기, 한 번의 전송으로 처리합니다.
+    """
+
+    def __init__(self, f: BinaryIO):
+        self._file = f
+        self._regions: List[Tuple[int, bytes]] = []  # 오프셋 순, 서로 겹치지 않음
+        self.bytes_read = 0
+
+    def _fetch(self, offset: int, size: int) -> bytes:
+        self._file.seek(offset)
+        data = self._file.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        parts: List[bytes] = []
+        fetched: List[Tuple[int, bytes]] = []
+        pos, end = offset, offset + size
+        for start, data in self._regions:
+            stop = start + len(data)
+            if stop <= pos:
+                continue
+            if start >= end:
+                break
+            if start > pos:
+                gap = self._fetch(pos, start - pos)
+                fetched.append((pos, gap))
+                parts.append(gap)
+                pos = start
+            chunk = data[pos - start : min(stop, end) - start]
+            parts.append(chunk)
+            pos += len(chunk)
+        if pos < end:
+            rest = self._fetch(pos, end - pos)
+            fetched.append((pos, rest))
+            parts.append(rest)
+        if fetched:
+            self._regions = sorted(self._regions + [r for r in fetched if r[1]])
+        return b"".join(parts)
+
+
+def _mark_sparse(f: BinaryIO) -> None:
+    """Windows(NTFS)에서 파일을 sparse로 표시
+
+    표시하지 않으면 파일 끝 근처에 쓸 때 앞부분이 0으로 실제 기록됩니다.
+    POSIX 파일시스템은 truncate만으로 sparse가 되므로 아무 것도 하지 않습니다.
+    """
+    if os.name != "nt":
+        return
+    try:
+        import ctypes
+        import msvcrt
+        from ctypes import wintypes
+
+        fsctl_set_sparse = 0x000900C4
+        returned = wintypes.DWORD()
+        ctypes.windll.kernel32.DeviceIoControl(
+            msvcrt.get_osfhandle(f.fileno()),
+            fsctl_set_sparse,
+            None,
+            0,
+            None,
+            0,
+            ctypes.byref(returned),
+            None,
+        )
+    except Exception as e:
+        logger.debug(f"Failed to mark sparse: {e}")
+
+
+def compute_fingerprint(
+    read_at: Callable[[int, int], bytes], file_size: int, chunk_size: int = 64 * 1024
+) -> str:
+    """콘텐츠 지문 계산 (크기 + 앞/뒤 chunk_size 바이트의 BLAKE2b 해시)
+
+    이름/경로와 무관하므로 복사·이동된 파일도 같은 지문을 가집니다.
+
+    Args:
+        read_at: (offset, size) -> bytes 범위 읽기 함수
+        file_size: 전체 파일 크기
+        chunk_size: 앞/뒤에서 읽을 크기
+
+    Returns:
+        "<크기>:<해시>" 형식 문자열
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(file_size.to_bytes(8, "little"))
+    if file_size <= chunk_size * 2:
+        digest.update(read_at(0, file_size))
+    else:
+        digest.update(read_at(0, chunk_size))
+        digest.update(read_at(file_size - chunk_size, chunk_size))
+    return f"{file_size}:{digest.hexdigest()}"
+
+
+class ProbeCache:
+    """콘텐츠 지문 기반 FFprobe 결과 캐시 (probe_cache 테이블)
+
+    크기 집합을 메모리에 두어, 같은 크기의 캐시 항목이 없으면
+    DB 조회 없이 바로 미스 처리합니다.
+    """
+
+    def __init__(self, database):
+        """
+        Args:
+            database: 데이터베이스 관리자
+        """
+        self.database = database
+        self._sizes = database.get_probe_cache_sizes()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def lookup(self, fingerprint: str, file_size: int) -> Optional[dict]:
+        """캐시 조회 (미스 시 None)"""
+        if file_size not in self._sizes:
+            return None
+        return self.database.get_probe_cache(fingerprint)
+
+    def record(self, infos: List[MediaInfo]) -> None:
+        """추출 결과를 캐시에 반영 (새 분석 결과 저장 + 적중 횟수 기록)"""
+        entries = [
+            (i.fingerprint, i.file_size, {f: getattr(i, f) for f in PROBE_RESULT_FIELDS})
+            for i in infos
+            if i.fingerprint
+            and i.file_size
+            and i.extraction_status == "success"
+            and i.probe_method != "cache"
+        ]
+        if entries:
+            self.database.save_probe_cache(entries)
+            with self._lock:
+                self._sizes.update(size for _, size, _ in entries)
+
+        self.database.add_probe_cache_hits(
+            [i.fingerprint for i in infos if i.probe_method == "cache"]
+        )
+
+
+@dataclass
+class ProbeJob:
+    """FFprobe 대기 중인 임시 파일 (SMBMediaExtractor.prepare → probe)"""
+
+    temp_path: str
+    file_size: int
+    bytes_read: int  # SMB에서 읽은 바이트 수 (지문 포함)
+    method: str  # full / small / head / moov / head+tail
+    full_download: bool = False
+    retry_count: int = 0
+
+
 class SMBMediaExtractor:
     """SMB 파일에서 메타데이터를 추출하는 클래스
 
-    FFprobe가 직접 SMB 경로를 지원하지 않으므로,
-    파일의 시작 부분만 임시로 다운로드하여 분석합니다.
+    FFprobe가 직접 SMB 경로를 지원하지 않으므로, 필요한 바이트 범위만 읽어
+    원본과 같은 크기의 sparse 임시 파일(같은 오프셋)에 기록한 뒤 분석합니다.
+
+    - MP4/MOV: 최상위 박스 헤더를 따라가 moov 위치를 찾고 그 범위만 읽음
+      (moov가 파일 끝에 있어도 전체 다운로드 불필요)
+    - 그 외 (MXF, MKV, TS 등): 앞부분 + 끝부분 (footer/cues/마지막 PTS)
+    - 분석 실패 시에만 전체 다운로드로 1회 재시도
     """
 
-    # 메타데이터 추출에 필요한 최소 바이트 수
-    # MP4 moov atom이 파일 앞에 있는 경우 약 512KB면 충분
-    # 파일 끝에 있는 경우 전체 다운로드 필요
+    # 파일 앞부분 읽기 크기 (faststart MP4는 moov가 여기 포함됨)
     HEADER_SIZE = 512 * 1024  # 512KB (속도 최적화)
+    # 비 MP4 컨테이너의 끝부분 읽기 크기 (MXF footer partition, MKV cues, TS 마지막 PTS)
+    TAIL_SIZE = 1024 * 1024  # 1MB
+    # 전체 다운로드 시 복사 단위
+    COPY_CHUNK_SIZE = 4 * 1024 * 1024
+    # 콘텐츠 지문 계산 시 앞/뒤에서 읽는 크기
+    FINGERPRINT_CHUNK_SIZE = 64 * 1024
 
     def __init__(
         self,
         connector: SMBConnector,
         ffprobe_path: str = "ffprobe",
         temp_dir: Optional[str] = None,
+        probe_slots: Optional[threading.Semaphore] = None,
+        probe_cache: Optional[ProbeCache] = None,
     ):
         """
         Args:
             connector: SMB 연결 관리자
             ffprobe_path: FFprobe 실행 파일 경로
             temp_dir: 임시 파일 저장 디렉토리
+            probe_slots: 동시 FFprobe 프로세스 수 제한용 세마포어 (없으면 무제한)
+            probe_cache: 콘텐츠 지문 캐시 (없으면 항상 FFprobe 실행)
         """
         self.connector = connector
         self.ffprobe = FFprobeExtractor(ffprobe_path)
         self.temp_dir = temp_dir or tempfile.gettempdir()
+        self.probe_slots = probe_slots
+        self.probe_cache = probe_cache
 
     def extract(
         self,
@@ -297,7 +564,7 @@ class SMBMediaExtractor:
         full_download: bool = False,
         _retry_count: int = 0,  # #36 - 재시도 카운터
     ) -> MediaInfo:
-        """SMB 파일에서 메타데이터 추출
+        """SMB 파일에서 메타데이터 추출 (prepare + probe)
 
         Args:
             smb_path: SMB 파일 경로 (공유 내 상대 경로)
@@ -307,6 +574,23 @@ class SMBMediaExtractor:
         Returns:
             MediaInfo 객체
         """
+        info, job = self.prepare(smb_path, file_id, full_download, _retry_count)
+        if job is None:
+            return info
+        return self.probe(info, job)
+
+    def prepare(
+        self,
+        smb_path: str,
+        file_id: Optional[int] = None,
+        full_download: bool = False,
+        _retry_count: int = 0,
+    ) -> Tuple[MediaInfo, Optional[ProbeJob]]:
+        """SMB 단계: 지문 캐시 조회 + FFprobe에 필요한 범위를 임시 파일로 읽기
+
+        Returns:
+            (MediaInfo, ProbeJob) - job이 None이면 info가 최종 결과 (캐시 적중/실패)
+        """
         info = MediaInfo(file_path=smb_path, file_id=file_id)
 
         try:
@@ -319,59 +603,94 @@ class SMBMediaExtractor:
             if not file_info:
                 info.extraction_status = "failed"
                 info.extraction_error = "File not found"
-                return info
+                return info, None
 
             info.file_size = file_info.size
 
-            # 임시 파일로 다운로드
-            temp_path = self._download_for_analysis(smb_path, file_info.size, full_download)
+            # 지문과 FFprobe용 범위를 한 번 열어 함께 읽음 (겹치는 앞/뒤 바이트는 재사용)
+            with self.connector.open_file(smb_path, mode="rb") as smb_file:
+                reader = _RangeReader(smb_file)
 
-            try:
-                # FFprobe로 분석
-                result = self.ffprobe.extract(temp_path)
-
-                # 결과 복사
-                for attr in [
-                    "video_codec",
-                    "video_codec_long",
-                    "width",
-                    "height",
-                    "framerate",
-                    "video_bitrate",
-                    "audio_codec",
-                    "audio_codec_long",
-                    "audio_channels",
-                    "audio_sample_rate",
-                    "audio_bitrate",
-                    "duration_seconds",
-                    "bitrate",
-                    "container_format",
-                    "format_long_name",
-                    "has_video",
-                    "has_audio",
-                    "video_stream_count",
-                    "audio_stream_count",
-                    "subtitle_stream_count",
-                    "title",
-                    "creation_time",
-                    "extraction_status",
-                    "extraction_error",
-                ]:
-                    setattr(info, attr, getattr(result, attr))
-
-                # 파일 크기는 원본 유지
-                info.file_size = file_info.size
-                info.extracted_at = datetime.now()
-
-                # 부분 다운로드로 실패한 경우 전체 다운로드 시도 (#36 - 재시도 1회 제한)
-                if info.extraction_status == "failed" and not full_download and _retry_count == 0:
-                    logger.info(f"Retrying with full download: {smb_path}")
-                    return self.extract(smb_path, file_id, full_download=True, _retry_count=1)
+                # 콘텐츠 지문으로 캐시 조회 (복사/이동된 파일은 다운로드·FFprobe 생략)
+                if self.probe_cache is not None and _retry_count == 0:
+                    info.fingerprint = compute_fingerprint(
+                        reader.read_at, file_info.size, self.FINGERPRINT_CHUNK_SIZE
+                    )
+                    cached = self.probe_cache.lookup(info.fingerprint, file_info.size)
+                    if cached is not None:
+                        for attr, value in cached.items():
+                            setattr(info, attr, value)
+                        info.extraction_status = "success"
+                        info.extracted_at = datetime.now()
+                        info.bytes_transferred = reader.bytes_read
+                        info.probe_method = "cache"
+                        logger.debug(f"Probe cache hit: {smb_path}")
+                        return info, None
+
+                # 임시 파일로 다운로드
+                temp_path, method = self._download_for_analysis(
+                    smb_file, reader, smb_path, file_info.size, full_download
+                )
+
+            return info, ProbeJob(
+                temp_path=temp_path,
+                file_size=file_info.size,
+                bytes_read=reader.bytes_read,
+                method=method,
+                full_download=full_download,
+                retry_count=_retry_count,
+            )
 
+        except Exception as e:
+            info.extraction_status = "failed"
+            info.extraction_error = str(e)
+            logger.warning(f"SMB extraction failed for {smb_path}: {e}")
+            return info, None
+
+    def probe(self, info: MediaInfo, job: ProbeJob) -> MediaInfo:
+        """FFprobe 단계: 임시 파일 분석 후 삭제
+
+        부분 읽기로 분석에 실패하면 전체 다운로드로 1회 재시도합니다 (SMB 읽기 포함).
+        """
+        smb_path = info.file_path
+        try:
+            try:
+                # FFprobe로 분석 (SMB 읽기와 별도로 동시 프로세스 수 제한)
+                with self.probe_slots or nullcontext():
+                    result = self.ffprobe.extract(job.temp_path)
             finally:
                 # 임시 파일 삭제
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+                if os.path.exists(job.temp_path):
+                    os.unlink(job.temp_path)
+
+            # 결과 복사
+            for attr in PROBE_RESULT_FIELDS + ["extraction_status", "extraction_error"]:
+                setattr(info, attr, getattr(result, attr))
+
+            # 파일 크기는 원본 유지
+            info.file_size = job.file_size
+            info.extracted_at = datetime.now()
+            info.bytes_transferred = job.bytes_read
+            info.probe_method = job.method
+
+            logger.debug(
+                f"Probed {smb_path} via {job.method}: "
+                f"{job.bytes_read:,} of {job.file_size:,} bytes transferred"
+            )
+
+            # 부분 다운로드로 실패한 경우 전체 다운로드 시도 (#36 - 재시도 1회 제한)
+            # small은 이미 파일 전체를 읽었으므로 재시도하지 않음
+            if (
+                info.extraction_status == "failed"
+                and not job.full_download
+                and job.method != "small"
+                and job.retry_count == 0
+            ):
+                logger.info(f"Retrying with full download: {smb_path}")
+                retry = self.extract(smb_path, info.file_id, full_download=True, _retry_count=1)
+                retry.bytes_transferred += info.bytes_transferred
+                retry.fingerprint = info.fingerprint
+                return retry
 
         except Exception as e:
             info.extraction_status = "failed"
@@ -380,16 +699,26 @@ class SMBMediaExtractor:
 
         return info
 
-    def _download_for_analysis(self, smb_path: str, file_size: int, full_download: bool) -> str:
+    def _download_for_analysis(
+        self,
+        smb_file: BinaryIO,
+        reader: _RangeReader,
+        smb_path: str,
+        file_size: int,
+        full_download: bool,
+    ) -> Tuple[str, str]:
         """분석을 위한 임시 다운로드
 
         Args:
+            smb_file: 열린 SMB 파일 (전체 다운로드용)
+            reader: 범위 읽기 (지문 계산 때 읽은 구간 재사용, 전송량 집계)
             smb_path: SMB 파일 경로
             file_size: 파일 크기
             full_download: 전체 다운로드 여부
 
         Returns:
-            임시 파일 경로
+            (임시 파일 경로, 읽기 방식)
+            읽기 방식: full / small / head / moov / head+tail
         """
         # 파일 확장자 추출
         ext = Path(smb_path).suffix or ".tmp"
@@ -399,23 +728,28 @@ class SMBMediaExtractor:
         os.close(fd)
 
         try:
-            # 다운로드할 크기 결정
-            if full_download or file_size <= self.HEADER_SIZE:
-                download_size = file_size
-            else:
-                download_size = self.HEADER_SIZE
-
-            logger.debug(f"Downloading {download_size:,} bytes of {smb_path}")
-
-            # SMB에서 읽기
-            with self.connector.open_file(smb_path, mode="rb") as smb_file:
-                data = smb_file.read(download_size)
-
-            # 임시 파일에 저장
-            with open(temp_path, "wb") as f:
-                f.write(data)
-
-            return temp_path
+            with open(temp_path, "wb") as out:
+                if full_download:
+                    logger.debug(f"Downloading {file_size:,} bytes of {smb_path}")
+                    smb_file.seek(0)
+                    shutil.copyfileobj(smb_file, out, self.COPY_CHUNK_SIZE)
+                    reader.bytes_read += file_size
+                    return temp_path, "full"
+                if file_size <= self.HEADER_SIZE + self.TAIL_SIZE:
+                    # 앞/뒤 구간이 겹칠 만큼 작은 파일은 전부 읽음 (전체 다운로드 통계와 구분)
+                    out.write(reader.read_at(0, file_size))
+                    return temp_path, "small"
+
+                regions, method = self._read_probe_ranges(reader.read_at, file_size, ext.lower())
+
+                # 원본과 같은 오프셋에 기록 (읽지 않은 구간은 sparse hole)
+                _mark_sparse(out)
+                out.truncate(file_size)
+                for offset, data in regions:
+                    out.seek(offset)
+                    out.write(data)
+
+            return temp_path, method
 
         except Exception:
             # 실패 시 임시 파일 삭제
@@ -423,6 +757,34 @@ class SMBMediaExtractor:
                 os.unlink(temp_path)
             raise
 
+    def _read_probe_ranges(
+        self, read_at: Callable[[int, int], bytes], file_size: int, ext: str
+    ) -> Tuple[List[Tuple[int, bytes]], str]:
+        """FFprobe에 필요한 바이트 범위 읽기
+
+        Returns:
+            ([(offset, data)], 읽기 방식)
+        """
+        head = read_at(0, self.HEADER_SIZE)
+        regions: List[Tuple[int, bytes]] = [(0, head)]
+
+        if ext in MP4_EXTENSIONS or head[4:8] == b"ftyp":
+            moov, headers = locate_mp4_boxes(read_at, file_size, head)
+            if moov is not None:
+                # 박스 헤더를 함께 기록해야 ffprobe가 hole을 건너뛰며 moov까지 도달
+                regions.extend(h for h in headers if h[0] >= len(head))
+                moov_offset, moov_size = moov
+                if moov_offset + moov_size <= len(head):
+                    return regions, "head"
+                start = max(moov_offset, len(head))
+                regions.append((start, read_at(start, moov_offset + moov_size - start)))
+                return regions, "moov"
+            # moov를 못 찾은 경우 (손상/비표준) - 아래 head+tail로 시도
+
+        tail_offset = max(len(head), file_size - self.TAIL_SIZE)
+        regions.append((tail_offset, read_at(tail_offset, file_size - tail_offset)))
+        return regions, "head+tail"
+
 
 @dataclass
 class ExtractionProgress:
@@ -456,15 +818,33 @@ class MediaMetadataExtractor:
 
     아카이브의 모든 비디오 파일에서 메타데이터를 추출합니다.
     #23: 병렬 처리 지원 추가
+
+    병렬 모드는 제한된 큐로 연결된 생산자/소비자 파이프라인입니다.
+    - 생산자: DB에서 대상 파일을 페이지 단위로 지연 조회
+    - 읽기 워커 (max_workers): 지문 캐시 조회 + SMB 범위 읽기 → 임시 파일
+    - FFprobe 워커 (max_probes): 임시 파일 분석 (SMB 읽기와 별도 단계이므로
+      FFprobe가 밀려도 읽기 동시성은 그대로, 읽기가 느려도 FFprobe는 큐의 파일을 처리)
+    - 기록자 (단일 스레드): media_info를 batch_size 단위 executemany 트랜잭션으로 저장
+    큐 크기가 고정되어 있어 파일 수와 무관하게 메모리/임시 파일 수가 일정합니다.
+
+    use_probe_cache가 켜져 있으면 콘텐츠 지문이 같은 파일(복사/이동/재등록)은
+    probe_cache의 결과를 복사하고 FFprobe를 생략합니다.
     """
 
+    # 기록자가 배치가 덜 차도 저장하는 최대 간격 (초)
+    FLUSH_INTERVAL = 5.0
+
+    _DONE = object()
+
     def __init__(
         self,
         connector: SMBConnector,
         database,  # Database 타입 (순환 임포트 방지)
         ffprobe_path: str = "ffprobe",
-        batch_size: int = 10,
+        batch_size: int = 50,
         max_workers: int = 4,
+        max_probes: Optional[int] = None,
+        use_probe_cache: bool = True,
     ):
         """
         Args:
@@ -472,11 +852,17 @@ class MediaMetadataExtractor:
             database: 데이터베이스 관리자
             ffprobe_path: FFprobe 경로
             batch_size: 배치 저장 크기
-            max_workers: 병렬 처리 워커 수 (#23)
+            max_workers: 병렬 처리 워커 수 (동시 SMB 읽기 수) (#23)
+            max_probes: FFprobe 워커 수 = 동시 FFprobe 프로세스 수 (기본: CPU 코어 수)
+            use_probe_cache: 콘텐츠 지문 기반 FFprobe 결과 캐시 사용 여부
         """
         self.connector = connector
         self.database = database
-        self.smb_extractor = SMBMediaExtractor(connector, ffprobe_path)
+        self.max_probes = max_probes or os.cpu_count() or 4
+        self.probe_cache = ProbeCache(database) if use_probe_cache else None
+        self.smb_extractor = SMBMediaExtractor(
+            connector, ffprobe_path, probe_cache=self.probe_cache
+        )
         self.batch_size = batch_size
         self.max_workers = max_workers
 
@@ -485,6 +871,9 @@ class MediaMetadataExtractor:
         self._processed = 0
         self._successful = 0
         self._failed = 0
+        self._bytes_transferred = 0
+        self._full_downloads = 0
+        self._cache_hits = 0
         self._lock = threading.Lock()  # #23 - 스레드 안전성
 
     def set_progress_callback(self, callback: Callable[[ExtractionProgress], None]) -> None:
@@ -511,37 +900,30 @@ class MediaMetadataExtractor:
         self._processed = 0
         self._successful = 0
         self._failed = 0
+        self._bytes_transferred = 0
+        self._full_downloads = 0
+        self._cache_hits = 0
 
-        # 비디오 파일 목록 조회
-        files = self.database.get_files_by_type(file_type, limit=100000)
-        total_files = len(files)
-
+        total_files = self.database.get_file_count(file_type)
         logger.info(f"Starting metadata extraction for {total_files} {file_type} files")
 
-        # #24 N+1 최적화: 이미 추출된 file_id들을 한 번에 조회
-        existing_ids: set = set()
+        # #24 N+1 최적화: 추출 완료 파일은 조회 쿼리에서 제외하고 개수만 집계
         if skip_existing:
-            file_ids = [f.id for f in files if f.id is not None]
-            existing_ids = self.database.get_existing_media_file_ids(file_ids)
-            logger.info(f"Already extracted: {len(existing_ids)} files (skipping)")
+            existing = self.database.get_extracted_media_count(file_type)
+            self._processed = existing
+            self._successful = existing
+            logger.info(f"Already extracted: {existing} files (skipping)")
 
-        # 처리할 파일 필터링
-        files_to_process = []
-        for file_record in files:
-            if skip_existing and file_record.id in existing_ids:
-                with self._lock:
-                    self._processed += 1
-                    self._successful += 1
-            else:
-                files_to_process.append(file_record)
+        logger.info(f"Files to process: {total_files - self._processed}")
 
-        logger.info(f"Files to process: {len(files_to_process)}")
+        # 대상 파일은 페이지 단위로 지연 조회 (전체 목록/Future를 만들지 않음)
+        files = self.database.iter_files_for_media(file_type, skip_existing=skip_existing)
 
         # #23 병렬 처리
-        if parallel and len(files_to_process) > 1 and self.max_workers > 1:
-            self._extract_parallel(files_to_process, total_files)
+        if parallel and self.max_workers > 1:
+            self._extract_parallel(files, total_files)
         else:
-            self._extract_sequential(files_to_process, total_files)
+            self._extract_sequential(files, total_files)
 
         # 결과 요약
         duration = (datetime.now() - self._start_time).total_seconds()
@@ -553,6 +935,9 @@ class MediaMetadataExtractor:
             "failed": self._failed,
             "duration_seconds": duration,
             "files_per_second": self._processed / duration if duration > 0 else 0,
+            "bytes_transferred": self._bytes_transferred,
+            "full_downloads": self._full_downloads,
+            "cache_hits": self._cache_hits,
         }
 
     def _extract_single(self, file_record) -> Optional[MediaInfo]:
@@ -571,69 +956,173 @@ class MediaMetadataExtractor:
             logger.error(f"Error processing {file_record.path}: {e}")
             return None
 
+    def _prepare_single(self, file_record) -> Tuple[Optional[MediaInfo], Optional[ProbeJob]]:
+        """읽기 워커: 캐시 조회 + SMB 범위 읽기 (job이 None이면 info가 최종 결과)"""
+        try:
+            return self.smb_extractor.prepare(file_record.path, file_id=file_record.id)
+        except Exception as e:
+            logger.error(f"Error processing {file_record.path}: {e}")
+            return None, None
+
+    def _probe_single(self, file_record, info: MediaInfo, job: ProbeJob) -> Optional[MediaInfo]:
+        """FFprobe 워커: 임시 파일 분석"""
+        try:
+            return self.smb_extractor.probe(info, job)
+        except Exception as e:
+            logger.error(f"Error processing {file_record.path}: {e}")
+            return None
+
+    def _record_result(self, info: Optional[MediaInfo]) -> None:
+        """결과 카운트 및 전송량 집계"""
+        with self._lock:
+            self._processed += 1
+            if info is None:
+                self._failed += 1
+                return
+            if info.extraction_status == "success":
+                self._successful += 1
+            else:
+                self._failed += 1
+            self._bytes_transferred += info.bytes_transferred
+            if info.probe_method == "full":
+                self._full_downloads += 1
+            elif info.probe_method == "cache":
+                self._cache_hits += 1
+
+    def _save_results(self, infos: List[MediaInfo]) -> None:
+        """media_info 일괄 저장 + 캐시 반영"""
+        self.database.insert_media_info_batch(infos)
+        if self.probe_cache is not None:
+            self.probe_cache.record(infos)
+
     def _extract_sequential(self, files, total_files: int) -> None:
         """순차 처리 (기존 로직)"""
         for file_record in files:
             info = self._extract_single(file_record)
 
             if info is not None:
-                self.database.insert_media_info(info)
-                if info.extraction_status == "success":
-                    self._successful += 1
-                else:
-                    self._failed += 1
-            else:
-                self._failed += 1
-
-            self._processed += 1
+                self._save_results([info])
+            self._record_result(info)
 
             if self._progress_callback:
                 self._notify_progress(total_files, file_record.path)
 
     def _extract_parallel(self, files, total_files: int) -> None:
-        """병렬 처리 (#23)
+        """병렬 처리 (#23) - 제한된 생산자/소비자 파이프라인
 
         Args:
-            files: 처리할 파일 목록
+            files: 처리할 파일 레코드 이터레이터 (지연 조회)
             total_files: 전체 파일 수 (진행률 계산용)
         """
-        logger.info(f"Starting parallel extraction with {self.max_workers} workers")
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 작업 제출
-            future_to_file = {
-                executor.submit(self._extract_single, f): f for f in files
-            }
-
-            # 완료된 작업 처리
-            for future in as_completed(future_to_file):
-                file_record = future_to_file[future]
+        logger.info(
+            f"Starting parallel extraction with {self.max_workers} SMB readers, "
+            f"{self.max_probes} ffprobe workers (batch: {self.batch_size})"
+        )
 
-                try:
-                    info = future.result()
+        tasks: "queue.Queue[Any]" = queue.Queue(maxsize=self.max_workers * 2)
+        probes: "queue.Queue[Any]" = queue.Queue(maxsize=self.max_probes * 2)
+        results: "queue.Queue[Any]" = queue.Queue(maxsize=self.batch_size * 2)
+        writer_error: List[BaseException] = []
 
-                    if info is not None:
-                        # DB 저장은 스레드 안전하게 순차 처리
-                        self.database.insert_media_info(info)
-                        with self._lock:
-                            if info.extraction_status == "success":
-                                self._successful += 1
-                            else:
-                                self._failed += 1
+        def reader() -> None:
+            try:
+                while True:
+                    file_record = tasks.get()
+                    if file_record is self._DONE:
+                        return
+                    info, job = self._prepare_single(file_record)
+                    if job is None:
+                        results.put((file_record, info))
                     else:
-                        with self._lock:
-                            self._failed += 1
-
-                except Exception as e:
-                    logger.error(f"Worker error for {file_record.path}: {e}")
-                    with self._lock:
-                        self._failed += 1
+                        probes.put((file_record, info, job))
+            finally:
+                self.database.close()  # 캐시 조회용 워커 스레드 연결 정리
+
+        def prober() -> None:
+            while True:
+                item = probes.get()
+                if item is self._DONE:
+                    return
+                file_record, info, job = item
+                results.put((file_record, self._probe_single(file_record, info, job)))
+
+        def writer() -> None:
+            pending: List[MediaInfo] = []
+            last_flush = time.monotonic()
+
+            def flush() -> None:
+                nonlocal pending, last_flush
+                if pending:
+                    self._save_results(pending)
+                    pending = []
+                last_flush = time.monotonic()
 
-                with self._lock:
-                    self._processed += 1
+            try:
+                while True:
+                    try:
+                        item = results.get(timeout=self.FLUSH_INTERVAL)
+                    except queue.Empty:
+                        flush()
+                        continue
+                    if item is self._DONE:
+                        break
+
+                    file_record, info = item
+                    if info is not None:
+                        pending.append(info)
+                    self._record_result(info)
+
+                    if (
+                        len(pending) >= self.batch_size
+                        or time.monotonic() - last_flush >= self.FLUSH_INTERVAL
+                    ):
+                        flush()
+
+                    if self._progress_callback:
+                        self._notify_progress(total_files, file_record.path)
+                flush()
+            except BaseException as e:
+                writer_error.append(e)
+                logger.error(f"Media info writer failed: {e}")
+                # 워커가 results.put에서 멈추지 않도록 남은 결과를 계속 비움
+                while results.get() is not self._DONE:
+                    pass
+            finally:
+                self.database.close()  # 기록자 스레드 전용 연결 정리
+
+        readers = [
+            threading.Thread(target=reader, name=f"media-reader-{i}", daemon=True)
+            for i in range(self.max_workers)
+        ]
+        probers = [
+            threading.Thread(target=prober, name=f"media-probe-{i}", daemon=True)
+            for i in range(self.max_probes)
+        ]
+        writer_thread = threading.Thread(target=writer, name="media-writer", daemon=True)
+        for t in readers + probers:
+            t.start()
+        writer_thread.start()
 
-                if self._progress_callback:
-                    self._notify_progress(total_files, file_record.path)
+        try:
+            for file_record in files:
+                if writer_error:
+                    break
+                tasks.put(file_record)
+        finally:
+            # 단계 순서대로 종료 (읽기 → FFprobe → 기록)
+            for _ in readers:
+                tasks.put(self._DONE)
+            for t in readers:
+                t.join()
+            for _ in probers:
+                probes.put(self._DONE)
+            for t in probers:
+                t.join()
+            results.put(self._DONE)
+            writer_thread.join()
+
+        if writer_error:
+            raise writer_error[0]
 
     def _notify_progress(self, total: int, current_path: str) -> None:
         """진행률 알림"""
@@ -655,7 +1144,6 @@ class MediaMetadataExtractor:
         )
         self._progress_callback(progress)
 
-
 def extract_media_info(file_path: str, ffprobe_path: str = "ffprobe") -> MediaInfo:
     """단일 파일에서 메타데이터 추출 (편의 함수)
 
@@ -17,16 +17,21 @@ Usage:
 
     # Dry-run (DB 변경 없음)
     python -m archive_analyzer.nas_auto_sync --once --dry-run
+
+    # 폴더 mtime 무시하고 전체 폴더 재확인
+    python -m archive_analyzer.nas_auto_sync --once --full
 """
 
 import logging
 import os
+import sqlite3
 import sys
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Tuple
 
 # 프로젝트 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
@@ -34,7 +39,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from archive_analyzer.config import SMBConfig
 from archive_analyzer.database import Database
 from archive_analyzer.file_classifier import classify_file
-from archive_analyzer.smb_connector import SMBConnector
+from archive_analyzer.smb_connector import FileInfo, SMBConnector, unc_folder, unc_parent
 from archive_analyzer.sync import SyncConfig, SyncService
 
 # 로깅 설정
@@ -64,6 +69,7 @@ class AutoSyncConfig:
     # 동기화 설정
     sync_interval_seconds: int = 1800  # 30분
     batch_size: int = 50
+    bulk_threshold: int = 0  # 신규 파일이 이 이상이면 bulk_load()로 적재 (0이면 사용 안 함)
 
     def __post_init__(self):
         # 환경변수에서 로드
@@ -77,6 +83,8 @@ class AutoSyncConfig:
 
         if env_interval := os.environ.get("SYNC_INTERVAL"):
             self.sync_interval_seconds = int(env_interval)
+        if env_bulk := os.environ.get("NAS_BULK_THRESHOLD"):
+            self.bulk_threshold = int(env_bulk)
 
 
 @dataclass
@@ -86,13 +94,20 @@ class IncrementalScanResult:
     new_files: int = 0
     updated_files: int = 0
     skipped_files: int = 0
+    deleted_files: int = 0
+    renamed_files: int = 0
+    scanned_dirs: int = 0
+    skipped_dirs: int = 0
     errors: List[str] = field(default_factory=list)
     duration_seconds: float = 0.0
 
     def __str__(self) -> str:
         return (
             f"New: {self.new_files}, Updated: {self.updated_files}, "
-            f"Skipped: {self.skipped_files}, Errors: {len(self.errors)}, "
+            f"Renamed: {self.renamed_files}, Deleted: {self.deleted_files}, "
+            f"Skipped: {self.skipped_files}, "
+            f"Dirs: {self.scanned_dirs} scanned / {self.skipped_dirs} unchanged, "
+            f"Errors: {len(self.errors)}, "
             f"Duration: {self.duration_seconds:.1f}s"
         )
 
@@ -102,13 +117,21 @@ class NASAutoSync:
 
     폴링 방식으로 NAS를 주기적으로 스캔하고,
     신규/변경된 파일만 DB에 등록합니다.
+
+    directories 테이블에 폴더별 mtime/자식 수를 저장하여, mtime이 그대로인
+    폴더는 파일 목록을 다시 읽지 않습니다. 폴더 mtime은 직속 항목의
+    추가/삭제/이름변경에만 반응하므로, 변경 없는 폴더라도 저장된 하위 폴더는
+    stat으로 mtime만 확인하며 내려갑니다 (파일 수 >> 폴더 수인 아카이브에서 효과적).
     """
 
+    # mtime 비교 허용 오차 (SMB 타임스탬프는 100ns 단위, float 변환 오차 흡수)
+    MTIME_TOLERANCE = 0.001
+
     def __init__(self, config: Optional[AutoSyncConfig] = None):
         self.config = config or AutoSyncConfig()
         self.connector: Optional[SMBConnector] = None
         self.database: Optional[Database] = None
-        self._existing_paths: Set[str] = set()
+        self._parent_folders_checked = False
 
     def _connect(self) -> None:
         """SMB 및 DB 연결"""
@@ -139,28 +162,70 @@ class NASAutoSync:
             self.database.close()
             self.database = None
 
-    def _load_existing_paths(self) -> Set[str]:
-        """기존 DB에 등록된 파일 경로 로드"""
-        if self.database is None:
-            return set()
-
-        conn = self.database._get_connection()
-        cursor = conn.execute("SELECT path FROM files")
-        paths = {row[0] for row in cursor.fetchall()}
-        logger.info(f"기존 파일 수: {len(paths)}")
-        return paths
-
     def _normalize_path(self, path: str) -> str:
         """경로 정규화"""
         return path.replace("\\", "/").lower()
 
-    def incremental_scan(self, dry_run: bool = False) -> IncrementalScanResult:
+    def _to_record(self, info: FileInfo) -> dict:
+        """FileInfo를 files 레코드 딕셔너리로 변환"""
+        return {
+            "path": info.path,
+            "filename": info.name,
+            "extension": info.extension,
+            "size_bytes": info.size,
+            "modified_at": datetime.fromtimestamp(info.modified_time)
+            if info.modified_time
+            else None,
+            "file_type": classify_file(info.name).value,
+            "parent_folder": unc_parent(info.path),
+            "scan_status": "scanned",
+        }
+
+    def _backfill_parent_folders(self) -> int:
+        """예전 형식 parent_folder 보정 (프로세스당 1회)
+
+        Linux에서 os.path.dirname으로 저장된 행은 parent_folder가 ''이고,
+        구분자가 섞인 행은 폴더 조회(get_files_in_folder)에 잡히지 않습니다.
+        """
+        self._parent_folders_checked = True
+        conn = self.database._get_connection()
+        rows = conn.execute(
+            """
+            SELECT id, path, parent_folder FROM files
+            WHERE parent_folder IS NULL OR parent_folder = '' OR instr(parent_folder, '/') > 0
+        """
+        ).fetchall()
+        fixes = [
+            (unc_parent(row["path"]), row["id"])
+            for row in rows
+            if unc_parent(row["path"]) != row["parent_folder"]
+        ]
+        if fixes:
+            with self.database.transaction() as tx:
+                tx.executemany("UPDATE files SET parent_folder = ? WHERE id = ?", fixes)
+            logger.info(f"parent_folder 형식 보정: {len(fixes)}개")
+        return len(fixes)
+
+    @staticmethod
+    def _file_key(size: int, modified_at: Optional[str]) -> tuple:
+        """이동/이름변경 판별용 키 (크기 + 수정시각)"""
+        return (size, (modified_at or "")[:19])
+
+    def _mtime_unchanged(self, known: Optional[dict], mtime: float) -> bool:
+        """저장된 디렉토리 mtime과 비교"""
+        if known is None or known["mtime"] is None:
+            return False
+        return abs(known["mtime"] - mtime) < self.MTIME_TOLERANCE
+
+    def incremental_scan(self, dry_run: bool = False, full: bool = False) -> IncrementalScanResult:
         """증분 스캔 실행
 
-        기존 DB에 없는 새 파일만 등록합니다.
+        mtime이 바뀐 폴더만 목록을 읽어 신규/변경/삭제/이동 파일을 반영합니다.
+        이미 알고 있던 폴더에서 발견된 변경은 file_history에 기록합니다.
 
         Args:
             dry_run: True면 실제 DB 변경 없이 시뮬레이션
+            full: True면 저장된 디렉토리 mtime을 무시하고 모든 폴더 목록을 읽음
 
         Returns:
             IncrementalScanResult 객체
@@ -170,62 +235,182 @@ class NASAutoSync:
 
         try:
             self._connect()
+            if not dry_run and not self._parent_folders_checked:
+                self._backfill_parent_folders()
 
-            # 기존 경로 로드
-            self._existing_paths = self._load_existing_paths()
-            existing_normalized = {self._normalize_path(p) for p in self._existing_paths}
-
-            logger.info(f"증분 스캔 시작: {self.config.archive_path}")
+            known_dirs = {} if full else self.database.get_directory_states()
+            children: Dict[str, List[str]] = {}
+            for dir_path, st in known_dirs.items():
+                if st["parent_path"]:
+                    children.setdefault(st["parent_path"], []).append(dir_path)
 
-            batch = []
+            logger.info(
+                f"증분 스캔 시작: {self.config.archive_path} (저장된 폴더 상태: {len(known_dirs)}개)"
+            )
 
-            for info in self.connector.scan_directory(self.config.archive_path, recursive=True):
-                if info.is_dir:
+            root = self.connector.get_file_info(self.config.archive_path)
+            stack: List[Tuple[str, Optional[str], float]] = [(root.path, None, root.modified_time)]
+
+            batch: List[dict] = []
+            dir_states: List[dict] = []
+            history: List[dict] = []
+            removed_dirs: List[str] = []
+            updates: List[tuple] = []
+            # 이동/이름변경 판별 후보 (변경 폴더에서 사라진 파일 / 새로 나타난 파일)
+            missing: Dict[tuple, List[sqlite3.Row]] = {}
+            appeared: Dict[tuple, List[dict]] = {}
+
+            while stack:
+                dir_path, parent_path, mtime = stack.pop()
+                known = known_dirs.get(dir_path)
+
+                # 1. 변경 없는 폴더: 목록 생략, 저장된 하위 폴더만 stat으로 확인
+                if self._mtime_unchanged(known, mtime):
+                    result.skipped_dirs += 1
+                    result.skipped_files += known["file_count"] or 0
+                    for child in children.get(dir_path, []):
+                        try:
+                            info = self.connector.get_file_info(child)
+                            stack.append((child, dir_path, info.modified_time))
+                        except Exception:
+                            # 부모 mtime 해상도 문제 등으로 놓친 삭제
+                            removed_dirs.append(child)
                     continue
 
-                normalized_path = self._normalize_path(info.path)
-
-                # 이미 존재하면 스킵
-                if normalized_path in existing_normalized:
-                    result.skipped_files += 1
+                # 2. 변경된(또는 새) 폴더: 목록을 읽어 DB와 비교
+                result.scanned_dirs += 1
+                try:
+                    entries = list(self.connector.scan_directory(dir_path, recursive=False))
+                except Exception as e:
+                    result.errors.append(f"{dir_path}: {str(e)}")
+                    logger.warning(f"폴더 읽기 오류: {dir_path} - {e}")
                     continue
 
-                try:
-                    # 새 파일 발견
-                    file_type = classify_file(info.name)
-                    parent = os.path.dirname(info.path)
-
-                    record = {
-                        "path": info.path,
-                        "filename": info.name,
-                        "extension": info.extension,
-                        "size_bytes": info.size,
-                        "modified_at": datetime.fromtimestamp(info.modified_time)
-                        if info.modified_time
-                        else None,
-                        "file_type": file_type.value,
-                        "parent_folder": parent,
-                        "scan_status": "scanned",
+                current_files = {}
+                current_dirs = set()
+                for info in entries:
+                    if info.is_dir:
+                        current_dirs.add(info.path)
+                        stack.append((info.path, dir_path, info.modified_time))
+                    else:
+                        current_files[self._normalize_path(info.path)] = info
+
+                for child in children.get(dir_path, []):
+                    if child not in current_dirs:
+                        removed_dirs.append(child)
+
+                record_history = known is not None
+                db_files = {
+                    self._normalize_path(row["path"]): row
+                    for row in self.database.get_files_in_folder(unc_folder(dir_path))
+                }
+
+                for norm_path, info in current_files.items():
+                    row = db_files.get(norm_path)
+                    try:
+                        record = self._to_record(info)
+                    except Exception as e:
+                        result.errors.append(f"{info.path}: {str(e)}")
+                        logger.warning(f"파일 처리 오류: {info.path} - {e}")
+                        continue
+
+                    if row is None:
+                        modified = record["modified_at"].isoformat() if record["modified_at"] else None
+                        key = self._file_key(info.size, modified)
+                        appeared.setdefault(key, []).append(
+                            {"record": record, "history": record_history}
+                        )
+                        continue
+
+                    modified = record["modified_at"].isoformat() if record["modified_at"] else None
+                    if row["size_bytes"] != info.size or (row["modified_at"] or "")[:19] != (
+                        modified or ""
+                    )[:19]:
+                        updates.append((info.size, modified, row["id"]))
+                        result.updated_files += 1
+                        if record_history:
+                            history.append(
+                                {
+                                    "file_id": row["id"],
+                                    "event_type": "modified",
+                                    "old_path": row["path"],
+                                    "new_path": info.path,
+                                }
+                            )
+                    else:
+                        result.skipped_files += 1
+
+                for norm_path, row in db_files.items():
+                    if norm_path not in current_files:
+                        key = self._file_key(row["size_bytes"], row["modified_at"])
+                        missing.setdefault(key, []).append(row)
+
+                dir_states.append(
+                    {
+                        "path": dir_path,
+                        "parent_path": parent_path,
+                        "mtime": mtime,
+                        "child_count": len(entries),
+                        "file_count": len(current_files),
                     }
+                )
 
-                    if not dry_run:
-                        batch.append(record)
+            # 3. 사라진 하위 폴더: 그 아래 파일 전부 삭제/이동 후보
+            removed_all: List[str] = []
+            pending = list(removed_dirs)
+            while pending:
+                gone = pending.pop()
+                removed_all.append(gone)
+                pending.extend(children.get(gone, []))
+                for row in self.database.get_files_in_folder(unc_folder(gone)):
+                    key = self._file_key(row["size_bytes"], row["modified_at"])
+                    missing.setdefault(key, []).append(row)
+
+            # 4. 이동/이름변경 매칭 (크기+수정시각이 1:1로 일치하는 경우만)
+            renames: List[tuple] = []
+            for key, rows in missing.items():
+                candidates = appeared.get(key, [])
+                if len(rows) == 1 and len(candidates) == 1:
+                    old, new = rows[0], candidates.pop()
+                    renames.append((old, new["record"]))
+                    history.append(
+                        {
+                            "file_id": old["id"],
+                            "event_type": "renamed",
+                            "old_path": old["path"],
+                            "new_path": new["record"]["path"],
+                        }
+                    )
+                    rows.clear()
+            result.renamed_files = len(renames)
+
+            deleted = [row for rows in missing.values() for row in rows]
+            result.deleted_files = len(deleted)
+            history.extend(
+                {"file_id": row["id"], "event_type": "deleted", "old_path": row["path"]}
+                for row in deleted
+            )
 
+            for candidates in appeared.values():
+                for item in candidates:
+                    batch.append(item["record"])
                     result.new_files += 1
-                    logger.debug(f"새 파일: {info.path}")
-
-                    # 배치 저장
-                    if len(batch) >= self.config.batch_size:
-                        self._save_batch(batch)
-                        batch = []
-
-                except Exception as e:
-                    result.errors.append(f"{info.path}: {str(e)}")
-                    logger.warning(f"파일 처리 오류: {info.path} - {e}")
-
-            # 남은 배치 저장
-            if batch and not dry_run:
-                self._save_batch(batch)
+                    logger.debug(f"새 파일: {item['record']['path']}")
+
+            if not dry_run:
+                self._apply_changes(batch, updates, renames, deleted)
+                # added 이력은 저장 후 file_id가 정해진 뒤 기록
+                added = [
+                    item["record"]["path"]
+                    for candidates in appeared.values()
+                    for item in candidates
+                    if item["history"]
+                ]
+                history.extend(self._added_history(added))
+                self.database.add_file_history(history)
+                self.database.delete_directory_states(removed_all)
+                # 폴더 상태는 파일 반영이 끝난 뒤 저장 (중단 시 다음 주기에 재스캔)
+                self.database.save_directory_states(dir_states)
 
         except Exception as e:
             result.errors.append(f"스캔 오류: {str(e)}")
@@ -237,6 +422,65 @@ class NASAutoSync:
 
         return result
 
+    def _apply_changes(
+        self,
+        batch: List[dict],
+        updates: List[tuple],
+        renames: List[tuple],
+        deleted: List[sqlite3.Row],
+    ) -> None:
+        """신규/변경/이동/삭제 반영"""
+        # bulk_load는 적재 중 다른 조회에 인덱스/통계가 비므로 명시적으로 켤 때만
+        use_bulk = 0 < self.config.bulk_threshold <= len(batch)
+        with self.database.bulk_load() if use_bulk else nullcontext():
+            for i in range(0, len(batch), self.config.batch_size):
+                self._save_batch(batch[i : i + self.config.batch_size])
+
+        if not (updates or renames or deleted):
+            return
+
+        with self.database.transaction() as conn:
+            conn.executemany(
+                "UPDATE files SET size_bytes = ?, modified_at = ? WHERE id = ?", updates
+            )
+            # 이동된 파일은 id를 유지하여 media_info 등 연결 데이터 보존
+            conn.executemany(
+                """
+                UPDATE files SET path = ?, filename = ?, extension = ?, parent_folder = ?
+                WHERE id = ?
+            """,
+                [
+                    (
+                        new["path"],
+                        new["filename"],
+                        new["extension"],
+                        new["parent_folder"],
+                        old["id"],
+                    )
+                    for old, new in renames
+                ],
+            )
+            conn.executemany(
+                "DELETE FROM media_info WHERE file_id = ?", [(row["id"],) for row in deleted]
+            )
+            conn.executemany("DELETE FROM files WHERE id = ?", [(row["id"],) for row in deleted])
+
+        self.database.invalidate_stats_cache()
+
+    def _added_history(self, paths: List[str]) -> List[dict]:
+        """신규 파일 이력 (file_id 조회 포함)"""
+        events = []
+        for path in paths:
+            record = self.database.get_file_by_path(path)
+            events.append(
+                {
+                    "file_id": record.id if record else None,
+                    "event_type": "added",
+                    "new_path": path,
+                }
+            )
+        return events
+
     def _save_batch(self, batch: List[dict]) -> None:
         """배치 저장"""
         if not self.database or not batch:
@@ -307,7 +551,7 @@ class NASAutoSync:
             logger.warning(f"동기화 스킵: {e}")
             return {"error": str(e)}
 
-    def run_once(self, dry_run: bool = False) -> dict:
+    def run_once(self, dry_run: bool = False, full: bool = False) -> dict:
         """1회 실행
 
         1. 증분 스캔 (NAS → archive.db)
@@ -315,6 +559,7 @@ class NASAutoSync:
 
         Args:
             dry_run: True면 실제 DB 변경 없이 시뮬레이션
+            full: True면 폴더 mtime을 무시하고 전체 폴더 확인
 
         Returns:
             실행 결과 딕셔너리
@@ -328,10 +573,15 @@ class NASAutoSync:
         try:
             # 1. 증분 스캔
             logger.info("[1/2] 증분 스캔...")
-            scan_result = self.incremental_scan(dry_run=dry_run)
+            scan_result = self.incremental_scan(dry_run=dry_run, full=full)
             results["scan"] = {
                 "new_files": scan_result.new_files,
+                "updated_files": scan_result.updated_files,
+                "renamed_files": scan_result.renamed_files,
+                "deleted_files": scan_result.deleted_files,
                 "skipped": scan_result.skipped_files,
+                "scanned_dirs": scan_result.scanned_dirs,
+                "skipped_dirs": scan_result.skipped_dirs,
                 "errors": len(scan_result.errors),
                 "duration": scan_result.duration_seconds,
             }
@@ -392,6 +642,7 @@ Examples:
   python -m archive_analyzer.nas_auto_sync --interval 600  # 10분 간격
   python -m archive_analyzer.nas_auto_sync --once          # 1회 실행
   python -m archive_analyzer.nas_auto_sync --once --dry-run  # 시뮬레이션
+  python -m archive_analyzer.nas_auto_sync --once --full     # 전체 폴더 재확인
         """,
     )
 
@@ -414,6 +665,11 @@ Examples:
         action="store_true",
         help="실제 DB 변경 없이 시뮬레이션",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="폴더 mtime을 무시하고 모든 폴더 목록을 다시 읽음",
+    )
     parser.add_argument(
         "--archive-db",
         type=str,
@@ -439,7 +695,7 @@ Examples:
     service = NASAutoSync(config)
 
     if args.once:
-        service.run_once(dry_run=args.dry_run)
+        service.run_once(dry_run=args.dry_run, full=args.full)
     else:
         service.run_daemon()
 
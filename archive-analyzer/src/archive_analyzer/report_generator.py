@@ -14,6 +14,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from .database import Database
+from .stats_summary import BITRATE_LABELS, RESOLUTION_LABELS, read_entry, stats_updated_at
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +177,8 @@ class ArchiveReport:
     report_date: str = ""
     archive_path: str = ""
     scan_duration_seconds: float = 0.0
+    # 사전 집계 통계 마지막 갱신 시각 (staleness 확인용)
+    stats_updated_at: Optional[str] = None
 
     # 전체 요약
     total_files: int = 0
@@ -216,6 +219,7 @@ class ArchiveReport:
         result = {
             "report_date": self.report_date,
             "archive_path": self.archive_path,
+            "stats_updated_at": self.stats_updated_at,
             "summary": {
                 "total_files": self.total_files,
                 "total_size": self.total_size,
@@ -270,6 +274,7 @@ class ReportGenerator:
         report = ArchiveReport(
             report_date=datetime.now().isoformat(),
             archive_path=archive_path,
+            stats_updated_at=stats_updated_at(self._conn),
         )
 
         # 기본 통계
@@ -300,165 +305,92 @@ class ReportGenerator:
         return report
 
     def _gather_summary(self, report: ArchiveReport) -> None:
-        """전체 요약 수집"""
-        cursor = self._conn.cursor()
-
-        # 전체 파일 수, 용량
-        cursor.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM files")
-        row = cursor.fetchone()
-        report.total_files = row[0]
-        report.total_size = row[1]
-
-        # 비디오 파일 수
-        cursor.execute("SELECT COUNT(*) FROM files WHERE file_type = 'video'")
-        report.total_videos = cursor.fetchone()[0]
+        """전체 요약 수집 (stats_summary)"""
+        total = read_entry(self._conn, "total")
+        report.total_files = total.file_count
+        report.total_size = total.total_size
+        report.total_videos = total.video_count
 
         # 총 재생시간
-        cursor.execute(
-            """
-            SELECT COALESCE(SUM(duration_seconds), 0) / 3600.0
-            FROM media_info
-            WHERE extraction_status = 'success'
-        """
-        )
-        report.total_duration_hours = cursor.fetchone()[0] or 0
+        report.total_duration_hours = read_entry(self._conn, "media_total").value_sum / 3600.0
 
     def _gather_file_type_stats(self, report: ArchiveReport) -> None:
-        """파일 유형별 통계 수집 (#44 - N+1 쿼리 최적화)"""
-        cursor = self._conn.cursor()
-
-        # 파일 타입별 기본 통계
-        cursor.execute(
-            """
-            SELECT
-                file_type,
-                COUNT(*) as count,
-                COALESCE(SUM(size_bytes), 0) as total_size
-            FROM files
-            GROUP BY file_type
-            ORDER BY total_size DESC
-        """
-        )
-
-        type_rows = cursor.fetchall()
-
-        # #44 - 단일 쿼리로 모든 확장자 통계 가져오기
-        cursor.execute(
-            """
-            SELECT file_type, extension, COUNT(*) as count
-            FROM files
-            GROUP BY file_type, extension
-            ORDER BY file_type, count DESC
-        """
+        """파일 유형별 통계 수집 (stats_summary)"""
+        type_rows = sorted(
+            self.db.get_summary_stats("type").values(), key=lambda e: e.total_size, reverse=True
         )
 
         # 확장자별 통계를 file_type으로 그룹화
-        ext_by_type = {}
-        for ext_row in cursor.fetchall():
-            ftype = ext_row[0] or "unknown"
-            if ftype not in ext_by_type:
-                ext_by_type[ftype] = {}
-            ext_by_type[ftype][ext_row[1] or "none"] = ext_row[2]
+        ext_by_type: Dict[str, Dict[str, int]] = {}
+        ext_rows = sorted(
+            self.db.get_summary_stats("type_ext").values(), key=lambda e: e.file_count, reverse=True
+        )
+        for entry in ext_rows:
+            ftype, ext = entry.key.split("|", 1)
+            ext_by_type.setdefault(ftype or "unknown", {})[ext or "none"] = entry.file_count
 
         stats_list = []
-        for row in type_rows:
-            file_type = row[0] or "unknown"
-            count = row[1]
-            size = row[2]
-
-            percentage = (count / report.total_files * 100) if report.total_files > 0 else 0
+        for entry in type_rows:
+            file_type = entry.key or "unknown"
+            percentage = (
+                (entry.file_count / report.total_files * 100) if report.total_files > 0 else 0
+            )
 
             stats = FileTypeStats(
                 file_type=file_type,
-                count=count,
-                total_size=size,
+                count=entry.file_count,
+                total_size=entry.total_size,
                 percentage=round(percentage, 1),
             )
-
-            # 미리 가져온 확장자 통계 사용
             stats.extensions = ext_by_type.get(file_type, {})
-
             stats_list.append(stats)
 
         report.file_type_stats = stats_list
 
     def _gather_extension_breakdown(self, report: ArchiveReport) -> None:
-        """확장자별 상세 분석"""
-        cursor = self._conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                extension,
-                file_type,
-                COUNT(*) as count,
-                COALESCE(SUM(size_bytes), 0) as total_size,
-                AVG(size_bytes) as avg_size
-            FROM files
-            GROUP BY extension
-            ORDER BY total_size DESC
-        """
-        )
+        """확장자별 상세 분석 (stats_summary)"""
+        # 확장자별 대표 file_type (가장 많은 유형)
+        ext_type: Dict[str, tuple] = {}
+        for entry in self.db.get_summary_stats("type_ext").values():
+            ftype, ext = entry.key.split("|", 1)
+            if ext not in ext_type or entry.file_count > ext_type[ext][1]:
+                ext_type[ext] = (ftype or None, entry.file_count)
 
         breakdown = {}
-        for row in cursor.fetchall():
-            ext = row[0] or "none"
-            breakdown[ext] = {
-                "file_type": row[1],
-                "count": row[2],
-                "total_size": row[3],
-                "avg_size": row[4],
-                "size_formatted": self._format_size(row[3]),
+        rows = sorted(
+            self.db.get_summary_stats("extension").values(),
+            key=lambda e: e.total_size,
+            reverse=True,
+        )
+        for entry in rows:
+            breakdown[entry.key or "none"] = {
+                "file_type": ext_type.get(entry.key, (None, 0))[0],
+                "count": entry.file_count,
+                "total_size": entry.total_size,
+                "avg_size": entry.total_size / entry.file_count if entry.file_count else None,
+                "size_formatted": self._format_size(entry.total_size),
             }
 
         report.extension_breakdown = breakdown
 
     def _gather_resolution_stats(self, report: ArchiveReport) -> None:
-        """해상도별 통계 수집"""
-        cursor = self._conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                CASE
-                    WHEN height >= 2160 THEN '4K (2160p+)'
-                    WHEN height >= 1440 THEN '1440p (QHD)'
-                    WHEN height >= 1080 THEN '1080p (FHD)'
-                    WHEN height >= 720 THEN '720p (HD)'
-                    WHEN height >= 480 THEN '480p (SD)'
-                    WHEN height > 0 THEN 'Other (<480p)'
-                    ELSE 'Unknown'
-                END as resolution,
-                COUNT(*) as count,
-                COALESCE(SUM(f.size_bytes), 0) as total_size,
-                AVG(m.bitrate) as avg_bitrate
-            FROM media_info m
-            LEFT JOIN files f ON m.file_id = f.id
-            WHERE m.extraction_status = 'success'
-            GROUP BY resolution
-            ORDER BY
-                CASE resolution
-                    WHEN '4K (2160p+)' THEN 1
-                    WHEN '1440p (QHD)' THEN 2
-                    WHEN '1080p (FHD)' THEN 3
-                    WHEN '720p (HD)' THEN 4
-                    WHEN '480p (SD)' THEN 5
-                    ELSE 6
-                END
-        """
-        )
+        """해상도별 통계 수집 (stats_summary)"""
+        entries = self.db.get_summary_stats("resolution")
 
         total_with_resolution = 0
         stats_list = []
 
-        for row in cursor.fetchall():
-            total_with_resolution += row[1]
+        for label in RESOLUTION_LABELS:
+            entry = entries.get(label)
+            if entry is None:
+                continue
+            total_with_resolution += entry.file_count
             stats_list.append(
                 ResolutionStats(
-                    resolution=row[0],
-                    count=row[1],
-                    total_size=row[2],
-                    avg_bitrate=row[3] or 0,
+                    resolution=label,
+                    count=entry.file_count,
+                    total_size=entry.total_size,
+                    avg_bitrate=entry.value_sum / entry.value_count if entry.value_count else 0,
                 )
             )
 
@@ -471,33 +403,13 @@ class ReportGenerator:
         report.resolution_stats = stats_list
 
     def _gather_codec_stats(self, report: ArchiveReport) -> None:
-        """코덱별 통계 수집"""
-        cursor = self._conn.cursor()
-
-        # 비디오 코덱
-        cursor.execute(
-            """
-            SELECT
-                COALESCE(video_codec, 'Unknown') as codec,
-                COUNT(*) as count
-            FROM media_info
-            WHERE extraction_status = 'success'
-            GROUP BY video_codec
-            ORDER BY count DESC
-        """
+        """코덱별 통계 수집 (stats_summary)"""
+        rows = sorted(
+            self.db.get_summary_stats("codec").values(), key=lambda e: e.file_count, reverse=True
         )
 
-        total = 0
-        stats_list = []
-
-        for row in cursor.fetchall():
-            total += row[1]
-            stats_list.append(
-                CodecStats(
-                    codec=row[0],
-                    count=row[1],
-                )
-            )
+        total = sum(entry.file_count for entry in rows)
+        stats_list = [CodecStats(codec=entry.key, count=entry.file_count) for entry in rows]
 
         for stats in stats_list:
             stats.percentage = round((stats.count / total * 100) if total > 0 else 0, 1)
@@ -505,34 +417,18 @@ class ReportGenerator:
         report.codec_stats = stats_list
 
     def _gather_container_stats(self, report: ArchiveReport) -> None:
-        """컨테이너 포맷별 통계 수집"""
-        cursor = self._conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                COALESCE(container_format, 'Unknown') as container,
-                COUNT(*) as count,
-                COALESCE(SUM(file_size), 0) as total_size
-            FROM media_info
-            WHERE extraction_status = 'success'
-            GROUP BY container_format
-            ORDER BY count DESC
-        """
+        """컨테이너 포맷별 통계 수집 (stats_summary)"""
+        rows = sorted(
+            self.db.get_summary_stats("container").values(),
+            key=lambda e: e.file_count,
+            reverse=True,
         )
 
-        total = 0
-        stats_list = []
-
-        for row in cursor.fetchall():
-            total += row[1]
-            stats_list.append(
-                ContainerStats(
-                    container=row[0],
-                    count=row[1],
-                    total_size=row[2],
-                )
-            )
+        total = sum(entry.file_count for entry in rows)
+        stats_list = [
+            ContainerStats(container=entry.key, count=entry.file_count, total_size=entry.total_size)
+            for entry in rows
+        ]
 
         for stats in stats_list:
             stats.percentage = round((stats.count / total * 100) if total > 0 else 0, 1)
@@ -540,36 +436,24 @@ class ReportGenerator:
         report.container_stats = stats_list
 
     def _gather_folder_stats(self, report: ArchiveReport) -> None:
-        """폴더별 통계 수집"""
-        cursor = self._conn.cursor()
-
-        # 모든 폴더 통계 조회
-        cursor.execute(
-            """
-            SELECT
-                parent_folder,
-                COUNT(*) as file_count,
-                COALESCE(SUM(size_bytes), 0) as total_size,
-                SUM(CASE WHEN file_type = 'video' THEN 1 ELSE 0 END) as video_count
-            FROM files
-            GROUP BY parent_folder
-            ORDER BY total_size DESC
-        """
+        """폴더별 통계 수집 (stats_summary)"""
+        rows = sorted(
+            self.db.get_summary_stats("folder").values(), key=lambda e: e.total_size, reverse=True
         )
 
         all_folders = []
 
-        for row in cursor.fetchall():
-            folder_path = row[0] or "(root)"
+        for entry in rows:
+            folder_path = entry.key or "(root)"
             # 상대 경로 추출 (ARCHIVE 이후)
             relative = self._extract_relative_path(folder_path)
             depth = relative.count("/") if relative else 0
 
             stats = FolderStats(
                 folder=folder_path,
-                file_count=row[1],
-                total_size=row[2],
-                video_count=row[3],
+                file_count=entry.file_count,
+                total_size=entry.total_size,
+                video_count=entry.video_count,
                 depth=depth,
                 relative_path=relative,
             )
@@ -647,31 +531,9 @@ class ReportGenerator:
             # 리프 노드만 실제 데이터 가짐
 
     def _gather_duration_stats(self, report: ArchiveReport) -> None:
-        """재생시간별 통계 수집"""
-        cursor = self._conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                CASE
-                    WHEN duration_seconds < 1800 THEN 'short'
-                    WHEN duration_seconds < 5400 THEN 'medium'
-                    ELSE 'long'
-                END as category,
-                COUNT(*) as count,
-                SUM(duration_seconds) / 3600.0 as total_hours
-            FROM media_info
-            WHERE extraction_status = 'success' AND duration_seconds IS NOT NULL
-            GROUP BY category
-        """
-        )
-
-        total = 0
-        category_map = {}
-
-        for row in cursor.fetchall():
-            total += row[1]
-            category_map[row[0]] = (row[1], row[2] or 0)
+        """재생시간별 통계 수집 (stats_summary)"""
+        entries = self.db.get_summary_stats("duration")
+        total = sum(entry.file_count for entry in entries.values())
 
         labels = {
             "short": "단편 (< 30분)",
@@ -681,7 +543,9 @@ class ReportGenerator:
 
         stats_list = []
         for key in ["short", "medium", "long"]:
-            count, hours = category_map.get(key, (0, 0))
+            entry = entries.get(key)
+            count = entry.file_count if entry else 0
+            hours = entry.value_sum / 3600.0 if entry else 0
             stats_list.append(
                 DurationStats(
                     category=labels[key],
@@ -694,45 +558,18 @@ class ReportGenerator:
         report.duration_stats = stats_list
 
     def _gather_bitrate_stats(self, report: ArchiveReport) -> None:
-        """비트레이트별 통계 수집"""
-        cursor = self._conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                CASE
-                    WHEN bitrate < 5000000 THEN '< 5 Mbps'
-                    WHEN bitrate < 10000000 THEN '5-10 Mbps'
-                    WHEN bitrate < 20000000 THEN '10-20 Mbps'
-                    WHEN bitrate < 50000000 THEN '20-50 Mbps'
-                    ELSE '> 50 Mbps'
-                END as range_label,
-                COUNT(*) as count
-            FROM media_info
-            WHERE extraction_status = 'success' AND bitrate IS NOT NULL
-            GROUP BY range_label
-            ORDER BY
-                CASE range_label
-                    WHEN '< 5 Mbps' THEN 1
-                    WHEN '5-10 Mbps' THEN 2
-                    WHEN '10-20 Mbps' THEN 3
-                    WHEN '20-50 Mbps' THEN 4
-                    ELSE 5
-                END
-        """
-        )
+        """비트레이트별 통계 수집 (stats_summary)"""
+        entries = self.db.get_summary_stats("bitrate")
 
         total = 0
         stats_list = []
 
-        for row in cursor.fetchall():
-            total += row[1]
-            stats_list.append(
-                BitrateStats(
-                    range_label=row[0],
-                    count=row[1],
-                )
-            )
+        for label in BITRATE_LABELS:
+            entry = entries.get(label)
+            if entry is None:
+                continue
+            total += entry.file_count
+            stats_list.append(BitrateStats(range_label=label, count=entry.file_count))
 
         for stats in stats_list:
             stats.percentage = round((stats.count / total * 100) if total > 0 else 0, 1)
@@ -745,38 +582,12 @@ class ReportGenerator:
 
         compatibility = StreamingCompatibility()
 
-        # 호환 비디오 수
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM media_info
-            WHERE extraction_status = 'success'
-            AND LOWER(video_codec) IN ('h264', 'hevc', 'h265', 'vp9', 'av1')
-            AND LOWER(container_format) IN ('mp4', 'webm', 'mov', 'matroska')
-        """
-        )
-        compatibility.compatible_count = cursor.fetchone()[0]
-
-        # 비호환 비디오 (트랜스코딩 필요)
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM media_info
-            WHERE extraction_status = 'success'
-            AND (
-                LOWER(video_codec) NOT IN ('h264', 'hevc', 'h265', 'vp9', 'av1')
-                OR LOWER(container_format) NOT IN ('mp4', 'webm', 'mov', 'matroska')
-            )
-        """
-        )
-        compatibility.needs_transcode = cursor.fetchone()[0]
-
-        # 추출 실패
-        cursor.execute(
-            """
-            SELECT COUNT(*) FROM media_info
-            WHERE extraction_status = 'failed'
-        """
-        )
-        compatibility.incompatible_count = cursor.fetchone()[0]
+        # 호환/트랜스코딩 필요/추출 실패 (stats_summary)
+        compatibility.compatible_count = read_entry(self._conn, "compat", "compatible").file_count
+        compatibility.needs_transcode = read_entry(
+            self._conn, "compat", "needs_transcode"
+        ).file_count
+        compatibility.incompatible_count = read_entry(self._conn, "extraction", "failed").file_count
 
         # 적합률
         total = compatibility.compatible_count + compatibility.needs_transcode
@@ -5,19 +5,21 @@ Issue #3: 아카이브 파일 스캐너 구현
 - 파일 유형별 분류
 - 진행률 표시
 - 중단 후 재개 기능
+- 다중 세션 병렬 탐색 모드 (parallel_workers > 1)
 """
 
 import logging
 import os
 import uuid
-from dataclasses import dataclass
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable, List, Optional
+from typing import Callable, Iterator, List, Optional
 
 from .config import AnalyzerConfig
 from .database import Database, FileRecord, ScanCheckpoint
 from .file_classifier import classify_file
-from .smb_connector import FileInfo, SMBConnector
+from .smb_connector import FileInfo, ParallelDirectoryWalker, SMBConnector, unc_parent
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,7 @@ class ScanResult:
     duration_seconds: float
     by_type: dict
     errors: List[str]
+    worker_stats: List[dict] = field(default_factory=list)  # 병렬 모드 워커별 처리량
 
     def __str__(self) -> str:
         return (
@@ -80,6 +83,8 @@ class ArchiveScanner:
         database: Database,
         archive_path: str = "",
         batch_size: int = 100,
+        parallel_workers: int = 1,
+        bulk_load: bool = False,
     ):
         """
         Args:
@@ -87,11 +92,18 @@ class ArchiveScanner:
             database: 데이터베이스 관리자
             archive_path: 스캔할 아카이브 경로 (공유 내 상대 경로)
             batch_size: 배치 저장 크기
+            parallel_workers: 병렬 탐색 세션 수 (1이면 기존 순차 탐색)
+            bulk_load: Database.bulk_load()로 적재 (오프라인 최초 적재용, 기본 꺼짐).
+                인덱스와 행 단위 트리거 없이 넣고 종료 시 한 번에 재구성하므로,
+                스캔 중에는 대시보드/API 조회가 느리고 통계가 갱신되지 않습니다
         """
         self.connector = connector
         self.database = database
         self.archive_path = archive_path
         self.batch_size = batch_size
+        self.parallel_workers = parallel_workers
+        self.bulk_load = bulk_load
+        self._walker: Optional[ParallelDirectoryWalker] = None
 
         self._scan_id: Optional[str] = None
         self._start_time: Optional[datetime] = None
@@ -121,13 +133,22 @@ class ArchiveScanner:
             )
             self._progress_callback(progress)
 
+    def _iter_entries(self, path: str) -> Iterator[FileInfo]:
+        """탐색 모드에 따라 파일 엔트리 스트림 반환"""
+        if self.parallel_workers > 1:
+            self._walker = ParallelDirectoryWalker(
+                self.connector.config, workers=self.parallel_workers
+            )
+            return self._walker.walk(path)
+        return self.connector.scan_directory(path, recursive=True)
+
     def _count_files(self, path: str = "") -> int:
         """디렉토리 내 총 파일 수 카운트"""
         count = 0
         scan_path = os.path.join(self.archive_path, path) if path else self.archive_path
 
         try:
-            for info in self.connector.scan_directory(scan_path, recursive=True):
+            for info in self._iter_entries(scan_path):
                 if not info.is_dir:
                     count += 1
         except Exception as e:
@@ -138,7 +159,7 @@ class ArchiveScanner:
     def _file_info_to_record(self, info: FileInfo) -> FileRecord:
         """FileInfo를 FileRecord로 변환"""
         file_type = classify_file(info.name)
-        parent = os.path.dirname(info.path)
+        parent = unc_parent(info.path)
 
         return FileRecord(
             path=info.path,
@@ -175,6 +196,7 @@ class ArchiveScanner:
         self._start_time = datetime.now()
         self._processed_count = 0
         self._errors = []
+        self._walker = None
 
         logger.info(f"Starting scan: {self._scan_id}")
         logger.info(f"Archive path: {self.archive_path}")
@@ -186,9 +208,13 @@ class ArchiveScanner:
         if resume_scan_id:
             checkpoint = self.database.get_checkpoint(resume_scan_id)
             if checkpoint and checkpoint.status != "completed":
-                resume_from_path = checkpoint.last_path
-                self._processed_count = checkpoint.processed_files
-                logger.info(f"Resuming from: {resume_from_path}")
+                if self.parallel_workers > 1:
+                    # 병렬 탐색은 순서가 비결정적이므로 경로 기반 재개 불가 - 전체 재스캔 (upsert라 멱등)
+                    logger.warning("Parallel scan cannot resume by path; rescanning all files")
+                else:
+                    resume_from_path = checkpoint.last_path
+                    self._processed_count = checkpoint.processed_files
+                    logger.info(f"Resuming from: {resume_from_path}")
 
         # 총 파일 수 카운트 (#39 - 기본적으로 스킵하여 이중 스캔 방지)
         if count_first:
@@ -215,63 +241,69 @@ class ArchiveScanner:
         skip_until_resume = resume_from_path is not None
         stats_by_type = {}
 
-        try:
-            for info in self.connector.scan_directory(self.archive_path, recursive=True):
-                # 디렉토리 건너뛰기
-                if info.is_dir:
-                    continue
-
-                # 재개 지점까지 건너뛰기 (#32 - 재개 파일 자체는 처리)
-                if skip_until_resume:
-                    if info.path == resume_from_path:
-                        skip_until_resume = False
-                        # resume 파일은 이미 처리되었으므로 건너뛰기
-                        continue
-                    else:
-                        continue
-
-                try:
-                    # 레코드 생성
-                    record = self._file_info_to_record(info)
-                    batch.append(record)
-
-                    # 통계 업데이트
-                    ft = record.file_type
-                    if ft not in stats_by_type:
-                        stats_by_type[ft] = {"count": 0, "size": 0}
-                    stats_by_type[ft]["count"] += 1
-                    stats_by_type[ft]["size"] += record.size_bytes
-
-                    self._processed_count += 1
+        if self.parallel_workers > 1:
+            logger.info(f"Parallel walk with {self.parallel_workers} SMB sessions")
 
-                    # 배치 저장
-                    if len(batch) >= self.batch_size:
-                        self.database.insert_files_batch(batch)
-                        self.database.update_checkpoint_progress(
-                            self._scan_id, info.path, self._processed_count
-                        )
-                        batch = []
-
-                    # 진행률 알림
-                    if self._processed_count % 100 == 0:
-                        self._notify_progress(info.path)
-
-                except Exception as e:
-                    error_msg = f"Error processing {info.path}: {e}"
-                    logger.warning(error_msg)
-                    self._errors.append(error_msg)
-
-            # 남은 배치 저장
-            if batch:
-                self.database.insert_files_batch(batch)
-
-            # 체크포인트 완료
-            self.database.complete_checkpoint(self._scan_id)
+        if self.bulk_load:
+            logger.info("Bulk load mode (indexes and derived tables rebuilt after scan)")
+        with self.database.bulk_load() if self.bulk_load else nullcontext():
+            try:
+                for info in self._iter_entries(self.archive_path):
+                    # 디렉토리 건너뛰기
+                    if info.is_dir:
+                        continue
 
-        except Exception as e:
-            logger.error(f"Scan failed: {e}")
-            self._errors.append(str(e))
-            raise
+                    # 재개 지점까지 건너뛰기 (#32 - 재개 파일 자체는 처리)
+                    if skip_until_resume:
+                        if info.path == resume_from_path:
+                            skip_until_resume = False
+                            # resume 파일은 이미 처리되었으므로 건너뛰기
+                            continue
+                        else:
+                            continue
+
+                    try:
+                        # 레코드 생성
+                        record = self._file_info_to_record(info)
+                        batch.append(record)
+
+                        # 통계 업데이트
+                        ft = record.file_type
+                        if ft not in stats_by_type:
+                            stats_by_type[ft] = {"count": 0, "size": 0}
+                        stats_by_type[ft]["count"] += 1
+                        stats_by_type[ft]["size"] += record.size_bytes
+
+                        self._processed_count += 1
+
+                        # 배치 저장
+                        if len(batch) >= self.batch_size:
+                            self.database.insert_files_batch(batch)
+                            self.database.update_checkpoint_progress(
+                                self._scan_id, info.path, self._processed_count
+                            )
+                            batch = []
+
+                        # 진행률 알림
+                        if self._processed_count % 100 == 0:
+                            self._notify_progress(info.path)
+
+                    except Exception as e:
+                        error_msg = f"Error processing {info.path}: {e}"
+                        logger.warning(error_msg)
+                        self._errors.append(error_msg)
+
+                # 남은 배치 저장
+                if batch:
+                    self.database.insert_files_batch(batch)
+
+                # 체크포인트 완료
+                self.database.complete_checkpoint(self._scan_id)
+
+            except Exception as e:
+                logger.error(f"Scan failed: {e}")
+                self._errors.append(str(e))
+                raise
 
         # 결과 생성
         duration = (datetime.now() - self._start_time).total_seconds()
@@ -284,9 +316,17 @@ class ArchiveScanner:
             duration_seconds=duration,
             by_type=stats_by_type,
             errors=self._errors,
+            worker_stats=(
+                [s.to_dict() for s in self._walker.worker_stats] if self._walker else []
+            ),
         )
 
         logger.info(str(result))
+        for stats in result.worker_stats:
+            logger.info(
+                f"  worker {stats['worker_id']}: {stats['files']:,} files, "
+                f"{stats['directories']:,} dirs, {stats['files_per_second']:.1f} files/s"
+            )
         return result
 
     def quick_scan(self) -> dict:
@@ -306,7 +346,7 @@ class ArchiveScanner:
 
         logger.info(f"Quick scanning: {self.archive_path}")
 
-        for info in self.connector.scan_directory(self.archive_path, recursive=True):
+        for info in self._iter_entries(self.archive_path):
             if info.is_dir:
                 continue
 
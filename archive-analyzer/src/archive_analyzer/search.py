@@ -1,13 +1,27 @@
 """MeiliSearch 기반 검색 모듈
 
 archive.db 데이터를 MeiliSearch로 인덱싱하고 검색 기능을 제공합니다.
+인덱싱은 search_changes 변경 로그 기준 증분 방식입니다.
 """
 
 import logging
 import os
 import sqlite3
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set
+
+from .search_changes import (
+    changes_since,
+    compact_changes,
+    current_seq,
+    ensure_change_log,
+    get_sync_state,
+    reset_sync_state,
+    set_sync_state,
+)
 
 try:
     import meilisearch
@@ -18,6 +32,35 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 인덱스별 문서 조회 SQL ({where}: 전체는 빈 문자열, 증분은 ID 목록 조건)
+_DOCUMENT_QUERIES = {
+    "files": "SELECT * FROM files {where}",
+    "media_info": """
+        SELECT
+            m.*,
+            CASE
+                WHEN m.height >= 2160 THEN '4K'
+                WHEN m.height >= 1440 THEN '1440p'
+                WHEN m.height >= 1080 THEN '1080p'
+                WHEN m.height >= 720 THEN '720p'
+                WHEN m.height >= 480 THEN '480p'
+                ELSE 'Other'
+            END as resolution_label
+        FROM media_info m
+        {where}
+    """,
+    "clip_metadata": "SELECT * FROM clip_metadata {where}",
+}
+
+# IN (...) 조회 한 번에 바인딩할 최대 ID 수 (구버전 SQLite 한도 999)
+_MAX_SQL_VARIABLES = 500
+
+
+class IndexingError(Exception):
+    """MeiliSearch 인덱싱 태스크 실패"""
+
+    pass
+
 
 @dataclass
 class SearchConfig:
@@ -31,6 +74,10 @@ class SearchConfig:
     media_index: str = "media_info"
     clips_index: str = "clip_metadata"
 
+    # 증분 인덱싱: 동시 진행 태스크 수 (백프레셔), 태스크 완료 대기 시간
+    max_inflight_tasks: int = 4
+    task_timeout_ms: int = 300_000
+
 
 @dataclass
 class SearchResult:
@@ -40,6 +87,67 @@ class SearchResult:
     total_hits: int
     processing_time_ms: int
     query: str
+    # 패싯 요청 시 {필드: {값: 문서 수}}
+    facets: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+@dataclass
+class IndexReport:
+    """인덱스별 인덱싱 결과 (처리량 보고용)"""
+
+    index: str
+    mode: str  # "full" | "incremental"
+    upserted: int = 0
+    deleted: int = 0
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return self.upserted + self.deleted
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.total / self.seconds if self.seconds > 0 else 0.0
+
+
+class _TaskPipeline:
+    """MeiliSearch 태스크 파이프라인 (동시 전송 + 완료 대기 백프레셔)
+
+    요청 전송은 스레드 풀에서 병렬로 하고, 진행 중 태스크가 max_inflight개에
+    도달하면 가장 오래된 태스크가 서버에서 끝날 때까지 기다립니다.
+    """
+
+    def __init__(self, client: Any, max_inflight: int, timeout_ms: int):
+        self.client = client
+        self.max_inflight = max(1, max_inflight)
+        self.timeout_ms = timeout_ms
+        self._executor = ThreadPoolExecutor(max_workers=self.max_inflight)
+        self._pending: Deque[Future] = deque()
+
+    def __enter__(self) -> "_TaskPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.drain()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def submit(self, func: Callable, *args: Any) -> None:
+        while len(self._pending) >= self.max_inflight:
+            self._wait_oldest()
+        self._pending.append(self._executor.submit(func, *args))
+
+    def drain(self) -> None:
+        while self._pending:
+            self._wait_oldest()
+
+    def _wait_oldest(self) -> None:
+        task_info = self._pending.popleft().result()
+        task = self.client.wait_for_task(task_info.task_uid, timeout_in_ms=self.timeout_ms)
+        if task.status != "succeeded":
+            raise IndexingError(f"MeiliSearch 태스크 {task_info.task_uid} 실패: {task.error}")
 
 
 class SearchService:
@@ -55,6 +163,9 @@ class SearchService:
 
         self.config = config or SearchConfig()
         self.client = meilisearch.Client(self.config.host, self.config.api_key)
+        self.last_reports: List[IndexReport] = []
+        # clear_all() 후 다음 index_from_db에서 전체 재인덱싱할 테이블
+        self._pending_full: Set[str] = set()
         self._setup_indexes()
 
     def _setup_indexes(self) -> None:
@@ -161,79 +272,112 @@ class SearchService:
     # #41 - 청크 처리를 위한 배치 크기
     BATCH_SIZE = 1000
 
-    def index_from_db(self, db_path: str) -> Dict[str, int]:
-        """SQLite DB에서 데이터를 읽어 인덱싱 (#41 - 청크 처리로 OOM 방지)
+    def index_from_db(self, db_path: str, full: bool = False) -> Dict[str, int]:
+        """SQLite DB에서 변경된 데이터만 인덱싱 (#41 - 청크 처리로 OOM 방지)
+
+        search_changes 변경 로그의 테이블별 워터마크 이후 변경만 전송합니다.
+        인덱싱 상태가 없는 테이블(첫 실행), clear_all() 직후, full=True면 전체를 전송합니다.
+        add_documents/delete_documents 태스크는 최대 max_inflight_tasks개까지
+        동시에 진행하고, 한도에 도달하면 가장 오래된 태스크 완료를 기다립니다.
+        모든 태스크가 성공한 뒤에만 워터마크를 올립니다.
 
         Args:
             db_path: archive.db 경로
+            full: True면 전체 재인덱싱
 
         Returns:
-            인덱싱된 문서 수 {index_name: count}
+            전송한 문서 수 (upsert + delete) {table_name: count}
+            처리량 등 상세 결과는 last_reports 참고
         """
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        ensure_change_log(conn)
+        conn.commit()
 
         results = {}
+        self.last_reports = []
+        try:
+            for table, index_name in (
+                ("files", self.config.files_index),
+                ("media_info", self.config.media_index),
+                ("clip_metadata", self.config.clips_index),
+            ):
+                report = self._sync_table(
+                    conn, table, index_name, full or table in self._pending_full
+                )
+                self._pending_full.discard(table)
+                self.last_reports.append(report)
+                if report.total:
+                    results[table] = report.total
+                logger.info(
+                    f"{table} 인덱싱 완료 ({report.mode}): upsert {report.upserted}건, "
+                    f"delete {report.deleted}건, {report.seconds:.1f}초 "
+                    f"({report.docs_per_sec:,.0f} docs/s)"
+                )
+        finally:
+            conn.close()
 
-        # files 테이블 인덱싱 (청크 처리)
-        cursor.execute("SELECT * FROM files")
-        files_count = 0
-        while True:
-            batch = cursor.fetchmany(self.BATCH_SIZE)
-            if not batch:
-                break
-            docs = [dict(row) for row in batch]
-            self.client.index(self.config.files_index).add_documents(docs, primary_key="id")
-            files_count += len(docs)
-        if files_count:
-            results["files"] = files_count
-            logger.info(f"files 인덱싱 완료: {files_count}건")
-
-        # media_info 테이블 인덱싱 (청크 처리)
-        cursor.execute(
-            """
-            SELECT
-                m.*,
-                CASE
-                    WHEN m.height >= 2160 THEN '4K'
-                    WHEN m.height >= 1440 THEN '1440p'
-                    WHEN m.height >= 1080 THEN '1080p'
-                    WHEN m.height >= 720 THEN '720p'
-                    WHEN m.height >= 480 THEN '480p'
-                    ELSE 'Other'
-                END as resolution_label
-            FROM media_info m
-        """
-        )
-        media_count = 0
-        while True:
-            batch = cursor.fetchmany(self.BATCH_SIZE)
-            if not batch:
-                break
-            docs = [dict(row) for row in batch]
-            self.client.index(self.config.media_index).add_documents(docs, primary_key="id")
-            media_count += len(docs)
-        if media_count:
-            results["media_info"] = media_count
-            logger.info(f"media_info 인덱싱 완료: {media_count}건")
-
-        # clip_metadata 테이블 인덱싱 (청크 처리)
-        cursor.execute("SELECT * FROM clip_metadata")
-        clips_count = 0
+        return results
+
+    def _sync_table(
+        self, conn: sqlite3.Connection, table: str, index_name: str, full: bool
+    ) -> "IndexReport":
+        """테이블 하나를 인덱스에 반영하고 워터마크 갱신"""
+        state = get_sync_state(conn, table)
+        upto = current_seq(conn)
+        mode = "full" if full or state is None else "incremental"
+        after = state.last_seq if state else 0
+        upserts, deletes = changes_since(conn, table, after, upto)
+
+        report = IndexReport(index=index_name, mode=mode)
+        index = self.client.index(index_name)
+        start = time.perf_counter()
+
+        with _TaskPipeline(
+            self.client, self.config.max_inflight_tasks, self.config.task_timeout_ms
+        ) as pipeline:
+            # 삭제 툼스톤 (전체 모드에서도 지난 반영 이후 삭제된 행은 제거)
+            for i in range(0, len(deletes), self.BATCH_SIZE):
+                chunk = deletes[i : i + self.BATCH_SIZE]
+                pipeline.submit(index.delete_documents, chunk)
+                report.deleted += len(chunk)
+
+            if mode == "full":
+                batches = self._iter_all(conn, table)
+            else:
+                batches = self._iter_by_ids(conn, table, upserts)
+            for docs in batches:
+                pipeline.submit(index.add_documents, docs, "id")
+                report.upserted += len(docs)
+
+        set_sync_state(conn, table, upto, mode)
+        compact_changes(conn, table, upto)
+        conn.commit()
+
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def _iter_all(self, conn: sqlite3.Connection, table: str) -> Iterator[List[Dict[str, Any]]]:
+        """테이블 전체를 BATCH_SIZE 단위 문서 목록으로"""
+        cursor = conn.execute(_DOCUMENT_QUERIES[table].format(where=""))
         while True:
             batch = cursor.fetchmany(self.BATCH_SIZE)
             if not batch:
                 break
-            docs = [dict(row) for row in batch]
-            self.client.index(self.config.clips_index).add_documents(docs, primary_key="id")
-            clips_count += len(docs)
-        if clips_count:
-            results["clip_metadata"] = clips_count
-            logger.info(f"clip_metadata 인덱싱 완료: {clips_count}건")
-
-        conn.close()
-        return results
+            yield [dict(row) for row in batch]
+
+    def _iter_by_ids(
+        self, conn: sqlite3.Connection, table: str, ids: List[int]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """변경된 행 ID 목록을 문서 목록으로 (SQLite 변수 한도 내 청크)"""
+        chunk_size = min(self.BATCH_SIZE, _MAX_SQL_VARIABLES)
+        for i in range(0, len(ids), chunk_size):
+            chunk = ids[i : i + chunk_size]
+            where = f"WHERE id IN ({','.join('?' * len(chunk))})"
+            rows = conn.execute(_DOCUMENT_QUERIES[table].format(where=where), chunk)
+            docs = [dict(row) for row in rows]
+            if docs:
+                yield docs
 
     def search_files(
         self,
@@ -242,6 +386,7 @@ class SearchService:
         extension: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        facets: Optional[List[str]] = None,
     ) -> SearchResult:
         """파일 검색
 
@@ -251,6 +396,7 @@ class SearchService:
             extension: 확장자 필터 (.mp4, .mkv 등)
             limit: 결과 수 제한
             offset: 시작 위치
+            facets: 패싯 카운트를 받을 필터 필드 목록
 
         Returns:
             SearchResult 객체
@@ -261,21 +407,7 @@ class SearchService:
         if extension:
             filters.append(f'extension = "{extension}"')
 
-        result = self.client.index(self.config.files_index).search(
-            query,
-            {
-                "limit": limit,
-                "offset": offset,
-                "filter": " AND ".join(filters) if filters else None,
-            },
-        )
-
-        return SearchResult(
-            hits=result["hits"],
-            total_hits=result.get("estimatedTotalHits", len(result["hits"])),
-            processing_time_ms=result.get("processingTimeMs", 0),
-            query=query,
-        )
+        return self._search(self.config.files_index, query, filters, limit, offset, facets)
 
     def search_media(
         self,
@@ -284,6 +416,7 @@ class SearchService:
         resolution: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        facets: Optional[List[str]] = None,
     ) -> SearchResult:
         """미디어 정보 검색
 
@@ -293,6 +426,7 @@ class SearchService:
             resolution: 해상도 라벨 필터 (4K, 1080p 등)
             limit: 결과 수 제한
             offset: 시작 위치
+            facets: 패싯 카운트를 받을 필터 필드 목록
 
         Returns:
             SearchResult 객체
@@ -303,21 +437,7 @@ class SearchService:
         if resolution:
             filters.append(f'resolution_label = "{resolution}"')
 
-        result = self.client.index(self.config.media_index).search(
-            query,
-            {
-                "limit": limit,
-                "offset": offset,
-                "filter": " AND ".join(filters) if filters else None,
-            },
-        )
-
-        return SearchResult(
-            hits=result["hits"],
-            total_hits=result.get("estimatedTotalHits", len(result["hits"])),
-            processing_time_ms=result.get("processingTimeMs", 0),
-            query=query,
-        )
+        return self._search(self.config.media_index, query, filters, limit, offset, facets)
 
     def search_clips(
         self,
@@ -328,6 +448,7 @@ class SearchService:
         is_bluff: Optional[bool] = None,
         limit: int = 20,
         offset: int = 0,
+        facets: Optional[List[str]] = None,
     ) -> SearchResult:
         """클립 메타데이터 검색
 
@@ -339,6 +460,7 @@ class SearchService:
             is_bluff: 블러프 여부 필터
             limit: 결과 수 제한
             offset: 시작 위치
+            facets: 패싯 카운트를 받을 필터 필드 목록
 
         Returns:
             SearchResult 객체
@@ -353,20 +475,33 @@ class SearchService:
         if is_bluff is not None:
             filters.append(f"is_bluff = {1 if is_bluff else 0}")
 
-        result = self.client.index(self.config.clips_index).search(
-            query,
-            {
-                "limit": limit,
-                "offset": offset,
-                "filter": " AND ".join(filters) if filters else None,
-            },
-        )
+        return self._search(self.config.clips_index, query, filters, limit, offset, facets)
+
+    def _search(
+        self,
+        index_name: str,
+        query: str,
+        filters: List[str],
+        limit: int,
+        offset: int,
+        facets: Optional[List[str]],
+    ) -> SearchResult:
+        params: Dict[str, Any] = {
+            "limit": limit,
+            "offset": offset,
+            "filter": " AND ".join(filters) if filters else None,
+        }
+        if facets:
+            params["facets"] = facets
+
+        result = self.client.index(index_name).search(query, params)
 
         return SearchResult(
             hits=result["hits"],
             total_hits=result.get("estimatedTotalHits", len(result["hits"])),
             processing_time_ms=result.get("processingTimeMs", 0),
             query=query,
+            facets=result.get("facetDistribution", {}),
         )
 
     def get_stats(self) -> Dict[str, Any]:
@@ -390,19 +525,37 @@ class SearchService:
 
         return stats
 
-    def clear_all(self) -> None:
-        """모든 인덱스 삭제 (테스트용)"""
-        for index_name in [
-            self.config.files_index,
-            self.config.media_index,
-            self.config.clips_index,
-        ]:
+    def clear_all(self, db_path: Optional[str] = None) -> None:
+        """모든 인덱스 삭제 (테스트용)
+
+        워터마크 이후 변경분만 보내면 빈 인덱스가 채워지지 않으므로, 다음
+        index_from_db는 전체 재인덱싱합니다. db_path를 주면 그 DB의 인덱싱 상태도
+        삭제하여 다른 프로세스의 다음 실행도 전체 재인덱싱하게 합니다.
+
+        Args:
+            db_path: 인덱싱 상태(search_sync_state)를 초기화할 archive.db 경로
+        """
+        for table, index_name in (
+            ("files", self.config.files_index),
+            ("media_info", self.config.media_index),
+            ("clip_metadata", self.config.clips_index),
+        ):
             try:
                 self.client.index(index_name).delete_all_documents()
+                self._pending_full.add(table)
                 logger.warning(f"인덱스 {index_name} 초기화됨")
             except Exception as e:
                 logger.error(f"인덱스 {index_name} 초기화 실패: {e}")
 
+        if db_path:
+            conn = sqlite3.connect(db_path)
+            try:
+                ensure_change_log(conn)
+                reset_sync_state(conn)
+                conn.commit()
+            finally:
+                conn.close()
+
     def health_check(self) -> bool:
         """MeiliSearch 서버 상태 확인"""
         try:
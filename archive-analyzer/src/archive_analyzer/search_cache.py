@@ -0,0 +1,386 @@
+"""검색 결과 캐시 (LRU + TTL, 선택적 SQLite 공유 계층)
+
+api.py 검색 엔드포인트가 같은 검색(대시보드, 자동완성)을 반복할 때
+MeiliSearch/FTS5 요청 없이 이전 SearchResult를 돌려줍니다.
+
+- 키: 검색 메서드 + 검색 엔진(meilisearch / fts5) + 정규화한 검색어(공백 정리, 소문자)
+  + 필터(None 제외, 정렬) + limit/offset + 패싯 목록
+- 1계층: 프로세스 내 LRU (max_entries개, ttl초)
+- 2계층(선택): SQLite 파일 (SEARCH_CACHE_PATH). uvicorn 워커끼리 결과를 공유합니다.
+- 무효화: index_from_db / clear_all 후 invalidate()가 세대(generation)를 올립니다.
+  공유 계층이 있으면 세대를 파일에 기록하고, 다른 워커는 조회 시 세대가 바뀐 것을
+  보고 자기 LRU를 비웁니다. 공유 계층이 없으면 다른 워커의 캐시는 TTL까지 유지됩니다.
+  sync_source()는 원본 DB 버전(검색 변경 로그 워터마크)이 바뀌면 같은 방식으로
+  무효화합니다 (스캔이 archive.db를 바꾸면 FTS5 결과가 달라지므로).
+
+통계(stats)는 적중률과 절약한 지연(원래 검색 시간 - 캐시 조회 시간 합계)을 제공합니다.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .search import SearchResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_cache (
+    key TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    cost_ms REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_cache_expires ON search_cache(expires_at);
+"""
+
+
+def normalize_query(query: str) -> str:
+    """검색어 정규화 (양 끝/연속 공백 제거, 소문자)
+
+    MeiliSearch와 FTS5(unicode61) 모두 대소문자를 구분하지 않습니다.
+    """
+    return " ".join(query.split()).lower()
+
+
+def make_key(method: str, **kwargs: Any) -> str:
+    """검색 호출 → 캐시 키 (JSON 문자열)"""
+    params = {}
+    for name, value in kwargs.items():
+        if value is None:
+            continue
+        if name == "query":
+            value = normalize_query(value)
+        elif name == "facets":
+            value = sorted(value)
+        params[name] = value
+    return json.dumps([method, params], sort_keys=True, ensure_ascii=False)
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+
+    hits: int = 0
+    misses: int = 0
+    shared_hits: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    saved_ms: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _SharedTier:
+    """SQLite 파일 기반 공유 계층 (워커 간 결과/세대 공유)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def generation(self) -> int:
+        row = self._connect().execute(
+            "SELECT value FROM cache_meta WHERE key = 'generation'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def bump_generation(self) -> int:
+        """세대 증가 + 이전 세대 항목 삭제"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """INSERT INTO cache_meta (key, value) VALUES ('generation', 1)
+                ON CONFLICT(key) DO UPDATE SET value = value + 1"""
+            )
+            generation = self.generation()
+            conn.execute("DELETE FROM search_cache WHERE generation < ?", (generation,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return generation
+
+    def sync_source(self, version: int) -> bool:
+        """기록된 원본 버전과 다르면 기록 + 세대 증가 (증가했으면 True)"""
+        conn = self._connect()
+        row = conn.execute("SELECT value FROM cache_meta WHERE key = 'source_version'").fetchone()
+        if row is not None and row[0] == version:
+            return False
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT value FROM cache_meta WHERE key = 'source_version'"
+            ).fetchone()
+            if row is not None and row[0] == version:
+                # 다른 워커가 먼저 반영
+                conn.execute("COMMIT")
+                return False
+            conn.execute(
+                """INSERT INTO cache_meta (key, value) VALUES ('source_version', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value""",
+                (version,),
+            )
+            conn.execute(
+                """INSERT INTO cache_meta (key, value) VALUES ('generation', 1)
+                ON CONFLICT(key) DO UPDATE SET value = value + 1"""
+            )
+            conn.execute("DELETE FROM search_cache WHERE generation < ?", (self.generation(),))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return True
+
+    def get(self, key: str, generation: int) -> Optional[Tuple[SearchResult, float]]:
+        row = self._connect().execute(
+            """SELECT value, cost_ms FROM search_cache
+            WHERE key = ? AND generation = ? AND expires_at > ?""",
+            (key, generation, time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+        return SearchResult(**json.loads(row[0])), row[1]
+
+    def put(
+        self, key: str, generation: int, result: SearchResult, cost_ms: float, ttl: float
+    ) -> None:
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            """INSERT OR REPLACE INTO search_cache
+                (key, generation, value, cost_ms, expires_at)
+            VALUES (?, ?, ?, ?, ?)""",
+            (key, generation, json.dumps(asdict(result), default=str), cost_ms, now + ttl),
+        )
+        conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class SearchCache:
+    """검색 결과 캐시
+
+    Usage:
+        cache = SearchCache(max_entries=1024, ttl=60, shared_path="search_cache.db")
+        result = cache.get_or_search("search_files", lambda: engine.search_files(**kw), **kw)
+        cache.invalidate()  # 인덱스 변경 후
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        shared_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            max_entries: 프로세스 내 LRU 최대 항목 수 (0이면 캐시 비활성화)
+            ttl: 항목 유효 시간 (초)
+            shared_path: 워커 간 공유 SQLite 파일 경로 (None이면 프로세스 내 캐시만)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        # key → (expires_at, SearchResult, cost_ms)
+        self._entries: "OrderedDict[str, Tuple[float, SearchResult, float]]" = OrderedDict()
+        self._generation = 0
+        self._source_version: Optional[int] = None
+        self._shared: Optional[_SharedTier] = None
+        if shared_path and max_entries > 0:
+            try:
+                self._shared = _SharedTier(shared_path)
+                self._generation = self._shared.generation()
+            except sqlite3.Error as e:
+                logger.warning(f"공유 검색 캐시 사용 불가 ({shared_path}): {e}")
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _sync_generation(self) -> int:
+        """공유 세대가 바뀌었으면 (다른 워커가 무효화) LRU 비우기"""
+        if self._shared is None:
+            return self._generation
+        try:
+            generation = self._shared.generation()
+        except sqlite3.Error:
+            return self._generation
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+        return generation
+
+    def _lookup(self, key: str, generation: int) -> Optional[Tuple[SearchResult, float]]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return entry[1], entry[2]
+                del self._entries[key]
+
+        if self._shared is None:
+            return None
+        try:
+            found = self._shared.get(key, generation)
+        except sqlite3.Error:
+            return None
+        if found is not None:
+            self._store(key, *found)
+            with self._lock:
+                self.stats.shared_hits += 1
+        return found
+
+    def _store(self, key: str, result: SearchResult, cost_ms: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result, cost_ms)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def get_or_search(
+        self, method: str, search: Callable[[], SearchResult], **kwargs: Any
+    ) -> SearchResult:
+        """캐시된 결과 반환, 없으면 search() 실행 후 저장
+
+        Args:
+            method: 검색 메서드 이름 (키 구분용)
+            search: 캐시 미스 시 실행할 검색
+            **kwargs: 검색 인자 (키 생성용)
+        """
+        if not self.enabled:
+            return search()
+
+        start = time.perf_counter()
+        key = make_key(method, **kwargs)
+        generation = self._sync_generation()
+        found = self._lookup(key, generation)
+        if found is not None:
+            result, cost_ms = found
+            lookup_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.stats.hits += 1
+                self.stats.saved_ms += max(0.0, cost_ms - lookup_ms)
+            return result
+
+        search_start = time.perf_counter()
+        result = search()
+        cost_ms = (time.perf_counter() - search_start) * 1000
+        with self._lock:
+            self.stats.misses += 1
+            # 검색 중 무효화됐으면 이전 인덱스 기준 결과이므로 저장하지 않음
+            if generation != self._generation:
+                return result
+        self._store(key, result, cost_ms)
+        if self._shared is not None:
+            try:
+                self._shared.put(key, generation, result, cost_ms, self.ttl)
+            except sqlite3.Error as e:
+                logger.debug(f"공유 검색 캐시 저장 실패: {e}")
+        return result
+
+    def invalidate(self) -> None:
+        """전체 무효화 (인덱싱/초기화 후 호출)"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.stats.invalidations += 1
+        if self._shared is not None:
+            try:
+                generation = self._shared.bump_generation()
+            except sqlite3.Error as e:
+                logger.warning(f"공유 검색 캐시 무효화 실패: {e}")
+                return
+            with self._lock:
+                self._generation = generation
+
+    def sync_source(self, version: int) -> None:
+        """원본 DB 버전(검색 변경 로그 워터마크)이 바뀌었으면 전체 무효화
+
+        프로세스 내 캐시는 처음 본 버전을 기준으로 삼고, 공유 계층은 파일에 기록된
+        버전과 비교하므로 여러 워커가 같은 변경을 한 번만 무효화합니다.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if version == self._source_version:
+                return
+            previous, self._source_version = self._source_version, version
+
+        if self._shared is None:
+            if previous is not None:
+                self.invalidate()
+            return
+        try:
+            bumped = self._shared.sync_source(version)
+        except sqlite3.Error as e:
+            logger.debug(f"공유 검색 캐시 원본 버전 확인 실패: {e}")
+            return
+        if bumped:
+            with self._lock:
+                self.stats.invalidations += 1
+        self._sync_generation()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """/stats 응답용 통계"""
+        with self._lock:
+            stats = asdict(self.stats)
+            entries = len(self._entries)
+        stats.update(
+            enabled=self.enabled,
+            hit_ratio=round(self.stats.hit_ratio, 4),
+            saved_ms=round(stats["saved_ms"], 1),
+            entries=entries,
+            max_entries=self.max_entries,
+            ttl_seconds=self.ttl,
+            shared=self._shared.path if self._shared else None,
+        )
+        return stats
+
+    def close(self) -> None:
+        if self._shared is not None:
+            self._shared.close()
+
+
+def invalidate_shared(path: str) -> None:
+    """API 서버 밖(인덱싱 스크립트 등)에서 공유 캐시 무효화"""
+    tier = _SharedTier(path)
+    try:
+        tier.bump_generation()
+    finally:
+        tier.close()
@@ -0,0 +1,179 @@
+"""MeiliSearch 증분 인덱싱용 변경 로그 (search_changes)
+
+files, media_info, clip_metadata의 INSERT/UPDATE/DELETE를 트리거로
+search_changes 테이블에 (seq, table_name, row_id, op) 형태로 기록합니다.
+
+- seq: AUTOINCREMENT 워터마크. 인덱서는 테이블별 마지막 반영 seq를
+  search_sync_state에 저장하고 그 이후 변경만 전송합니다.
+- op: 'upsert' 또는 'delete' (삭제 툼스톤)
+- 같은 행의 여러 변경은 마지막 op만 반영합니다 (changes_since).
+- 반영이 끝난 변경은 compact_changes()로 삭제합니다.
+
+트리거는 SearchService가 처음 인덱싱할 때 설치되므로 MeiliSearch를 쓰지 않는
+DB에는 변경 로그가 쌓이지 않습니다.
+
+외부 도구로 DB를 수정했다면 reset_sync_state()로 전체 재인덱싱하세요.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+CHANGES_TABLE = "search_changes"
+STATE_TABLE = "search_sync_state"
+
+# 변경을 추적하는 테이블 (MeiliSearch 인덱스 원본)
+TRACKED_TABLES = ("files", "media_info", "clip_metadata")
+
+_NOW = "strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {CHANGES_TABLE} (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    row_id INTEGER NOT NULL,
+    op TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_changes_table_seq
+    ON {CHANGES_TABLE}(table_name, seq);
+CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+    table_name TEXT PRIMARY KEY,
+    last_seq INTEGER NOT NULL DEFAULT 0,
+    mode TEXT,
+    synced_at DATETIME
+);
+"""
+
+
+@dataclass
+class SyncState:
+    """테이블별 인덱싱 상태"""
+
+    table_name: str
+    last_seq: int
+    mode: Optional[str] = None
+    synced_at: Optional[str] = None
+
+
+def _trigger_definitions() -> List[Tuple[str, str, str]]:
+    """(트리거 이름, 테이블, CREATE TRIGGER SQL)"""
+    definitions = []
+    for table in TRACKED_TABLES:
+        for event, row, op in (
+            ("INSERT", "NEW", "upsert"),
+            ("UPDATE", "NEW", "upsert"),
+            ("DELETE", "OLD", "delete"),
+        ):
+            name = f"trg_search_{table}_{event.lower()}"
+            definitions.append(
+                (
+                    name,
+                    table,
+                    f"""CREATE TRIGGER IF NOT EXISTS {name}
+                    AFTER {event} ON {table}
+                    BEGIN
+                        INSERT INTO {CHANGES_TABLE} (table_name, row_id, op)
+                        VALUES ('{table}', {row}.id, '{op}');
+                    END""",
+                )
+            )
+    return definitions
+
+
+def _existing_tables(conn: sqlite3.Connection) -> set:
+    return {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+
+
+def ensure_change_log(conn: sqlite3.Connection) -> None:
+    """변경 로그 테이블과 트리거 생성 (있으면 유지)
+
+    추적 테이블이 아직 없으면 그 테이블의 트리거는 건너뜁니다.
+    트리거가 새로 생기기 전의 변경은 기록되지 않으므로, 상태가 없는 테이블은
+    인덱서가 처음에 전체 인덱싱합니다.
+    """
+    conn.executescript(_SCHEMA)
+    tables = _existing_tables(conn)
+    for _, table, sql in _trigger_definitions():
+        if table in tables:
+            conn.execute(sql)
+
+
+def current_seq(conn: sqlite3.Connection) -> int:
+    """현재 최대 seq (스냅샷 워터마크)"""
+    row = conn.execute(f"SELECT MAX(seq) FROM {CHANGES_TABLE}").fetchone()
+    return row[0] or 0
+
+
+def get_sync_state(conn: sqlite3.Connection, table: str) -> Optional[SyncState]:
+    row = conn.execute(
+        f"SELECT table_name, last_seq, mode, synced_at FROM {STATE_TABLE} WHERE table_name = ?",
+        (table,),
+    ).fetchone()
+    return SyncState(*row) if row else None
+
+
+def set_sync_state(conn: sqlite3.Connection, table: str, last_seq: int, mode: str) -> None:
+    conn.execute(
+        f"""
+        INSERT INTO {STATE_TABLE} (table_name, last_seq, mode, synced_at)
+        VALUES (?, ?, ?, {_NOW})
+        ON CONFLICT(table_name) DO UPDATE SET
+            last_seq = excluded.last_seq,
+            mode = excluded.mode,
+            synced_at = excluded.synced_at
+        """,
+        (table, last_seq, mode),
+    )
+
+
+def reset_sync_state(conn: sqlite3.Connection, tables: Tuple[str, ...] = TRACKED_TABLES) -> None:
+    """인덱싱 상태 삭제 (다음 실행에서 전체 재인덱싱)"""
+    conn.executemany(
+        f"DELETE FROM {STATE_TABLE} WHERE table_name = ?", [(t,) for t in tables]
+    )
+
+
+def changes_since(
+    conn: sqlite3.Connection, table: str, after_seq: int, upto_seq: int
+) -> Tuple[List[int], List[int]]:
+    """(after_seq, upto_seq] 구간에서 행별 마지막 op 기준 (upsert ID, delete ID)
+
+    SQLite는 MAX()와 함께 조회한 bare column을 최대값 행에서 가져오므로
+    op는 그 행의 마지막 변경입니다.
+    """
+    upserts, deletes = [], []
+    for row_id, op, _ in conn.execute(
+        f"""
+        SELECT row_id, op, MAX(seq)
+        FROM {CHANGES_TABLE}
+        WHERE table_name = ? AND seq > ? AND seq <= ?
+        GROUP BY row_id
+        ORDER BY row_id
+        """,
+        (table, after_seq, upto_seq),
+    ):
+        (deletes if op == "delete" else upserts).append(row_id)
+    return upserts, deletes
+
+
+def compact_changes(conn: sqlite3.Connection, table: str, upto_seq: int) -> int:
+    """반영이 끝난 변경 삭제"""
+    cursor = conn.execute(
+        f"DELETE FROM {CHANGES_TABLE} WHERE table_name = ? AND seq <= ?", (table, upto_seq)
+    )
+    return cursor.rowcount
+
+
+def pending_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    """테이블별 미반영 변경 수 (워터마크 이후)"""
+    counts = {}
+    for table in TRACKED_TABLES:
+        state = get_sync_state(conn, table)
+        counts[table] = conn.execute(
+            f"SELECT COUNT(*) FROM {CHANGES_TABLE} WHERE table_name = ? AND seq > ?",
+            (table, state.last_seq if state else 0),
+        ).fetchone()[0]
+    return counts
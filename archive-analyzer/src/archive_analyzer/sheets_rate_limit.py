@@ -0,0 +1,280 @@
+"""Google Sheets API 요청 스케줄러 (토큰 버킷)
+
+SheetsSyncService, ArchiveHandsSync 등 모든 Google Sheets 클라이언트가 같은 스케줄러로
+요청을 보냅니다. 고정 딜레이 대신 토큰 버킷으로 한도까지 요청을 허용합니다.
+
+- 읽기/쓰기 한도를 따로 적용 (기본 각 60회/분/유저)
+- 버킷 용량(burst) + 보충 속도 (limit - burst) / window 이므로 어느 window 구간에서도
+  요청 수가 limit을 넘지 않습니다 (기본: 처음 5회 즉시, 이후 55회/분).
+- shared_path(SHEETS_RATE_LIMIT_PATH)를 지정하면 SQLite 파일로 버킷 상태를 공유해
+  같은 서비스 계정을 쓰는 여러 프로세스(두 데몬 등)가 한도를 나눠 씁니다.
+  BEGIN IMMEDIATE 쓰기 잠금이 프로세스 간 파일 잠금 역할을 합니다.
+- 429/5xx 응답은 지터를 넣은 지수 백오프로 재시도하고, 해당 버킷을 비워
+  다른 스레드/프로세스도 함께 물러나게 합니다.
+- batch_get(): 여러 범위 읽기를 values_batch_get 한 번(읽기 1회)으로 묶습니다.
+
+Usage:
+    scheduler = get_scheduler()
+    worksheet = scheduler.read(spreadsheet.worksheet, "hands")
+    scheduler.write(worksheet.update, values=rows, range_name="A2")
+    values_by_range = scheduler.batch_get(spreadsheet, ["'Sheet1'", "'Sheet2'!A1:C10"])
+
+참고: https://developers.google.com/workspace/sheets/api/limits
+"""
+
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from gspread.exceptions import APIError
+
+logger = logging.getLogger(__name__)
+
+READ = "read"
+WRITE = "write"
+
+# 재시도할 응답 코드 (한도 초과, 일시적 서버 오류)
+RETRY_STATUS_CODES = (429, 500, 503)
+
+# values_batch_get 한 번에 보낼 최대 범위 수
+BATCH_GET_MAX_RANGES = 100
+
+# 쓰기 요청으로 분류할 gspread 메서드 (나머지는 읽기)
+WRITE_METHODS = frozenset(
+    {
+        "add_rows",
+        "add_worksheet",
+        "append_row",
+        "append_rows",
+        "batch_clear",
+        "batch_update",
+        "clear",
+        "delete_rows",
+        "freeze",
+        "update",
+        "update_cell",
+        "update_cells",
+        "values_batch_update",
+        "values_update",
+    }
+)
+
+
+def request_kind(func: Callable) -> str:
+    """gspread 메서드 → "read" / "write" """
+    return WRITE if getattr(func, "__name__", "") in WRITE_METHODS else READ
+
+
+class TokenBucket:
+    """프로세스 내 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, limit: int, window: float = 60.0, burst: int = 5):
+        """
+        Args:
+            limit: window 동안 허용할 최대 요청 수
+            window: 한도 기준 구간 (초)
+            burst: 즉시 보낼 수 있는 요청 수 (버킷 용량)
+        """
+        self.capacity = max(1, min(burst, limit - 1))
+        self.rate = (limit - self.capacity) / window  # 초당 보충 토큰
+        self._tokens = float(self.capacity)
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def _refill(self, tokens: float, updated: float, now: float) -> float:
+        return min(self.capacity, tokens + (now - updated) * self.rate)
+
+    def _reserve(self) -> float:
+        """토큰 1개 사용 시도 → 0이면 성공, 아니면 기다릴 시간 (초)"""
+        with self._lock:
+            now = time.time()
+            self._tokens = self._refill(self._tokens, self._updated, now)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """토큰 1개 확보 (필요하면 대기) → 대기한 시간 (초)"""
+        waited = 0.0
+        while (wait := self._reserve()) > 0:
+            time.sleep(wait)
+            waited += wait
+        return waited
+
+    def penalize(self, seconds: float) -> None:
+        """seconds 동안 토큰이 없도록 버킷 비우기 (429 이후)"""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+            self._updated = time.time()
+
+
+class SharedTokenBucket(TokenBucket):
+    """SQLite 파일로 상태를 공유하는 토큰 버킷 (프로세스 간)"""
+
+    def __init__(self, path: str, name: str, limit: int, window: float = 60.0, burst: int = 5):
+        super().__init__(limit, window, burst)
+        self.path = path
+        self.name = name
+        conn = self._connect()
+        try:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )"""
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+
+    def _update(self, change: Callable[[float, float], float]) -> float:
+        """잠금 상태에서 현재 토큰 수 → change(tokens, now) 결과로 갱신"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            now = time.time()
+            tokens = self._refill(*row, now) if row else float(self.capacity)
+            tokens = change(tokens, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (name, tokens, updated_at) "
+                "VALUES (?, ?, ?)",
+                (self.name, tokens, now),
+            )
+            conn.execute("COMMIT")
+            return tokens
+        finally:
+            conn.close()
+
+    def _reserve(self) -> float:
+        result = {}
+
+        def take(tokens: float, now: float) -> float:
+            if tokens >= 1:
+                result["wait"] = 0.0
+                return tokens - 1
+            result["wait"] = (1 - tokens) / self.rate
+            return tokens
+
+        with self._lock:
+            self._update(take)
+        return result["wait"]
+
+    def penalize(self, seconds: float) -> None:
+        with self._lock:
+            self._update(lambda tokens, now: min(tokens, 0.0) - seconds * self.rate)
+
+
+class SheetsRequestScheduler:
+    """읽기/쓰기 토큰 버킷 + 재시도를 적용해 Google Sheets API 호출"""
+
+    def __init__(
+        self,
+        read_limit: int = 60,
+        write_limit: int = 60,
+        window: float = 60.0,
+        burst: int = 5,
+        shared_path: Optional[str] = None,
+        max_retries: int = 5,
+        max_backoff: float = 64.0,
+    ):
+        """
+        Args:
+            read_limit: window 동안 읽기 요청 한도
+            write_limit: window 동안 쓰기 요청 한도
+            window: 한도 기준 구간 (초, Google 기준 60초)
+            burst: 버킷 용량
+            shared_path: 프로세스 간 공유 SQLite 파일 (None이면 프로세스 내만)
+            max_retries: 429/5xx 최대 재시도 횟수
+            max_backoff: 최대 백오프 (초)
+        """
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.shared_path = shared_path
+        self.buckets: Dict[str, TokenBucket] = {}
+        for kind, limit in ((READ, read_limit), (WRITE, write_limit)):
+            if shared_path:
+                self.buckets[kind] = SharedTokenBucket(shared_path, kind, limit, window, burst)
+            else:
+                self.buckets[kind] = TokenBucket(limit, window, burst)
+        self._lock = threading.Lock()
+        self.stats = {"read": 0, "write": 0, "retries": 0, "waited_seconds": 0.0}
+
+    def call(self, kind: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """토큰 확보 후 func 호출, 429/5xx면 지터 백오프로 재시도"""
+        bucket = self.buckets[kind]
+        for attempt in range(self.max_retries):
+            waited = bucket.acquire()
+            with self._lock:
+                self.stats[kind] += 1
+                self.stats["waited_seconds"] += waited
+            try:
+                return func(*args, **kwargs)
+            except APIError as e:
+                status = getattr(e.response, "status_code", None)
+                if status not in RETRY_STATUS_CODES or attempt == self.max_retries - 1:
+                    raise
+                # Full jitter: [0, min(2^n, max_backoff)] 중 임의 대기
+                wait_time = random.uniform(0, min(2 ** (attempt + 1), self.max_backoff))
+                logger.warning(
+                    f"Sheets API {status} ({kind}), backoff {wait_time:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+                with self._lock:
+                    self.stats["retries"] += 1
+                if status == 429:
+                    bucket.penalize(wait_time)
+                time.sleep(wait_time)
+        raise RuntimeError(f"Max retries ({self.max_retries}) exceeded")
+
+    def read(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        return self.call(READ, func, *args, **kwargs)
+
+    def write(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        return self.call(WRITE, func, *args, **kwargs)
+
+    def batch_get(self, spreadsheet: Any, ranges: List[str]) -> List[List[List[str]]]:
+        """여러 범위 값을 values_batch_get으로 묶어 읽기 (범위 순서대로 값 목록)"""
+        results: List[List[List[str]]] = []
+        for i in range(0, len(ranges), BATCH_GET_MAX_RANGES):
+            chunk = ranges[i : i + BATCH_GET_MAX_RANGES]
+            response = self.read(spreadsheet.values_batch_get, chunk)
+            value_ranges = response.get("valueRanges", [])
+            results.extend(value_range.get("values", []) for value_range in value_ranges)
+            # 빈 응답 보정 (범위 수와 맞춤)
+            results.extend([] for _ in range(len(chunk) - len(value_ranges)))
+        return results
+
+
+_scheduler: Optional[SheetsRequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> SheetsRequestScheduler:
+    """프로세스 공용 스케줄러
+
+    환경변수:
+        SHEETS_READ_LIMIT: 분당 읽기 한도 (기본 60)
+        SHEETS_WRITE_LIMIT: 분당 쓰기 한도 (기본 60)
+        SHEETS_RATE_LIMIT_PATH: 프로세스 간 공유 SQLite 파일 경로 (기본 없음)
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = SheetsRequestScheduler(
+                read_limit=int(os.environ.get("SHEETS_READ_LIMIT", 60)),
+                write_limit=int(os.environ.get("SHEETS_WRITE_LIMIT", 60)),
+                shared_path=os.environ.get("SHEETS_RATE_LIMIT_PATH") or None,
+            )
+        return _scheduler
@@ -12,19 +12,25 @@ Usage:
 
     # 백그라운드 서비스 시작
     python -m archive_analyzer.sheets_sync --daemon
+
+변경 감지는 행 단위입니다. 행마다 DB/시트 양쪽 내용 해시를 로컬 DB의
+sheets_sync_state 테이블에 저장해 두고, 주기마다 양쪽을 한 번씩 읽어
+해시가 바뀐 행만 반대편에 반영합니다 (양쪽 모두 바뀐 행은 시트 우선).
+시트 쓰기는 바뀐 행만 범위 지정 batch_update로 보내고, 삭제는 행 삭제 요청 한 번으로 보냅니다.
 """
 
 import hashlib
 import json
 import os
 import sqlite3
-import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import gspread
 from google.oauth2.service_account import Credentials
-from gspread.exceptions import APIError
+from gspread.utils import absolute_range_name
+
+from archive_analyzer.sheets_rate_limit import SheetsRequestScheduler, get_scheduler, request_kind
 
 # Title Generator (optional - 없으면 규칙 기반 생성 스킵)
 try:
@@ -112,6 +118,38 @@ class SyncConfig:
                 ]
 
 
+# =============================================
+# Row Hash
+# =============================================
+
+SYNC_STATE_TABLE = "sheets_sync_state"
+# 동기화 기준(해시)을 한 번이라도 저장한 테이블 (빈 테이블도 초기화 여부를 구분)
+SYNC_TABLES_TABLE = "sheets_sync_tables"
+
+
+def canonical_value(value: Any) -> str:
+    """DB 값/시트 값을 시트에 보이는 문자열 형태로 정규화
+
+    시트는 값을 문자열로 돌려주므로 (1.0 -> "1", True -> "TRUE")
+    DB 값도 같은 형태로 맞춰야 양쪽 해시를 같은 기준으로 비교할 수 있습니다.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else repr(value)
+    return str(value)
+
+
+def row_hash(columns: List[str], row: Dict[str, Any]) -> str:
+    """행 내용 해시 (columns 순서, 없는 컬럼은 빈 값)"""
+    data = "\x1f".join(canonical_value(row.get(col)) for col in columns)
+    return hashlib.md5(data.encode()).hexdigest()
+
+
 # =============================================
 # Google Sheets Client
 # =============================================
@@ -124,6 +162,8 @@ class SheetsClient:
     - 읽기: 60회/분/유저, 300회/분/프로젝트
     - 쓰기: 60회/분/유저, 300회/분/프로젝트
 
+    모든 요청은 프로세스 공용 SheetsRequestScheduler(토큰 버킷)를 거칩니다.
+
     참고: https://developers.google.com/workspace/sheets/api/limits
     """
 
@@ -132,17 +172,11 @@ class SheetsClient:
         "https://www.googleapis.com/auth/drive",
     ]
 
-    # API Rate Limit 설정 (60 req/min = 1 req/sec)
-    API_DELAY = 1.2  # 요청 간 딜레이 (초) - 안전 마진 포함
-    MAX_RETRIES = 5  # 최대 재시도 횟수
-    MAX_BACKOFF = 64  # 최대 백오프 시간 (초)
-
-    def __init__(self, config: SyncConfig):
+    def __init__(self, config: SyncConfig, scheduler: SheetsRequestScheduler = None):
         self.config = config
+        self.scheduler = scheduler or get_scheduler()
         self.client = None
         self.spreadsheet = None
-        self._request_count = 0
-        self._minute_start = time.time()
         self._connect()
 
     def _connect(self):
@@ -152,57 +186,11 @@ class SheetsClient:
             scopes=self.SCOPES,
         )
         self.client = gspread.authorize(creds)
-        self.spreadsheet = self.client.open_by_key(self.config.spreadsheet_id)
-
-    def _check_rate_limit(self):
-        """분당 요청 수 체크 및 대기"""
-        current_time = time.time()
-        elapsed = current_time - self._minute_start
-
-        # 1분 경과 시 카운터 리셋
-        if elapsed >= 60:
-            self._request_count = 0
-            self._minute_start = current_time
-            return
-
-        # 60회 한도 근접 시 남은 시간 대기
-        if self._request_count >= 55:  # 안전 마진
-            wait_time = 60 - elapsed + 1
-            print(
-                f"    Approaching rate limit ({self._request_count}/60), waiting {wait_time:.1f}s..."
-            )
-            time.sleep(wait_time)
-            self._request_count = 0
-            self._minute_start = time.time()
+        self.spreadsheet = self.scheduler.read(self.client.open_by_key, self.config.spreadsheet_id)
 
     def _with_retry(self, func, *args, **kwargs):
-        """API 호출 래퍼: Exponential Backoff 적용
-
-        Google 권장 알고리즘: min((2^n + random_ms), max_backoff)
-        """
-        import random
-
-        self._check_rate_limit()
-
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                time.sleep(self.API_DELAY)
-                self._request_count += 1
-                return func(*args, **kwargs)
-            except APIError as e:
-                if e.response.status_code == 429:
-                    # Truncated Exponential Backoff
-                    wait_time = min((2**attempt) + random.uniform(0, 1), self.MAX_BACKOFF)
-                    print(
-                        f"    Rate limit (429), backoff {wait_time:.1f}s (attempt {attempt + 1}/{self.MAX_RETRIES})"
-                    )
-                    time.sleep(wait_time)
-                    # 분 카운터 리셋
-                    self._request_count = 0
-                    self._minute_start = time.time()
-                else:
-                    raise
-        raise Exception(f"Max retries ({self.MAX_RETRIES}) exceeded")
+        """API 호출 래퍼: 읽기/쓰기 토큰 버킷 + 429 지터 백오프 (SheetsRequestScheduler)"""
+        return self.scheduler.call(request_kind(func), func, *args, **kwargs)
 
     def get_or_create_worksheet(self, name: str, headers: List[str]) -> gspread.Worksheet:
         """워크시트 가져오기 또는 생성"""
@@ -224,22 +212,73 @@ class SheetsClient:
         except gspread.WorksheetNotFound:
             return []
 
+    def read_worksheet(
+        self, worksheet_name: str
+    ) -> Tuple[Optional[gspread.Worksheet], List[List[str]]]:
+        """워크시트와 전체 값 (헤더 포함) 가져오기 - 없으면 (None, [])"""
+        try:
+            worksheet = self._with_retry(self.spreadsheet.worksheet, worksheet_name)
+        except gspread.WorksheetNotFound:
+            return None, []
+        return worksheet, self._with_retry(worksheet.get_all_values)
+
+    def read_worksheets(
+        self, worksheet_names: List[str]
+    ) -> Dict[str, Tuple[Optional[gspread.Worksheet], List[List[str]]]]:
+        """여러 워크시트와 값을 한 번에 가져오기 (목록 1회 + values_batch_get 1회)"""
+        existing = {ws.title: ws for ws in self._with_retry(self.spreadsheet.worksheets)}
+        names = [name for name in worksheet_names if name in existing]
+        ranges = [absolute_range_name(name) for name in names]
+        values = self.scheduler.batch_get(self.spreadsheet, ranges) if ranges else []
+
+        result = {name: (None, []) for name in worksheet_names}
+        for name, rows in zip(names, values):
+            result[name] = (existing[name], rows)
+        return result
+
     def update_worksheet(self, worksheet_name: str, headers: List[str], rows: List[List[Any]]):
-        """워크시트 전체 업데이트"""
+        """워크시트 전체 업데이트 (헤더 포함)"""
         worksheet = self.get_or_create_worksheet(worksheet_name, headers)
 
-        # 기존 데이터 클리어 (헤더 제외)
-        self._with_retry(worksheet.batch_clear, ["A2:ZZ"])
-
-        if rows:
-            # 새 데이터 입력
-            self._with_retry(worksheet.update, values=rows, range_name="A2")
+        # 기존 데이터 클리어
+        self._with_retry(worksheet.batch_clear, ["A1:ZZ"])
+        self._with_retry(worksheet.update, values=[headers] + rows, range_name="A1")
 
-    def get_worksheet_hash(self, worksheet_name: str) -> str:
-        """워크시트 데이터의 해시값 계산"""
-        records = self.get_all_records(worksheet_name)
-        data_str = json.dumps(records, sort_keys=True, default=str)
-        return hashlib.md5(data_str.encode()).hexdigest()
+    def update_rows(self, worksheet: gspread.Worksheet, rows: Dict[int, List[Any]]):
+        """지정한 행 번호(1부터)만 덮어쓰기 - 요청 1회 (시트 크기 부족 시 +1회)"""
+        if not rows:
+            return
+        last_row = max(rows)
+        if last_row > worksheet.row_count:
+            self._with_retry(worksheet.add_rows, last_row - worksheet.row_count)
+        data = [{"range": f"A{row}", "values": [values]} for row, values in sorted(rows.items())]
+        self._with_retry(worksheet.batch_update, data)
+
+    def delete_rows(self, worksheet: gspread.Worksheet, row_numbers: Iterable[int]):
+        """지정한 행 번호(1부터) 삭제 - 연속 구간별 deleteDimension을 요청 1회로"""
+        ranges: List[List[int]] = []
+        for row in sorted(set(row_numbers), reverse=True):
+            if ranges and ranges[-1][0] == row + 1:
+                ranges[-1][0] = row
+            else:
+                ranges.append([row, row])
+        if not ranges:
+            return
+        # 아래쪽 구간부터 삭제해야 위쪽 행 번호가 유지됨
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": worksheet.id,
+                        "dimension": "ROWS",
+                        "startIndex": start - 1,
+                        "endIndex": end,
+                    }
+                }
+            }
+            for start, end in ranges
+        ]
+        self._with_retry(self.spreadsheet.batch_update, {"requests": requests})
 
 
 # =============================================
@@ -292,11 +331,78 @@ class DatabaseClient:
         conn.close()
         return columns, rows
 
-    def get_table_hash(self, table_name: str) -> str:
-        """테이블 데이터의 해시값 계산"""
-        _, rows = self.get_all_records(table_name)
-        data_str = json.dumps(rows, sort_keys=True, default=str)
-        return hashlib.md5(data_str.encode()).hexdigest()
+    def get_records_by_pk(
+        self, table_name: str, pk_column: str, pk_values: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """PK 목록에 해당하는 레코드 가져오기"""
+        conn = self.get_connection()
+        rows = []
+        for i in range(0, len(pk_values), 500):
+            chunk = pk_values[i : i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor = conn.execute(
+                f"SELECT * FROM {table_name} WHERE {pk_column} IN ({placeholders})", chunk
+            )
+            rows.extend(dict(row) for row in cursor.fetchall())
+        conn.close()
+        return rows
+
+    def _ensure_sync_state(self, conn: sqlite3.Connection):
+        conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {SYNC_STATE_TABLE} (
+                table_name TEXT NOT NULL,
+                pk TEXT NOT NULL,
+                db_hash TEXT,
+                sheet_hash TEXT,
+                PRIMARY KEY (table_name, pk)
+            ) WITHOUT ROWID"""
+        )
+        conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {SYNC_TABLES_TABLE} (
+                table_name TEXT PRIMARY KEY,
+                initialized_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )"""
+        )
+
+    def load_sync_state(
+        self, table_name: str
+    ) -> Optional[Dict[str, Tuple[Optional[str], Optional[str]]]]:
+        """행별 마지막 동기화 해시 {pk: (db_hash, sheet_hash)}
+
+        한 번도 저장한 적 없는 테이블이면 None (빈 테이블을 동기화한 경우는 빈 dict)
+        """
+        conn = self.get_connection()
+        self._ensure_sync_state(conn)
+        cursor = conn.execute(
+            f"SELECT pk, db_hash, sheet_hash FROM {SYNC_STATE_TABLE} WHERE table_name = ?",
+            (table_name,),
+        )
+        state = {row["pk"]: (row["db_hash"], row["sheet_hash"]) for row in cursor.fetchall()}
+        initialized = conn.execute(
+            f"SELECT 1 FROM {SYNC_TABLES_TABLE} WHERE table_name = ?", (table_name,)
+        ).fetchone()
+        conn.close()
+        # 표시 테이블 도입 전 저장된 상태도 초기화된 것으로 간주
+        return state if initialized or state else None
+
+    def save_sync_state(
+        self, table_name: str, state: Dict[str, Tuple[Optional[str], Optional[str]]]
+    ):
+        """행별 동기화 해시 저장 (테이블 단위 교체)"""
+        conn = self.get_connection()
+        self._ensure_sync_state(conn)
+        with conn:
+            conn.execute(
+                f"INSERT OR IGNORE INTO {SYNC_TABLES_TABLE} (table_name) VALUES (?)",
+                (table_name,),
+            )
+            conn.execute(f"DELETE FROM {SYNC_STATE_TABLE} WHERE table_name = ?", (table_name,))
+            conn.executemany(
+                f"""INSERT INTO {SYNC_STATE_TABLE} (table_name, pk, db_hash, sheet_hash)
+                VALUES (?, ?, ?, ?)""",
+                [(table_name, pk, hashes[0], hashes[1]) for pk, hashes in state.items()],
+            )
+        conn.close()
 
     def upsert_record(self, table_name: str, record: Dict[str, Any], pk_column: str):
         """레코드 삽입 또는 업데이트"""
@@ -327,27 +433,51 @@ class DatabaseClient:
 
     def bulk_upsert(self, table_name: str, records: List[Dict[str, Any]], pk_column: str):
         """여러 레코드 일괄 삽입/업데이트"""
-        if not records:
-            return
+        self.apply_changes(table_name, pk_column, records, [])
 
-        conn = self.get_connection()
-        columns = list(records[0].keys())
-        placeholders = ", ".join(["?" for _ in columns])
-        update_clause = ", ".join(
-            [f"{col} = excluded.{col}" for col in columns if col != pk_column]
-        )
+    def apply_changes(
+        self,
+        table_name: str,
+        pk_column: str,
+        upserts: List[Dict[str, Any]],
+        deletes: List[Any],
+    ):
+        """upsert/삭제를 연결 1개, 트랜잭션 1개로 반영 (실패 시 전체 롤백)
 
-        sql = f"""
-            INSERT INTO {table_name} ({", ".join(columns)})
-            VALUES ({placeholders})
-            ON CONFLICT({pk_column}) DO UPDATE SET {update_clause}
+        컬럼 구성이 같은 레코드끼리 묶어 executemany로 실행합니다.
         """
+        if not upserts and not deletes:
+            return
 
-        for record in records:
-            conn.execute(sql, list(record.values()))
+        groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for record in upserts:
+            groups.setdefault(tuple(record.keys()), []).append(list(record.values()))
 
-        conn.commit()
-        conn.close()
+        conn = self.get_connection()
+        try:
+            with conn:
+                for columns, rows in groups.items():
+                    placeholders = ", ".join(["?" for _ in columns])
+                    update_clause = ", ".join(
+                        [f"{col} = excluded.{col}" for col in columns if col != pk_column]
+                    )
+                    conflict = (
+                        f"DO UPDATE SET {update_clause}" if update_clause else "DO NOTHING"
+                    )
+                    conn.executemany(
+                        f"""
+                        INSERT INTO {table_name} ({", ".join(columns)})
+                        VALUES ({placeholders})
+                        ON CONFLICT({pk_column}) {conflict}
+                    """,
+                        rows,
+                    )
+                conn.executemany(
+                    f"DELETE FROM {table_name} WHERE {pk_column} = ?",
+                    [(pk_value,) for pk_value in deletes],
+                )
+        finally:
+            conn.close()
 
 
 # =============================================
@@ -362,7 +492,6 @@ class SheetsSyncService:
         self.config = config or SyncConfig()
         self.sheets = SheetsClient(self.config)
         self.db = DatabaseClient(self.config.db_path)
-        self._last_hashes: Dict[str, Dict[str, str]] = {}  # {table: {source: hash}}
 
         # Title Generator 초기화
         self.title_generator = TitleGenerator() if TITLE_GENERATOR_AVAILABLE else None
@@ -374,102 +503,172 @@ class SheetsSyncService:
         for table_name in self.config.tables_to_sync:
             print(f"  - {table_name}...")
             columns, rows = self.db.get_all_records(table_name)
+            self._write_full_table(table_name, columns, rows)
+            print(f"    -> {len(rows)} rows synced")
+
+        print("Initialization complete!")
 
-            # 데이터를 시트 형식으로 변환
-            sheet_rows = []
+    def _write_full_table(self, table_name: str, columns: List[str], rows: List[Dict]):
+        """DB 테이블 전체를 시트에 쓰고 행별 동기화 해시를 새로 저장"""
+        # 데이터를 시트 형식으로 변환
+        sheet_rows = []
+        for row in rows:
+            sheet_rows.append([self._serialize_value(row.get(col)) for col in columns])
+
+        self.sheets.update_worksheet(table_name, columns, sheet_rows)
+
+        pk_column = self.db.get_primary_key(table_name)
+        if pk_column:
+            state = {}
             for row in rows:
-                sheet_rows.append([self._serialize_value(row.get(col)) for col in columns])
+                digest = row_hash(columns, row)
+                state[canonical_value(row[pk_column])] = (digest, digest)
+            self.db.save_sync_state(table_name, state)
+
+    def _read_sheet_rows(
+        self, table_name: str, values: List[List[str]], pk_column: str
+    ) -> Dict[str, Tuple[int, Dict[str, str]]]:
+        """시트 값 → {pk: (행 번호, {컬럼: 값})} (빈 행/PK 없는 행 제외)"""
+        header = values[0] if values else []
+        rows = {}
+        for row_number, raw in enumerate(values[1:], start=2):
+            record = {col: (raw[i] if i < len(raw) else "") for i, col in enumerate(header) if col}
+            # 빈 행 스킵
+            if not any(record.values()):
+                continue
 
-            self.sheets.update_worksheet(table_name, columns, sheet_rows)
-            print(f"    -> {len(rows)} rows synced")
+            pk_value = record.get(pk_column, "")
+            # #35 - PK None 처리 개선: 경고 로깅
+            if pk_value == "":
+                import logging
 
-        print("Initialization complete!")
+                logging.warning(f"Skipping row with empty PK in {table_name}: {record}")
+                continue
+            rows[str(pk_value)] = (row_number, record)
+        return rows
 
-    def sync_table(self, table_name: str) -> Dict[str, int]:
-        """단일 테이블 동기화"""
+    def sync_table(
+        self,
+        table_name: str,
+        sheet_data: Optional[Tuple[Optional[gspread.Worksheet], List[List[str]]]] = None,
+    ) -> Dict[str, int]:
+        """단일 테이블 동기화 (행 단위 변경 감지)
+
+        DB/시트를 한 번씩 읽고 행별 해시를 마지막 동기화 해시와 비교합니다.
+        sheet_data(read_worksheets 결과)를 넘기면 시트를 다시 읽지 않습니다.
+        - 시트 쪽 행이 바뀜 → DB upsert/삭제 (양쪽 다 바뀌어도 시트 우선)
+        - DB 쪽 행만 바뀜 → 해당 시트 행만 덮어쓰기/추가/삭제
+        - 최초 실행 → 양쪽 모두 있는 행은 기준만 저장, 한쪽에만 있는 행은 반대쪽에 추가
+        """
         pk_column = self.db.get_primary_key(table_name)
         if not pk_column:
             print(f"  Warning: {table_name} has no primary key, skipping...")
             return {"inserted": 0, "updated": 0, "deleted": 0}
 
-        # DB와 Sheet 데이터 가져오기
+        # DB와 Sheet 데이터 가져오기 (각 1회)
         db_columns, db_rows = self.db.get_all_records(table_name)
-        sheet_records = self.sheets.get_all_records(table_name)
-
-        # 해시 비교로 변경 감지
-        db_hash = self.db.get_table_hash(table_name)
-        sheet_hash = self.sheets.get_worksheet_hash(table_name)
-
-        last_db_hash = self._last_hashes.get(table_name, {}).get("db")
-        last_sheet_hash = self._last_hashes.get(table_name, {}).get("sheet")
+        if sheet_data is None:
+            sheet_data = self.sheets.read_worksheet(table_name)
+        worksheet, values = sheet_data
 
         stats = {"inserted": 0, "updated": 0, "deleted": 0}
 
-        # 최초 실행 시 해시만 저장하고 스킵 (거짓 변경 방지)
-        if last_db_hash is None or last_sheet_hash is None:
-            self._last_hashes[table_name] = {"db": db_hash, "sheet": sheet_hash}
-            print("    (초기화 - 해시 저장)")
+        if worksheet is None or not values:
+            # 시트가 없거나 헤더도 없음 -> DB 기준으로 새로 작성
+            print("    (시트 없음 - DB 기준 작성)")
+            self._write_full_table(table_name, db_columns, db_rows)
+            stats["inserted"] = len(db_rows)
             return stats
 
-        db_changed = db_hash != last_db_hash
-        sheet_changed = sheet_hash != last_sheet_hash
+        db_by_pk = {canonical_value(row[pk_column]): row for row in db_rows}
+        sheet_by_pk = self._read_sheet_rows(table_name, values, pk_column)
+        db_hashes = {pk: row_hash(db_columns, row) for pk, row in db_by_pk.items()}
+        sheet_hashes = {pk: row_hash(db_columns, rec) for pk, (_, rec) in sheet_by_pk.items()}
 
-        if not db_changed and not sheet_changed:
+        last_state = self.db.load_sync_state(table_name)
+
+        # 최초 실행: 양쪽에 모두 있는 행은 현재 해시를 기준으로 삼고 (거짓 변경 방지)
+        # 한쪽에만 있는 행은 기준 없이 두어 아래에서 추가로 반영
+        if last_state is None:
+            last_state = {
+                pk: (db_hashes[pk], sheet_hashes[pk])
+                for pk in db_hashes.keys() & sheet_hashes.keys()
+            }
+            print("    (초기화 - 해시 저장)")
+            if len(last_state) == len(db_hashes) == len(sheet_hashes):
+                self.db.save_sync_state(table_name, last_state)
+                return stats
+
+        state = dict(last_state)
+        to_db: List[str] = []
+        to_sheet: List[str] = []
+        conflicts = 0
+        for pk in db_hashes.keys() | sheet_hashes.keys() | last_state.keys():
+            last_db, last_sheet = last_state.get(pk, (None, None))
+            db_changed = db_hashes.get(pk) != last_db
+            if sheet_hashes.get(pk) != last_sheet:
+                if db_changed:
+                    conflicts += 1
+                to_db.append(pk)
+            elif db_changed:
+                to_sheet.append(pk)
+
+        if not to_db and not to_sheet:
             # 변경 없음
             return stats
 
-        if sheet_changed and not db_changed:
-            # Sheet에서 변경됨 -> DB로 동기화
-            stats = self._sync_sheet_to_db(
-                table_name, sheet_records, db_rows, pk_column, db_columns
+        if conflicts:
+            print(f"    Both changed ({conflicts} rows), prioritizing Sheet changes...")
+
+        if to_db:
+            self._sync_sheet_to_db(
+                table_name, pk_column, db_columns, to_db, sheet_by_pk, db_by_pk, state, stats
             )
-        elif db_changed and not sheet_changed:
-            # DB에서 변경됨 -> Sheet로 동기화
-            stats = self._sync_db_to_sheet(table_name, db_columns, db_rows)
-        else:
-            # 양쪽 다 변경됨 -> Sheet 우선 (사용자 편집 우선)
-            print("    Both changed, prioritizing Sheet changes...")
-            stats = self._sync_sheet_to_db(
-                table_name, sheet_records, db_rows, pk_column, db_columns
+        if to_sheet:
+            self._sync_db_to_sheet(
+                worksheet, values, db_columns, to_sheet, sheet_by_pk, db_by_pk, state, stats
             )
 
-        # 해시 저장
-        self._last_hashes[table_name] = {
-            "db": self.db.get_table_hash(table_name),
-            "sheet": self.sheets.get_worksheet_hash(table_name),
-        }
+        # 마지막 동기화 해시 저장 (양쪽 모두 없는 행 제외)
+        state = {pk: hashes for pk, hashes in state.items() if hashes != (None, None)}
+        self.db.save_sync_state(table_name, state)
 
         return stats
 
     def _sync_sheet_to_db(
         self,
         table_name: str,
-        sheet_records: List[Dict],
-        db_rows: List[Dict],
         pk_column: str,
         db_columns: List[str],
-    ) -> Dict[str, int]:
-        """Sheet -> DB 동기화"""
-        stats = {"inserted": 0, "updated": 0, "deleted": 0}
-
-        # DB의 현재 PK 목록
-        db_pks = {self._serialize_value(row[pk_column]) for row in db_rows}
-        sheet_pks = set()
-
-        for record in sheet_records:
-            # 빈 행 스킵
-            if not any(record.values()):
+        pks: List[str],
+        sheet_by_pk: Dict[str, Tuple[int, Dict[str, str]]],
+        db_by_pk: Dict[str, Dict],
+        state: Dict[str, Tuple[Optional[str], Optional[str]]],
+        stats: Dict[str, int],
+    ):
+        """Sheet -> DB 동기화 (바뀐 행만, 한 트랜잭션으로 반영)"""
+        upserts: List[Dict[str, Any]] = []
+        upserted = []
+        deletes = []
+        for pk in pks:
+            if pk not in sheet_by_pk:
+                # Sheet에서 삭제된 레코드 처리
+                if pk in db_by_pk:
+                    deletes.append(db_by_pk[pk][pk_column])
+                    stats["deleted"] += 1
+                state[pk] = (None, None)
                 continue
 
+            _, record = sheet_by_pk[pk]
+            state[pk] = (state.get(pk, (None, None))[0], row_hash(db_columns, record))
+
             # 타입 변환
             typed_record = self._convert_types(record, table_name)
             pk_value = typed_record.get(pk_column)
-
-            # #35 - PK None 처리 개선: 경고 로깅
-            if pk_value is None or pk_value == "":
+            if pk_value is None:
                 import logging
 
-                logging.warning(f"Skipping row with empty PK in {table_name}: {record}")
+                logging.warning(f"Skipping row with invalid PK in {table_name}: {record}")
                 continue
 
             # subcatalogs: full_path_name 자동 계산
@@ -480,37 +679,69 @@ class SheetsSyncService:
             if table_name in ["catalogs", "subcatalogs", "files", "hands"]:
                 typed_record = self._auto_generate_display_title(table_name, typed_record)
 
-            sheet_pks.add(str(pk_value))
+            upserts.append(typed_record)
+            upserted.append(pk_value)
 
-            # DB에 upsert
-            self.db.upsert_record(table_name, typed_record, pk_column)
-
-            if str(pk_value) in db_pks:
+            if pk in db_by_pk:
                 stats["updated"] += 1
             else:
                 stats["inserted"] += 1
 
-        # Sheet에서 삭제된 레코드 처리
-        deleted_pks = db_pks - sheet_pks
-        for pk in deleted_pks:
-            self.db.delete_record(table_name, pk_column, pk)
-            stats["deleted"] += 1
+        # DB에 일괄 upsert/삭제
+        self.db.apply_changes(table_name, pk_column, upserts, deletes)
 
-        return stats
+        # 반영 후 DB 행 해시 갱신 (자동 생성 필드 포함)
+        for row in self.db.get_records_by_pk(table_name, pk_column, upserted):
+            pk = canonical_value(row[pk_column])
+            state[pk] = (row_hash(db_columns, row), state.get(pk, (None, None))[1])
 
     def _sync_db_to_sheet(
         self,
-        table_name: str,
-        columns: List[str],
-        rows: List[Dict],
-    ) -> Dict[str, int]:
-        """DB -> Sheet 동기화"""
-        sheet_rows = []
-        for row in rows:
-            sheet_rows.append([self._serialize_value(row.get(col)) for col in columns])
+        worksheet: gspread.Worksheet,
+        values: List[List[str]],
+        db_columns: List[str],
+        pks: List[str],
+        sheet_by_pk: Dict[str, Tuple[int, Dict[str, str]]],
+        db_by_pk: Dict[str, Dict],
+        state: Dict[str, Tuple[Optional[str], Optional[str]]],
+        stats: Dict[str, int],
+    ):
+        """DB -> Sheet 동기화 (바뀐 행만 범위 지정으로 덮어쓰기/추가/삭제)"""
+        header = values[0]
+        db_column_set = set(db_columns)
+        next_row = len(values) + 1
+        updates: Dict[int, List[Any]] = {}
+        deletes: List[int] = []
+
+        for pk in pks:
+            if pk not in db_by_pk:
+                if pk in sheet_by_pk:
+                    deletes.append(sheet_by_pk[pk][0])
+                    stats["deleted"] += 1
+                state[pk] = (None, None)
+                continue
 
-        self.sheets.update_worksheet(table_name, columns, sheet_rows)
-        return {"inserted": 0, "updated": len(rows), "deleted": 0}
+            row = db_by_pk[pk]
+            if pk in sheet_by_pk:
+                row_number, existing = sheet_by_pk[pk]
+                stats["updated"] += 1
+            else:
+                row_number, existing = next_row, {}
+                next_row += 1
+                stats["inserted"] += 1
+
+            # 시트 헤더 순서로 작성 (DB에 없는 시트 컬럼은 기존 값 유지)
+            written = {}
+            for col in header:
+                if col in db_column_set:
+                    written[col] = self._serialize_value(row.get(col))
+                else:
+                    written[col] = existing.get(col, "")
+            updates[row_number] = list(written.values())
+            state[pk] = (row_hash(db_columns, row), row_hash(db_columns, written))
+
+        self.sheets.update_rows(worksheet, updates)
+        self.sheets.delete_rows(worksheet, deletes)
 
     def _serialize_value(self, value: Any) -> Any:
         """값을 시트 호환 형식으로 변환"""
@@ -680,9 +911,12 @@ class SheetsSyncService:
         print(f"Syncing {len(self.config.tables_to_sync)} tables...")
         results = {}
 
+        # 모든 테이블 시트를 한 번에 읽기 (테이블별 요청 대신 2회)
+        sheet_data = self.sheets.read_worksheets(self.config.tables_to_sync)
+
         for table_name in self.config.tables_to_sync:
             print(f"  - {table_name}...")
-            stats = self.sync_table(table_name)
+            stats = self.sync_table(table_name, sheet_data[table_name])
             results[table_name] = stats
 
             if any(stats.values()):
@@ -700,13 +934,6 @@ class SheetsSyncService:
         print("Press Ctrl+C to stop")
         print()
 
-        # 초기 해시 설정
-        for table_name in self.config.tables_to_sync:
-            self._last_hashes[table_name] = {
-                "db": self.db.get_table_hash(table_name),
-                "sheet": self.sheets.get_worksheet_hash(table_name),
-            }
-
         try:
             while True:
                 self.sync_all()
@@ -5,14 +5,19 @@ Issue #2: SMB 네트워크 연결 모듈 구현
 - 연결 풀링 및 재사용
 - 연결 실패 시 재시도 로직
 - 연결 상태 모니터링
+- 다중 세션 병렬 디렉토리 탐색 (ParallelDirectoryWalker)
 """
 
 import logging
+import ntpath
 import os
+import queue
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Iterator, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
 
 from smbclient import (
     delete_session,
@@ -28,6 +33,35 @@ from .config import AnalyzerConfig, SMBConfig
 
 logger = logging.getLogger(__name__)
 
+# FILE_ATTRIBUTE_DIRECTORY
+_FILE_ATTRIBUTE_DIRECTORY = 0x10
+
+
+def unc_folder(path: str) -> str:
+    """SMB 폴더 경로 정규화 (역슬래시 UNC 형식, 실행 OS와 무관)
+
+    smbclient 경로는 역슬래시 UNC(\\\\server\\share\\dir)이므로 Linux에서
+    os.path를 쓰면 구분자를 인식하지 못합니다. parent_folder 저장과 조회에 같이 사용합니다.
+    """
+    return ntpath.normpath(path) if path else ""
+
+
+def unc_parent(path: str) -> str:
+    """SMB 파일 경로의 상위 폴더 (unc_folder 형식)"""
+    return unc_folder(ntpath.dirname(path))
+
+
+def _to_timestamp(value: Any) -> float:
+    """SMB 시간 값(datetime 또는 FILETIME 정수)을 POSIX timestamp로 변환"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, int):
+        # FILETIME: 1601-01-01 기준 100ns 단위
+        return (value - 116444736000000000) / 10_000_000
+    return float(value or 0)
+
 
 @dataclass
 class FileInfo:
@@ -55,6 +89,31 @@ class FileInfo:
             extension=ext,
         )
 
+    @classmethod
+    def from_dir_entry(cls, entry: Any) -> "FileInfo":
+        """scandir 엔트리에서 FileInfo 생성
+
+        QUERY_DIRECTORY 응답에 이미 포함된 속성(크기/속성/수정시각)을 사용하여
+        entry.stat()의 추가 왕복(파일 open + query info)을 피합니다.
+        smb_info가 없는 엔트리는 stat()으로 대체합니다.
+        """
+        dir_info = getattr(entry, "smb_info", None)
+        if dir_info is None:
+            return cls.from_stat(entry.path, entry.name, entry.stat())
+
+        attributes = dir_info["file_attributes"].get_value()
+        is_directory = bool(attributes & _FILE_ATTRIBUTE_DIRECTORY)
+        ext = os.path.splitext(entry.name)[1].lower() if not is_directory else ""
+
+        return cls(
+            path=entry.path,
+            name=entry.name,
+            size=dir_info["end_of_file"].get_value(),
+            is_dir=is_directory,
+            modified_time=_to_timestamp(dir_info["last_write_time"].get_value()),
+            extension=ext,
+        )
+
 
 class SMBConnectionError(Exception):
     """SMB 연결 오류"""
@@ -152,7 +211,9 @@ class SMBConnector:
             self.connect()
 
     def _build_path(self, *parts: str) -> str:
-        """경로 조합"""
+        """경로 조합 (전체 UNC 경로는 그대로 사용)"""
+        if len(parts) == 1 and (parts[0].startswith("\\\\") or parts[0].startswith("//")):
+            return parts[0]
         base = self.base_path
         for part in parts:
             if part:
@@ -218,8 +279,7 @@ class SMBConnector:
                     continue
 
                 try:
-                    stat_result = entry.stat()
-                    file_info = FileInfo.from_stat(entry.path, entry.name, stat_result)
+                    file_info = FileInfo.from_dir_entry(entry)
                     yield file_info
 
                     # 재귀 스캔
@@ -327,6 +387,227 @@ class SMBConnector:
         return False
 
 
+@dataclass
+class WalkerWorkerStats:
+    """병렬 탐색 워커별 처리량 카운터"""
+
+    worker_id: int
+    directories: int = 0
+    files: int = 0
+    bytes: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        if self.busy_seconds <= 0:
+            return 0.0
+        return self.files / self.busy_seconds
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        return {
+            "worker_id": self.worker_id,
+            "directories": self.directories,
+            "files": self.files,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "files_per_second": round(self.files_per_second, 1),
+        }
+
+
+class ParallelDirectoryWalker:
+    """다중 SMB 세션 병렬 디렉토리 탐색기
+
+    디렉토리 작업 큐를 워커 풀이 공유하며, 워커마다 별도의
+    connection_cache로 독립된 SMB 세션(TCP 연결)을 사용합니다.
+    탐색 순서는 보장되지 않습니다.
+
+    Usage:
+        walker = ParallelDirectoryWalker(config, workers=8)
+        for info in walker.walk("GGPNAs/ARCHIVE"):
+            ...
+        print([s.to_dict() for s in walker.worker_stats])
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, config: SMBConfig, workers: int = 4, output_buffer: int = 10000):
+        """
+        Args:
+            config: SMB 연결 설정
+            workers: 워커(세션) 수
+            output_buffer: 결과 큐 최대 크기 (소비자가 느리면 워커가 대기)
+        """
+        self.config = config
+        self.workers = max(1, workers)
+        self.output_buffer = output_buffer
+        self.worker_stats: List[WalkerWorkerStats] = []
+
+        self._dirs: "queue.Queue[str]" = queue.Queue()
+        self._out: "queue.Queue[Any]" = queue.Queue(maxsize=output_buffer)
+        self._stop = threading.Event()
+
+    def _build_path(self, path: str) -> str:
+        """공유 루트 기준 전체 경로"""
+        if path.startswith("\\\\") or path.startswith("//"):
+            return path
+        return os.path.join(self.config.share_path, path) if path else self.config.share_path
+
+    def _put(self, item: Any) -> bool:
+        """결과 큐에 적재 (중단 시 False)"""
+        while not self._stop.is_set():
+            try:
+                self._out.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _open_session(self, cache: Dict[str, Any]) -> None:
+        """워커 전용 세션 등록 (재시도 포함)"""
+        for attempt in range(self.config.max_retries):
+            try:
+                register_session(
+                    self.config.server,
+                    username=self.config.username,
+                    password=self.config.password,
+                    port=self.config.port,
+                    connection_timeout=self.config.timeout,
+                    connection_cache=cache,
+                )
+                return
+            except Exception as e:
+                if attempt >= self.config.max_retries - 1:
+                    raise SMBConnectionError(f"Connection failed: {e}") from e
+                time.sleep(self.config.retry_delay * (attempt + 1))
+
+    def _scan_one(self, dir_path: str, cache: Dict[str, Any], stats: WalkerWorkerStats) -> None:
+        """디렉토리 1개 탐색 - 하위 디렉토리는 작업 큐로, 엔트리는 결과 큐로"""
+        for entry in scandir(dir_path, connection_cache=cache):
+            if entry.name.startswith("."):
+                continue
+
+            try:
+                info = FileInfo.from_dir_entry(entry)
+            except Exception as e:
+                stats.errors += 1
+                logger.warning(f"Failed to process {entry.path}: {e}")
+                continue
+
+            if info.is_dir:
+                self._dirs.put(info.path)
+            else:
+                stats.files += 1
+                stats.bytes += info.size
+
+            if not self._put(info):
+                return
+
+    def _worker(self, stats: WalkerWorkerStats) -> None:
+        """워커 루프"""
+        cache: Dict[str, Any] = {}
+        try:
+            self._open_session(cache)
+        except Exception as e:
+            logger.error(f"Walker worker {stats.worker_id} failed to connect: {e}")
+            stats.errors += 1
+            # 세션 없이도 큐를 소진해야 join()이 끝나므로 실패 워커는 작업을 가져가지 않음
+            return
+
+        try:
+            while not self._stop.is_set():
+                try:
+                    dir_path = self._dirs.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                started = time.perf_counter()
+                try:
+                    self._scan_one(dir_path, cache, stats)
+                    stats.directories += 1
+                except Exception as e:
+                    stats.errors += 1
+                    logger.warning(f"Failed to scan directory {dir_path}: {e}")
+                finally:
+                    stats.busy_seconds += time.perf_counter() - started
+                    self._dirs.task_done()
+        finally:
+            try:
+                delete_session(self.config.server, port=self.config.port, connection_cache=cache)
+            except Exception as e:
+                logger.debug(f"Walker worker {stats.worker_id} disconnect error: {e}")
+
+    def _wait_done(self, threads: List[threading.Thread]) -> None:
+        """작업 큐 소진 대기 후 종료 신호 전달"""
+        while not self._stop.is_set():
+            # 모든 워커가 연결에 실패하면 큐가 비워지지 않으므로 생존 확인
+            if not any(t.is_alive() for t in threads):
+                break
+            if self._dirs.unfinished_tasks == 0:
+                break
+            time.sleep(0.1)
+        self._put(self._SENTINEL)
+
+    def walk(self, path: str = "") -> Iterator[FileInfo]:
+        """병렬 재귀 탐색 (제너레이터)
+
+        Args:
+            path: 공유 내 상대 경로 또는 전체 UNC 경로
+
+        Yields:
+            FileInfo 객체 (디렉토리 포함, 순서 비결정적)
+        """
+        self._stop.clear()
+        self._dirs = queue.Queue()
+        self._out = queue.Queue(maxsize=self.output_buffer)
+        self.worker_stats = [WalkerWorkerStats(worker_id=i) for i in range(self.workers)]
+
+        self._dirs.put(self._build_path(path))
+
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(stats,),
+                name=f"smb-walker-{stats.worker_id}",
+                daemon=True,
+            )
+            for stats in self.worker_stats
+        ]
+        for t in threads:
+            t.start()
+
+        monitor = threading.Thread(target=self._wait_done, args=(threads,), daemon=True)
+        monitor.start()
+
+        try:
+            while True:
+                item = self._out.get()
+                if item is self._SENTINEL:
+                    if self._dirs.unfinished_tasks > 0:
+                        raise SMBConnectionError(
+                            f"Parallel walk aborted: {self._dirs.unfinished_tasks} "
+                            "directories left unscanned (all workers stopped)"
+                        )
+                    break
+                yield item
+        finally:
+            self._stop.set()
+            for t in threads:
+                t.join(timeout=self.config.timeout)
+            monitor.join(timeout=1)
+
+            total_files = sum(s.files for s in self.worker_stats)
+            logger.info(
+                f"Parallel walk finished: {total_files:,} files, "
+                f"{sum(s.directories for s in self.worker_stats):,} dirs, "
+                f"{self.workers} workers"
+            )
+            for s in self.worker_stats:
+                logger.debug(f"Walker worker stats: {s.to_dict()}")
+
+
 def create_connector(config: Optional[AnalyzerConfig] = None) -> SMBConnector:
     """SMBConnector 팩토리 함수
 
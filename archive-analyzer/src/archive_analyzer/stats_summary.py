@@ -0,0 +1,403 @@
+"""사전 집계 통계 테이블 (stats_summary)
+
+대시보드/리포트가 요청마다 files, media_info 전체를 GROUP BY 하지 않도록
+차원(dimension)별 집계를 archive.db의 stats_summary 테이블에 유지합니다.
+
+- 트리거 기반 증분 갱신: 스캐너, NAS 동기화, 메타데이터 추출기 등
+  어떤 경로로 files/media_info가 바뀌어도 같은 트랜잭션 안에서 반영
+- 각 행의 updated_at이 마지막 반영 시각 (staleness 확인용)
+- rebuild_stats(): 전체 재집계 (복구용, scripts/rebuild_stats.py)
+
+쓰기 비용: 트리거는 새로 추가/변경되는 files 행마다 차원별 UPDATE를 실행하므로
+최초 적재 처리량이 트리거 없을 때의 약 1/3입니다 (10만 행 기준 약 21.5k → 7.8k rows/s).
+변경 없는 재스캔은 upsert가 행을 건너뛰어 트리거가 돌지 않습니다.
+오프라인 대량 적재는 Database.bulk_load()로 트리거를 끄고 종료 시 rebuild_stats()로
+재집계합니다 (run_scan.py --bulk / SCAN_BULK=1, NASAutoSync는 NAS_BULK_THRESHOLD 설정 시).
+
+외부 도구로 DB를 수정했다면 rebuild_stats()로 재집계하세요.
+"""
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATS_TABLE = "stats_summary"
+
+# 행 단위 값 표현식의 {r}는 NEW/OLD(트리거) 또는 테이블 별칭(재집계)으로 치환됩니다.
+_NOW = "strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')"
+
+_SUCCESS = "{r}.extraction_status = 'success'"
+
+# 카탈로그 분류 (대시보드 get_matching_summary와 동일)
+_CATALOG_KEY = """CASE
+    WHEN {r}.path LIKE '%/WSOP/%' OR {r}.path LIKE 'WSOP/%' THEN 'WSOP'
+    WHEN {r}.path LIKE '%/HCL/%' OR {r}.path LIKE 'HCL/%' THEN 'HCL'
+    WHEN {r}.path LIKE '%/PAD/%' OR {r}.path LIKE 'PAD/%' THEN 'PAD'
+    WHEN {r}.path LIKE '%/MPP/%' OR {r}.path LIKE 'MPP/%' THEN 'MPP'
+    WHEN {r}.path LIKE '%/GOG/%' OR {r}.path LIKE 'GOG/%' THEN 'GOG'
+    WHEN {r}.path LIKE '%/GGMillions/%' OR {r}.path LIKE 'GGMillions/%' THEN 'GGMillions'
+    ELSE 'Other'
+END"""
+
+# HLS 비호환 확장자 (대시보드 "제외" 집계)
+NON_HLS_EXTENSIONS = ("mxf", "webm", "mkv", "avi", "wmv", "flv")
+_NON_HLS = " OR ".join(f"{{r}}.filename LIKE '%.{ext}'" for ext in NON_HLS_EXTENSIONS)
+
+RESOLUTION_LABELS = (
+    "4K (2160p+)",
+    "1440p (QHD)",
+    "1080p (FHD)",
+    "720p (HD)",
+    "480p (SD)",
+    "Other (<480p)",
+    "Unknown",
+)
+_RESOLUTION_KEY = """CASE
+    WHEN {r}.height >= 2160 THEN '4K (2160p+)'
+    WHEN {r}.height >= 1440 THEN '1440p (QHD)'
+    WHEN {r}.height >= 1080 THEN '1080p (FHD)'
+    WHEN {r}.height >= 720 THEN '720p (HD)'
+    WHEN {r}.height >= 480 THEN '480p (SD)'
+    WHEN {r}.height > 0 THEN 'Other (<480p)'
+    ELSE 'Unknown'
+END"""
+
+_DURATION_KEY = """CASE
+    WHEN {r}.duration_seconds < 1800 THEN 'short'
+    WHEN {r}.duration_seconds < 5400 THEN 'medium'
+    ELSE 'long'
+END"""
+
+BITRATE_LABELS = ("< 5 Mbps", "5-10 Mbps", "10-20 Mbps", "20-50 Mbps", "> 50 Mbps")
+_BITRATE_KEY = """CASE
+    WHEN {r}.bitrate < 5000000 THEN '< 5 Mbps'
+    WHEN {r}.bitrate < 10000000 THEN '5-10 Mbps'
+    WHEN {r}.bitrate < 20000000 THEN '10-20 Mbps'
+    WHEN {r}.bitrate < 50000000 THEN '20-50 Mbps'
+    ELSE '> 50 Mbps'
+END"""
+
+# 스트리밍 호환성 (ReportGenerator와 동일, 코덱/컨테이너가 NULL이면 어느 쪽에도 포함 안 됨)
+_COMPATIBLE = (
+    "LOWER({r}.video_codec) IN ('h264', 'hevc', 'h265', 'vp9', 'av1') "
+    "AND LOWER({r}.container_format) IN ('mp4', 'webm', 'mov', 'matroska')"
+)
+_NEEDS_TRANSCODE = (
+    "LOWER({r}.video_codec) NOT IN ('h264', 'hevc', 'h265', 'vp9', 'av1') "
+    "OR LOWER({r}.container_format) NOT IN ('mp4', 'webm', 'mov', 'matroska')"
+)
+_COMPAT_KEY = (
+    f"CASE WHEN {_COMPATIBLE} THEN 'compatible' "
+    f"WHEN {_NEEDS_TRANSCODE} THEN 'needs_transcode' END"
+)
+
+_FILE_SIZE = "COALESCE({r}.size_bytes, 0)"
+_IS_VIDEO = "CASE WHEN {r}.file_type = 'video' THEN 1 ELSE 0 END"
+_FILENAME_KEY = "COALESCE({r}.filename, '')"
+
+
+@dataclass(frozen=True)
+class _Dimension:
+    """집계 차원 정의
+
+    key: 그룹 키 SQL, where: 포함 조건 SQL
+    size/video/value_sum/value_count: 행별 누적 값 SQL (NULL 불가)
+    """
+
+    name: str
+    key: str
+    where: str = "1"
+    size: str = "0"
+    video: str = "0"
+    value_sum: str = "0"
+    value_count: str = "0"
+
+
+# files 기반 차원 (순서 중요: duplicates는 filename 갱신 이후에 평가)
+FILE_DIMENSIONS: Tuple[_Dimension, ...] = (
+    _Dimension("total", "''", size=_FILE_SIZE, video=_IS_VIDEO),
+    _Dimension("type", "COALESCE({r}.file_type, '')", size=_FILE_SIZE, video=_IS_VIDEO),
+    _Dimension(
+        "type_ext",
+        "COALESCE({r}.file_type, '') || '|' || COALESCE({r}.extension, '')",
+        size=_FILE_SIZE,
+    ),
+    _Dimension("extension", "COALESCE({r}.extension, '')", size=_FILE_SIZE),
+    _Dimension("folder", "COALESCE({r}.parent_folder, '')", size=_FILE_SIZE, video=_IS_VIDEO),
+    _Dimension("status", "COALESCE({r}.scan_status, '')"),
+    _Dimension("catalog", _CATALOG_KEY, size=_FILE_SIZE),
+    _Dimension("non_hls", "''", where=f"({_NON_HLS})"),
+    _Dimension("filename", _FILENAME_KEY),
+    # 동일 파일명 중복으로 제외되는 파일 수 (그룹당 n-1개)
+    _Dimension(
+        "duplicates",
+        "''",
+        where=(
+            f"(SELECT file_count FROM {STATS_TABLE} "
+            f"WHERE dimension = 'filename' AND key = {_FILENAME_KEY}) > 1"
+        ),
+    ),
+)
+
+# media_info 기반 차원
+MEDIA_DIMENSIONS: Tuple[_Dimension, ...] = (
+    _Dimension("extraction", "COALESCE({r}.extraction_status, '')"),
+    _Dimension(
+        "media_total", "''", where=_SUCCESS, value_sum="COALESCE({r}.duration_seconds, 0)"
+    ),
+    _Dimension(
+        "resolution",
+        _RESOLUTION_KEY,
+        where=_SUCCESS,
+        size="COALESCE((SELECT size_bytes FROM files WHERE id = {r}.file_id), 0)",
+        value_sum="COALESCE({r}.bitrate, 0)",
+        value_count="CASE WHEN {r}.bitrate IS NOT NULL THEN 1 ELSE 0 END",
+    ),
+    _Dimension("codec", "COALESCE({r}.video_codec, 'Unknown')", where=_SUCCESS),
+    _Dimension(
+        "container",
+        "COALESCE({r}.container_format, 'Unknown')",
+        where=_SUCCESS,
+        size="COALESCE({r}.file_size, 0)",
+    ),
+    _Dimension(
+        "duration",
+        _DURATION_KEY,
+        where=f"{_SUCCESS} AND {{r}}.duration_seconds IS NOT NULL",
+        value_sum="{r}.duration_seconds",
+    ),
+    _Dimension(
+        "bitrate", _BITRATE_KEY, where=f"{_SUCCESS} AND {{r}}.bitrate IS NOT NULL"
+    ),
+    _Dimension("compat", _COMPAT_KEY, where=f"{_SUCCESS} AND ({_COMPAT_KEY}) IS NOT NULL"),
+)
+
+# 트리거가 감시하는 컬럼
+_FILE_COLUMNS = "path, filename, extension, size_bytes, file_type, parent_folder, scan_status"
+_MEDIA_COLUMNS = (
+    "file_id, extraction_status, height, bitrate, video_codec, "
+    "container_format, file_size, duration_seconds"
+)
+
+# 파일 크기 변경을 resolution 차원(media_info ↔ files 조인 값)에 반영
+_RESOLUTION_SIZE_SQL = f"""
+    UPDATE {STATS_TABLE} SET
+        total_size = total_size {{sign}} COALESCE({{r}}.size_bytes, 0) * (
+            SELECT COUNT(*) FROM media_info m
+            WHERE m.file_id = {{r}}.id AND m.extraction_status = 'success'
+            AND {_RESOLUTION_KEY.format(r="m")} = {STATS_TABLE}.key
+        ),
+        updated_at = {_NOW}
+    WHERE dimension = 'resolution' AND EXISTS (
+        SELECT 1 FROM media_info WHERE file_id = {{r}}.id AND extraction_status = 'success'
+    )
+"""
+
+TRIGGER_NAMES = (
+    "trg_stats_files_insert",
+    "trg_stats_files_delete",
+    "trg_stats_files_update",
+    "trg_stats_media_insert",
+    "trg_stats_media_delete",
+    "trg_stats_media_update",
+)
+
+
+@dataclass
+class StatsEntry:
+    """집계 행"""
+
+    key: str
+    file_count: int = 0
+    total_size: int = 0
+    video_count: int = 0
+    value_sum: float = 0.0
+    value_count: int = 0
+    updated_at: Optional[str] = None
+
+
+def _apply_row_sql(dim: _Dimension, row: str, sign: str) -> str:
+    """한 행(NEW/OLD)의 기여분을 더하거나(+) 빼는(-) UPSERT"""
+    key = dim.key.format(r=row)
+    return f"""
+        INSERT INTO {STATS_TABLE}
+            (dimension, key, file_count, total_size, video_count, value_sum, value_count, updated_at)
+        SELECT '{dim.name}', {key}, {sign}1, {sign}({dim.size.format(r=row)}),
+               {sign}({dim.video.format(r=row)}), {sign}({dim.value_sum.format(r=row)}),
+               {sign}({dim.value_count.format(r=row)}), {_NOW}
+        WHERE {dim.where.format(r=row)}
+        ON CONFLICT(dimension, key) DO UPDATE SET
+            file_count = file_count + excluded.file_count,
+            total_size = total_size + excluded.total_size,
+            video_count = video_count + excluded.video_count,
+            value_sum = value_sum + excluded.value_sum,
+            value_count = value_count + excluded.value_count,
+            updated_at = excluded.updated_at;
+    """
+
+
+def _remove_row_sql(dim: _Dimension) -> str:
+    """OLD 행 기여분 제거 + 비어버린 집계 행 정리"""
+    return _apply_row_sql(dim, "OLD", "-") + (
+        f"DELETE FROM {STATS_TABLE} WHERE dimension = '{dim.name}' "
+        f"AND key = {dim.key.format(r='OLD')} AND file_count <= 0;"
+    )
+
+
+def _trigger_sql(name: str, event: str, table: str, dims: Tuple[_Dimension, ...]) -> str:
+    body = []
+    if event != "INSERT":
+        # 역순 제거: duplicates가 filename 감소 전에 평가되도록
+        body.extend(_remove_row_sql(dim) for dim in reversed(dims))
+        if table == "files":
+            body.append(_RESOLUTION_SIZE_SQL.format(sign="-", r="OLD") + ";")
+    if event != "DELETE":
+        body.extend(_apply_row_sql(dim, "NEW", "+") for dim in dims)
+        if table == "files":
+            body.append(_RESOLUTION_SIZE_SQL.format(sign="+", r="NEW") + ";")
+
+    columns = _FILE_COLUMNS if table == "files" else _MEDIA_COLUMNS
+    timing = f"AFTER UPDATE OF {columns}" if event == "UPDATE" else f"AFTER {event}"
+    return f"CREATE TRIGGER {name} {timing} ON {table} FOR EACH ROW BEGIN {''.join(body)} END"
+
+
+def _trigger_definitions() -> List[Tuple[str, str]]:
+    names = iter(TRIGGER_NAMES)
+    definitions = []
+    for table, dims in (("files", FILE_DIMENSIONS), ("media_info", MEDIA_DIMENSIONS)):
+        for event in ("INSERT", "DELETE", "UPDATE"):
+            name = next(names)
+            definitions.append((name, _trigger_sql(name, event, table, dims)))
+    return definitions
+
+
+def has_stats_table(conn: sqlite3.Connection) -> bool:
+    """stats_summary 테이블 존재 여부"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (STATS_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def create_stats_triggers(conn: sqlite3.Connection) -> None:
+    """증분 갱신 트리거 (재)생성 - 정의가 바뀌어도 항상 최신으로 유지"""
+    drop_stats_triggers(conn)
+    for _, sql in _trigger_definitions():
+        conn.execute(sql)
+
+
+def drop_stats_triggers(conn: sqlite3.Connection) -> None:
+    """증분 갱신 트리거 삭제 (대량 적재 시 사용, 이후 rebuild_stats 필요)"""
+    for name in TRIGGER_NAMES:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def ensure_stats_schema(conn: sqlite3.Connection) -> bool:
+    """stats_summary 테이블/트리거 생성
+
+    Returns:
+        테이블을 새로 만들었으면 True (기존 데이터 재집계 필요)
+    """
+    created = not has_stats_table(conn)
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+            dimension TEXT NOT NULL,
+            key TEXT NOT NULL,
+            file_count INTEGER NOT NULL DEFAULT 0,
+            total_size INTEGER NOT NULL DEFAULT 0,
+            video_count INTEGER NOT NULL DEFAULT 0,
+            value_sum REAL NOT NULL DEFAULT 0,
+            value_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT,
+            PRIMARY KEY (dimension, key)
+        )
+    """
+    )
+    create_stats_triggers(conn)
+    return created
+
+
+def _rebuild_dimension_sql(dim: _Dimension, table: str) -> str:
+    r = "r"
+    return f"""
+        INSERT INTO {STATS_TABLE}
+            (dimension, key, file_count, total_size, video_count, value_sum, value_count, updated_at)
+        SELECT '{dim.name}', {dim.key.format(r=r)}, COUNT(*),
+               SUM({dim.size.format(r=r)}), SUM({dim.video.format(r=r)}),
+               SUM({dim.value_sum.format(r=r)}), SUM({dim.value_count.format(r=r)}), {_NOW}
+        FROM {table} {r}
+        WHERE {dim.where.format(r=r)}
+        GROUP BY 2
+    """
+
+
+def rebuild_stats(conn: sqlite3.Connection) -> int:
+    """files/media_info 전체에서 집계 재생성 (호출자가 커밋)
+
+    Returns:
+        생성된 집계 행 수
+    """
+    conn.execute(f"DELETE FROM {STATS_TABLE}")
+    for dim in FILE_DIMENSIONS:
+        if dim.name == "duplicates":
+            conn.execute(
+                f"""
+                INSERT INTO {STATS_TABLE}
+                    (dimension, key, file_count, total_size, video_count,
+                     value_sum, value_count, updated_at)
+                SELECT 'duplicates', '', excess, 0, 0, 0, 0, {_NOW}
+                FROM (
+                    SELECT SUM(file_count - 1) AS excess FROM {STATS_TABLE}
+                    WHERE dimension = 'filename' AND file_count > 1
+                )
+                WHERE excess IS NOT NULL
+            """
+            )
+        else:
+            conn.execute(_rebuild_dimension_sql(dim, "files"))
+    for dim in MEDIA_DIMENSIONS:
+        conn.execute(_rebuild_dimension_sql(dim, "media_info"))
+
+    # 재집계 시각 기록
+    conn.execute(
+        f"""
+        INSERT INTO {STATS_TABLE} (dimension, key, updated_at) VALUES ('_meta', 'rebuilt_at', {_NOW})
+    """
+    )
+    count = conn.execute(f"SELECT COUNT(*) FROM {STATS_TABLE}").fetchone()[0]
+    logger.info(f"Stats summary rebuilt: {count} rows")
+    return count
+
+
+def read_dimension(conn: sqlite3.Connection, dimension: str) -> Dict[str, StatsEntry]:
+    """차원별 집계 조회 {key: StatsEntry} (NULL 키는 ''로 저장됨)"""
+    rows = conn.execute(
+        f"""
+        SELECT key, file_count, total_size, video_count, value_sum, value_count, updated_at
+        FROM {STATS_TABLE} WHERE dimension = ?
+    """,
+        (dimension,),
+    ).fetchall()
+    return {row[0]: StatsEntry(*row) for row in rows}
+
+
+def read_entry(conn: sqlite3.Connection, dimension: str, key: str = "") -> StatsEntry:
+    """단일 집계 행 조회 (없으면 0으로 채운 StatsEntry)"""
+    row = conn.execute(
+        f"""
+        SELECT key, file_count, total_size, video_count, value_sum, value_count, updated_at
+        FROM {STATS_TABLE} WHERE dimension = ? AND key = ?
+    """,
+        (dimension, key),
+    ).fetchone()
+    return StatsEntry(*row) if row else StatsEntry(key=key)
+
+
+def stats_updated_at(conn: sqlite3.Connection) -> Optional[str]:
+    """집계 마지막 갱신 시각"""
+    row = conn.execute(f"SELECT MAX(updated_at) FROM {STATS_TABLE}").fetchone()
+    return row[0] if row else None
@@ -28,6 +28,20 @@ logger = logging.getLogger(__name__)
 # HLS 스트리밍 호환 확장자 (트랜스코딩 없이 재생 가능)
 HLS_COMPATIBLE_EXTENSIONS = ("mp4", "mov", "ts", "m4v", "m2ts", "mts")
 
+# archive.db에서 갱신하는 pokervod.db files 컬럼
+_SYNCED_COLUMNS = ("size_bytes", "duration_sec", "resolution", "codec", "fps", "bitrate_kbps")
+
+
+def _changed_condition(old: str, new: str) -> str:
+    """동기화 컬럼 중 하나라도 다르면 참인 SQL 조건"""
+    return " OR ".join(f"{old}.{col} IS NOT {new}.{col}" for col in _SYNCED_COLUMNS)
+
+
+# 스테이징(s) 기준 신규/변경 판정 조건
+_STAGE_NEW = "NOT EXISTS (SELECT 1 FROM main.files f WHERE f.nas_path = s.nas_path)"
+_STAGE_CHANGED = _changed_condition("f", "s")
+_UPSERT_CHANGED = _changed_condition("files", "excluded")
+
 
 @dataclass
 class SyncConfig:
@@ -47,6 +61,12 @@ class SyncConfig:
     # HLS 호환 파일만 동기화 (mp4, mov, ts 등)
     hls_only: bool = False
 
+    # 집합 기반 동기화 UPSERT 청크 크기
+    chunk_size: int = 5000
+
+    # dry-run 시 보고할 변경 예정 경로 샘플 수
+    diff_sample_size: int = 20
+
 
 @dataclass
 class SyncResult:
@@ -56,6 +76,8 @@ class SyncResult:
     updated: int = 0
     skipped: int = 0
     errors: List[str] = field(default_factory=list)
+    # dry-run 변경 예정 경로 샘플 {"inserted": [...], "updated": [...]}
+    diff: Dict[str, List[str]] = field(default_factory=dict)
 
     @property
     def total(self) -> int:
@@ -138,6 +160,7 @@ def classify_path_multilevel(path: str) -> SubcatalogMatch:
     """경로에서 다단계 서브카탈로그 정보 추출
 
     #37 - 가장 긴 매칭(가장 구체적인 패턴) 선택으로 패턴 순서 의존성 제거
+    컴파일된 CatalogClassifier 싱글톤을 사용합니다.
 
     Args:
         path: 파일 경로
@@ -145,36 +168,268 @@ def classify_path_multilevel(path: str) -> SubcatalogMatch:
     Returns:
         SubcatalogMatch 객체 (catalog_id, subcatalog_id, depth, year)
     """
-    normalized = normalize_path(path)  # #21 - 유틸 사용
+    return get_catalog_classifier().classify(path)
+
+
+# 정규식 메타 문자 (리터럴 접두사 추출용)
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+
+def _literal_prefix(regex: str) -> str:
+    """정규식 앞부분의 리터럴 문자열 (매칭 시 반드시 포함되는 부분)"""
+    if "|" in regex:
+        return ""
+
+    prefix = []
+    for i, ch in enumerate(regex):
+        if ch in _REGEX_META:
+            # 바로 뒤 수량자가 붙은 문자는 생략 가능하므로 제외
+            if ch in "?*{" and prefix:
+                prefix.pop()
+            break
+        prefix.append(ch)
+    return "".join(prefix)
+
+
+def _split_last_slash(regex: str) -> Optional[Tuple[str, str]]:
+    """최상위 레벨의 마지막 리터럴 '/' 기준으로 정규식 분할
+
+    '/'를 매칭할 수 있는 구성요소(., 부정 클래스, \\S 등)나 최상위 '|'가
+    있으면 None을 반환합니다.
+    """
+    depth = 0
+    in_class = False
+    split_at = None
+    i = 0
+    while i < len(regex):
+        ch = regex[i]
+        if ch == "\\":
+            if regex[i + 1 : i + 2] in ("S", "W", "D", "/"):
+                return None
+            i += 2
+            continue
+        if in_class:
+            if ch == "]":
+                in_class = False
+            elif ch == "/":
+                return None
+        elif ch == "[":
+            if regex[i + 1 : i + 2] == "^":
+                return None
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == ".":
+            return None
+        elif ch == "|" and depth == 0:
+            return None
+        elif ch == "/" and depth == 0 and regex[i + 1 : i + 2] not in ("?", "*", "+", "{"):
+            split_at = i + 1
+        i += 1
+
+    if split_at is None:
+        return None
+    return regex[:split_at], regex[split_at:]
+
 
-    best_match = None
-    best_match_length = 0
-    best_result = None
-
-    for pattern, catalog, subcatalog_template, depth in get_multilevel_patterns():  # #20
-        match = re.search(pattern, normalized, re.IGNORECASE)
-        if match:
-            match_length = len(match.group(0))
-            if match_length > best_match_length:
-                best_match_length = match_length
-                best_match = match
-                best_result = (catalog, subcatalog_template, depth)
-
-    if best_match and best_result:
-        catalog, subcatalog_template, depth = best_result
-        year = None
-        # 연도 캡처 그룹이 있으면 추출
-        if best_match.groups() and best_match.group(1).isdigit():
-            year = best_match.group(1)
+@dataclass
+class _CompiledPattern:
+    """컴파일된 다단계 패턴"""
+
+    index: int
+    regex: "re.Pattern[str]"
+    catalog_id: str
+    subcatalog_id: Optional[str]
+    depth: int
+    # 폴더 경로가 이 정규식으로 끝나면 파일명까지 매칭이 이어질 수 있음
+    # None이면 항상 파일 단위로 평가 (., .* 등 '/'를 넘을 수 있는 패턴)
+    boundary: Optional["re.Pattern[str]"]
+    tail_free: bool
+
+
+class CatalogClassifier:
+    """컴파일된 다단계 카탈로그 분류기
+
+    classify_path_multilevel()과 같은 결과(가장 긴 매칭, 동률이면 앞선 패턴)를
+    반환하되 다음 방식으로 패턴 평가 횟수를 줄입니다.
+
+    - 패턴은 생성 시 한 번만 IGNORECASE로 컴파일
+    - 리터럴 접두사의 첫 세그먼트(예: "wsop/", "hcl/")로 후보 패턴 분기
+    - 상위 폴더별 메모이제이션: 파일명에 닿을 수 없는 패턴의 매칭 결과는
+      폴더 단위로 캐시하고, 파일명까지 이어질 수 있는 패턴만 파일마다 평가
+    """
+
+    def __init__(
+        self,
+        patterns: List[Tuple[str, str, Optional[str], int]],
+        max_folders: int = 10000,
+    ):
+        self.max_folders = max_folders
+        self._patterns: List[_CompiledPattern] = []
+        self._always: List[_CompiledPattern] = []
+        self._by_anchor: Dict[str, List[_CompiledPattern]] = {}
+        self._folder_cache: Dict[str, Tuple[List[Tuple[int, int, Optional[str]]], List[_CompiledPattern]]] = {}
+
+        for index, (regex, catalog, subcatalog, depth) in enumerate(patterns):
+            split = _split_last_slash(regex)
+            boundary = None
+            if split:
+                head, tail = split
+                boundary = re.compile(f"(?:{head})\\Z", re.IGNORECASE)
+            compiled = _CompiledPattern(
+                index=index,
+                regex=re.compile(regex, re.IGNORECASE),
+                catalog_id=catalog,
+                subcatalog_id=subcatalog,
+                depth=depth,
+                boundary=boundary,
+                tail_free=bool(split) and not split[1],
+            )
+            self._patterns.append(compiled)
 
+            prefix = _literal_prefix(regex).lower()
+            if "/" in prefix:
+                anchor = prefix[: prefix.index("/") + 1]
+                self._by_anchor.setdefault(anchor, []).append(compiled)
+            else:
+                self._always.append(compiled)
+
+    @classmethod
+    def from_yaml(cls) -> "CatalogClassifier":
+        """catalog_patterns.yaml의 multilevel_patterns로 생성"""
+        return cls(get_multilevel_patterns())
+
+    def classify(self, path: str) -> SubcatalogMatch:
+        """경로에서 다단계 서브카탈로그 정보 추출"""
+        normalized = normalize_path(path)
+        if "/" not in normalized:
+            hits = self._search(self._candidates(normalized), normalized)
+            return self._to_match(hits)
+
+        folder = normalized.rsplit("/", 1)[0] + "/"
+        entry = self._folder_cache.get(folder)
+        if entry is None:
+            entry = self._build_folder_entry(folder)
+
+        decided, pending = entry
+        return self._to_match(decided + self._search(pending, normalized))
+
+    def _candidates(self, text: str) -> List[_CompiledPattern]:
+        """리터럴 접두사가 포함된 패턴만 원래 순서대로 반환"""
+        lowered = text.lower()
+        candidates = list(self._always)
+        for anchor, patterns in self._by_anchor.items():
+            if anchor in lowered:
+                candidates.extend(patterns)
+        candidates.sort(key=lambda p: p.index)
+        return candidates
+
+    def _build_folder_entry(
+        self, folder: str
+    ) -> Tuple[List[Tuple[int, int, Optional[str]]], List[_CompiledPattern]]:
+        """폴더 단위로 결정 가능한 매칭과 파일마다 평가할 패턴 분리
+
+        '/'를 넘지 않는 패턴의 매칭이 파일명에 닿으려면 마지막 '/' 앞부분이
+        폴더 경로 끝과 매칭되어야 합니다. 그렇지 않은 패턴은 파일명과 무관하게
+        폴더 경로에서의 매칭 결과가 그대로 유지됩니다.
+        """
+        settled: List[_CompiledPattern] = []
+        pending: List[_CompiledPattern] = []
+        for pattern in self._candidates(folder):
+            if pattern.boundary is None:
+                pending.append(pattern)
+            elif not pattern.tail_free and pattern.boundary.search(folder):
+                pending.append(pattern)
+            else:
+                settled.append(pattern)
+
+        entry = (self._search(settled, folder), pending)
+        if len(self._folder_cache) >= self.max_folders:
+            self._folder_cache.clear()
+        self._folder_cache[folder] = entry
+        return entry
+
+    @staticmethod
+    def _search(
+        patterns: List[_CompiledPattern], text: str
+    ) -> List[Tuple[int, int, Optional[str]]]:
+        """(패턴 인덱스, 매칭 길이, 연도) 목록"""
+        hits = []
+        for pattern in patterns:
+            match = pattern.regex.search(text)
+            if match:
+                year = None
+                # 연도 캡처 그룹이 있으면 추출
+                if match.groups() and match.group(1).isdigit():
+                    year = match.group(1)
+                hits.append((pattern.index, len(match.group(0)), year))
+        return hits
+
+    def _to_match(self, hits: List[Tuple[int, int, Optional[str]]]) -> SubcatalogMatch:
+        """가장 긴 매칭 선택 (동률이면 YAML에서 앞선 패턴)"""
+        if not hits:
+            return SubcatalogMatch(catalog_id="OTHER", subcatalog_id=None, depth=0)
+
+        index, _, year = min(hits, key=lambda hit: (-hit[1], hit[0]))
+        pattern = self._patterns[index]
         return SubcatalogMatch(
-            catalog_id=catalog,
-            subcatalog_id=subcatalog_template,
-            depth=depth,
+            catalog_id=pattern.catalog_id,
+            subcatalog_id=pattern.subcatalog_id,
+            depth=pattern.depth,
             year=year,
         )
 
-    return SubcatalogMatch(catalog_id="OTHER", subcatalog_id=None, depth=0)
+
+# 캐시된 분류기 (지연 생성)
+_classifier_cache: Optional[CatalogClassifier] = None
+
+
+def get_catalog_classifier() -> CatalogClassifier:
+    """catalog_patterns.yaml 기반 분류기 싱글톤 반환"""
+    global _classifier_cache
+    if _classifier_cache is None:
+        _classifier_cache = CatalogClassifier.from_yaml()
+    return _classifier_cache
+
+
+def parent_subcatalog_id(match: SubcatalogMatch) -> Optional[str]:
+    """상위 서브카탈로그 ID 결정"""
+    subcatalog_id = match.full_subcatalog_id
+    if not subcatalog_id:
+        return None
+
+    # depth=1이면 상위 없음
+    if match.depth <= 1:
+        return None
+
+    # depth=2: wsop-europe -> wsop-br, wsop-archive-2003-2010 -> wsop-archive
+    if match.depth == 2:
+        if subcatalog_id.startswith("wsop-archive-"):
+            return "wsop-archive"
+        if subcatalog_id in ("wsop-europe", "wsop-paradise", "wsop-las-vegas"):
+            return "wsop-br"
+
+    # depth=3: wsop-europe-2024 -> wsop-europe
+    if match.depth == 3:
+        # 연도 제거: wsop-europe-2024 -> wsop-europe
+        if match.year:
+            return subcatalog_id.replace(f"-{match.year}", "")
+
+    return None
+
+
+def subcatalog_display_name(subcatalog_id: str, match: SubcatalogMatch) -> str:
+    """서브카탈로그 표시 이름 생성"""
+    if match.year:
+        # wsop-europe-2024 -> "2024 WSOP Europe"
+        base_name = subcatalog_id.replace(f"-{match.year}", "")
+        base_name = base_name.replace("-", " ").title()
+        return f"{match.year} {base_name.upper()}"
+
+    # wsop-archive -> "WSOP Archive"
+    return subcatalog_id.replace("-", " ").title()
 
 
 def local_to_nas(local_path: str, config: SyncConfig) -> str:
@@ -195,16 +450,33 @@ class SyncService:
 
     def __init__(self, config: Optional[SyncConfig] = None):
         self.config = config or SyncConfig()
+        self._upsert_supported = False
         self._validate_paths()
         self._ensure_indexes()
 
     def _ensure_indexes(self) -> None:
-        """pokervod.db 인덱스 생성 (#40 - nas_path 인덱스 추가)"""
+        """pokervod.db 인덱스 생성 (#40 - nas_path, filename 인덱스)
+
+        ON CONFLICT(nas_path) UPSERT에는 UNIQUE 인덱스가 필요합니다.
+        기존 데이터에 중복 nas_path가 있으면 생성에 실패하며, 이 경우
+        sync_files()는 행 단위 동기화로 동작합니다.
+        """
         try:
             conn = sqlite3.connect(self.config.pokervod_db)
             cursor = conn.cursor()
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_nas_path ON files(nas_path)")
+            # 웹 매칭 화면의 filename 조인 (archive.db files.filename ↔ pokervod files.filename)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_filename ON files(filename)")
             conn.commit()
+            try:
+                cursor.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_files_nas_path_unique "
+                    "ON files(nas_path)"
+                )
+                conn.commit()
+                self._upsert_supported = True
+            except sqlite3.IntegrityError as e:
+                logger.warning(f"nas_path 중복으로 UNIQUE 인덱스 생성 실패: {e}")
             conn.close()
             logger.debug("pokervod.db 인덱스 확인 완료")
         except Exception as e:
@@ -221,7 +493,204 @@ class SyncService:
             raise FileNotFoundError(f"pokervod.db를 찾을 수 없습니다: {pokervod_path}")
 
     def sync_files(self, dry_run: bool = False) -> SyncResult:
-        """파일 정보 동기화
+        """파일 정보 동기화 (집합 기반)
+
+        archive.db를 pokervod.db에 ATTACH하여 경로 변환/ID 생성/해상도 포맷을
+        SQL 안에서 처리하고, 청크 단위 INSERT ... ON CONFLICT(nas_path) DO UPDATE로
+        반영합니다. 소스 컬럼이 바뀐 행만 갱신되며 나머지는 skipped로 집계됩니다.
+
+        nas_path UNIQUE 인덱스를 만들 수 없는 DB(중복 nas_path 존재)에서는
+        행 단위 동기화로 대체합니다.
+
+        Args:
+            dry_run: True면 실제 쓰기 없이 변경 내역(diff)만 계산
+
+        Returns:
+            SyncResult 객체 (dry_run이면 diff에 샘플 경로 포함)
+        """
+        if not self._upsert_supported:
+            logger.warning("nas_path UNIQUE 인덱스 없음, 행 단위 동기화로 대체")
+            return self._sync_files_rowwise(dry_run)
+
+        result = SyncResult()
+
+        dst_conn = sqlite3.connect(self.config.pokervod_db)
+        dst_conn.create_function("file_id", 1, generate_file_id, deterministic=True)
+
+        try:
+            dst_conn.execute("ATTACH DATABASE ? AS archive", (self.config.archive_db,))
+            self._stage_source_files(dst_conn)
+
+            total = dst_conn.execute("SELECT COUNT(*) FROM temp.sync_stage").fetchone()[0]
+            logger.info(f"동기화 대상 파일: {total}개")
+
+            result.inserted = dst_conn.execute(
+                f"SELECT COUNT(*) FROM temp.sync_stage s WHERE {_STAGE_NEW}"
+            ).fetchone()[0]
+            result.updated = dst_conn.execute(
+                f"""
+                SELECT COUNT(*) FROM temp.sync_stage s
+                JOIN main.files f ON f.nas_path = s.nas_path
+                WHERE {_STAGE_CHANGED}
+            """
+            ).fetchone()[0]
+            result.skipped = total - result.inserted - result.updated
+
+            if dry_run:
+                result.diff = self._sample_diff(dst_conn)
+            else:
+                self._upsert_staged_files(dst_conn)
+
+            logger.info(
+                f"동기화 완료: 삽입 {result.inserted}, "
+                f"업데이트 {result.updated}, 변경 없음 {result.skipped}"
+            )
+
+        except Exception as e:
+            logger.exception(f"동기화 중 치명적 오류 발생: {e}")
+            try:
+                dst_conn.rollback()
+            except Exception:
+                pass
+            raise
+
+        finally:
+            dst_conn.close()
+
+        return result
+
+    def _hls_filter(self) -> str:
+        """HLS 호환 확장자 필터 SQL 조건 (archive.files 별칭 f 기준)"""
+        if not self.config.hls_only:
+            return ""
+
+        ext_conditions = " OR ".join(
+            f"LOWER(f.path) LIKE '%.{ext}'" for ext in HLS_COMPATIBLE_EXTENSIONS
+        )
+        logger.info(f"HLS 호환 파일만 동기화: {HLS_COMPATIBLE_EXTENSIONS}")
+        return f"AND ({ext_conditions})"
+
+    def _stage_source_files(self, conn: sqlite3.Connection) -> None:
+        """archive.files + media_info를 변환된 형태로 임시 테이블에 적재
+
+        local_to_nas(), generate_file_id(), format_resolution()과 같은 결과를
+        SQL로 계산합니다. 같은 nas_path가 여러 번 나오면 마지막 행이 남습니다.
+        """
+        conn.execute("DROP TABLE IF EXISTS temp.sync_stage")
+        conn.execute(
+            """
+            CREATE TEMP TABLE sync_stage (
+                nas_path TEXT PRIMARY KEY,
+                id TEXT,
+                filename TEXT,
+                size_bytes INTEGER,
+                duration_sec REAL,
+                resolution TEXT,
+                codec TEXT,
+                fps REAL,
+                bitrate_kbps INTEGER
+            )
+        """
+        )
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO temp.sync_stage
+            SELECT
+                nas_path,
+                file_id(nas_path),
+                filename,
+                size_bytes,
+                duration_seconds,
+                resolution,
+                codec,
+                fps,
+                bitrate_kbps
+            FROM (
+                SELECT
+                    REPLACE(REPLACE(f.path, '\\', '/'), :local_prefix, :nas_prefix) AS nas_path,
+                    f.filename,
+                    f.size_bytes,
+                    m.duration_seconds,
+                    CASE WHEN m.width AND m.height
+                         THEN m.width || 'x' || m.height END AS resolution,
+                    m.video_codec AS codec,
+                    m.framerate AS fps,
+                    m.bitrate AS bitrate_kbps
+                FROM archive.files f
+                LEFT JOIN archive.media_info m ON f.id = m.file_id
+                WHERE f.file_type = 'video'
+                {self._hls_filter()}
+                ORDER BY f.id, m.id
+            )
+        """,
+            {"local_prefix": self.config.local_prefix, "nas_prefix": self.config.nas_prefix},
+        )
+
+    def _upsert_staged_files(self, conn: sqlite3.Connection) -> None:
+        """임시 테이블 → main.files 청크 단위 UPSERT
+
+        청크마다 커밋하여 쓰기 잠금을 짧게 유지합니다. UPSERT는 멱등이므로
+        중간에 실패해도 재실행하면 이어서 반영됩니다.
+        """
+        now = datetime.now().isoformat()
+        max_rowid = conn.execute("SELECT MAX(rowid) FROM temp.sync_stage").fetchone()[0] or 0
+        chunk_size = self.config.chunk_size
+
+        for low in range(1, max_rowid + 1, chunk_size):
+            conn.execute(
+                f"""
+                INSERT INTO main.files (
+                    id, nas_path, filename, size_bytes,
+                    duration_sec, resolution, codec, fps, bitrate_kbps,
+                    analysis_status, created_at, updated_at
+                )
+                SELECT
+                    s.id, s.nas_path, s.filename, s.size_bytes,
+                    s.duration_sec, s.resolution, s.codec, s.fps, s.bitrate_kbps,
+                    :status, :now, :now
+                FROM temp.sync_stage s
+                WHERE s.rowid BETWEEN :low AND :high
+                ON CONFLICT(nas_path) DO UPDATE SET
+                    size_bytes = excluded.size_bytes,
+                    duration_sec = excluded.duration_sec,
+                    resolution = excluded.resolution,
+                    codec = excluded.codec,
+                    fps = excluded.fps,
+                    bitrate_kbps = excluded.bitrate_kbps,
+                    updated_at = excluded.updated_at
+                WHERE {_UPSERT_CHANGED}
+            """,
+                {
+                    "status": self.config.default_analysis_status,
+                    "now": now,
+                    "low": low,
+                    "high": low + chunk_size - 1,
+                },
+            )
+            conn.commit()
+
+    def _sample_diff(self, conn: sqlite3.Connection) -> Dict[str, List[str]]:
+        """dry-run용 변경 예정 nas_path 샘플"""
+        limit = self.config.diff_sample_size
+        inserted = conn.execute(
+            f"SELECT s.nas_path FROM temp.sync_stage s WHERE {_STAGE_NEW} LIMIT ?", (limit,)
+        ).fetchall()
+        updated = conn.execute(
+            f"""
+            SELECT s.nas_path FROM temp.sync_stage s
+            JOIN main.files f ON f.nas_path = s.nas_path
+            WHERE {_STAGE_CHANGED}
+            LIMIT ?
+        """,
+            (limit,),
+        ).fetchall()
+        return {
+            "inserted": [row[0] for row in inserted],
+            "updated": [row[0] for row in updated],
+        }
+
+    def _sync_files_rowwise(self, dry_run: bool = False) -> SyncResult:
+        """파일 정보 동기화 (행 단위, nas_path UNIQUE 인덱스가 없을 때 사용)
 
         archive.db의 files + media_info를 pokervod.db의 files로 동기화
 
@@ -245,16 +714,7 @@ class SyncService:
             # archive.db에서 비디오 파일 조회 (media_info 조인)
             src_cursor = src_conn.cursor()
 
-            # HLS 필터링 조건 생성
-            if self.config.hls_only:
-                # HLS 호환 확장자만 필터링
-                ext_conditions = " OR ".join(
-                    f"LOWER(f.path) LIKE '%.{ext}'" for ext in HLS_COMPATIBLE_EXTENSIONS
-                )
-                hls_filter = f"AND ({ext_conditions})"
-                logger.info(f"HLS 호환 파일만 동기화: {HLS_COMPATIBLE_EXTENSIONS}")
-            else:
-                hls_filter = ""
+            hls_filter = self._hls_filter()
 
             src_cursor.execute(
                 f"""
@@ -506,28 +966,7 @@ class SyncService:
 
     def _get_parent_subcatalog_id(self, match: SubcatalogMatch) -> Optional[str]:
         """상위 서브카탈로그 ID 결정"""
-        subcatalog_id = match.full_subcatalog_id
-        if not subcatalog_id:
-            return None
-
-        # depth=1이면 상위 없음
-        if match.depth <= 1:
-            return None
-
-        # depth=2: wsop-europe -> wsop-br, wsop-archive-2003-2010 -> wsop-archive
-        if match.depth == 2:
-            if subcatalog_id.startswith("wsop-archive-"):
-                return "wsop-archive"
-            if subcatalog_id in ("wsop-europe", "wsop-paradise", "wsop-las-vegas"):
-                return "wsop-br"
-
-        # depth=3: wsop-europe-2024 -> wsop-europe
-        if match.depth == 3:
-            # 연도 제거: wsop-europe-2024 -> wsop-europe
-            if match.year:
-                return subcatalog_id.replace(f"-{match.year}", "")
-
-        return None
+        return parent_subcatalog_id(match)
 
     def _build_subcatalog_path(self, catalog_id: str, match: SubcatalogMatch) -> Optional[str]:
         """서브카탈로그 전체 경로 생성"""
@@ -564,14 +1003,7 @@ class SyncService:
 
     def _format_subcatalog_name(self, subcatalog_id: str, match: SubcatalogMatch) -> str:
         """서브카탈로그 표시 이름 생성"""
-        if match.year:
-            # wsop-europe-2024 -> "2024 WSOP Europe"
-            base_name = subcatalog_id.replace(f"-{match.year}", "")
-            base_name = base_name.replace("-", " ").title()
-            return f"{match.year} {base_name.upper()}"
-
-        # wsop-archive -> "WSOP Archive"
-        return subcatalog_id.replace("-", " ").title()
+        return subcatalog_display_name(subcatalog_id, match)
 
     def get_sync_stats(self) -> Dict[str, Any]:
         """동기화 통계 조회"""
@@ -620,6 +1052,16 @@ class SyncService:
         logger.info("2. 파일 동기화...")
         results["files"] = self.sync_files(dry_run)
 
+        # 3. 대시보드 카탈로그 트리 집계 (archive.db)
+        if not dry_run:
+            logger.info("3. 카탈로그 트리 갱신...")
+            try:
+                from .catalog_tree import refresh_catalog_tree
+
+                refresh_catalog_tree(self.config.archive_db, self.config.pokervod_db)
+            except sqlite3.Error as e:
+                logger.warning(f"카탈로그 트리 갱신 실패: {e}")
+
         logger.info("=== 동기화 완료 ===")
 
         return results
@@ -8,6 +8,9 @@ FastAPI 기반 웹 대시보드:
 - 로그 스트리밍 (WebSocket)
 - 수동 동기화/정합성 검증 트리거
 
+DB 조회는 이벤트 루프 밖(제한된 스레드 풀)에서 읽기 전용 풀 연결로 실행되며,
+동시에 들어온 동일 요청은 하나의 쿼리 결과를 공유합니다.
+
 Usage:
     uvicorn archive_analyzer.web.app:app --host 0.0.0.0 --port 8080
 """
@@ -16,12 +19,14 @@ import asyncio
 import logging
 import os
 import sqlite3
+import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
 
 from fastapi import BackgroundTasks, FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, JSONResponse
@@ -29,6 +34,9 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.requests import Request
 
+from ..catalog_tree import CatalogNode, has_catalog_tables, read_catalog_tree, read_node_files
+from ..stats_summary import has_stats_table, read_dimension, read_entry, stats_updated_at
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -47,6 +55,8 @@ class WebConfig:
     log_buffer_size: int = 1000
     host: str = "0.0.0.0"
     port: int = 8080
+    db_workers: int = 4  # DB 조회 스레드 수 (= DB별 최대 읽기 연결 수)
+    log_queue_size: int = 500  # WebSocket 클라이언트별 로그 대기열 (넘치면 오래된 줄 생략)
 
     def __post_init__(self):
         self.archive_db = os.environ.get("ARCHIVE_DB", self.archive_db)
@@ -56,6 +66,145 @@ class WebConfig:
             self.sync_interval = int(interval)
         if port := os.environ.get("WEB_PORT"):
             self.port = int(port)
+        if workers := os.environ.get("WEB_DB_WORKERS"):
+            self.db_workers = int(workers)
+        if queue_size := os.environ.get("WEB_LOG_QUEUE_SIZE"):
+            self.log_queue_size = int(queue_size)
+
+
+# =============================================================================
+# Log Streaming (WebSocket fan-out)
+# =============================================================================
+
+
+class _LogClient:
+    """WebSocket 클라이언트별 전송 대기열 (크기 제한, 넘치면 오래된 줄부터 버림)"""
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.lines: Deque[str] = deque(maxlen=queue_size)
+        self.dropped = 0
+        self.ready = asyncio.Event()
+
+    def push(self, lines: List[str], dropped: int = 0) -> None:
+        self.dropped += dropped + max(0, len(self.lines) + len(lines) - self.lines.maxlen)
+        self.lines.extend(lines)
+        self.ready.set()
+
+    def take(self, max_lines: int) -> List[str]:
+        batch = []
+        if self.dropped:
+            batch.append(f"[... 로그 {self.dropped:,}줄 생략]")
+            self.dropped = 0
+        while self.lines and len(batch) < max_lines:
+            batch.append(self.lines.popleft())
+        return batch
+
+
+class LogBroadcaster:
+    """로그 → WebSocket 클라이언트 팬아웃
+
+    - publish()는 어느 스레드에서나 호출 가능 (동기화 백그라운드 스레드 포함).
+      줄을 스레드 안전 대기열에 쌓고 이벤트 루프에 flush를 한 번만 예약합니다.
+    - 클라이언트마다 크기 제한 대기열 + 전송 태스크가 있어 느린 브라우저가
+      다른 클라이언트를 막지 않습니다. 넘친 줄은 버리고 "N줄 생략" 한 줄로 알립니다.
+    - 전송은 여러 줄을 개행으로 묶어 한 프레임으로 보냅니다.
+    - send_timeout 안에 프레임을 받지 못하는 클라이언트는 연결을 끊습니다.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 500,
+        batch_lines: int = 200,
+        flush_interval: float = 0.05,
+        send_timeout: float = 5.0,
+    ):
+        self.queue_size = queue_size
+        self.batch_lines = batch_lines
+        self.flush_interval = flush_interval
+        self.send_timeout = send_timeout
+        self._clients: List[_LogClient] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._pending: Deque[str] = deque(maxlen=queue_size)
+        self._pending_dropped = 0
+        self._flush_scheduled = False
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def publish(self, message: str) -> None:
+        """로그 한 줄 전달 (스레드 안전, 블로킹 없음)"""
+        loop = self._loop
+        if not self._clients or loop is None:
+            return
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self._pending_dropped += 1
+            self._pending.append(message)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            loop.call_soon_threadsafe(self._flush)
+        except RuntimeError:
+            # 루프 종료됨
+            with self._lock:
+                self._flush_scheduled = False
+
+    def _flush(self) -> None:
+        """(이벤트 루프) 쌓인 줄을 클라이언트 대기열로 분배"""
+        with self._lock:
+            lines = list(self._pending)
+            dropped = self._pending_dropped
+            self._pending.clear()
+            self._pending_dropped = 0
+            self._flush_scheduled = False
+        for client in self._clients:
+            client.push(lines, dropped)
+
+    async def _send_loop(self, client: _LogClient) -> None:
+        while True:
+            await client.ready.wait()
+            if self.flush_interval:
+                # 잠시 기다려 이어지는 줄을 한 프레임으로 묶음
+                await asyncio.sleep(self.flush_interval)
+            client.ready.clear()
+            while client.lines or client.dropped:
+                batch = client.take(self.batch_lines)
+                await asyncio.wait_for(
+                    client.websocket.send_text("\n".join(batch)), self.send_timeout
+                )
+
+    async def _receive_loop(self, websocket: WebSocket) -> None:
+        while True:
+            await websocket.receive_text()
+
+    async def serve(self, websocket: WebSocket, backlog: List[str]) -> None:
+        """연결된 클라이언트 처리 (연결 종료 또는 전송 지연까지)"""
+        self._loop = asyncio.get_running_loop()
+        # backlog 전체 + 실시간 줄 queue_size만큼 여유 (backlog가 대기열보다 커도 잘리지 않음)
+        client = _LogClient(websocket, len(backlog) + self.queue_size)
+        client.push(backlog)
+        self._clients.append(client)
+        tasks = [
+            asyncio.ensure_future(self._send_loop(client)),
+            asyncio.ensure_future(self._receive_loop(websocket)),
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if isinstance(error, asyncio.TimeoutError):
+                    logger.debug("로그 WebSocket 전송 지연 - 연결 종료")
+                    await websocket.close()
+                elif error is not None and not isinstance(error, WebSocketDisconnect):
+                    logger.debug(f"로그 WebSocket 종료: {error}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._clients.remove(client)
 
 
 # =============================================================================
@@ -73,8 +222,9 @@ class ServiceState:
     sync_in_progress: bool = False
     error_message: Optional[str] = None
     log_buffer: Deque[str] = field(default_factory=lambda: deque(maxlen=1000))
-    connected_clients: List[WebSocket] = field(default_factory=list)
+    log_broadcaster: LogBroadcaster = field(default_factory=LogBroadcaster)
     config: WebConfig = field(default_factory=WebConfig)
+    db_executor: Optional[ThreadPoolExecutor] = None
 
 
 state = ServiceState()
@@ -86,7 +236,7 @@ state = ServiceState()
 
 
 class WebSocketLogHandler(logging.Handler):
-    """WebSocket으로 로그 스트리밍"""
+    """WebSocket으로 로그 스트리밍 (어느 스레드에서 로깅해도 안전)"""
 
     def __init__(self, state: ServiceState):
         super().__init__()
@@ -100,19 +250,108 @@ class WebSocketLogHandler(logging.Handler):
             msg = self.format(record)
             self.state.log_buffer.append(msg)
             # WebSocket 클라이언트에 브로드캐스트
-            asyncio.create_task(self._broadcast(msg))
+            self.state.log_broadcaster.publish(msg)
         except Exception:
             pass
 
-    async def _broadcast(self, message: str):
-        disconnected = []
-        for client in self.state.connected_clients:
-            try:
-                await client.send_text(message)
-            except Exception:
-                disconnected.append(client)
-        for client in disconnected:
-            self.state.connected_clients.remove(client)
+
+# =============================================================================
+# Read Connection Pool / DB Executor
+# =============================================================================
+
+
+class ReadConnectionPool:
+    """DB 경로별 읽기 전용 SQLite 연결 풀
+
+    요청마다 sqlite3.connect 하지 않고 유휴 연결을 재사용합니다.
+    동시 사용 수는 DB 스레드 풀 크기로 제한되므로 유휴 연결도 max_idle개까지만 보관합니다.
+    attach({별칭: 경로})를 주면 다른 DB를 읽기 전용으로 ATTACH한 연결을 따로 풀링합니다.
+    """
+
+    def __init__(self, max_idle: int = 4):
+        self.max_idle = max_idle
+        self._idle: Dict[Hashable, List[sqlite3.Connection]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _uri(db_path: str) -> str:
+        return f"{Path(db_path).resolve().as_uri()}?mode=ro"
+
+    @classmethod
+    def _connect(cls, db_path: str, attach: Optional[Dict[str, str]] = None) -> sqlite3.Connection:
+        conn = sqlite3.connect(cls._uri(db_path), uri=True, check_same_thread=False)
+        for alias, path in (attach or {}).items():
+            conn.execute(f"ATTACH DATABASE ? AS {alias}", (cls._uri(path),))
+        return conn
+
+    @staticmethod
+    def _key(db_path: str, attach: Optional[Dict[str, str]]) -> Hashable:
+        return (db_path, tuple(sorted(attach.items()))) if attach else db_path
+
+    def acquire(self, db_path: str, attach: Optional[Dict[str, str]] = None) -> sqlite3.Connection:
+        """유휴 연결을 꺼내거나 새로 연결"""
+        with self._lock:
+            idle = self._idle.get(self._key(db_path, attach))
+            if idle:
+                return idle.pop()
+        return self._connect(db_path, attach)
+
+    def release(
+        self,
+        db_path: str,
+        conn: sqlite3.Connection,
+        attach: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """연결 반환 (유휴 연결이 max_idle개를 넘으면 닫음)"""
+        # 열린 읽기 트랜잭션이 남지 않도록 정리
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            idle = self._idle.setdefault(self._key(db_path, attach), [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close_all(self) -> None:
+        """유휴 연결 모두 닫기 (종료 시)"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+read_pool = ReadConnectionPool()
+
+
+async def run_db(func: Callable[..., Any], *args: Any) -> Any:
+    """동기 DB 헬퍼를 DB 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(state.db_executor, func, *args)
+
+
+class RequestCoalescer:
+    """동시에 들어온 동일 요청을 하나의 실행으로 합침
+
+    같은 키의 작업이 진행 중이면 새로 실행하지 않고 그 결과를 함께 기다립니다.
+    완료 후에는 다음 요청이 다시 실행하므로 결과가 캐시되지는 않습니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, func: Callable[..., Any], *args: Any) -> Any:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(run_db(func, *args))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 클라이언트의 연결 종료(취소)가 공유 작업을 취소하지 않도록 shield
+        return await asyncio.shield(future)
+
+
+coalescer = RequestCoalescer()
 
 
 # =============================================================================
@@ -125,7 +364,7 @@ def get_db_stats(db_path: str) -> Dict[str, Any]:
     if not Path(db_path).exists():
         return {"error": f"DB not found: {db_path}"}
 
-    conn = sqlite3.connect(db_path)
+    conn = read_pool.acquire(db_path)
     try:
         stats = {}
 
@@ -133,12 +372,24 @@ def get_db_stats(db_path: str) -> Dict[str, Any]:
         cursor = conn.execute("PRAGMA table_info(files)")
         columns = {row[1] for row in cursor.fetchall()}
 
+        # archive.db: 사전 집계 테이블 사용 (stats_summary)
+        use_summary = "scan_status" in columns and has_stats_table(conn)
+
         # 전체 파일 수
-        cursor = conn.execute("SELECT COUNT(*) FROM files")
-        stats["total_files"] = cursor.fetchone()[0]
+        if use_summary:
+            stats["total_files"] = read_entry(conn, "total").file_count
+            stats["stats_updated_at"] = stats_updated_at(conn)
+        else:
+            cursor = conn.execute("SELECT COUNT(*) FROM files")
+            stats["total_files"] = cursor.fetchone()[0]
 
         # 상태별 파일 수 (스키마에 따라 다른 컬럼 사용)
-        if "scan_status" in columns:
+        if use_summary:
+            stats["by_status"] = {
+                key or "unknown": entry.file_count
+                for key, entry in read_dimension(conn, "status").items()
+            }
+        elif "scan_status" in columns:
             # archive.db
             cursor = conn.execute(
                 """SELECT COALESCE(scan_status, 'unknown'), COUNT(*)
@@ -156,7 +407,12 @@ def get_db_stats(db_path: str) -> Dict[str, Any]:
             stats["by_status"] = {}
 
         # 파일 타입별 (archive.db only)
-        if "file_type" in columns:
+        if use_summary:
+            by_type = sorted(
+                read_dimension(conn, "type").values(), key=lambda e: e.file_count, reverse=True
+            )
+            stats["by_type"] = {entry.key or None: entry.file_count for entry in by_type[:10]}
+        elif "file_type" in columns:
             cursor = conn.execute(
                 """SELECT file_type, COUNT(*)
                    FROM files GROUP BY file_type
@@ -209,13 +465,58 @@ def get_db_stats(db_path: str) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
     finally:
-        conn.close()
+        read_pool.release(db_path, conn)
 
 
 # HLS 호환 확장자 (sync.py와 동일)
 HLS_COMPATIBLE_EXTENSIONS = ("mp4", "mov", "ts", "m4v", "m2ts", "mts")
 
 
+def _scan_matching_summary(conn: sqlite3.Connection) -> tuple:
+    """stats_summary가 없는 DB용 전체 스캔 집계 (not_synced, duplicates, catalogs)"""
+    # HLS 비호환 (확장자 기반)
+    non_hls_extensions = tuple(
+        f"%.{ext}" for ext in ("mxf", "webm", "mkv", "avi", "wmv", "flv")
+    )
+    cursor = conn.execute(
+        f"""SELECT COUNT(*) FROM files
+           WHERE {' OR '.join('filename LIKE ?' for _ in non_hls_extensions)}""",
+        non_hls_extensions,
+    )
+    not_synced = cursor.fetchone()[0]
+
+    # 중복으로 인해 제외된 파일 수 (그룹당 n-1개)
+    cursor = conn.execute(
+        """SELECT SUM(cnt - 1) FROM (
+               SELECT filename, COUNT(*) as cnt FROM files
+               GROUP BY filename HAVING cnt > 1
+           )"""
+    )
+    result = cursor.fetchone()[0]
+    duplicates_excluded = result if result else 0
+
+    # 카탈로그별 통계
+    cursor = conn.execute(
+        """SELECT
+               CASE
+                   WHEN path LIKE '%/WSOP/%' OR path LIKE 'WSOP/%' THEN 'WSOP'
+                   WHEN path LIKE '%/HCL/%' OR path LIKE 'HCL/%' THEN 'HCL'
+                   WHEN path LIKE '%/PAD/%' OR path LIKE 'PAD/%' THEN 'PAD'
+                   WHEN path LIKE '%/MPP/%' OR path LIKE 'MPP/%' THEN 'MPP'
+                   WHEN path LIKE '%/GOG/%' OR path LIKE 'GOG/%' THEN 'GOG'
+                   WHEN path LIKE '%/GGMillions/%' OR path LIKE 'GGMillions/%' THEN 'GGMillions'
+                   ELSE 'Other'
+               END as catalog,
+               COUNT(*) as count
+           FROM files
+           GROUP BY catalog
+           ORDER BY count DESC"""
+    )
+    catalogs = [{"name": row[0], "count": row[1]} for row in cursor.fetchall()]
+
+    return not_synced, duplicates_excluded, catalogs
+
+
 def get_matching_summary(
     archive_db: str, pokervod_db: str
 ) -> Dict[str, Any]:
@@ -230,70 +531,32 @@ def get_matching_summary(
     if not Path(archive_db).exists():
         return summary
 
-    conn_archive = sqlite3.connect(archive_db)
+    conn_archive = read_pool.acquire(archive_db)
     conn_pokervod = None
     if Path(pokervod_db).exists():
-        conn_pokervod = sqlite3.connect(pokervod_db)
+        conn_pokervod = read_pool.acquire(pokervod_db)
 
     try:
-        # archive.db 파일 수 (전체 - 향후 summary에 추가 가능)
-        cursor = conn_archive.execute("SELECT COUNT(*) FROM files")
-        _ = cursor.fetchone()[0]
-
         # pokervod.db 파일 수 (매칭된 파일)
         synced = 0
         if conn_pokervod:
             cursor = conn_pokervod.execute("SELECT COUNT(*) FROM files")
             synced = cursor.fetchone()[0]
 
-        # HLS 비호환 (확장자 기반)
-        non_hls_extensions = tuple(
-            f"%.{ext}" for ext in ("mxf", "webm", "mkv", "avi", "wmv", "flv")
-        )
-        cursor = conn_archive.execute(
-            f"""SELECT COUNT(*) FROM files
-               WHERE {' OR '.join('filename LIKE ?' for _ in non_hls_extensions)}""",
-            non_hls_extensions,
-        )
-        not_synced = cursor.fetchone()[0]
-
-        # 중복 파일 수 (동일 파일명이 여러 경로에 존재 - 향후 summary에 추가 가능)
-        cursor = conn_archive.execute(
-            """SELECT COUNT(*) FROM (
-                   SELECT filename, COUNT(*) as cnt FROM files
-                   GROUP BY filename HAVING cnt > 1
-               )"""
-        )
-        _ = cursor.fetchone()[0]
-
-        # 중복으로 인해 제외된 파일 수 (그룹당 n-1개)
-        cursor = conn_archive.execute(
-            """SELECT SUM(cnt - 1) FROM (
-                   SELECT filename, COUNT(*) as cnt FROM files
-                   GROUP BY filename HAVING cnt > 1
-               )"""
-        )
-        result = cursor.fetchone()[0]
-        duplicates_excluded = result if result else 0
-
-        # 카탈로그별 통계
-        cursor = conn_archive.execute(
-            """SELECT
-                   CASE
-                       WHEN path LIKE '%/WSOP/%' OR path LIKE 'WSOP/%' THEN 'WSOP'
-                       WHEN path LIKE '%/HCL/%' OR path LIKE 'HCL/%' THEN 'HCL'
-                       WHEN path LIKE '%/PAD/%' OR path LIKE 'PAD/%' THEN 'PAD'
-                       WHEN path LIKE '%/MPP/%' OR path LIKE 'MPP/%' THEN 'MPP'
-                       WHEN path LIKE '%/GOG/%' OR path LIKE 'GOG/%' THEN 'GOG'
-                       WHEN path LIKE '%/GGMillions/%' OR path LIKE 'GGMillions/%' THEN 'GGMillions'
-                       ELSE 'Other'
-                   END as catalog,
-                   COUNT(*) as count
-               FROM files
-               GROUP BY catalog
-               ORDER BY count DESC"""
-        )
-        catalogs = [{"name": row[0], "count": row[1]} for row in cursor.fetchall()]
+        if has_stats_table(conn_archive):
+            # 사전 집계 테이블 (stats_summary)
+            not_synced = read_entry(conn_archive, "non_hls").file_count
+            duplicates_excluded = read_entry(conn_archive, "duplicates").file_count
+            catalogs = sorted(
+                (
+                    {"name": entry.key, "count": entry.file_count}
+                    for entry in read_dimension(conn_archive, "catalog").values()
+                ),
+                key=lambda c: c["count"],
+                reverse=True,
+            )
+        else:
+            not_synced, duplicates_excluded, catalogs = _scan_matching_summary(conn_archive)
 
         summary = {
             "synced": synced,
@@ -305,198 +568,239 @@ def get_matching_summary(
     except Exception as e:
         logger.error(f"매칭 요약 계산 오류: {e}")
     finally:
-        conn_archive.close()
+        read_pool.release(archive_db, conn_archive)
         if conn_pokervod:
-            conn_pokervod.close()
+            read_pool.release(pokervod_db, conn_pokervod)
 
     return summary
 
 
+# 매칭 상태 SQL (archive.db files f + ATTACH한 pokervod.db pv.files)
+# - 대상: 같은 filename의 pokervod 파일 중 마지막 행 (rowid 최대)
+# - 중복: 같은 filename의 다른 archive 파일 존재
+# 둘 다 files(filename) 인덱스로 행당 인덱스 탐색 한 번입니다.
+_TARGET_ROWID_SQL = (
+    "(SELECT p2.rowid FROM pv.files p2 WHERE p2.filename = f.filename "
+    "ORDER BY p2.rowid DESC LIMIT 1)"
+)
+_IS_DUPLICATE_SQL = (
+    "EXISTS (SELECT 1 FROM files d WHERE d.filename = f.filename AND d.id != f.id)"
+)
+_STATUS_FILTER_SQL = {
+    "synced": f"p.rowid IS NOT NULL AND NOT {_IS_DUPLICATE_SQL}",
+    "synced_with_duplicates": f"p.rowid IS NOT NULL AND {_IS_DUPLICATE_SQL}",
+    "not_synced": "p.rowid IS NULL",
+}
+
+
+def _matching_status(has_target: bool, is_duplicate: bool) -> str:
+    if not has_target:
+        return "not_synced"
+    return "synced_with_duplicates" if is_duplicate else "synced"
+
+
 def get_matching_items(
     archive_db: str,
     pokervod_db: str,
     page: int = 1,
     per_page: int = 20,
     status_filter: Optional[str] = None,
+    cursor: Optional[int] = None,
 ) -> tuple:
-    """1:1 매칭 아이템 목록 조회"""
+    """1:1 매칭 아이템 목록 조회 (id 순 keyset 페이지네이션)
+
+    cursor(이전 페이지 마지막 source id)를 주면 `id > cursor`로 인덱스에서 바로
+    시작하므로 페이지 깊이와 무관하게 같은 비용입니다. cursor 없이 page만 주면
+    OFFSET으로 건너뜁니다 (하위 호환, 깊은 페이지는 느림).
+    상태 필터는 SQL에서 적용하므로 필터된 페이지도 per_page개를 채웁니다.
+
+    Returns:
+        (items, total, summary, next_cursor) - total은 상태 필터를 적용한 전체 수,
+        summary는 반환한 항목의 상태별 수, next_cursor는 다음 페이지가 없으면 None
+    """
     items = []
     total = 0
     summary = {"synced": 0, "not_synced": 0, "synced_with_duplicates": 0}
+    next_cursor = None
 
     if not Path(archive_db).exists():
-        return items, total, summary
-
-    conn_archive = sqlite3.connect(archive_db)
-    conn_pokervod = None
-    pokervod_files = {}
+        return items, total, summary, next_cursor
+    if status_filter and status_filter not in _STATUS_FILTER_SQL:
+        return items, total, summary, next_cursor
 
-    if Path(pokervod_db).exists():
-        conn_pokervod = sqlite3.connect(pokervod_db)
-        # pokervod.db의 파일들을 filename으로 인덱싱
-        cursor = conn_pokervod.execute(
-            "SELECT id, filename, nas_path, size_bytes FROM files"
-        )
-        for row in cursor.fetchall():
-            pokervod_files[row[1]] = {
-                "id": row[0],
-                "filename": row[1],
-                "nas_path": row[2],
-                "size_bytes": row[3],
-            }
+    attach = {"pv": pokervod_db} if Path(pokervod_db).exists() else None
+    conn = read_pool.acquire(archive_db, attach)
 
     try:
-        # 중복 파일 목록 (동일 filename이 여러 path에 존재)
-        cursor = conn_archive.execute(
-            """SELECT filename FROM files
-               GROUP BY filename HAVING COUNT(*) > 1"""
-        )
-        duplicate_filenames = {row[0] for row in cursor.fetchall()}
-
-        # 전체 파일 수
-        cursor = conn_archive.execute("SELECT COUNT(*) FROM files")
-        total = cursor.fetchone()[0]
-
-        # 페이지네이션
-        offset = (page - 1) * per_page
-        cursor = conn_archive.execute(
-            """SELECT id, path, filename, file_type, size_bytes
-               FROM files
-               ORDER BY id
-               LIMIT ? OFFSET ?""",
-            (per_page, offset),
-        )
-
-        for row in cursor.fetchall():
-            source_id, path, filename, file_type, size_bytes = row
+        if attach:
+            target_columns = "p.id, p.filename, p.nas_path, p.size_bytes"
+            target_join = f"LEFT JOIN pv.files p ON p.rowid = {_TARGET_ROWID_SQL}"
+        else:
+            target_columns = "NULL, NULL, NULL, NULL"
+            target_join = "LEFT JOIN (SELECT NULL AS rowid) p ON 0"
+
+        clauses, params = [], []
+        if cursor is not None:
+            clauses.append("f.id > ?")
+            params.append(cursor)
+        if status_filter:
+            clauses.append(_STATUS_FILTER_SQL[status_filter])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        offset = 0 if cursor is not None else max(0, (page - 1) * per_page)
+
+        # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+        rows = conn.execute(
+            f"""SELECT f.id, f.path, f.filename, f.file_type, f.size_bytes,
+                       {target_columns}, {_IS_DUPLICATE_SQL}
+                FROM files f
+                {target_join}
+                {where}
+                ORDER BY f.id
+                LIMIT ? OFFSET ?""",
+            params + [per_page + 1, offset],
+        ).fetchall()
+        if len(rows) > per_page:
+            rows = rows[:per_page]
+            next_cursor = rows[-1][0]
+
+        # 전체 수 (상태 필터는 목록과 같은 조건으로 적용, cursor와는 무관)
+        if status_filter:
+            total = conn.execute(
+                f"""SELECT COUNT(*) FROM files f
+                    {target_join}
+                    WHERE {_STATUS_FILTER_SQL[status_filter]}"""
+            ).fetchone()[0]
+        else:
+            total = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+        # 중복 경로 일괄 조회 (페이지의 중복 filename 전체를 한 번에)
+        duplicate_names = sorted({row[2] for row in rows if row[9]})
+        paths_by_name: Dict[str, List[tuple]] = {}
+        if duplicate_names:
+            placeholders = ",".join("?" * len(duplicate_names))
+            for dup_id, dup_path, dup_name in conn.execute(
+                f"""SELECT id, path, filename FROM files
+                    WHERE filename IN ({placeholders}) ORDER BY id""",
+                duplicate_names,
+            ):
+                paths_by_name.setdefault(dup_name, []).append((dup_id, dup_path))
+
+        for row in rows:
+            source_id, path, filename, file_type, size_bytes = row[:5]
+            target_id, target_name, target_path, target_size, is_duplicate = row[5:]
 
             # 확장자로 HLS 호환 여부 확인
             ext = filename.split(".")[-1].lower() if "." in filename else ""
-            is_hls_compatible = ext in HLS_COMPATIBLE_EXTENSIONS
-
-            # 매칭 상태 결정
-            target_info = pokervod_files.get(filename)
-            is_duplicate = filename in duplicate_filenames
-
-            if target_info:
-                if is_duplicate:
-                    status = "synced_with_duplicates"
-                    summary["synced_with_duplicates"] += 1
-                else:
-                    status = "synced"
-                    summary["synced"] += 1
-            else:
-                status = "not_synced"
-                summary["not_synced"] += 1
-
-            # 필터 적용
-            if status_filter and status != status_filter:
-                continue
-
-            item = {
-                "status": status,
-                "source": {
-                    "id": source_id,
-                    "path": path,
-                    "filename": filename,
-                    "file_type": file_type,
-                    "size_bytes": size_bytes,
-                },
-                "target": target_info,
-                "is_hls_compatible": is_hls_compatible,
-            }
-
-            if is_duplicate:
-                # 중복 경로 조회
-                dup_cursor = conn_archive.execute(
-                    "SELECT id, path FROM files WHERE filename = ? AND id != ?",
-                    (filename, source_id),
-                )
-                item["duplicates"] = [
-                    {"id": r[0], "path": r[1]} for r in dup_cursor.fetchall()
-                ]
-            else:
-                item["duplicates"] = []
+            status = _matching_status(target_name is not None, bool(is_duplicate))
+            summary[status] += 1
 
-            items.append(item)
+            items.append(
+                {
+                    "status": status,
+                    "source": {
+                        "id": source_id,
+                        "path": path,
+                        "filename": filename,
+                        "file_type": file_type,
+                        "size_bytes": size_bytes,
+                    },
+                    "target": (
+                        {
+                            "id": target_id,
+                            "filename": target_name,
+                            "nas_path": target_path,
+                            "size_bytes": target_size,
+                        }
+                        if target_name is not None
+                        else None
+                    ),
+                    "is_hls_compatible": ext in HLS_COMPATIBLE_EXTENSIONS,
+                    "duplicates": [
+                        {"id": dup_id, "path": dup_path}
+                        for dup_id, dup_path in paths_by_name.get(filename, [])
+                        if dup_id != source_id
+                    ],
+                }
+            )
 
     except Exception as e:
         logger.error(f"매칭 아이템 조회 오류: {e}")
     finally:
-        conn_archive.close()
-        if conn_pokervod:
-            conn_pokervod.close()
+        read_pool.release(archive_db, conn, attach)
+
+    return items, total, summary, next_cursor
+
+
+def _node_to_dict(node: CatalogNode) -> Dict[str, Any]:
+    return {
+        "catalog_id": node.catalog_id,
+        "subcatalog_id": node.subcatalog_id,
+        "name": node.name,
+        "depth": node.depth,
+        "direct_files": node.direct_files,
+        "total_files": node.total_files,
+        "total_size": node.total_size,
+        "synced": node.synced_files,
+        "not_synced": node.total_files - node.synced_files,
+        "children": [_node_to_dict(child) for child in node.children],
+    }
 
-    return items, total, summary
 
+def get_catalog_tree(archive_db: str) -> Dict[str, Any]:
+    """카탈로그/서브카탈로그 노드 트리 (catalog_nodes 사전 집계, 파일 목록 제외)
 
-def get_catalog_tree(archive_db: str, pokervod_db: str) -> List[Dict[str, Any]]:
-    """카탈로그별 트리 구조 생성"""
-    catalogs = []
+    파일 목록은 노드를 펼칠 때 get_catalog_files()로 페이지 단위 조회합니다.
+    """
+    tree: Dict[str, Any] = {"catalogs": [], "updated_at": None}
 
     if not Path(archive_db).exists():
-        return catalogs
+        return tree
 
-    conn_archive = sqlite3.connect(archive_db)
-    conn_pokervod = None
-    pokervod_files = set()
+    conn = read_pool.acquire(archive_db)
+    try:
+        if not has_catalog_tables(conn):
+            # 아직 집계 전 (동기화 또는 scripts/rebuild_catalog_tree.py 실행 필요)
+            return tree
+        tree["catalogs"] = [_node_to_dict(node) for node in read_catalog_tree(conn)]
+        row = conn.execute("SELECT MAX(updated_at) FROM catalog_nodes").fetchone()
+        tree["updated_at"] = row[0] if row else None
 
-    if Path(pokervod_db).exists():
-        conn_pokervod = sqlite3.connect(pokervod_db)
-        cursor = conn_pokervod.execute("SELECT filename FROM files")
-        pokervod_files = {row[0] for row in cursor.fetchall()}
+    except Exception as e:
+        logger.error(f"카탈로그 트리 조회 오류: {e}")
+    finally:
+        read_pool.release(archive_db, conn)
+
+    return tree
 
-    try:
-        # 카탈로그 정의
-        catalog_patterns = [
-            ("WSOP", "%WSOP%"),
-            ("HCL", "%HCL%"),
-            ("PAD", "%PAD%"),
-            ("MPP", "%MPP%"),
-            ("GOG", "%GOG%"),
-            ("GGMillions", "%GGMillions%"),
-        ]
 
-        for catalog_name, pattern in catalog_patterns:
-            cursor = conn_archive.execute(
-                """SELECT id, path, filename, size_bytes
-                   FROM files WHERE path LIKE ?
-                   ORDER BY path""",
-                (pattern,),
+def get_catalog_files(
+    archive_db: str,
+    pokervod_db: str,
+    catalog_id: str,
+    subcatalog_id: str = "",
+    cursor: Optional[int] = None,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """카탈로그 노드 직속 파일 목록 (file_id 순 keyset 페이지)"""
+    result: Dict[str, Any] = {"files": [], "next_cursor": None}
+
+    if not Path(archive_db).exists():
+        return result
+
+    attach = {"pv": pokervod_db} if Path(pokervod_db).exists() else None
+    conn = read_pool.acquire(archive_db, attach)
+    try:
+        if has_catalog_tables(conn):
+            result["files"], result["next_cursor"] = read_node_files(
+                conn, catalog_id, subcatalog_id, cursor, limit, pokervod_attached=bool(attach)
             )
-            files = cursor.fetchall()
-
-            synced = sum(1 for f in files if f[2] in pokervod_files)
-            not_synced = len(files) - synced
-
-            catalog = {
-                "name": catalog_name,
-                "total_files": len(files),
-                "synced": synced,
-                "not_synced": not_synced,
-                "files": [
-                    {
-                        "name": f[2],
-                        "source_id": f[0],
-                        "path": f[1],
-                        "target_id": None,  # 간소화
-                        "status": "synced" if f[2] in pokervod_files else "not_synced",
-                        "size_bytes": f[3],
-                    }
-                    for f in files[:50]  # 첫 50개만
-                ],
-            }
-            if len(files) > 0:
-                catalogs.append(catalog)
 
     except Exception as e:
-        logger.error(f"카탈로그 트리 생성 오류: {e}")
+        logger.error(f"카탈로그 파일 조회 오류: {e}")
     finally:
-        conn_archive.close()
-        if conn_pokervod:
-            conn_pokervod.close()
+        read_pool.release(archive_db, conn, attach)
 
-    return catalogs
+    return result
 
 
 def get_file_history(db_path: str, limit: int = 50) -> List[Dict[str, Any]]:
@@ -504,7 +808,7 @@ def get_file_history(db_path: str, limit: int = 50) -> List[Dict[str, Any]]:
     if not Path(db_path).exists():
         return []
 
-    conn = sqlite3.connect(db_path)
+    conn = read_pool.acquire(db_path)
     try:
         # file_history 테이블 존재 확인
         cursor = conn.execute(
@@ -540,7 +844,7 @@ def get_file_history(db_path: str, limit: int = 50) -> List[Dict[str, Any]]:
         logger.error(f"파일 이력 조회 오류: {e}")
         return []
     finally:
-        conn.close()
+        read_pool.release(db_path, conn)
 
 
 # =============================================================================
@@ -618,7 +922,14 @@ async def lifespan(app: FastAPI):
     state.is_running = True
     state.config = WebConfig()
 
+    # DB 조회 전용 스레드 풀 (읽기 연결 풀 크기와 동일하게 제한)
+    state.db_executor = ThreadPoolExecutor(
+        max_workers=state.config.db_workers, thread_name_prefix="web-db"
+    )
+    read_pool.max_idle = state.config.db_workers
+
     # 로그 핸들러 등록
+    state.log_broadcaster = LogBroadcaster(queue_size=state.config.log_queue_size)
     ws_handler = WebSocketLogHandler(state)
     logging.getLogger("archive_analyzer").addHandler(ws_handler)
 
@@ -628,7 +939,11 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     state.is_running = False
+    state.db_executor.shutdown(wait=True)
+    state.db_executor = None
+    read_pool.close_all()
     logger.info("Web 모니터링 서버 종료")
+    logging.getLogger("archive_analyzer").removeHandler(ws_handler)
 
 
 def create_app() -> FastAPI:
@@ -654,6 +969,10 @@ def create_app() -> FastAPI:
     if static_dir.exists():
         app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
+    def db_stats(db_path: str):
+        """get_db_stats를 DB 스레드 풀에서 실행 (동일 DB 동시 요청은 합침)"""
+        return coalescer.run(("stats", db_path), get_db_stats, db_path)
+
     # ==========================================================================
     # Routes
     # ==========================================================================
@@ -662,13 +981,17 @@ def create_app() -> FastAPI:
     async def dashboard(request: Request):
         """메인 대시보드"""
         if templates:
+            archive_stats, pokervod_stats = await asyncio.gather(
+                db_stats(state.config.archive_db),
+                db_stats(state.config.pokervod_db),
+            )
             return templates.TemplateResponse(
                 "dashboard.html",
                 {
                     "request": request,
                     "state": state,
-                    "archive_stats": get_db_stats(state.config.archive_db),
-                    "pokervod_stats": get_db_stats(state.config.pokervod_db),
+                    "archive_stats": archive_stats,
+                    "pokervod_stats": pokervod_stats,
                 },
             )
         else:
@@ -704,16 +1027,22 @@ def create_app() -> FastAPI:
     @app.get("/api/stats")
     async def get_stats():
         """DB 통계 조회"""
+        archive_stats, pokervod_stats = await asyncio.gather(
+            db_stats(state.config.archive_db),
+            db_stats(state.config.pokervod_db),
+        )
         return {
-            "archive": get_db_stats(state.config.archive_db),
-            "pokervod": get_db_stats(state.config.pokervod_db),
+            "archive": archive_stats,
+            "pokervod": pokervod_stats,
         }
 
     @app.get("/api/history")
     async def get_history(limit: int = 50):
         """파일 변경 이력 조회"""
         return {
-            "history": get_file_history(state.config.archive_db, limit),
+            "history": await coalescer.run(
+                ("history", limit), get_file_history, state.config.archive_db, limit
+            ),
         }
 
     @app.post("/api/sync")
@@ -757,12 +1086,16 @@ def create_app() -> FastAPI:
     @app.get("/api/dashboard")
     async def get_dashboard():
         """통합 대시보드 데이터 (PRD 7.2)"""
-        archive_stats = get_db_stats(state.config.archive_db)
-        pokervod_stats = get_db_stats(state.config.pokervod_db)
-
-        # 매칭 요약 계산
-        matching_summary = get_matching_summary(
-            state.config.archive_db, state.config.pokervod_db
+        archive_stats, pokervod_stats, matching_summary = await asyncio.gather(
+            db_stats(state.config.archive_db),
+            db_stats(state.config.pokervod_db),
+            # 매칭 요약 계산
+            coalescer.run(
+                ("matching_summary",),
+                get_matching_summary,
+                state.config.archive_db,
+                state.config.pokervod_db,
+            ),
         )
 
         return {
@@ -772,6 +1105,7 @@ def create_app() -> FastAPI:
                 "total_files": archive_stats.get("total_files", 0),
                 "by_type": archive_stats.get("by_type", {}),
                 "db_size_mb": archive_stats.get("db_size_mb", 0),
+                "stats_updated_at": archive_stats.get("stats_updated_at"),
             },
             "target": {
                 "name": "OTT 플랫폼",
@@ -796,14 +1130,21 @@ def create_app() -> FastAPI:
         page: int = 1,
         per_page: int = 20,
         status: Optional[str] = None,
+        cursor: Optional[int] = None,
     ):
-        """1:1 매칭 테이블 데이터 (PRD 7.3)"""
-        items, total, summary = get_matching_items(
+        """1:1 매칭 테이블 데이터 (PRD 7.3)
+
+        cursor: 이전 응답의 next_cursor (keyset 페이지네이션, page보다 우선)
+        """
+        items, total, summary, next_cursor = await coalescer.run(
+            ("matching", page, per_page, status, cursor),
+            get_matching_items,
             state.config.archive_db,
             state.config.pokervod_db,
-            page=page,
-            per_page=per_page,
-            status_filter=status,
+            page,
+            per_page,
+            status,
+            cursor,
         )
 
         return {
@@ -812,35 +1153,40 @@ def create_app() -> FastAPI:
             "per_page": per_page,
             "items": items,
             "summary": summary,
+            "next_cursor": next_cursor,
         }
 
     @app.get("/api/matching/tree")
     async def get_matching_tree():
-        """트리 구조 매칭 데이터 (PRD 7.4)"""
-        catalogs = get_catalog_tree(
-            state.config.archive_db, state.config.pokervod_db
+        """트리 구조 매칭 데이터 (PRD 7.4) - 노드별 사전 집계, 파일은 /files로 지연 조회"""
+        return await coalescer.run(("catalog_tree",), get_catalog_tree, state.config.archive_db)
+
+    @app.get("/api/matching/tree/files")
+    async def get_matching_tree_files(
+        catalog: str,
+        subcatalog: str = "",
+        cursor: Optional[int] = None,
+        limit: int = 50,
+    ):
+        """트리 노드 직속 파일 목록 (cursor 페이지네이션)"""
+        limit = max(1, min(limit, 500))
+        return await coalescer.run(
+            ("catalog_files", catalog, subcatalog, cursor, limit),
+            get_catalog_files,
+            state.config.archive_db,
+            state.config.pokervod_db,
+            catalog,
+            subcatalog,
+            cursor,
+            limit,
         )
-        return {"catalogs": catalogs}
 
     @app.websocket("/ws/logs")
     async def websocket_logs(websocket: WebSocket):
         """로그 실시간 스트리밍 (WebSocket)"""
         await websocket.accept()
-        state.connected_clients.append(websocket)
-
-        try:
-            # 기존 로그 전송
-            for log in state.log_buffer:
-                await websocket.send_text(log)
-
-            # 연결 유지
-            while True:
-                await websocket.receive_text()
-        except WebSocketDisconnect:
-            pass
-        finally:
-            if websocket in state.connected_clients:
-                state.connected_clients.remove(websocket)
+        # 기존 로그(backlog) 전송 후 연결 유지
+        await state.log_broadcaster.serve(websocket, list(state.log_buffer))
 
     return app
 
@@ -937,7 +1283,7 @@ def get_embedded_dashboard() -> HTMLResponse:
         <div id="content-table" class="bg-gray-800 rounded-lg p-4">
             <!-- Filter -->
             <div class="flex gap-4 mb-4 text-sm">
-                <select id="status-filter" onchange="loadMatching()" class="bg-gray-700 rounded px-3 py-1">
+                <select id="status-filter" onchange="resetMatching()" class="bg-gray-700 rounded px-3 py-1">
                     <option value="">전체 상태</option>
                     <option value="synced">✅ 동기화됨</option>
                     <option value="not_synced">❌ 미등록</option>
@@ -997,6 +1343,9 @@ def get_embedded_dashboard() -> HTMLResponse:
     <script>
         let currentPage = 1;
         const perPage = 20;
+        // 페이지별 시작 cursor (keyset 페이지네이션), nextCursor가 null이면 마지막 페이지
+        let pageCursors = [null];
+        let nextCursor = null;
 
         // Tab switching
         function showTab(tab) {
@@ -1028,10 +1377,13 @@ def get_embedded_dashboard() -> HTMLResponse:
         async function loadMatching() {
             try {
                 const status = document.getElementById('status-filter').value;
+                const cursor = pageCursors[currentPage - 1];
                 const url = `/api/matching?page=${currentPage}&per_page=${perPage}` +
+                           (cursor !== null ? `&cursor=${cursor}` : '') +
                            (status ? `&status=${status}` : '');
                 const res = await fetch(url);
                 const data = await res.json();
+                nextCursor = data.next_cursor ?? null;
 
                 // Summary
                 const sum = data.summary || {};
@@ -1097,11 +1449,21 @@ def get_embedded_dashboard() -> HTMLResponse:
         }
 
         function changePage(delta) {
+            if (delta > 0) {
+                if (nextCursor === null) return;
+                pageCursors[currentPage] = nextCursor;
+            }
             currentPage = Math.max(1, currentPage + delta);
             loadMatching();
         }
 
-        // Load tree view
+        function resetMatching() {
+            currentPage = 1;
+            pageCursors = [null];
+            loadMatching();
+        }
+
+        // Load tree view (노드 집계만 받고, 파일은 노드를 펼칠 때 cursor로 조회)
         async function loadTree() {
             try {
                 const res = await fetch('/api/matching/tree');
@@ -1109,42 +1471,84 @@ def get_embedded_dashboard() -> HTMLResponse:
                 const container = document.getElementById('tree-container');
 
                 if (!data.catalogs || data.catalogs.length === 0) {
-                    container.innerHTML = '<div class="text-gray-500">카탈로그 없음</div>';
+                    container.innerHTML = '<div class="text-gray-500">카탈로그 없음 (동기화 후 집계됩니다)</div>';
                     return;
                 }
 
-                container.innerHTML = data.catalogs.map(cat => `
-                    <div class="mb-4">
-                        <div class="flex items-center gap-2 cursor-pointer hover:bg-gray-700/50 p-2 rounded"
-                             onclick="toggleCatalog('${cat.name}')">
-                            <span id="icon-${cat.name}">📂</span>
-                            <span class="font-medium">${cat.name}</span>
-                            <span class="text-sm text-gray-400">(${cat.total_files} 파일)</span>
-                            <span class="text-xs text-green-500">✅ ${cat.synced}</span>
-                            <span class="text-xs text-red-500">❌ ${cat.not_synced}</span>
-                        </div>
-                        <div id="files-${cat.name}" class="hidden ml-6 border-l border-gray-700 pl-4">
-                            ${cat.files.slice(0, 20).map(f => `
-                                <div class="flex items-center gap-2 text-sm py-1">
-                                    <span>${f.status === 'synced' ? '✅' : '❌'}</span>
-                                    <span class="text-gray-300">${f.name}</span>
-                                    <span class="text-xs text-gray-600">${formatSize(f.size_bytes)}</span>
-                                </div>
-                            `).join('')}
-                            ${cat.files.length > 20 ? `<div class="text-xs text-gray-500">... 외 ${cat.files.length - 20}개</div>` : ''}
-                        </div>
-                    </div>
-                `).join('');
+                container.innerHTML = data.catalogs.map(renderNode).join('') +
+                    (data.updated_at ? `<div class="text-xs text-gray-600 mt-2">집계: ${data.updated_at}</div>` : '');
             } catch (e) {
                 console.error('Tree load error:', e);
             }
         }
 
-        function toggleCatalog(name) {
-            const files = document.getElementById('files-' + name);
-            const icon = document.getElementById('icon-' + name);
-            files.classList.toggle('hidden');
-            icon.textContent = files.classList.contains('hidden') ? '📂' : '📂';
+        function nodeKey(node) {
+            return `${node.catalog_id}|${node.subcatalog_id}`;
+        }
+
+        function renderNode(node) {
+            const key = encodeURIComponent(nodeKey(node)).replace(/'/g, '%27');
+            return `
+                <div class="${node.depth === 0 ? 'mb-4' : 'mb-1'}">
+                    <div class="flex items-center gap-2 cursor-pointer hover:bg-gray-700/50 p-2 rounded"
+                         onclick="toggleNode('${key}')">
+                        <span id="icon-${key}">📁</span>
+                        <span class="font-medium">${node.name}</span>
+                        <span class="text-sm text-gray-400">(${node.total_files} 파일, ${formatSize(node.total_size)})</span>
+                        <span class="text-xs text-green-500">✅ ${node.synced}</span>
+                        <span class="text-xs text-red-500">❌ ${node.not_synced}</span>
+                    </div>
+                    <div id="node-${key}" class="hidden ml-6 border-l border-gray-700 pl-4">
+                        ${node.children.map(renderNode).join('')}
+                        <div id="files-${key}" data-loaded="0"
+                             data-catalog="${node.catalog_id}" data-subcatalog="${node.subcatalog_id}"
+                             data-direct="${node.direct_files}"></div>
+                    </div>
+                </div>
+            `;
+        }
+
+        function toggleNode(key) {
+            const body = document.getElementById('node-' + key);
+            const icon = document.getElementById('icon-' + key);
+            body.classList.toggle('hidden');
+            const open = !body.classList.contains('hidden');
+            icon.textContent = open ? '📂' : '📁';
+            const files = document.getElementById('files-' + key);
+            if (open && files.dataset.loaded === '0' && files.dataset.direct !== '0') {
+                loadNodeFiles(key, null);
+            }
+        }
+
+        async function loadNodeFiles(key, cursor) {
+            const files = document.getElementById('files-' + key);
+            files.dataset.loaded = '1';
+            const params = new URLSearchParams({
+                catalog: files.dataset.catalog,
+                subcatalog: files.dataset.subcatalog,
+                limit: 50,
+            });
+            if (cursor !== null) params.set('cursor', cursor);
+            try {
+                const res = await fetch('/api/matching/tree/files?' + params);
+                const data = await res.json();
+                document.getElementById('more-' + key)?.remove();
+                files.insertAdjacentHTML('beforeend', (data.files || []).map(f => `
+                    <div class="flex items-center gap-2 text-sm py-1">
+                        <span>${f.status === 'synced' ? '✅' : '❌'}</span>
+                        <span class="text-gray-300">${f.name}</span>
+                        <span class="text-xs text-gray-600">${formatSize(f.size_bytes)}</span>
+                    </div>
+                `).join(''));
+                if (data.next_cursor !== null && data.next_cursor !== undefined) {
+                    files.insertAdjacentHTML('beforeend', `
+                        <button id="more-${key}" onclick="loadNodeFiles('${key}', ${data.next_cursor})"
+                                class="text-xs text-blue-400 hover:underline py-1">더 보기 ▼</button>
+                    `);
+                }
+            } catch (e) {
+                console.error('Tree files load error:', e);
+            }
         }
 
         // Actions
@@ -1165,14 +1569,23 @@ def get_embedded_dashboard() -> HTMLResponse:
         }
 
         // WebSocket for logs
+        const MAX_LOG_LINES = 2000;
         function connectWebSocket() {
             const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
             const ws = new WebSocket(`${protocol}//${window.location.host}/ws/logs`);
             ws.onmessage = (event) => {
+                // 한 프레임에 여러 줄이 개행으로 묶여 옴
                 const logsDiv = document.getElementById('logs');
-                const line = document.createElement('div');
-                line.textContent = event.data;
-                logsDiv.appendChild(line);
+                const fragment = document.createDocumentFragment();
+                for (const text of event.data.split('\n')) {
+                    const line = document.createElement('div');
+                    line.textContent = text;
+                    fragment.appendChild(line);
+                }
+                logsDiv.appendChild(fragment);
+                while (logsDiv.childElementCount > MAX_LOG_LINES) {
+                    logsDiv.removeChild(logsDiv.firstChild);
+                }
                 const container = document.getElementById('log-container');
                 container.scrollTop = container.scrollHeight;
             };
@@ -3,7 +3,20 @@
 import sys
 from pathlib import Path
 
-# 프로젝트 src 디렉토리를 Python 경로에 추가
+import pytest
+
+# 프로젝트 src, scripts 디렉토리를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
+scripts_path = project_root / "scripts"
 sys.path.insert(0, str(src_path))
+sys.path.insert(0, str(scripts_path))
+
+
+@pytest.fixture
+def fake_sheets():
+    """가짜 Google Sheets 서버 (기본 한도 60회/60초, 지연 없음)"""
+    pytest.importorskip("gspread")
+    from tests.fake_sheets import FakeSheetsServer
+
+    return FakeSheetsServer()
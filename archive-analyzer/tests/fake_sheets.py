@@ -0,0 +1,188 @@
+"""가짜 Google Sheets 서버 (테스트 픽스처, scripts/benchmark_sheets_quota.py 공용)
+
+실제 API 대신 window당 읽기/쓰기 요청 한도를 슬라이딩 윈도우로 적용하고,
+넘으면 gspread와 같은 APIError(429)를 냅니다. 워크시트 값은 메모리에 보관하며
+sheets_sync가 쓰는 gspread 메서드만 구현합니다. 메서드 이름이 gspread와 같아야
+sheets_rate_limit.request_kind가 읽기/쓰기를 같은 기준으로 분류합니다.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import gspread
+from gspread.exceptions import APIError
+
+from archive_analyzer.sheets_rate_limit import READ, WRITE
+
+_CELL = re.compile(r"^[A-Z]+(\d+)")
+
+
+class _FakeResponse:
+    """APIError 생성용 응답"""
+
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        self.text = message
+        self._error = {"code": status_code, "message": message, "status": "RESOURCE_EXHAUSTED"}
+
+    def json(self) -> Dict:
+        return {"error": self._error}
+
+
+def _display(value: Any) -> str:
+    """시트가 돌려주는 표시 문자열 (1.0 -> "1", True -> "TRUE")"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _start_row(range_name: str) -> int:
+    match = _CELL.match(range_name.split("!")[-1])
+    return int(match.group(1)) if match else 1
+
+
+class FakeSheetsServer:
+    """window당 읽기/쓰기 한도를 적용하는 가짜 Sheets (슬라이딩 윈도우)
+
+    fail_next에 상태 코드를 넣으면 다음 요청들이 차례로 그 코드로 실패합니다.
+    """
+
+    def __init__(
+        self,
+        read_limit: int = 60,
+        write_limit: int = 60,
+        window: float = 60.0,
+        latency: float = 0.0,
+    ):
+        self.limits = {READ: read_limit, WRITE: write_limit}
+        self.window = window
+        self.latency = latency
+        self._log: Dict[str, Deque[float]] = {READ: deque(), WRITE: deque()}
+        self._lock = threading.Lock()
+        self.accepted = {READ: 0, WRITE: 0}
+        self.rejected = {READ: 0, WRITE: 0}
+        self.fail_next: Deque[int] = deque()
+        self.spreadsheet = FakeSpreadsheet(self)
+
+    def request(self, kind: str) -> None:
+        now = time.time()
+        with self._lock:
+            if self.fail_next:
+                status = self.fail_next.popleft()
+                self.rejected[kind] += 1
+                raise APIError(_FakeResponse(status, f"Injected {status} (fake)"))
+            log = self._log[kind]
+            while log and log[0] <= now - self.window:
+                log.popleft()
+            if len(log) >= self.limits[kind]:
+                self.rejected[kind] += 1
+                raise APIError(_FakeResponse(429, "Quota exceeded (fake)"))
+            log.append(now)
+            self.accepted[kind] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.accepted = {READ: 0, WRITE: 0}
+            self.rejected = {READ: 0, WRITE: 0}
+
+
+class FakeWorksheet:
+    def __init__(self, server: FakeSheetsServer, title: str, sheet_id: int, rows: int = 1000):
+        self.server = server
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.values: List[List[Any]] = []
+
+    def _set_rows(self, start_row: int, rows: List[List[Any]]) -> None:
+        end = start_row - 1 + len(rows)
+        while len(self.values) < end:
+            self.values.append([])
+        for offset, row in enumerate(rows):
+            self.values[start_row - 1 + offset] = [_display(v) for v in row]
+
+    def get_all_values(self) -> List[List[str]]:
+        self.server.request(READ)
+        return [list(row) for row in self.values]
+
+    def update(self, values: List[List[Any]], range_name: str = "A1") -> None:
+        self.server.request(WRITE)
+        self._set_rows(_start_row(range_name), values)
+
+    def batch_update(self, data: List[Dict[str, Any]]) -> None:
+        self.server.request(WRITE)
+        for item in data:
+            self._set_rows(_start_row(item["range"]), item["values"])
+
+    def batch_clear(self, ranges: List[str]) -> None:
+        self.server.request(WRITE)
+        self.values = []
+
+    def freeze(self, rows: Optional[int] = None) -> None:
+        self.server.request(WRITE)
+
+    def add_rows(self, rows: int) -> None:
+        self.server.request(WRITE)
+        self.row_count += rows
+
+    def update_cell(self, row: int, col: int, value: str) -> None:
+        self.server.request(WRITE)
+
+
+class FakeSpreadsheet:
+    def __init__(self, server: FakeSheetsServer):
+        self.server = server
+        self.sheets: Dict[str, FakeWorksheet] = {}
+
+    def add_sheet(self, title: str, values: List[List[Any]]) -> FakeWorksheet:
+        """요청 수에 포함하지 않고 시트 준비 (테스트 초기 상태)"""
+        worksheet = FakeWorksheet(self.server, title, len(self.sheets) + 1)
+        worksheet._set_rows(1, values)
+        self.sheets[title] = worksheet
+        return worksheet
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self.server.request(READ)
+        if title not in self.sheets:
+            raise gspread.WorksheetNotFound(title)
+        return self.sheets[title]
+
+    def worksheets(self) -> List[FakeWorksheet]:
+        self.server.request(READ)
+        return list(self.sheets.values())
+
+    def add_worksheet(self, title: str, rows: int, cols: int) -> FakeWorksheet:
+        self.server.request(WRITE)
+        worksheet = FakeWorksheet(self.server, title, len(self.sheets) + 1, rows)
+        self.sheets[title] = worksheet
+        return worksheet
+
+    def values_batch_get(self, ranges: List[str]) -> Dict:
+        self.server.request(READ)
+        value_ranges = []
+        for name in ranges:
+            title = name.split("!")[0].strip("'").replace("''", "'")
+            worksheet = self.sheets.get(title)
+            values = [list(row) for row in worksheet.values] if worksheet else []
+            value_ranges.append({"range": name, "values": values})
+        return {"valueRanges": value_ranges}
+
+    def batch_update(self, body: Dict[str, Any]) -> None:
+        self.server.request(WRITE)
+        by_id = {worksheet.id: worksheet for worksheet in self.sheets.values()}
+        for request in body.get("requests", []):
+            dimension = request.get("deleteDimension")
+            if dimension is None:
+                continue
+            target = dimension["range"]
+            worksheet = by_id[target["sheetId"]]
+            del worksheet.values[target["startIndex"] : target["endIndex"]]
@@ -0,0 +1,122 @@
+"""Database.bulk_load 테스트: 트리거/인덱스 복구와 파생 테이블 재구성"""
+
+import sqlite3
+
+import pytest
+
+from archive_analyzer.database import FILES_SECONDARY_INDEXES, Database, FileRecord
+from archive_analyzer.fts_search import ensure_fts_schema, fts5_available
+from archive_analyzer.scanner import ArchiveScanner
+from archive_analyzer.search_changes import (
+    CHANGES_TABLE,
+    ensure_change_log,
+    get_sync_state,
+    set_sync_state,
+)
+from archive_analyzer.stats_summary import STATS_TABLE, rebuild_stats
+
+
+def records(start, count):
+    return [
+        FileRecord(
+            path=f"ARCHIVE/WSOP/{i % 3}/hand{i}.mp4",
+            filename=f"hand{i}.mp4",
+            extension=".mp4",
+            size_bytes=1000 + i,
+            file_type="video" if i % 4 else "other",
+            parent_folder=f"ARCHIVE/WSOP/{i % 3}",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def schema(conn, kind):
+    return {
+        row[0]: row[1]
+        for row in conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = ? AND tbl_name = 'files'", (kind,)
+        )
+    }
+
+
+def stats_rows(conn):
+    return sorted(
+        tuple(row)
+        for row in conn.execute(
+            f"""SELECT dimension, key, file_count, total_size, video_count
+            FROM {STATS_TABLE} WHERE dimension != '_meta'"""
+        )
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "archive.db"))
+    conn = database._get_connection()
+    if fts5_available():
+        ensure_fts_schema(conn)
+    ensure_change_log(conn)
+    conn.commit()
+    database.insert_files_batch(records(0, 30))
+    set_sync_state(conn, "files", 1, "full")
+    conn.commit()
+    yield database
+    database.close()
+
+
+def test_bulk_load_restores_triggers_indexes_and_derived_tables(db):
+    conn = db._get_connection()
+    triggers, indexes = schema(conn, "trigger"), schema(conn, "index")
+    assert set(FILES_SECONDARY_INDEXES) <= set(indexes)
+
+    with db.bulk_load():
+        assert not schema(conn, "trigger")
+        assert not set(FILES_SECONDARY_INDEXES) & set(schema(conn, "index"))
+        db.insert_files_batch(records(30, 70))
+
+    assert schema(conn, "trigger") == triggers
+    assert schema(conn, "index") == indexes
+
+    # 트리거 없이 넣은 행도 통계는 전체 재집계와 같아야 함
+    after_bulk = stats_rows(conn)
+    rebuild_stats(conn)
+    assert after_bulk == stats_rows(conn)
+
+    # 변경 로그가 남지 않았으므로 다음 인덱싱은 files 전체
+    assert get_sync_state(conn, "files") is None
+
+    if fts5_available():
+        hits = conn.execute(
+            "SELECT COUNT(*) FROM files_fts WHERE files_fts MATCH 'hand99'"
+        ).fetchone()[0]
+        assert hits == 1
+
+
+def test_triggers_fire_again_after_bulk_load(db):
+    with db.bulk_load():
+        db.insert_files_batch(records(30, 10))
+    db.insert_files_batch(records(40, 5))
+
+    conn = db._get_connection()
+    status = conn.execute(
+        f"SELECT file_count FROM {STATS_TABLE} WHERE dimension = 'status' AND key = 'pending'"
+    ).fetchone()
+    assert tuple(status) == (45,)
+    logged = conn.execute(
+        f"SELECT COUNT(DISTINCT row_id) FROM {CHANGES_TABLE} WHERE row_id > 40"
+    ).fetchone()
+    assert tuple(logged) == (5,)
+
+
+def test_scanner_does_not_bulk_load_by_default(tmp_path):
+    scanner = ArchiveScanner(connector=None, database=Database(str(tmp_path / "a.db")))
+    assert scanner.bulk_load is False
+
+
+def test_bulk_load_failure_still_restores_schema(db):
+    conn = db._get_connection()
+    triggers = schema(conn, "trigger")
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.bulk_load():
+            raise sqlite3.IntegrityError("boom")
+    assert schema(conn, "trigger") == triggers
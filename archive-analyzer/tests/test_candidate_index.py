@@ -0,0 +1,82 @@
+"""CandidateIndex 후보 조회 회귀 테스트
+
+후보 조회 후 원래 조건(경로/부분 문자열 포함)을 다시 적용하면
+블로킹 없는 FullScanIndex와 같은 결과(같은 순서)가 나와야 합니다.
+"""
+
+import random
+
+import pytest
+from candidate_index import PATH_SEP, CandidateIndex, FullScanIndex
+
+FOLDERS = [
+    ["wsop", "wsop-las vegas", "2024", "main event"],
+    ["wsop", "wsop-las vegas", "2023"],
+    ["wsop", "wsop archive (2003-2010)", "2005"],
+    ["hcl", "hcl", "2025"],
+    ["pad", "pad", "season 12"],
+    ["ggmillions"],
+]
+WORDS = ["main event", "day 1a", "final table", "ivey", "negreanu", "hellmuth", "bluff", "2024"]
+
+
+def build(index_cls, docs):
+    index = index_cls()
+    for doc_id, (path, name) in docs.items():
+        index.add(doc_id, path, path=path, texts=[name])
+    return index
+
+
+@pytest.fixture(scope="module")
+def docs():
+    rng = random.Random(3)
+    result = {}
+    for i in range(400):
+        folder = rng.choice(FOLDERS)
+        name = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}.mp4"
+        result[i] = (PATH_SEP.join(["", *folder, name]), name)
+    # 내부 컴포넌트 없는 짧은 경로
+    result[900] = ("ggmillions", "ggmillions")
+    return result
+
+
+def search_paths(docs):
+    paths = {PATH_SEP.join(["", *folder[:depth]]) for folder in FOLDERS for depth in (1, 2, 3)}
+    paths |= {PATH_SEP.join(["", *folder, ""]) for folder in FOLDERS}
+    # 문서 경로를 포함하는 더 긴 경로 / 중간부터 시작하는 경로
+    paths |= {path + PATH_SEP + "clips" for path, _ in list(docs.values())[:20]}
+    paths |= {PATH_SEP.join(path.split(PATH_SEP)[2:]) for path, _ in list(docs.values())[:20]}
+    return sorted(paths)
+
+
+def path_matches(index, search_path):
+    return [
+        doc_id
+        for doc_id in index.path_candidates(search_path)
+        if search_path in index.docs[doc_id] or index.docs[doc_id] in search_path
+    ]
+
+
+def test_path_candidates_match_full_scan(docs):
+    blocked, full = build(CandidateIndex, docs), build(FullScanIndex, docs)
+
+    pruned = 0
+    for search_path in search_paths(docs):
+        expected = path_matches(full, search_path)
+        assert path_matches(blocked, search_path) == expected, search_path
+        pruned += len(blocked.path_candidates(search_path)) < len(docs)
+    # 블로킹이 실제로 후보를 줄이는 경우가 있어야 의미 있는 비교
+    assert pruned > 0
+
+
+@pytest.mark.parametrize(
+    "needle", ["main event", "ivey", "negreanu bluff", "day 1a final", "12.mp4", "ab", "zzz"]
+)
+def test_substring_candidates_match_full_scan(docs, needle):
+    blocked, full = build(CandidateIndex, docs), build(FullScanIndex, docs)
+
+    def matches(index):
+        ids = index.substring_candidates(needle)
+        return index.ordered(d for d in ids if needle in docs[d][1])
+
+    assert matches(blocked) == matches(full)
@@ -0,0 +1,125 @@
+"""FTS5 폴백 인덱스 동기화 테스트
+
+원본 테이블의 UPDATE/DELETE/INSERT OR REPLACE 후에도 FTS 인덱스가 원본과
+일치해야 합니다 (외부 콘텐츠 테이블 integrity-check + 검색 결과 비교).
+"""
+
+import pytest
+
+from archive_analyzer.database import Database, FileRecord
+from archive_analyzer.fts_search import FTSSearchEngine, fts5_available, rebuild_fts
+
+pytestmark = pytest.mark.skipif(not fts5_available(), reason="FTS5 unavailable")
+
+FTS_TABLES = ("files_fts", "media_info_fts")
+
+
+@pytest.fixture
+def archive(tmp_path):
+    db = Database(str(tmp_path / "archive.db"))
+    db.insert_files_batch(
+        [
+            FileRecord(
+                path=f"WSOP/2024/main event day{i}.mp4",
+                filename=f"main event day{i}.mp4",
+                extension=".mp4",
+                file_type="video",
+                parent_folder="WSOP/2024",
+            )
+            for i in range(1, 6)
+        ]
+        + [FileRecord(path="HCL/2025/clip07.mov", filename="ivey bluff.mov", extension=".mov")]
+    )
+    conn = db._get_connection()
+    conn.executemany(
+        "INSERT INTO media_info (file_id, file_path, video_codec, container_format) "
+        "VALUES (?, ?, ?, ?)",
+        [(i, f"WSOP/2024/main event day{i}.mp4", "h264", "mov,mp4") for i in range(1, 6)],
+    )
+    conn.commit()
+    engine = FTSSearchEngine(db.db_path)
+    yield db, engine
+    engine.close()
+    db.close()
+
+
+def assert_in_sync(conn):
+    for fts in FTS_TABLES:
+        # rank=1: 외부 콘텐츠 테이블과 인덱스 내용까지 비교
+        conn.execute(f"INSERT INTO {fts}({fts}, rank) VALUES ('integrity-check', 1)")
+
+
+def paths(result):
+    return sorted(hit["path"] for hit in result.hits)
+
+
+def test_update_reindexes_changed_columns(archive):
+    db, engine = archive
+    conn = db._get_connection()
+
+    conn.execute(
+        "UPDATE files SET filename = 'negreanu final table.mp4', "
+        "path = 'WSOP/2024/negreanu final table.mp4' WHERE id = 2"
+    )
+    conn.execute("UPDATE media_info SET video_codec = 'hevc' WHERE file_id = 3")
+    conn.commit()
+
+    assert_in_sync(conn)
+    assert paths(engine.search_files("negreanu")) == ["WSOP/2024/negreanu final table.mp4"]
+    assert engine.search_files("day2").total_hits == 0
+    assert engine.search_files("main event").total_hits == 4
+    assert [hit["file_id"] for hit in engine.search_media("hevc").hits] == [3]
+
+
+def test_delete_removes_rows_from_index(archive):
+    db, engine = archive
+    conn = db._get_connection()
+
+    conn.execute("DELETE FROM files WHERE filename LIKE 'ivey%'")
+    conn.execute("DELETE FROM media_info WHERE file_id IN (1, 2)")
+    conn.commit()
+
+    assert_in_sync(conn)
+    assert engine.search_files("ivey").total_hits == 0
+    assert engine.search_media("h264").total_hits == 3
+
+
+def test_insert_or_replace_drops_replaced_row(archive):
+    db, engine = archive
+    conn = db._get_connection()
+
+    # REPLACE는 기존 행을 지우고 새 id로 삽입 - 지워진 행도 인덱스에서 빠져야 함
+    conn.execute(
+        "INSERT OR REPLACE INTO files (path, filename, extension, file_type) "
+        "VALUES ('HCL/2025/clip07.mov', 'hellmuth cooler.mov', '.mov', 'video')"
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO media_info (file_id, file_path, video_codec) "
+        "VALUES (4, 'WSOP/2024/main event day4.mp4', 'prores')"
+    )
+    conn.commit()
+
+    assert_in_sync(conn)
+    assert engine.search_files("ivey").total_hits == 0
+    assert paths(engine.search_files("hellmuth")) == ["HCL/2025/clip07.mov"]
+    assert engine.search_files("clip07").total_hits == 1
+    assert engine.search_media("h264").total_hits == 4
+    assert [hit["file_id"] for hit in engine.search_media("prores").hits] == [4]
+
+
+def test_incremental_index_matches_rebuild(archive):
+    db, engine = archive
+    conn = db._get_connection()
+    conn.execute("UPDATE files SET parent_folder = 'WSOP/ARCHIVE' WHERE id % 2 = 0")
+    conn.execute("DELETE FROM files WHERE id = 5")
+    conn.execute(
+        "INSERT OR REPLACE INTO files (path, filename, parent_folder) "
+        "VALUES ('WSOP/2024/main event day1.mp4', 'main event day1 remaster.mp4', 'WSOP/2024')"
+    )
+    conn.commit()
+    queries = ["main event", "archive", "remaster", "wsop 2024", "day5", "ivey"]
+    before = {q: paths(engine.search_files(q, limit=50)) for q in queries}
+
+    rebuild_fts(conn)
+
+    assert {q: paths(engine.search_files(q, limit=50)) for q in queries} == before
@@ -0,0 +1,112 @@
+"""match_by_path 후보 인덱스 회귀 테스트
+
+CandidateIndex(기본), 배치 퍼지 매칭이 기존 선형 탐색(FullScanIndex)과
+같은 결과를 내는지, IDF 후보 제한은 --approx-pool로만 켜지는지 확인합니다.
+"""
+
+import random
+
+import match_by_path as mbp
+import pytest
+from candidate_index import CandidateIndex, FullScanIndex
+
+pytestmark = pytest.mark.skipif(not mbp.FUZZY_AVAILABLE, reason="rapidfuzz not installed")
+
+EVENTS = ["main event", "high roller", "mystery bounty", "heads up", "ladies event"]
+PLAYERS = ["ivey", "negreanu", "hellmuth", "dwan", "brunson", "kenney", "tilly"]
+
+
+def _media_file(file_id: int, filename: str, folder: str) -> mbp.MediaFile:
+    return mbp.MediaFile(
+        id=file_id,
+        filename=filename,
+        path=f"{folder}\\{filename}",
+        folder=folder,
+        category=folder.split("\\")[0],
+        sub_category=folder.split("\\")[-1],
+        location="",
+        year_folder="",
+        normalized_name=mbp.normalize_filename(filename),
+    )
+
+
+@pytest.fixture(scope="module")
+def media_files():
+    rng = random.Random(7)
+    files = []
+    folders = ["WSOP\\WSOP-LAS VEGAS", "WSOP\\WSOP Archive (2003-2010)", "HCL\\HCL", "PAD\\PAD"]
+    for i in range(600):
+        name = (
+            f"wsop 2024 {rng.choice(EVENTS)} day {rng.randint(1, 7)} "
+            f"{rng.choice(PLAYERS)} {rng.choice(PLAYERS)} {i}.mp4"
+        )
+        files.append(_media_file(i + 1, name, rng.choice(folders)))
+    # 클립 제목과 토큰을 하나도 공유하지 않는 오타 파일명 (IDF 후보 선별에서 빠짐)
+    files.append(_media_file(1000, "negranu helmuth bigbluf.mp4", "HCL\\HCL"))
+    return files
+
+
+@pytest.fixture(scope="module")
+def clips():
+    rng = random.Random(11)
+    result = [
+        {
+            "iconik_id": "typo",
+            "title": "negreanu hellmuth big bluff",
+            "project_name": "",
+            "players_tags": "",
+            "year": None,
+        },
+        {
+            "iconik_id": "subclip",
+            "title": "negranu_helmuth_bigbluf_subclip_1",
+            "project_name": "Hustler Casino Live",
+            "players_tags": "",
+            "year": None,
+        },
+    ]
+    projects = ["", "WSOP", "Hustler Casino Live", "2008 WSOP", "PAD (POKER AFTER DARK) SEASON 13"]
+    for i in range(80):
+        result.append(
+            {
+                "iconik_id": f"clip{i}",
+                "title": f"{rng.choice(PLAYERS)} {rng.choice(EVENTS)} day {rng.randint(1, 7)}",
+                "project_name": rng.choice(projects),
+                "players_tags": rng.choice(["", "Phil Ivey", "Tom Dwan, Phil Hellmuth"]),
+                "year": rng.choice([None, 2008, 2024]),
+            }
+        )
+    return result
+
+
+def _match(clips, media_files, factory, batch=False, approximate_pool=False):
+    index = mbp.build_media_index(
+        media_files, index_factory=factory, approximate_pool=approximate_pool
+    )
+    results, _ = mbp.match_clips(clips, media_files, index, batch=batch)
+    return {r.iconik_id: r for r in results}
+
+
+def test_candidate_index_matches_full_scan(clips, media_files):
+    expected = _match(clips, media_files, FullScanIndex)
+    assert _match(clips, media_files, CandidateIndex) == expected
+    assert expected["typo"].confidence == pytest.approx(0.92)
+
+
+def test_batch_matches_per_clip(clips, media_files):
+    expected = _match(clips, media_files, FullScanIndex)
+    assert _match(clips, media_files, CandidateIndex, batch=True) == expected
+
+
+def test_similarity_finds_file_without_shared_tokens(clips, media_files):
+    index = mbp.build_media_index(media_files)
+    result = mbp.match_by_filename_similarity(clips[0], index, media_files)
+    assert result is not None
+    assert result.media_file_id == 1000
+    assert result.confidence == pytest.approx(0.92)
+
+
+def test_approximate_pool_is_opt_in(clips, media_files):
+    index = mbp.build_media_index(media_files, approximate_pool=True)
+    result = mbp.match_by_filename_similarity(clips[0], index, media_files)
+    assert result is None or result.media_file_id != 1000
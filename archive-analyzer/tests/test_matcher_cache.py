@@ -0,0 +1,75 @@
+"""matcher_cache.FeatureCache 변경 감지 테스트"""
+
+import sqlite3
+
+import pytest
+from matcher_cache import FeatureCache
+
+
+def extract(filename, path):
+    name = filename.rsplit(".", 1)[0].lower()
+    return name, name.split(), "2024", "", ""
+
+
+@pytest.fixture
+def archive_db(tmp_path):
+    db_path = str(tmp_path / "archive.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """CREATE TABLE files (
+            id INTEGER PRIMARY KEY, path TEXT, filename TEXT, parent_folder TEXT,
+            modified_at TEXT, file_type TEXT
+        )"""
+    )
+    conn.executemany(
+        "INSERT INTO files VALUES (?, ?, ?, ?, '2024-01-01T00:00:00', ?)",
+        [
+            (i, f"ARCHIVE/WSOP/f{i}.mp4", f"f{i}.mp4", "ARCHIVE/WSOP", "video")
+            for i in range(1, 51)
+        ]
+        + [(100, "ARCHIVE/WSOP/notes.txt", "notes.txt", "ARCHIVE/WSOP", "other")],
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def cached_rows(db_path):
+    with FeatureCache(db_path) as cache:
+        refreshed, removed = cache.refresh(extract)
+        return refreshed, removed, {row[0]: row for row in cache.load()}
+
+
+def test_unchanged_archive_is_not_recomputed(archive_db):
+    assert cached_rows(archive_db)[:2] == (50, 0)
+    assert cached_rows(archive_db)[:2] == (0, 0)
+
+
+def test_parent_folder_and_filename_changes_refresh_cache(archive_db):
+    cached_rows(archive_db)
+
+    conn = sqlite3.connect(archive_db)
+    conn.execute("UPDATE files SET parent_folder = '\\\\nas\\ARCHIVE\\WSOP'")
+    conn.execute("UPDATE files SET filename = 'renamed.mp4' WHERE id = 7")
+    conn.commit()
+    conn.close()
+
+    refreshed, _, rows = cached_rows(archive_db)
+    assert refreshed == 50
+    assert all(row[3] == "\\\\nas\\ARCHIVE\\WSOP" for row in rows.values())
+    assert rows[7][1] == "renamed.mp4"
+    assert rows[7][4] == "renamed"
+
+
+def test_deleted_and_non_video_rows_are_removed(archive_db):
+    cached_rows(archive_db)
+
+    conn = sqlite3.connect(archive_db)
+    conn.execute("DELETE FROM files WHERE id = 3")
+    conn.execute("UPDATE files SET file_type = 'other' WHERE id = 4")
+    conn.commit()
+    conn.close()
+
+    refreshed, removed, rows = cached_rows(archive_db)
+    assert (refreshed, removed) == (0, 2)
+    assert 3 not in rows and 4 not in rows
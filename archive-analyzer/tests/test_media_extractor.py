@@ -0,0 +1,225 @@
+"""media_extractor 테스트 (가짜 SMB 연결 + 가짜 FFprobe)"""
+
+import io
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from archive_analyzer import media_extractor as me
+from archive_analyzer.database import Database, FileRecord
+
+
+class CountingFile(io.BytesIO):
+    def __init__(self, data, stats):
+        super().__init__(data)
+        self.stats = stats
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.stats["bytes"] += len(data)
+        return data
+
+
+class FakeConnector:
+    """메모리 바이트를 SMB 파일처럼 제공 (열기 횟수/읽은 바이트/스레드 기록)"""
+
+    is_connected = True
+
+    def __init__(self, files):
+        self.files = files
+        self.stats = {"opens": 0, "bytes": 0}
+        self.threads = set()
+
+    def get_file_info(self, path):
+        return SimpleNamespace(size=len(self.files[path]))
+
+    def open_file(self, path, mode="rb"):
+        self.stats["opens"] += 1
+        self.threads.add(threading.current_thread().name)
+        return CountingFile(self.files[path], self.stats)
+
+
+class FakeFFprobe:
+    """임시 파일 내용 해시와 동시 실행 수를 기록하는 FFprobe 대역"""
+
+    delay = 0.0
+
+    def __init__(self, ffprobe_path="ffprobe"):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.threads = set()
+
+    def extract(self, file_path, timeout=60):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.threads.add(threading.current_thread().name)
+        try:
+            time.sleep(self.delay)
+            return me.MediaInfo(
+                file_path=file_path,
+                duration_seconds=float(os.path.getsize(file_path)),
+                extraction_status="success",
+            )
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+@pytest.fixture(autouse=True)
+def fake_ffprobe(monkeypatch):
+    monkeypatch.setattr(me, "FFprobeExtractor", FakeFFprobe)
+
+
+def test_parallel_pipeline_runs_ffprobe_in_its_own_stage(tmp_path, monkeypatch):
+    monkeypatch.setattr(FakeFFprobe, "delay", 0.02)
+    files = {f"ARCHIVE/f{i}.mxf": os.urandom(2_000_000 + i) for i in range(12)}
+    db = Database(str(tmp_path / "archive.db"))
+    db.insert_files_batch(
+        [FileRecord(path=p, filename=p.rsplit("/", 1)[1], file_type="video") for p in files]
+    )
+    connector = FakeConnector(files)
+
+    extractor = me.MediaMetadataExtractor(
+        connector, db, max_workers=2, max_probes=3, use_probe_cache=False
+    )
+    summary = extractor.extract_all(parallel=True)
+
+    probe = extractor.smb_extractor.ffprobe
+    assert summary["successful"] == len(files)
+    assert db.get_extracted_media_count("video") == len(files)
+    assert {name.rsplit("-", 1)[0] for name in connector.threads} == {"media-reader"}
+    assert {name.rsplit("-", 1)[0] for name in probe.threads} == {"media-probe"}
+    assert 1 < probe.max_running <= 3
+    db.close()
+
+
+def test_small_files_are_not_counted_as_full_downloads(tmp_path):
+    files = {"ARCHIVE/small.mp4": os.urandom(200_000), "ARCHIVE/large.mxf": os.urandom(3_000_000)}
+    db = Database(str(tmp_path / "archive.db"))
+    db.insert_files_batch(
+        [FileRecord(path=p, filename=p.rsplit("/", 1)[1], file_type="video") for p in files]
+    )
+    extractor = me.MediaMetadataExtractor(FakeConnector(files), db, use_probe_cache=False)
+    summary = extractor.extract_all(parallel=False)
+
+    assert summary["successful"] == 2
+    assert summary["full_downloads"] == 0
+    db.close()
+
+
+def test_small_file_probe_failure_is_not_retried(tmp_path, monkeypatch):
+    def failing(self, file_path, timeout=60):
+        return me.MediaInfo(file_path=file_path, extraction_status="failed")
+
+    monkeypatch.setattr(FakeFFprobe, "extract", failing)
+    connector = FakeConnector({"ARCHIVE/small.mp4": os.urandom(200_000)})
+    extractor = me.SMBMediaExtractor(connector, temp_dir=str(tmp_path))
+
+    info = extractor.extract("ARCHIVE/small.mp4")
+
+    assert info.probe_method == "small"
+    assert connector.stats == {"opens": 1, "bytes": 200_000}
+
+
+def test_range_reader_fetches_only_missing_bytes():
+    data = os.urandom(10_000)
+    stats = {"bytes": 0}
+    reader = me._RangeReader(CountingFile(data, stats))
+
+    assert reader.read_at(1000, 500) == data[1000:1500]
+    assert reader.read_at(3000, 500) == data[3000:3500]
+    assert reader.bytes_read == stats["bytes"] == 1000
+    # 이미 읽은 구간 안쪽은 전송 없음
+    assert reader.read_at(1100, 300) == data[1100:1400]
+    assert stats["bytes"] == 1000
+    # 두 구간과 겹치는 범위는 사이 빈 구간과 양끝만 읽음
+    assert reader.read_at(800, 3000) == data[800:3800]
+    assert reader.bytes_read == stats["bytes"] == 1000 + 200 + 1500 + 300
+    # 파일 끝을 넘는 요청은 있는 만큼만
+    assert reader.read_at(9_900, 500) == data[9_900:]
+    assert reader.read_at(0, 10_000) == data
+
+
+def test_fingerprint_ranges_are_reused_for_probe(tmp_path):
+    data = os.urandom(3_000_000)
+    db = Database(str(tmp_path / "archive.db"))
+    transferred = {}
+    for use_cache in (False, True):
+        connector = FakeConnector({"ARCHIVE/clip.mxf": data})
+        cache = me.ProbeCache(db) if use_cache else None
+        extractor = me.SMBMediaExtractor(connector, temp_dir=str(tmp_path), probe_cache=cache)
+
+        info = extractor.extract("ARCHIVE/clip.mxf")
+
+        assert info.probe_method == "head+tail"
+        assert connector.stats["opens"] == 1
+        assert info.bytes_transferred == connector.stats["bytes"]
+        transferred[use_cache] = connector.stats["bytes"]
+    db.close()
+    # 지문의 앞/뒤 64KB는 head/tail 범위에 포함되므로 추가 전송 없음
+    assert (
+        transferred[True]
+        == transferred[False]
+        == (me.SMBMediaExtractor.HEADER_SIZE + me.SMBMediaExtractor.TAIL_SIZE)
+    )
+
+
+def test_fingerprint_depends_on_content_not_path():
+    chunk = 64 * 1024
+    data = bytearray(os.urandom(1_000_000))
+
+    def fingerprint(content):
+        return me.compute_fingerprint(lambda o, s: bytes(content[o : o + s]), len(content), chunk)
+
+    base = fingerprint(data)
+    assert base.startswith("1000000:")
+    assert fingerprint(bytearray(data)) == base
+    for offset in (0, chunk - 1, len(data) - chunk, len(data) - 1):
+        changed = bytearray(data)
+        changed[offset] ^= 0xFF
+        assert fingerprint(changed) != base, offset
+    assert fingerprint(data + b"\0") != base
+    # 작은 파일은 전체 내용으로 계산
+    assert fingerprint(data[:1000]) != fingerprint(data[1:1001])
+
+
+def test_probe_cache_skips_ffprobe_for_copied_file(tmp_path, monkeypatch):
+    data = os.urandom(3_000_000)
+    files = {"ARCHIVE/2024/clip.mxf": data}
+    db = Database(str(tmp_path / "archive.db"))
+    db.insert_files_batch(
+        [FileRecord(path=p, filename="clip.mxf", file_type="video") for p in files]
+    )
+    first = me.MediaMetadataExtractor(FakeConnector(files), db)
+    assert first.extract_all(parallel=False)["cache_hits"] == 0
+
+    # 같은 내용을 다른 경로로 복사 - FFprobe가 실패해도 캐시 결과로 성공해야 함
+    def failing(self, file_path, timeout=60):
+        return me.MediaInfo(file_path=file_path, extraction_status="failed")
+
+    monkeypatch.setattr(FakeFFprobe, "extract", failing)
+    files["BACKUP/clip copy.mxf"] = data
+    db.insert_files_batch(
+        [FileRecord(path="BACKUP/clip copy.mxf", filename="clip copy.mxf", file_type="video")]
+    )
+    connector = FakeConnector(files)
+    summary = me.MediaMetadataExtractor(connector, db).extract_all(parallel=False)
+
+    assert summary["cache_hits"] == 1
+    assert summary["successful"] == 2
+    assert connector.stats == {"opens": 1, "bytes": 2 * me.SMBMediaExtractor.FINGERPRINT_CHUNK_SIZE}
+    copied = (
+        db._get_connection()
+        .execute(
+            "SELECT duration_seconds FROM media_info m JOIN files f ON f.id = m.file_id "
+            "WHERE f.path = 'BACKUP/clip copy.mxf'"
+        )
+        .fetchone()
+    )
+    assert copied[0] == float(len(data))
+    db.close()
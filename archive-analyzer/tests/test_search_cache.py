@@ -0,0 +1,100 @@
+"""SearchCache 키/무효화 테스트"""
+
+import pytest
+
+from archive_analyzer.search import SearchResult
+from archive_analyzer.search_cache import SearchCache, make_key
+
+
+def result(tag):
+    return SearchResult(hits=[{"id": tag}], total_hits=1, processing_time_ms=1, query="q")
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return result(self.calls)
+
+
+def test_key_separates_engines():
+    assert make_key("search_files", engine="meilisearch", query="WSOP") != make_key(
+        "search_files", engine="fts5", query="WSOP"
+    )
+    assert make_key("search_files", engine="fts5", query=" WSOP  Main ") == make_key(
+        "search_files", engine="fts5", query="wsop main"
+    )
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_source_version_change_invalidates(tmp_path, shared):
+    path = str(tmp_path / "cache.db") if shared else None
+    cache = SearchCache(shared_path=path)
+    search = Counter()
+
+    cache.sync_source(10)
+    cache.get_or_search("search_files", search, engine="fts5", query="a")
+    cache.sync_source(10)
+    cache.get_or_search("search_files", search, engine="fts5", query="a")
+    assert search.calls == 1
+
+    cache.sync_source(11)
+    assert cache.get_or_search("search_files", search, engine="fts5", query="a").hits == [
+        {"id": 2}
+    ]
+    assert search.calls == 2
+    cache.close()
+
+
+def test_shared_source_version_invalidates_once_for_all_workers(tmp_path):
+    path = str(tmp_path / "cache.db")
+    workers = [SearchCache(shared_path=path), SearchCache(shared_path=path)]
+    search = Counter()
+
+    for cache in workers:
+        cache.sync_source(1)
+        cache.get_or_search("search_files", search, engine="fts5", query="a")
+    assert search.calls == 1
+
+    before = sum(cache.stats.invalidations for cache in workers)
+    for cache in workers:
+        cache.sync_source(2)
+    assert sum(cache.stats.invalidations for cache in workers) == before + 1
+
+    for cache in workers:
+        cache.get_or_search("search_files", search, engine="fts5", query="a")
+    assert search.calls == 2
+    for cache in workers:
+        cache.close()
+
+
+def test_api_fts_results_follow_archive_changes(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    from archive_analyzer import api
+    from archive_analyzer.database import Database, FileRecord
+    from archive_analyzer.fts_search import FTSSearchEngine, fts5_available
+    from archive_analyzer.search_changes import ensure_change_log
+
+    if not fts5_available():
+        pytest.skip("FTS5 unavailable")
+
+    db = Database(str(tmp_path / "archive.db"))
+    ensure_change_log(db._get_connection())
+    db.insert_files_batch([FileRecord(path="A/hand1.mp4", filename="hand1.mp4")])
+    engine = FTSSearchEngine(db.db_path)
+    monkeypatch.setattr(api, "_service", None)
+    monkeypatch.setattr(api, "_fts_engine", engine)
+    monkeypatch.setattr(api, "_cache", SearchCache())
+
+    assert api.current_engine() == "fts5"
+    assert api.run_search("search_files", query="hand1").total_hits == 1
+    assert api.run_search("search_files", query="hand1").total_hits == 1
+    assert api._cache.stats.hits == 1
+
+    db.insert_files_batch([FileRecord(path="B/hand1.mp4", filename="hand1.mp4")])
+    assert api.run_search("search_files", query="hand1").total_hits == 2
+
+    engine.close()
+    db.close()
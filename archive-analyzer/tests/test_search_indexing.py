@@ -0,0 +1,95 @@
+"""SearchService 증분 인덱싱 테스트 (가짜 MeiliSearch 클라이언트)"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("meilisearch")
+
+from archive_analyzer import search  # noqa: E402
+from archive_analyzer.database import Database, FileRecord  # noqa: E402
+
+
+class FakeIndex:
+    def __init__(self, client):
+        self.client = client
+        self.docs = {}
+
+    def _task(self):
+        self.client.task_uid += 1
+        return SimpleNamespace(task_uid=self.client.task_uid)
+
+    def update_settings(self, settings):
+        return self._task()
+
+    def add_documents(self, docs, primary_key):
+        self.docs.update((doc[primary_key], doc) for doc in docs)
+        return self._task()
+
+    def delete_documents(self, ids):
+        for doc_id in ids:
+            self.docs.pop(doc_id, None)
+        return self._task()
+
+    def delete_all_documents(self):
+        self.docs.clear()
+        return self._task()
+
+
+class FakeClient:
+    def __init__(self, host, api_key):
+        self.task_uid = 0
+        self.indexes = {}
+
+    def index(self, name):
+        return self.indexes.setdefault(name, FakeIndex(self))
+
+    def wait_for_task(self, task_uid, timeout_in_ms):
+        return SimpleNamespace(status="succeeded", error=None)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(search.meilisearch, "Client", FakeClient)
+    return search.SearchService(search.SearchConfig())
+
+
+@pytest.fixture
+def archive_db(tmp_path):
+    db_path = tmp_path / "archive.db"
+    db = Database(str(db_path))
+    db.insert_files_batch(
+        [FileRecord(path=f"ARCHIVE/WSOP/f{i}.mp4", filename=f"f{i}.mp4") for i in range(20)]
+    )
+    db.close()
+    return str(db_path)
+
+
+def files_docs(service):
+    return service.client.index(service.config.files_index).docs
+
+
+def test_incremental_run_sends_only_changes(service, archive_db):
+    assert service.index_from_db(archive_db)["files"] == 20
+    assert service.index_from_db(archive_db) == {}
+    assert len(files_docs(service)) == 20
+
+
+def test_clear_all_forces_full_reindex(service, archive_db):
+    service.index_from_db(archive_db)
+    service.clear_all()
+    assert not files_docs(service)
+
+    service.index_from_db(archive_db)
+    assert len(files_docs(service)) == 20
+    assert service.last_reports[0].mode == "full"
+
+
+def test_clear_all_resets_watermark_for_other_processes(service, archive_db):
+    service.index_from_db(archive_db)
+    service.clear_all(archive_db)
+
+    # 다른 프로세스(새 서비스 인스턴스)도 전체 재인덱싱
+    other = search.SearchService(search.SearchConfig())
+    other.index_from_db(archive_db)
+    assert len(files_docs(other)) == 20
@@ -0,0 +1,73 @@
+"""SheetsRequestScheduler 테스트 (가짜 Sheets 서버)"""
+
+import pytest
+
+pytest.importorskip("gspread")
+
+from gspread.exceptions import APIError  # noqa: E402
+
+from archive_analyzer.sheets_rate_limit import READ, SheetsRequestScheduler  # noqa: E402
+
+
+def fast_scheduler(**kwargs):
+    # 1초 window, 백오프 최대 10ms (실제 한도 비율은 그대로)
+    kwargs.setdefault("window", 1.0)
+    kwargs.setdefault("max_backoff", 0.01)
+    return SheetsRequestScheduler(**kwargs)
+
+
+@pytest.fixture
+def worksheet(fake_sheets):
+    return fake_sheets.spreadsheet.add_sheet("hands", [["id", "title"], ["1", "AA vs KK"]])
+
+
+def test_429_is_retried_and_drains_the_bucket(fake_sheets, worksheet):
+    scheduler = fast_scheduler()
+    fake_sheets.fail_next.append(429)
+
+    assert scheduler.read(worksheet.get_all_values) == [["id", "title"], ["1", "AA vs KK"]]
+
+    assert fake_sheets.rejected[READ] == 1
+    assert scheduler.stats["retries"] == 1
+    assert scheduler.stats[READ] == 2
+    # 429 후 버킷이 비워져 재시도는 토큰 보충을 기다림
+    assert scheduler.stats["waited_seconds"] > 0
+
+
+def test_server_errors_are_retried_up_to_max_retries(fake_sheets, worksheet):
+    scheduler = fast_scheduler(max_retries=3)
+    fake_sheets.fail_next.extend([503, 500, 503])
+
+    with pytest.raises(APIError):
+        scheduler.read(worksheet.get_all_values)
+
+    assert fake_sheets.rejected[READ] == 3
+    assert scheduler.stats["retries"] == 2
+
+
+def test_client_errors_are_not_retried(fake_sheets, worksheet):
+    scheduler = fast_scheduler()
+    fake_sheets.fail_next.append(400)
+
+    with pytest.raises(APIError):
+        scheduler.read(worksheet.get_all_values)
+
+    assert scheduler.stats["retries"] == 0
+    assert fake_sheets.accepted[READ] == 0
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_clients_stay_within_quota(fake_sheets, worksheet, tmp_path, shared):
+    fake_sheets.limits[READ] = 20
+    fake_sheets.window = 0.2
+    shared_path = str(tmp_path / "buckets.db") if shared else None
+    clients = [
+        fast_scheduler(read_limit=20, window=0.2, shared_path=shared_path)
+        for _ in range(2 if shared else 1)
+    ]
+
+    for i in range(40):
+        clients[i % len(clients)].read(worksheet.get_all_values)
+
+    assert fake_sheets.accepted[READ] == 40
+    assert fake_sheets.rejected[READ] == 0
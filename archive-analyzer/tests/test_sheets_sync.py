@@ -0,0 +1,102 @@
+"""SheetsSyncService 행 해시 변경 감지 테스트 (가짜 Sheets 서버)"""
+
+import sqlite3
+
+import pytest
+
+pytest.importorskip("gspread")
+pytest.importorskip("google.oauth2")
+
+from archive_analyzer import sheets_sync  # noqa: E402
+from archive_analyzer.sheets_rate_limit import READ, WRITE, SheetsRequestScheduler  # noqa: E402
+
+
+@pytest.fixture
+def service(fake_sheets, tmp_path, monkeypatch):
+    db_path = str(tmp_path / "pokervod.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE players (id INTEGER PRIMARY KEY, name TEXT, winnings REAL)")
+    conn.executemany(
+        "INSERT INTO players VALUES (?, ?, ?)",
+        [(i, f"player {i}", i * 1000.0) for i in range(1, 21)],
+    )
+    conn.commit()
+    conn.close()
+
+    def connect(client):
+        client.spreadsheet = fake_sheets.spreadsheet
+
+    scheduler = SheetsRequestScheduler(window=1.0, max_backoff=0.01)
+    monkeypatch.setattr(sheets_sync.SheetsClient, "_connect", connect)
+    monkeypatch.setattr(sheets_sync, "get_scheduler", lambda: scheduler)
+    config = sheets_sync.SyncConfig(
+        credentials_path="unused.json",
+        spreadsheet_id="fake",
+        db_path=db_path,
+        tables_to_sync=["players"],
+    )
+    service = sheets_sync.SheetsSyncService(config)
+    service.init_sheets()
+    fake_sheets.reset_counts()
+    return service
+
+
+def db_rows(service):
+    conn = sqlite3.connect(service.config.db_path)
+    rows = {row[0]: row[1:] for row in conn.execute("SELECT * FROM players")}
+    conn.close()
+    return rows
+
+
+def sheet_values(fake_sheets):
+    return fake_sheets.spreadsheet.sheets["players"].values
+
+
+def test_unchanged_rows_are_skipped(service, fake_sheets):
+    before = db_rows(service)
+
+    assert service.sync_all() == {"players": {"inserted": 0, "updated": 0, "deleted": 0}}
+
+    # 시트 목록 1회 + values_batch_get 1회, 쓰기 없음
+    assert fake_sheets.accepted == {READ: 2, WRITE: 0}
+    assert db_rows(service) == before
+
+
+def test_only_changed_db_row_is_written(service, fake_sheets):
+    conn = sqlite3.connect(service.config.db_path)
+    conn.execute("UPDATE players SET name = 'Phil Ivey' WHERE id = 7")
+    conn.commit()
+    conn.close()
+    values_before = [list(row) for row in sheet_values(fake_sheets)]
+
+    stats = service.sync_all()["players"]
+
+    assert stats == {"inserted": 0, "updated": 1, "deleted": 0}
+    assert fake_sheets.accepted[WRITE] == 1
+    changed = [
+        i for i, row in enumerate(sheet_values(fake_sheets)) if row != values_before[i]
+    ]
+    assert changed == [7]
+    assert sheet_values(fake_sheets)[7] == ["7", "Phil Ivey", "7000"]
+
+
+def test_only_changed_sheet_row_reaches_db(service, fake_sheets):
+    sheet_values(fake_sheets)[3][2] = "12345.5"
+    del sheet_values(fake_sheets)[10]  # id 10 삭제
+    before = db_rows(service)
+
+    stats = service.sync_all()["players"]
+
+    assert stats == {"inserted": 0, "updated": 1, "deleted": 1}
+    assert fake_sheets.accepted[WRITE] == 0
+    after = db_rows(service)
+    assert after[3] == ("player 3", 12345.5)
+    assert 10 not in after
+    assert {k: v for k, v in after.items() if k != 3} == {
+        k: v for k, v in before.items() if k not in (3, 10)
+    }
+
+    # 반영 후에는 다시 변경 없음
+    fake_sheets.reset_counts()
+    assert service.sync_all()["players"] == {"inserted": 0, "updated": 0, "deleted": 0}
+    assert fake_sheets.accepted[WRITE] == 0
@@ -0,0 +1,145 @@
+"""stats_summary 트리거 증분 갱신 vs 전체 재집계 회귀 테스트
+
+변경마다 트리거가 유지한 집계가 rebuild_stats 결과와 같아야 합니다.
+"""
+
+import pytest
+
+from archive_analyzer.database import Database, FileRecord
+from archive_analyzer.stats_summary import STATS_TABLE, rebuild_stats
+
+FILE_SQL = """INSERT {verb} INTO files
+    (path, filename, extension, size_bytes, file_type, parent_folder, scan_status)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+MEDIA_SQL = """INSERT OR REPLACE INTO media_info
+    (file_id, file_path, extraction_status, height, bitrate, video_codec,
+     container_format, file_size, duration_seconds)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+FOLDERS = ["WSOP/2024", "WSOP/ARCHIVE/2005", "HCL/2025", "PAD/S12", ""]
+EXTENSIONS = [".mp4", ".mxf", ".mov", None]
+
+
+def file_row(i, size=None):
+    ext = EXTENSIONS[i % len(EXTENSIONS)]
+    folder = FOLDERS[i % len(FOLDERS)]
+    # 파일명 중복 (duplicates 차원)
+    filename = f"hand{i % 17}{ext or ''}"
+    return (
+        f"{folder}/{i}/{filename}",
+        filename,
+        ext,
+        size if size is not None else 1000 * i,
+        "video" if i % 3 else "other",
+        folder or None,
+        "pending" if i % 2 else "done",
+    )
+
+
+def media_row(file_id, status="success"):
+    return (
+        file_id,
+        f"path/{file_id}",
+        status,
+        (480, 720, 1080, 2160, None)[file_id % 5],
+        (None, 3_000_000, 8_000_000, 15_000_000, 60_000_000)[file_id % 5],
+        ("h264", "hevc", None)[file_id % 3],
+        ("mov,mp4", "mxf", None)[file_id % 3],
+        file_id * 500,
+        (None, 120.5, 3600.25, 7300.0)[file_id % 4],
+    )
+
+
+def snapshot(conn):
+    return sorted(
+        (row[0], row[1], row[2], row[3], row[4], round(row[5], 6), row[6])
+        for row in conn.execute(
+            f"""SELECT dimension, key, file_count, total_size, video_count, value_sum, value_count
+            FROM {STATS_TABLE} WHERE dimension != '_meta'"""
+        )
+    )
+
+
+def assert_matches_rebuild(conn):
+    """트리거 결과와 전체 재집계를 비교 (재집계는 되돌려 다음 단계에 영향 없음)"""
+    incremental = snapshot(conn)
+    conn.execute("SAVEPOINT rebuild_check")
+    rebuild_stats(conn)
+    rebuilt = snapshot(conn)
+    conn.execute("ROLLBACK TO rebuild_check")
+    conn.execute("RELEASE rebuild_check")
+    assert incremental == rebuilt
+    assert incremental
+
+
+@pytest.fixture
+def conn(tmp_path):
+    db = Database(str(tmp_path / "archive.db"))
+    connection = db._get_connection()
+    connection.executemany(FILE_SQL.format(verb=""), [file_row(i) for i in range(1, 61)])
+    connection.executemany(MEDIA_SQL, [media_row(i) for i in range(1, 41)])
+    connection.commit()
+    yield connection
+    db.close()
+
+
+def test_inserts_match_rebuild(conn):
+    assert_matches_rebuild(conn)
+
+
+def test_file_updates_match_rebuild(conn):
+    conn.execute("UPDATE files SET file_type = 'video' WHERE id % 3 = 0 AND id < 20")
+    assert_matches_rebuild(conn)
+    # 크기 변경은 media_info 기반 resolution 차원에도 반영돼야 함
+    conn.execute("UPDATE files SET size_bytes = size_bytes * 7 + 1 WHERE id % 4 = 1")
+    assert_matches_rebuild(conn)
+    conn.execute("UPDATE files SET parent_folder = 'MOVED/ARCHIVE' WHERE id % 5 = 2")
+    conn.execute("UPDATE files SET scan_status = 'error' WHERE id BETWEEN 10 AND 15")
+    assert_matches_rebuild(conn)
+    # 파일명 변경으로 중복 그룹이 생기고 없어짐
+    conn.execute("UPDATE files SET filename = 'unique' || id WHERE id % 17 = 3")
+    conn.execute("UPDATE files SET filename = 'hand1.mp4', extension = '.mp4' WHERE id = 30")
+    assert_matches_rebuild(conn)
+
+
+def test_file_deletes_match_rebuild(conn):
+    conn.execute("DELETE FROM files WHERE id % 6 = 0")
+    assert_matches_rebuild(conn)
+    conn.execute("DELETE FROM files")
+    assert_matches_rebuild(conn)
+
+
+def test_insert_or_replace_matches_rebuild(conn):
+    # 기존 경로에 다른 값으로 REPLACE -> 지워지는 행에도 DELETE 트리거 동작
+    replaced = [file_row(i)[:3] + (77, "other", "REPLACED", "done") for i in range(1, 11)]
+    conn.executemany(FILE_SQL.format(verb="OR REPLACE"), replaced)
+    assert_matches_rebuild(conn)
+
+
+def test_upsert_batch_matches_rebuild(tmp_path):
+    db = Database(str(tmp_path / "archive.db"))
+    records = [
+        FileRecord(path=f"A/{i}.mp4", filename=f"{i % 4}.mp4", extension=".mp4", size_bytes=i)
+        for i in range(20)
+    ]
+    db.insert_files_batch(records)
+    for record in records[::2]:
+        record.size_bytes += 1000
+        record.file_type = "video"
+    db.insert_files_batch(records[::2])
+    assert_matches_rebuild(db._get_connection())
+    db.close()
+
+
+def test_media_changes_match_rebuild(conn):
+    conn.execute("UPDATE media_info SET extraction_status = 'failed' WHERE file_id % 7 = 0")
+    conn.execute("UPDATE media_info SET height = 1080, bitrate = 25000000 WHERE file_id < 5")
+    conn.execute("UPDATE media_info SET duration_seconds = NULL WHERE file_id % 9 = 1")
+    assert_matches_rebuild(conn)
+    # 추출 결과 재저장 (INSERT OR REPLACE, UNIQUE(file_id))
+    conn.executemany(MEDIA_SQL, [media_row(i) for i in range(30, 51)])
+    conn.executemany(MEDIA_SQL, [media_row(i, "failed") for i in range(1, 6)])
+    assert_matches_rebuild(conn)
+    conn.execute("DELETE FROM media_info WHERE file_id % 4 = 0")
+    assert_matches_rebuild(conn)
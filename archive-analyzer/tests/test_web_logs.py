@@ -0,0 +1,58 @@
+"""웹 대시보드 로그 WebSocket 팬아웃 테스트"""
+
+import asyncio
+import importlib
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import WebSocketDisconnect  # noqa: E402
+
+web_app = importlib.import_module("archive_analyzer.web.app")
+
+
+class FakeWebSocket:
+    """받은 줄을 모으고, expected줄을 받으면 연결 종료"""
+
+    def __init__(self, expected):
+        self.expected = expected
+        self.lines = []
+        self.done = asyncio.Event()
+
+    async def send_text(self, text):
+        self.lines.extend(text.split("\n"))
+        if len(self.lines) >= self.expected:
+            self.done.set()
+
+    async def receive_text(self):
+        await self.done.wait()
+        raise WebSocketDisconnect()
+
+    async def close(self):
+        pass
+
+
+def serve(broadcaster, websocket, backlog):
+    async def run():
+        await asyncio.wait_for(broadcaster.serve(websocket, backlog), 5)
+
+    asyncio.run(run())
+
+
+def test_backlog_larger_than_queue_is_replayed_in_full():
+    broadcaster = web_app.LogBroadcaster(queue_size=500, flush_interval=0)
+    backlog = [f"line {i}" for i in range(1000)]
+    websocket = FakeWebSocket(expected=len(backlog))
+
+    serve(broadcaster, websocket, backlog)
+
+    assert websocket.lines == backlog
+    assert broadcaster.client_count == 0
+
+
+def test_live_lines_beyond_queue_are_dropped_with_notice():
+    client = web_app._LogClient(websocket=None, queue_size=3)
+    client.push([f"line {i}" for i in range(5)])
+
+    assert client.take(10) == ["[... 로그 2줄 생략]", "line 2", "line 3", "line 4"]
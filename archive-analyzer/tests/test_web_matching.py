@@ -0,0 +1,62 @@
+"""웹 대시보드 1:1 매칭 목록 테스트"""
+
+import importlib
+import sqlite3
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+web_app = importlib.import_module("archive_analyzer.web.app")
+
+
+@pytest.fixture
+def dbs(tmp_path):
+    archive_db = str(tmp_path / "archive.db")
+    conn = sqlite3.connect(archive_db)
+    conn.execute(
+        "CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, filename TEXT, "
+        "file_type TEXT, size_bytes INTEGER)"
+    )
+    # 1~30: 동기화됨, 31~40: 중복 파일명 + 동기화됨, 41~100: 미동기화
+    rows = [(i, f"A/{i}.mp4", f"{i}.mp4", "video", i) for i in range(1, 31)]
+    rows += [(i, f"B{i}/dup{i % 5}.mp4", f"dup{i % 5}.mp4", "video", i) for i in range(31, 41)]
+    rows += [(i, f"C/{i}.mxf", f"{i}.mxf", "video", i) for i in range(41, 101)]
+    conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+    pokervod_db = str(tmp_path / "pokervod.db")
+    conn = sqlite3.connect(pokervod_db)
+    conn.execute("CREATE TABLE files (id TEXT, filename TEXT, nas_path TEXT, size_bytes INTEGER)")
+    synced = [f"{i}.mp4" for i in range(1, 31)] + [f"dup{i}.mp4" for i in range(5)]
+    conn.executemany(
+        "INSERT INTO files VALUES (?, ?, ?, 0)", [(name, name, f"/nas/{name}") for name in synced]
+    )
+    conn.commit()
+    conn.close()
+    return archive_db, pokervod_db
+
+
+@pytest.mark.parametrize(
+    "status, expected",
+    [(None, 100), ("synced", 30), ("synced_with_duplicates", 10), ("not_synced", 60)],
+)
+def test_total_applies_status_filter(dbs, status, expected):
+    items, total, _, _ = web_app.get_matching_items(*dbs, per_page=7, status_filter=status)
+    assert total == expected
+    assert len(items) == 7
+
+
+def test_cursor_pages_cover_filtered_total(dbs):
+    seen, cursor = [], None
+    while True:
+        items, total, _, cursor = web_app.get_matching_items(
+            *dbs, per_page=7, status_filter="not_synced", cursor=cursor
+        )
+        seen.extend(item["source"]["id"] for item in items)
+        assert all(item["status"] == "not_synced" for item in items)
+        if cursor is None:
+            break
+    assert len(seen) == total == 60
+    assert seen == sorted(seen)